@@ -219,18 +219,12 @@ class BaseAgent(ABC):
     def _initialize_llm_model(self):
         """Initialize the LLM model for agent operations."""
         try:
-            import streamlit as st
-            from langchain_google_genai import ChatGoogleGenerativeAI
+            from utils.core.llm_gateway import get_llm_gateway
             
-            # Get API key from Streamlit secrets
-            api_key = st.secrets.get("GEMINI_API_KEY")
-            if not api_key:
-                raise ValueError("GEMINI_API_KEY not found in Streamlit secrets")
-            
-            return ChatGoogleGenerativeAI(
-                model=self.config.model_name,
-                google_api_key=api_key,
+            return get_llm_gateway().get_chat_model(
+                self.config.model_name,
                 temperature=self.config.temperature,
+                agent_name=self.config.agent_id,
                 max_tokens=8192
             )
         except Exception as e:
@@ -502,36 +496,38 @@ class BaseAgent(ABC):
             self.logger.error(f"Error generating response: {e}")
             raise
     
-    def parse_json_response(self, response: str) -> dict:
-        """Parse JSON response with error handling."""
-        import json
-        import re
-        
-        # Clean the response - remove code blocks if present
-        if "```json" in response:
-            # Extract JSON from code blocks
-            json_match = re.search(r'```(?:json)?\s*(.*?)\s*```', response, re.DOTALL)
-            if json_match:
-                response = json_match.group(1)
-        elif "```" in response:
-            # Generic code blocks
-            json_match = re.search(r'```\s*(.*?)\s*```', response, re.DOTALL)
-            if json_match:
-                response = json_match.group(1)
-        
-        # Remove trailing commas
-        response = re.sub(r',(\s*[}\]])', r'\1', response)
-        
-        # Remove trailing commas in arrays
-        response = re.sub(r',(\s*\])', r'\1', response)
+    def parse_json_response(self, response: str) -> Any:
+        """Parse JSON response (an object, or a list if the response is one) with error handling."""
+        from utils.parsing.streaming_json_parser import parse_json_text, StreamingJSONError
         
+        # One pass: skips code fences and prose, tolerates trailing commas,
+        # repairs truncated output
         try:
-            return json.loads(response)
-        except json.JSONDecodeError as e:
+            return parse_json_text(response)
+        except StreamingJSONError as e:
             self.logger.error(f"JSON parsing error: {e}")
             # Return a fallback dict instead of raising
             return {"error": "JSON parsing failed", "original_response": response}
     
+    async def stream_json_response(self, prompt: str, on_value=None, watch=None) -> dict:
+        """
+        Stream a JSON completion from the agent's LLM, parsing it incrementally.
+        
+        Args:
+            prompt: Prompt to send
+            on_value: Called (or awaited) with each ``ParsedValue`` as soon as it
+                completes, so downstream work can start before the model finishes
+            watch: Path patterns to report, e.g. ``[("source_files", "*")]``
+            
+        Returns:
+            Parsed (and, if truncated, repaired) JSON object
+        """
+        from utils.parsing.streaming_json_parser import parse_json_stream
+        
+        if self.llm_model is None:
+            raise ValueError("LLM model not available for streaming")
+        return await parse_json_stream(self.llm_model.astream(prompt), on_value=on_value, watch=watch)
+    
     def prepare_prompt(self, state: dict, **kwargs) -> str:
         """Prepare prompt using template and context."""
         if not hasattr(self.config, 'prompt_template'):
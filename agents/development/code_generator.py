@@ -5,7 +5,6 @@ Uses LangChain StrOutputParser for markdown with code blocks.
 Implements quality gate functionality to validate generated code.
 """
 
-import json
 import os
 import sys
 import time
@@ -452,21 +451,8 @@ NEVER violate file organization rules!
         # Parse response using simplified models directly
         self.add_log_entry("info", "Parsing JSON response with simplified models")
         
-        # Parse JSON directly without using the old structured output parser
-        try:
-            # Find JSON in the response
-            start = response_text.find('{')
-            end = response_text.rfind('}') + 1
-            if start != -1 and end != 0:
-                json_str = response_text[start:end]
-                code_data = json.loads(json_str)
-                self.add_log_entry("info", "Successfully parsed JSON directly")
-            else:
-                raise ValueError("No JSON found in response")
-        except Exception as e:
-            self.add_log_entry("error", f"Failed to parse JSON directly: {e}")
-            # Fall back to old parser
-            code_data = self.parse_json_response(response_text)
+        # Single incremental pass (handles fences, prose and truncation)
+        code_data = self.parse_json_response(response_text)
         
         # Create simplified response
         try:
@@ -1114,77 +1100,25 @@ NEVER violate file organization rules!
         Returns:
             Parsed code data
         """
-        self.add_log_entry("info", "Attempting enhanced JSON parsing for code generation")
+        from utils.parsing.streaming_json_parser import StreamingJSONParser, StreamingJSONError
         
-        # First try standard JSON parsing  
-        try:
-            import json
-            data = json.loads(response)
-            self.add_log_entry("info", "Standard JSON parsing successful")
-            
-            # Validate structure and add missing fields
-            return self._ensure_complete_structure(data)
-            
-        except json.JSONDecodeError as e:
-            self.add_log_entry("warning", f"Standard JSON parsing failed: {e}")
-            
-            # Try to fix common JSON issues
-            try:
-                fixed_response = self._fix_truncated_json(response)
-                data = json.loads(fixed_response)
-                self.add_log_entry("info", "JSON parsing successful after fixing")
-                
-                return self._ensure_complete_structure(data)
-                
-            except Exception as fix_error:
-                self.add_log_entry("warning", f"JSON fix attempt failed: {fix_error}")
-                
-                # Try enhanced parser as last resort
-                try:
-                    from utils.parsing.enhanced_output_parsers import CodeGenerationParser
-                    parser = CodeGenerationParser()
-                    data = parser.parse(response)
-                    self.add_log_entry("info", "Enhanced parser successful")
-                    return data
-                    
-                except Exception as parser_error:
-                    self.add_log_entry("error", f"All parsing methods failed: {parser_error}")
-                    raise parser_error
-    
-    def _fix_truncated_json(self, response: str) -> str:
-        """
-        Attempt to fix truncated or malformed JSON.
-        
-        Args:
-            response: Raw JSON response
-            
-        Returns:
-            Fixed JSON string
-        """
-        self.add_log_entry("info", "Attempting to fix truncated JSON")
-        
-        # Remove any text before the first {
-        start_idx = response.find('{')
-        if start_idx > 0:
-            response = response[start_idx:]
-        
-        # Try to fix unterminated strings and objects
-        if not response.endswith('}'):
-            # Count open braces vs close braces
-            open_braces = response.count('{')
-            close_braces = response.count('}')
-            
-            # Add missing closing braces
-            missing_braces = open_braces - close_braces
-            if missing_braces > 0:
-                response += '}' * missing_braces
+        self.add_log_entry("info", "Attempting incremental JSON parsing for code generation")
         
-        # Fix unterminated strings by finding the last quote and ensuring it's closed
-        if response.count('"') % 2 != 0:
-            # Add closing quote if needed
-            response += '"'
+        parser = StreamingJSONParser()
+        try:
+            parser.feed(response)
+            data = parser.finish()
+        except StreamingJSONError as e:
+            self.add_log_entry("error", f"JSON parsing failed: {e}")
+            raise
+        
+        if parser.repaired:
+            self.add_log_entry("warning", "Response was truncated; JSON repaired while parsing")
+        else:
+            self.add_log_entry("info", "JSON parsing successful")
         
-        return response
+        # Validate structure and add missing fields
+        return self._ensure_complete_structure(data)
     
     def _ensure_complete_structure(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
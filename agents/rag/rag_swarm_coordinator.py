@@ -19,8 +19,13 @@ Architecture:
 User Story: US-RAG-004
 """
 
+import asyncio
+import contextvars
+import functools
 import logging
-from typing import Literal, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -32,6 +37,7 @@ from langgraph.prebuilt import ToolNode, tools_condition
 from langchain_core.tools.retriever import create_retriever_tool
 from langchain_core.tools import tool
 from langchain_core.messages import ToolMessage, HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import messages_from_dict, messages_to_dict
 
 # Context engine
 from context.context_engine import ContextEngine
@@ -43,8 +49,29 @@ from agents.rag.re_ranker_agent import ReRankerAgent
 from agents.rag.quality_assurance_agent import QualityAssuranceAgent
 from agents.rag.writer_agent import WriterAgent
 
+# Per-stage timing for headless evaluation (no-op outside a stage trace)
+from utils.rag.stage_timing import NODE_STAGES, timed_stage
+
+# Durable per-node checkpoints (survive process restarts)
+from utils.rag.swarm_checkpoint_store import SwarmCheckpointStore
+
 logger = logging.getLogger(__name__)
 
+# Thread whose graph run is executing in this context (for durable node checkpoints)
+_active_thread: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "rag_swarm_thread", default=None
+)
+
+# Thread node logs kept in memory; older ones are reloaded from the checkpoint store
+NODE_LOG_CACHE_SIZE = 64
+
+
+@dataclass
+class _ThreadReplay:
+    """Completed nodes of a thread and the step its current run has reached."""
+    log: List[Tuple[str, dict]]
+    cursor: Optional[int] = None  # None: the next node continues after the log
+
 
 class TaskType(str, Enum):
     """Task types that determine workflow routing."""
@@ -90,7 +117,8 @@ class RAGSwarmCoordinator:
         result = await coordinator.execute("Research LangGraph architecture")
     """
     
-    def __init__(self, context_engine: ContextEngine, human_in_loop: bool = False, retrieval_only: bool = False):
+    def __init__(self, context_engine: ContextEngine, human_in_loop: bool = False, retrieval_only: bool = False,
+                 checkpoint_path: Optional[str] = None):
         """
         Initialize RAG Swarm Coordinator.
         
@@ -98,6 +126,8 @@ class RAGSwarmCoordinator:
             context_engine: ContextEngine instance with initialized vector store
             human_in_loop: Enable human approval before generating final answer
             retrieval_only: Simple retrieval mode (skip sophisticated agents, fast)
+            checkpoint_path: Optional SQLite file for durable node checkpoints; threads
+                resumed after a restart skip nodes that already completed
             
         Operational Modes:
             1. retrieval_only=True
@@ -118,6 +148,10 @@ class RAGSwarmCoordinator:
             logger.warning("⚠️ retrieval_only=True overrides human_in_loop - using simple retrieval mode")
             self.human_in_loop = False
         
+        # Durable checkpoints: per-thread node log replayed after a restart
+        self.checkpoint_store = SwarmCheckpointStore(checkpoint_path) if checkpoint_path and not retrieval_only else None
+        self._threads: "OrderedDict[str, _ThreadReplay]" = OrderedDict()
+        
         # Initialize LLM (use Gemini for consistency)
         self.llm = self._create_llm()
         
@@ -148,24 +182,17 @@ class RAGSwarmCoordinator:
         logger.info(f"   🚨 Graph interrupt_before: {['human_review'] if self.human_in_loop else []}")
     
     def _create_llm(self):
-        """Create LLM instance."""
+        """Get the pooled LLM from the shared gateway (cheap; safe to call per node)."""
         try:
-            from langchain_google_genai import ChatGoogleGenerativeAI
-            import os
-            
-            api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
-            if not api_key:
-                raise ValueError("GEMINI_API_KEY or GOOGLE_API_KEY environment variable must be set")
+            from utils.core.llm_gateway import get_llm_gateway
             
-            llm = ChatGoogleGenerativeAI(
-                model="gemini-2.5-flash",
-                google_api_key=api_key,  # CRITICAL: Must pass API key explicitly
+            return get_llm_gateway().get_chat_model(
+                "gemini-2.5-flash",
                 temperature=0,
+                agent_name="rag_swarm",
                 convert_system_message_to_human=True,
                 transport="rest"  # Use REST to avoid grpc event loop issues
             )
-            logger.info("✅ LLM initialized: gemini-2.5-flash")
-            return llm
             
         except Exception as e:
             logger.error(f"❌ Failed to initialize LLM: {e}")
@@ -442,17 +469,17 @@ Answer:"""
         workflow = StateGraph(MessagesState)
         
         # Add sophisticated agent nodes (ENHANCED FLOW)
-        workflow.add_node("query_analyst", self._query_analyst_node)
-        workflow.add_node("retrieval_specialist", self._retrieval_specialist_node)
-        workflow.add_node("document_grader", self._document_grader_node)  # NEW: Grade BEFORE re-ranking
-        workflow.add_node("re_ranker", self._re_ranker_node)
-        workflow.add_node("context_enrichment", self._context_enrichment_node)  # NEW: Enrich after ranking
-        workflow.add_node("writer", self._writer_node)
-        workflow.add_node("citation_verification", self._citation_verification_node)  # NEW: Verify citations
-        workflow.add_node("quality_assurance", self._quality_assurance_node)
+        workflow.add_node("query_analyst", self._stage_node("query_analyst", self._query_analyst_node))
+        workflow.add_node("retrieval_specialist", self._stage_node("retrieval_specialist", self._retrieval_specialist_node))
+        workflow.add_node("document_grader", self._stage_node("document_grader", self._document_grader_node))  # NEW: Grade BEFORE re-ranking
+        workflow.add_node("re_ranker", self._stage_node("re_ranker", self._re_ranker_node))
+        workflow.add_node("context_enrichment", self._stage_node("context_enrichment", self._context_enrichment_node))  # NEW: Enrich after ranking
+        workflow.add_node("writer", self._stage_node("writer", self._writer_node))
+        workflow.add_node("citation_verification", self._stage_node("citation_verification", self._citation_verification_node))  # NEW: Verify citations
+        workflow.add_node("quality_assurance", self._stage_node("quality_assurance", self._quality_assurance_node))
         
         # Add control nodes
-        workflow.add_node("rewrite_question", self._rewrite_question)
+        workflow.add_node("rewrite_question", self._stage_node("rewrite_question", self._rewrite_question))
         
         # Add MULTIPLE human review nodes for different stages
         if self.human_in_loop:
@@ -629,6 +656,160 @@ Answer:"""
             # Fallback: compile without checkpointer
             return workflow.compile()
     
+    @staticmethod
+    def _timed_node(name: str, node):
+        """Report the node's runtime to an active golden-evaluation stage trace."""
+        return timed_stage(NODE_STAGES.get(name, name), node)
+    
+    def _stage_node(self, name: str, node):
+        """Timed stage node, checkpointed durably when a checkpoint store is configured."""
+        node = self._timed_node(name, node)
+        if self.checkpoint_store is None:
+            return node
+        
+        if asyncio.iscoroutinefunction(node):
+            @functools.wraps(node)
+            async def async_wrapper(state):
+                thread_id = _active_thread.get()
+                step, delta = self._replay_node(thread_id, name)
+                if delta is None:
+                    delta = await node(state)
+                    self._record_node(thread_id, step, name, delta)
+                return delta
+            return async_wrapper
+        
+        @functools.wraps(node)
+        def wrapper(state):
+            thread_id = _active_thread.get()
+            step, delta = self._replay_node(thread_id, name)
+            if delta is None:
+                delta = node(state)
+                self._record_node(thread_id, step, name, delta)
+            return delta
+        return wrapper
+    
+    # ------------------------------------------------------------------
+    # Durable checkpoints
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _encode_delta(delta: dict) -> dict:
+        return {key: messages_to_dict(value) if key == "messages" else value for key, value in delta.items()}
+    
+    @staticmethod
+    def _decode_delta(delta: dict) -> dict:
+        return {key: messages_from_dict(value) if key == "messages" else value for key, value in delta.items()}
+    
+    def _thread_replay(self, thread_id: str) -> _ThreadReplay:
+        """
+        Node log and cursor of the thread, most recently used threads kept in memory.
+        
+        Evicted logs are reloaded from the durable store, which always holds
+        the same history.
+        """
+        replay = self._threads.get(thread_id)
+        if replay is None:
+            replay = _ThreadReplay(self.checkpoint_store.node_deltas(thread_id))
+            self._threads[thread_id] = replay
+            while len(self._threads) > NODE_LOG_CACHE_SIZE:
+                self._threads.popitem(last=False)
+        else:
+            self._threads.move_to_end(thread_id)
+        return replay
+    
+    def _replay_node(self, thread_id: Optional[str], name: str) -> Tuple[int, Optional[dict]]:
+        """
+        Next step of the thread and, if that step already completed, its stored delta.
+        
+        A node differing from the recorded history means the thread diverged
+        (e.g. different human feedback), so the rest of the history is dropped.
+        """
+        if thread_id is None:
+            return -1, None
+        replay = self._thread_replay(thread_id)
+        log = replay.log
+        step = len(log) if replay.cursor is None else replay.cursor
+        replay.cursor = step + 1
+        
+        if step < len(log):
+            recorded_node, recorded_delta = log[step]
+            if recorded_node == name:
+                logger.info(f"♻️ Skipping completed node '{name}' (thread {thread_id}, step {step})")
+                return step, self._decode_delta(recorded_delta)
+            del log[step:]
+            self.checkpoint_store.truncate(thread_id, step)
+        return step, None
+    
+    def _record_node(self, thread_id: Optional[str], step: int, name: str, delta) -> None:
+        if thread_id is None or not isinstance(delta, dict):
+            return
+        try:
+            encoded = self._encode_delta(delta)
+            self.checkpoint_store.record_node(thread_id, step, name, encoded)
+            # An evicted log is reloaded with this node from the store
+            if thread_id in self._threads:
+                self._threads[thread_id].log.append((name, encoded))
+        except Exception as e:
+            logger.warning(f"⚠️ Could not checkpoint node '{name}': {e}")
+    
+    def _start_initial_state(self, payload: dict, existing_messages: list) -> dict:
+        """Initial graph input of an ``execute`` call from its recorded payload."""
+        initial_state = {"messages": existing_messages + [HumanMessage(content=payload["query"])]}
+        if payload.get("document_filters"):
+            initial_state["document_filters"] = payload["document_filters"]
+        return initial_state
+    
+    def _restore_thread(self, config: dict) -> bool:
+        """
+        Rebuild a thread lost from the in-memory checkpointer by replaying its inputs.
+        
+        Completed nodes are served from the durable store instead of re-running,
+        so the graph cheaply returns to where the thread stopped.
+        
+        Returns:
+            True if the thread was restored
+        """
+        thread_id = config["configurable"]["thread_id"]
+        if self.checkpoint_store is None or thread_id in self._threads:
+            return False
+        # Evicted from the node log cache, but still live in the checkpointer
+        try:
+            if self.graph.get_state(config).values:
+                return False
+        except ValueError:
+            return False
+        
+        inputs = self.checkpoint_store.inputs(thread_id)
+        self._threads.pop(thread_id, None)
+        replay = self._thread_replay(thread_id)
+        replay.cursor = 0
+        log = replay.log
+        if not inputs:
+            return False
+        
+        logger.info(f"💾 Restoring thread {thread_id}: {len(inputs)} input(s), "
+                    f"{len(log)} completed node(s)")
+        token = _active_thread.set(thread_id)
+        try:
+            for kind, payload in inputs:
+                if kind == "start":
+                    snapshot = self.graph.get_state(config)
+                    existing_messages = snapshot.values.get("messages", []) if snapshot.values else []
+                    self.graph.invoke(self._start_initial_state(payload, existing_messages), config=config)
+                elif kind == "resume":
+                    if payload is not None:
+                        snapshot = self.graph.get_state(config)
+                        self.graph.update_state(
+                            config,
+                            {"messages": [HumanMessage(content=payload)]},
+                            as_node=snapshot.next[0] if snapshot.next else None
+                        )
+                    for _ in self.graph.stream(None, config, stream_mode="values"):
+                        pass
+        finally:
+            _active_thread.reset(token)
+        return True
+    
     def _extract_query_from_state(self, state: MessagesState) -> Optional[str]:
         """
         Helper function to extract query from MessagesState.
@@ -2257,6 +2438,9 @@ Provide verification results:
             thread_id = config["configurable"]["thread_id"]
             logger.info(f"📋 Thread ID: {thread_id}")
             
+            # Durable checkpoints: rebuild the thread if this process has never seen it
+            self._restore_thread(config)
+            
             # CRITICAL FIX: Load existing state from checkpointer and merge with new query
             # This matches the pattern used in simple_rag.py and agentic_rag.py
             # LangGraph's invoke() doesn't automatically merge initial_state with existing checkpointer state
@@ -2270,29 +2454,24 @@ Provide verification results:
                 logger.info(f"📝 No existing state found (new thread): {e}")
                 existing_messages = []
             
-            # Create proper HumanMessage object for LangGraph
-            human_msg = HumanMessage(content=query)
-            
-            # Merge existing messages with new query
+            # Merge existing messages with new query (and document filters, if provided)
+            start_payload = {"query": query, "document_filters": document_filters}
+            initial_state = self._start_initial_state(start_payload, existing_messages)
             if existing_messages:
-                input_messages = existing_messages + [human_msg]
                 logger.info(f"📝 Merged new query with {len(existing_messages)} existing messages")
             else:
-                input_messages = [human_msg]
                 logger.info(f"📝 Starting fresh conversation with query: '{query[:60]}...'")
+            if document_filters:
+                logger.info(f"🎯 Document filters added to state: {document_filters}")
             
             # Debug: Verify messages are correct
+            input_messages = initial_state["messages"]
             logger.debug(f"   Total messages to pass: {len(input_messages)}")
             logger.debug(f"   Last message type: {type(input_messages[-1]).__name__}")
             logger.debug(f"   Last message content: {input_messages[-1].content[:100] if hasattr(input_messages[-1], 'content') else str(input_messages[-1])[:100]}")
             
-            # Build initial state with merged messages
-            initial_state = {"messages": input_messages}
-            
-            # Add document filters to state if provided
-            if document_filters:
-                initial_state["document_filters"] = document_filters
-                logger.info(f"🎯 Document filters added to state: {document_filters}")
+            if self.checkpoint_store is not None:
+                self.checkpoint_store.record_input(thread_id, "start", start_payload)
             
             logger.info(f"🚀 Starting graph execution with thread_id: {thread_id}")
             
@@ -2311,10 +2490,14 @@ Provide verification results:
             # Invoke graph with properly merged state
             # This ensures all nodes receive the complete message history including the new query
             logger.info(f"🚀 Invoking graph with {len(initial_state['messages'])} messages...")
-            final_response = self.graph.invoke(
-                initial_state,
-                config=config
-            )
+            token = _active_thread.set(thread_id)
+            try:
+                final_response = self.graph.invoke(
+                    initial_state,
+                    config=config
+                )
+            finally:
+                _active_thread.reset(token)
             
             logger.info(f"✅ Graph execution completed")
             logger.debug(f"   Final response keys: {list(final_response.keys()) if isinstance(final_response, dict) else 'not a dict'}")
@@ -2409,6 +2592,9 @@ Provide verification results:
                 config["run_id"] = parent_run_id
                 logger.info(f"🔗 Linking to parent run_id: {parent_run_id}")
             
+            # Durable checkpoints: rebuild the thread if this process restarted since execute()
+            self._restore_thread(config)
+            
             # Add human input if provided
             if human_input:
                 logger.info(f"👤 Human input received: '{human_input}'")
@@ -2439,15 +2625,22 @@ Provide verification results:
             else:
                 logger.warning("⚠️ Resume called without human input")
             
+            if self.checkpoint_store is not None:
+                self.checkpoint_store.record_input(thread_id, "resume", human_input)
+            
             # Resume execution
             final_response = None
             event_count = 0
-            for event in self.graph.stream(None, config, stream_mode="values"):
-                event_count += 1
-                final_response = event
-                logger.info(f"📊 Resume stream event #{event_count}: {list(event.keys()) if isinstance(event, dict) else type(event)}")
-                if isinstance(event, dict) and "messages" in event:
-                    logger.info(f"   Messages in event: {len(event['messages'])} total")
+            token = _active_thread.set(thread_id)
+            try:
+                for event in self.graph.stream(None, config, stream_mode="values"):
+                    event_count += 1
+                    final_response = event
+                    logger.info(f"📊 Resume stream event #{event_count}: {list(event.keys()) if isinstance(event, dict) else type(event)}")
+                    if isinstance(event, dict) and "messages" in event:
+                        logger.info(f"   Messages in event: {len(event['messages'])} total")
+            finally:
+                _active_thread.reset(token)
             
             logger.info(f"✅ Resume stream completed - {event_count} events processed")
             
@@ -15,9 +15,13 @@ Status: US-RESEARCH-001 Implementation
 
 import os
 import json
+import time
 import asyncio
 import logging
 import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Any, Optional, Union
 from pathlib import Path
@@ -39,6 +43,7 @@ except ImportError:
 # Core imports
 from agents.core.enhanced_base_agent import EnhancedBaseAgent
 from agents.core.base_agent import AgentConfig
+from agents.research.local_knowledge_index import LocalKnowledgeIndex
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -169,7 +174,9 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
         self.research_db_path = self.project_root / "data" / "research_cache.db"
         self.research_db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Initialize research databases
+        # Initialize research databases (one pooled connection for the agent)
+        self._db_lock = threading.RLock()
+        self._db_conn: Optional[sqlite3.Connection] = None
         self._init_research_database()
         
         # Research capabilities
@@ -181,10 +188,17 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
         self.max_concurrent_searches = 3
         self.confidence_threshold = 0.7
         
-        # Research findings storage
-        self.research_cache: Dict[str, ResearchResult] = {}
+        # Per-source timeouts (seconds); sources run concurrently
+        self.source_timeouts = {"domain": 10.0, "local_knowledge": 30.0, "web_search": 30.0}
+        
+        # Research findings storage: in-memory LRU in front of the SQLite cache
+        self.research_cache: "OrderedDict[str, ResearchResult]" = OrderedDict()
+        self.research_cache_size = 256
         self.active_queries: Dict[str, ResearchQuery] = {}
         
+        # Persistent path/content index for local knowledge research
+        self.local_index = LocalKnowledgeIndex(self.project_root, self.research_db_path)
+        
         logger.info("✅ Comprehensive Research Agent initialized")
         logger.info(f"📂 Research database: {self.research_db_path}")
         logger.info(f"🌐 Web search available: {self.web_search_enabled}")
@@ -218,9 +232,26 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
             # No event loop exists, create one
             return asyncio.run(self.execute(task))
     
+    def _connection(self) -> sqlite3.Connection:
+        """Pooled SQLite connection shared by all cache operations (use under ``_db_lock``)."""
+        if self._db_conn is None:
+            self._db_conn = sqlite3.connect(str(self.research_db_path), check_same_thread=False)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+        return self._db_conn
+    
+    def close(self):
+        """Close the pooled database connection and the local knowledge index."""
+        with self._db_lock:
+            if self._db_conn is not None:
+                self._db_conn.close()
+                self._db_conn = None
+        self.local_index.close()
+    
     def _init_research_database(self):
         """Initialize SQLite database for research caching."""
-        with sqlite3.connect(self.research_db_path) as conn:
+        with self._db_lock:
+            conn = self._connection()
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS research_queries (
                     query_id TEXT PRIMARY KEY,
@@ -417,24 +448,28 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
         sources = []
         confidence_scores = []
         
-        # 1. Domain-specific research
-        domain_findings = await self._research_domain_specific(query)
-        findings.update(domain_findings["findings"])
-        sources.extend(domain_findings["sources"])
-        confidence_scores.append(domain_findings["confidence"])
-        
-        # 2. Local knowledge base research
-        local_findings = await self._research_local_knowledge(query)
-        findings.update(local_findings["findings"])
-        sources.extend(local_findings["sources"])
-        confidence_scores.append(local_findings["confidence"])
-        
-        # 3. Web search research (if enabled)
+        # 1-3. Domain-specific, local knowledge and web research run concurrently,
+        # so latency is the slowest source rather than the sum of all sources
+        source_tasks = {
+            "domain": self._research_domain_specific(query),
+            "local_knowledge": self._research_local_knowledge(query),
+        }
         if use_web_search and self.web_search_enabled:
-            web_findings = await self._research_web_search(query)
-            findings.update(web_findings["findings"])
-            sources.extend(web_findings["sources"])
-            confidence_scores.append(web_findings["confidence"])
+            source_tasks["web_search"] = self._research_web_search(query)
+        
+        source_results = await asyncio.gather(*(
+            self._run_research_source(name, task) for name, task in source_tasks.items()
+        ))
+        
+        source_timings = {}
+        source_errors = {}
+        for name, (source_findings, elapsed, error) in zip(source_tasks, source_results):
+            findings.update(source_findings["findings"])
+            sources.extend(source_findings["sources"])
+            confidence_scores.append(source_findings["confidence"])
+            source_timings[name] = round(elapsed, 4)
+            if error:
+                source_errors[name] = error
         
         # 4. Cross-reference validation
         validation_score = await self._validate_research_findings(findings, sources)
@@ -460,12 +495,27 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
                 "domain_specialist": True,
                 "local_knowledge": True,
                 "web_search": use_web_search and self.web_search_enabled,
-                "validation_performed": True
+                "validation_performed": True,
+                "source_timings": source_timings,
+                "source_errors": source_errors
             }
         )
         
         return result
     
+    async def _run_research_source(self, name: str, task) -> Tuple[Dict[str, Any], float, Optional[str]]:
+        """Await one research source under its timeout; failures yield empty findings."""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(task, timeout=self.source_timeouts.get(name))
+            return result, time.perf_counter() - started, None
+        except asyncio.TimeoutError:
+            error = f"timed out after {self.source_timeouts.get(name)}s"
+        except Exception as e:
+            error = str(e)
+        logger.warning(f"⚠️ Research source '{name}' failed: {error}")
+        return {"findings": {}, "sources": [], "confidence": 0.0}, time.perf_counter() - started, error
+    
     async def _research_domain_specific(self, query: ResearchQuery) -> Dict[str, Any]:
         """Perform domain-specific research using specialized knowledge."""
         
@@ -495,6 +545,11 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
     
     async def _research_local_knowledge(self, query: ResearchQuery) -> Dict[str, Any]:
         """Research using local knowledge base and documentation."""
+        # Index refresh touches the file system; keep it off the event loop
+        return await asyncio.to_thread(self._collect_local_knowledge, query)
+    
+    def _collect_local_knowledge(self, query: ResearchQuery) -> Dict[str, Any]:
+        """Local knowledge findings served from the path/content index."""
         
         findings = {
             "local_knowledge": {
@@ -564,17 +619,23 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
         return hashlib.md5(content.encode()).hexdigest()
     
     def _get_cached_result(self, query_id: str) -> Optional[ResearchResult]:
-        """Get cached research result."""
+        """Get cached research result (in-memory LRU first, then SQLite)."""
+        with self._db_lock:
+            cached = self.research_cache.get(query_id)
+            if cached is not None:
+                self.research_cache.move_to_end(query_id)
+                return replace(cached)
+        
         try:
-            with sqlite3.connect(self.research_db_path) as conn:
-                cursor = conn.execute(
+            with self._db_lock:
+                cursor = self._connection().execute(
                     "SELECT * FROM research_results WHERE query_id = ?",
                     (query_id,)
                 )
                 row = cursor.fetchone()
                 
                 if row:
-                    return ResearchResult(
+                    result = ResearchResult(
                         query_id=row[0],
                         domain=ResearchDomain(row[1]),
                         status=ResearchStatus(row[2]),
@@ -586,11 +647,20 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
                         expires_at=row[8],
                         metadata=json.loads(row[9]) if row[9] else {}
                     )
+                    self._remember_result(result)
+                    return replace(result)
         except Exception as e:
             logger.warning(f"⚠️ Cache lookup failed: {e}")
         
         return None
     
+    def _remember_result(self, result: ResearchResult):
+        """Put a result in the in-memory LRU (call under ``_db_lock``)."""
+        self.research_cache[result.query_id] = result
+        self.research_cache.move_to_end(result.query_id)
+        while len(self.research_cache) > self.research_cache_size:
+            self.research_cache.popitem(last=False)
+    
     def _is_result_expired(self, result: ResearchResult) -> bool:
         """Check if research result has expired."""
         if not result.expires_at:
@@ -603,9 +673,11 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
             return True
     
     def _cache_result(self, result: ResearchResult):
-        """Cache research result to database."""
+        """Cache research result to the LRU and the database."""
         try:
-            with sqlite3.connect(self.research_db_path) as conn:
+            with self._db_lock:
+                self._remember_result(replace(result))
+                conn = self._connection()
                 conn.execute("""
                     INSERT OR REPLACE INTO research_results 
                     (query_id, domain, status, findings, sources, confidence_score, 
@@ -630,7 +702,8 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
     def _save_query_to_db(self, query: ResearchQuery):
         """Save research query to database."""
         try:
-            with sqlite3.connect(self.research_db_path) as conn:
+            with self._db_lock:
+                conn = self._connection()
                 conn.execute("""
                     INSERT OR REPLACE INTO research_queries 
                     (query_id, domain, query_text, priority, context, requested_by, 
@@ -654,7 +727,8 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
     def get_research_recommendations(self, domain: Optional[ResearchDomain] = None) -> List[ResearchRecommendation]:
         """Get research-based recommendations."""
         try:
-            with sqlite3.connect(self.research_db_path) as conn:
+            with self._db_lock:
+                conn = self._connection()
                 if domain:
                     cursor = conn.execute(
                         "SELECT * FROM research_recommendations WHERE research_evidence LIKE ?",
@@ -735,62 +809,29 @@ class ComprehensiveResearchAgent(EnhancedBaseAgent):
     
     def _scan_project_documentation(self, query: str) -> List[Dict[str, str]]:
         """Scan project documentation for relevant information."""
-        docs_dir = self.project_root / "docs"
-        relevant_docs = []
-        
-        if docs_dir.exists():
-            for doc_file in docs_dir.rglob("*.md"):
-                if self._is_document_relevant(doc_file, query):
-                    relevant_docs.append({
-                        "file": str(doc_file),
-                        "type": "documentation",
-                        "relevance": "high"
-                    })
-        
-        return relevant_docs
+        return [
+            {
+                "file": doc_file,
+                "type": "documentation",
+                "relevance": "high"
+            }
+            for doc_file in self.local_index.relevant_documents(query)
+        ]
     
     def _find_existing_implementations(self, query: ResearchQuery) -> List[Dict[str, str]]:
         """Find existing implementations related to the query."""
-        implementations = []
-        
-        # Search for relevant Python files
-        for py_file in self.project_root.rglob("*.py"):
-            if self._is_file_relevant(py_file, query.query_text):
-                implementations.append({
-                    "file": str(py_file),
-                    "type": "implementation",
-                    "domain": query.domain.value
-                })
-        
-        return implementations
+        return [
+            {
+                "file": py_file,
+                "type": "implementation",
+                "domain": query.domain.value
+            }
+            for py_file in self.local_index.files_matching(query.query_text, suffix=".py", min_word_length=3)
+        ]
     
     def _find_related_files(self, query: str) -> List[str]:
         """Find files related to the research query."""
-        related_files = []
-        query_words = query.lower().split()
-        
-        for file_path in self.project_root.rglob("*"):
-            if file_path.is_file():
-                file_name_lower = file_path.name.lower()
-                if any(word in file_name_lower for word in query_words):
-                    related_files.append(str(file_path))
-        
-        return related_files[:10]  # Limit to 10 most relevant
-    
-    def _is_document_relevant(self, doc_path: Path, query: str) -> bool:
-        """Check if document is relevant to query."""
-        try:
-            content = doc_path.read_text(encoding='utf-8').lower()
-            query_words = query.lower().split()
-            return any(word in content for word in query_words if len(word) > 3)
-        except:
-            return False
-    
-    def _is_file_relevant(self, file_path: Path, query: str) -> bool:
-        """Check if file is relevant to query."""
-        file_name = file_path.name.lower()
-        query_words = query.lower().split()
-        return any(word in file_name for word in query_words if len(word) > 3)
+        return self.local_index.files_matching(query, limit=10)  # Limit to 10 most relevant
     
     async def _validate_research_findings(self, findings: Dict[str, Any], sources: List[Dict[str, str]]) -> float:
         """Validate research findings across sources."""
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Local Knowledge Index - Persistent Path/Content Index for Research
+==================================================================
+
+Serves the local-knowledge source of ComprehensiveResearchAgent without
+walking and reading the project tree for every query.
+
+- File paths from one pruned directory walk, redone at most every
+  ``refresh_interval`` seconds
+- Documentation text (``docs/**/*.md``) kept lowercased in memory and
+  persisted in SQLite; a document is only re-read when its mtime/size change
+- Queries (relevant docs, implementations, related files) are pure lookups
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Directories never worth indexing
+IGNORED_DIRECTORIES = {
+    ".git", "__pycache__", ".pytest_cache", ".mypy_cache", "node_modules",
+    ".venv", "venv", ".tox", ".idea", ".vscode"
+}
+
+
+class LocalKnowledgeIndex:
+    """Path index of a project plus lowercased documentation contents."""
+
+    def __init__(self, project_root: Path, db_path: Optional[Path] = None,
+                 docs_dir: str = "docs", refresh_interval: float = 30.0):
+        """
+        Initialize index.
+
+        Args:
+            project_root: Root directory to index
+            db_path: SQLite file persisting documentation contents
+            docs_dir: Documentation directory (relative to the root) whose
+                Markdown files are searched by content
+            refresh_interval: Seconds between tree walks; 0 walks on every query
+        """
+        self.project_root = Path(project_root)
+        self.docs_root = self.project_root / docs_dir
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.RLock()
+        self._files: List[Path] = []
+        self._docs: Dict[str, Tuple[int, int, str]] = {}  # path -> (mtime_ns, size, text)
+        self._refreshed_at: Optional[float] = None
+        self.documents_read = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS local_knowledge_docs (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    content TEXT NOT NULL
+                )
+            """)
+            self._conn.commit()
+            for path, mtime_ns, size, content in self._conn.execute(
+                "SELECT path, mtime_ns, size, content FROM local_knowledge_docs"
+            ):
+                self._docs[path] = (mtime_ns, size, content)
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> None:
+        """Re-walk the tree if stale; re-read only docs whose mtime/size changed."""
+        with self._lock:
+            now = time.monotonic()
+            if (not force and self._refreshed_at is not None
+                    and now - self._refreshed_at < self.refresh_interval):
+                return
+
+            files: List[Path] = []
+            docs_seen: Dict[str, os.stat_result] = {}
+            docs_prefix = str(self.docs_root) + os.sep
+
+            for directory, dirnames, filenames in os.walk(self.project_root):
+                dirnames[:] = sorted(d for d in dirnames if d not in IGNORED_DIRECTORIES)
+                for filename in sorted(filenames):
+                    file_path = Path(directory, filename)
+                    files.append(file_path)
+                    path = str(file_path)
+                    if filename.endswith(".md") and path.startswith(docs_prefix):
+                        try:
+                            docs_seen[path] = os.stat(path)
+                        except OSError:
+                            continue
+
+            changed = []
+            for path, stat in docs_seen.items():
+                cached = self._docs.get(path)
+                if cached is None or cached[0] != stat.st_mtime_ns or cached[1] != stat.st_size:
+                    try:
+                        text = Path(path).read_text(encoding='utf-8').lower()
+                    except (OSError, UnicodeDecodeError):
+                        text = ""
+                    self._docs[path] = (stat.st_mtime_ns, stat.st_size, text)
+                    changed.append(path)
+                    self.documents_read += 1
+
+            removed = [path for path in self._docs if path not in docs_seen]
+            for path in removed:
+                del self._docs[path]
+
+            self._persist(changed, removed)
+            self._files = files
+            self._refreshed_at = now
+            if changed or removed:
+                logger.info(f"📚 Local knowledge index: {len(changed)} docs updated, {len(removed)} removed")
+
+    def _persist(self, changed: List[str], removed: List[str]) -> None:
+        if self._conn is None or not (changed or removed):
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO local_knowledge_docs (path, mtime_ns, size, content) VALUES (?, ?, ?, ?)",
+                [(path, *self._docs[path]) for path in changed]
+            )
+            self._conn.executemany("DELETE FROM local_knowledge_docs WHERE path = ?",
+                                   [(path,) for path in removed])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def relevant_documents(self, query: str) -> List[str]:
+        """Docs containing any query word longer than three characters."""
+        self.refresh()
+        words = [word for word in query.lower().split() if len(word) > 3]
+        with self._lock:
+            return [path for path, (_, _, text) in sorted(self._docs.items())
+                    if any(word in text for word in words)]
+
+    def files_matching(self, query: str, suffix: Optional[str] = None,
+                       min_word_length: int = 0, limit: Optional[int] = None) -> List[str]:
+        """Files whose name contains a query word, optionally filtered by suffix."""
+        self.refresh()
+        words = [word for word in query.lower().split() if len(word) > min_word_length]
+        matches = []
+        if not words:
+            return matches
+        with self._lock:
+            for path in self._files:
+                if suffix is not None and path.suffix != suffix:
+                    continue
+                name = path.name.lower()
+                if any(word in name for word in words):
+                    matches.append(str(path))
+                    if limit is not None and len(matches) >= limit:
+                        break
+        return matches
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
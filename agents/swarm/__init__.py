@@ -9,17 +9,21 @@ Components:
 - SwarmCoordinator: Orchestrates agent swarms
 - Specialized Agents: Product, Development, Quality, Testing, Release agents
 - Workflow Management: Complete workflow execution and monitoring
+- WorkStealingScheduler: Dependency-aware queue idle agents pull tasks from
 
 Author: AI Development Agent
 Created: 2025-01-02 (US-MCP-001 Phase 3)
 """
 
-from .swarm_coordinator import SwarmCoordinator, create_swarm_coordinator, SwarmWorkflow, SwarmTask, AgentRole
+from .swarm_coordinator import SwarmCoordinator, create_swarm_coordinator, SwarmWorkflow, SwarmTask, AgentRole, ExecutionMode
+from .work_stealing import WorkStealingScheduler
 
 __all__ = [
     'SwarmCoordinator', 
     'create_swarm_coordinator', 
     'SwarmWorkflow', 
     'SwarmTask', 
-    'AgentRole'
+    'AgentRole',
+    'ExecutionMode',
+    'WorkStealingScheduler'
 ]
@@ -54,6 +54,8 @@ except ImportError as e:
     print(f"⚠️ Base agent components not available: {e}")
     BASE_AGENT_AVAILABLE = False
 
+from agents.swarm.work_stealing import WorkStealingScheduler
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -79,6 +81,12 @@ class AgentRole(Enum):
     RELEASE_AGENT = "release_agent"
 
 
+class ExecutionMode(Enum):
+    """How workflow tasks are executed."""
+    SEQUENTIAL = "sequential"        # Tasks assigned up front, awaited one by one
+    WORK_STEALING = "work_stealing"  # Idle agents pull ready tasks concurrently
+
+
 class TaskPriority(Enum):
     """Task priority levels."""
     CRITICAL = 1
@@ -157,16 +165,25 @@ class SwarmCoordinator(EnhancedBaseAgent, MCPAgentMixin if BASE_AGENT_AVAILABLE
     using MCP tools for coordination and communication.
     """
     
-    def __init__(self, config: AgentConfig, gemini_client=None):
+    def __init__(self, config: AgentConfig, gemini_client=None,
+                 execution_mode: ExecutionMode = ExecutionMode.WORK_STEALING,
+                 max_concurrent_per_agent: int = 1):
         """
         Initialize swarm coordinator.
         
         Args:
             config: Agent configuration
             gemini_client: Gemini client instance
+            execution_mode: Sequential or work-stealing task execution
+            max_concurrent_per_agent: Tasks each agent may run at once (work stealing)
         """
         super().__init__(config, gemini_client)
         
+        # Execution strategy
+        self.execution_mode = execution_mode
+        self.max_concurrent_per_agent = max_concurrent_per_agent
+        self.active_scheduler: Optional[WorkStealingScheduler] = None
+        
         # Swarm management
         self.swarm_state = SwarmState.INITIALIZING
         self.swarm_agents: Dict[str, SwarmAgent] = {}
@@ -388,11 +405,15 @@ class SwarmCoordinator(EnhancedBaseAgent, MCPAgentMixin if BASE_AGENT_AVAILABLE
             self.active_workflows[workflow.workflow_id] = workflow
             self.swarm_state = SwarmState.EXECUTING
             
-            # Phase 1: Task Planning and Assignment
-            await self._plan_and_assign_tasks(workflow)
-            
-            # Phase 2: Execute Tasks
-            execution_results = await self._execute_workflow_tasks(workflow)
+            if self.execution_mode == ExecutionMode.WORK_STEALING:
+                # Phase 1+2: Agents pull ready tasks from a dependency-aware queue
+                execution_results = await self._execute_workflow_tasks_work_stealing(workflow)
+            else:
+                # Phase 1: Task Planning and Assignment
+                await self._plan_and_assign_tasks(workflow)
+                
+                # Phase 2: Execute Tasks
+                execution_results = await self._execute_workflow_tasks(workflow)
             
             # Phase 3: Validate and Complete
             completion_results = await self._complete_workflow(workflow)
@@ -503,6 +524,59 @@ class SwarmCoordinator(EnhancedBaseAgent, MCPAgentMixin if BASE_AGENT_AVAILABLE
         
         return execution_results
     
+    async def _execute_workflow_tasks_work_stealing(self, workflow: SwarmWorkflow) -> Dict[str, Any]:
+        """Execute workflow tasks with idle agents pulling ready tasks concurrently."""
+        logger.info(
+            f"⚡ Executing workflow tasks (work stealing, {len(self.swarm_agents)} agents "
+            f"x {self.max_concurrent_per_agent} slots)..."
+        )
+        
+        scheduler = WorkStealingScheduler(
+            list(self.swarm_agents.values()),
+            max_concurrent_per_agent=self.max_concurrent_per_agent
+        )
+        self.active_scheduler = scheduler
+        
+        async def execute_task(task: SwarmTask, agent: SwarmAgent) -> Dict[str, Any]:
+            result = await self._simulate_task_execution(task)
+            self._update_agent_performance(agent, result)
+            return result
+        
+        try:
+            metrics = await scheduler.run(workflow.tasks, execute_task)
+        finally:
+            self.active_scheduler = None
+        
+        self.swarm_metrics['tasks_completed'] += metrics['tasks_completed']
+        self.swarm_metrics['error_count'] += metrics['tasks_failed']
+        self.swarm_metrics['agent_utilization'] = {
+            agent_id: agent_metrics['busy_seconds']
+            for agent_id, agent_metrics in metrics['agents'].items()
+        }
+        
+        return {
+            'tasks_executed': metrics['tasks_completed'] + metrics['tasks_failed'],
+            'tasks_successful': metrics['tasks_completed'],
+            'tasks_failed': metrics['tasks_failed'],
+            'tasks_cancelled': metrics['tasks_cancelled'],
+            'max_parallel_tasks': metrics['max_parallel_tasks'],
+            'agent_performance': metrics['agents']
+        }
+    
+    def _update_agent_performance(self, agent: SwarmAgent, result: Dict[str, Any]):
+        """Update an agent's running performance metrics after a task."""
+        perf = agent.performance_metrics
+        runs = perf.get('tasks_attempted', 0) + 1
+        successes = perf.get('tasks_succeeded', 0) + (1 if result.get('success') else 0)
+        previous_avg = perf.get('average_execution_time', 0.0)
+        
+        perf['tasks_attempted'] = runs
+        perf['tasks_succeeded'] = successes
+        perf['tasks_completed'] = perf.get('tasks_completed', 0) + 1
+        perf['success_rate'] = successes / runs
+        perf['average_execution_time'] = previous_avg + (result.get('execution_time', 0.0) - previous_avg) / runs
+        agent.last_heartbeat = datetime.now()
+    
     async def _simulate_task_execution(self, task: SwarmTask) -> Dict[str, Any]:
         """Simulate task execution using MCP tools."""
         start_time = datetime.now()
@@ -636,6 +710,7 @@ class SwarmCoordinator(EnhancedBaseAgent, MCPAgentMixin if BASE_AGENT_AVAILABLE
                 task_id=task_def.get('id', f"task_{uuid.uuid4().hex[:8]}"),
                 description=task_def.get('description', 'Unknown task'),
                 priority=TaskPriority(task_def.get('priority', 3)),
+                dependencies=task_def.get('dependencies', []),
                 mcp_tools_required=task_def.get('mcp_tools', []),
                 estimated_duration=task_def.get('duration', 30)
             )
@@ -659,6 +734,8 @@ class SwarmCoordinator(EnhancedBaseAgent, MCPAgentMixin if BASE_AGENT_AVAILABLE
             'pending_tasks': len(self.task_queue),
             'completed_tasks': len(self.completed_tasks),
             'swarm_metrics': self.swarm_metrics.copy(),
+            'execution_mode': self.execution_mode.value,
+            'live_execution': self.active_scheduler.get_live_metrics() if self.active_scheduler else None,
             'agent_status': {
                 agent_id: {
                     'role': agent.role.value,
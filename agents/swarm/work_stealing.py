@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Work-Stealing Swarm Execution
+=============================
+
+Dependency-aware task queue from which idle swarm agents pull work.
+
+Instead of assigning every task once at planning time, each agent runs a
+number of worker slots that repeatedly take the highest-priority *ready*
+task whose required MCP tools match the agent's capabilities. A task becomes
+ready once all of its dependencies have completed, so a swarm of N agents
+runs N independent tasks at once.
+
+Features:
+- Capability matching (task.mcp_tools_required ⊆ agent.capabilities)
+- Priority ordering of ready tasks (TaskPriority, then submission order)
+- Per-agent concurrency limits
+- Cancellation of dependents when a task fails
+- Live metrics for monitoring while the workflow runs
+
+Author: AI Development Agent
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class WorkStealingScheduler:
+    """
+    Dependency-aware ready queue shared by all swarm agents.
+
+    Works on ``SwarmTask``/``SwarmAgent`` objects and updates their status
+    fields in place.
+    """
+
+    def __init__(self, agents: List[Any], max_concurrent_per_agent: int = 1):
+        """
+        Initialize scheduler.
+
+        Args:
+            agents: Swarm agents pulling work (need ``agent_id`` and ``capabilities``)
+            max_concurrent_per_agent: Worker slots per agent
+        """
+        if max_concurrent_per_agent < 1:
+            raise ValueError("max_concurrent_per_agent must be at least 1")
+        self.agents = list(agents)
+        self.max_concurrent_per_agent = max_concurrent_per_agent
+
+        self._condition: Optional[asyncio.Condition] = None
+        self._ready: List = []
+        self._tasks: Dict[str, Any] = {}
+        self._order: Dict[str, int] = {}
+        self._waiting_on: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._running: Set[str] = set()
+        self._finished: Set[str] = set()
+
+        self.metrics: Dict[str, Any] = self._empty_metrics()
+
+    def _empty_metrics(self) -> Dict[str, Any]:
+        return {
+            'tasks_total': 0,
+            'tasks_ready': 0,
+            'tasks_running': 0,
+            'tasks_completed': 0,
+            'tasks_failed': 0,
+            'tasks_cancelled': 0,
+            'max_parallel_tasks': 0,
+            'started_at': None,
+            'finished_at': None,
+            'agents': {
+                agent.agent_id: {
+                    'in_flight': 0,
+                    'tasks_completed': 0,
+                    'tasks_failed': 0,
+                    'busy_seconds': 0.0
+                }
+                for agent in self.agents
+            }
+        }
+
+    # ------------------------------------------------------------------
+    # Queue management
+    # ------------------------------------------------------------------
+
+    def _can_run(self, agent: Any, task: Any) -> bool:
+        return set(task.mcp_tools_required).issubset(agent.capabilities)
+
+    def _push_ready(self, task_id: str):
+        task = self._tasks[task_id]
+        heapq.heappush(self._ready, (task.priority.value, self._order[task_id], task_id))
+        task.status = 'ready'
+
+    def _take_ready_for(self, agent: Any) -> Optional[Any]:
+        """Pop the best ready task this agent can run, keeping the others queued."""
+        skipped = []
+        chosen = None
+        while self._ready:
+            entry = heapq.heappop(self._ready)
+            task = self._tasks[entry[2]]
+            if task.task_id in self._finished:
+                continue
+            if self._can_run(agent, task):
+                chosen = task
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(self._ready, entry)
+        return chosen
+
+    def _finish(self, task: Any, status: str, error: Optional[str] = None):
+        """Mark a task finished and release or cancel its dependents."""
+        task.status = status
+        task.completed_at = datetime.now()
+        if error:
+            task.error = error
+        self._finished.add(task.task_id)
+        self.metrics[f'tasks_{status}'] += 1
+
+        for dependent_id in self._dependents.get(task.task_id, []):
+            if dependent_id in self._finished:
+                continue
+            if status == 'completed':
+                waiting = self._waiting_on[dependent_id]
+                waiting.discard(task.task_id)
+                if not waiting:
+                    self._push_ready(dependent_id)
+            else:
+                self._finish(self._tasks[dependent_id], 'cancelled',
+                             f"Dependency '{task.task_id}' {status}")
+
+    def _update_gauges(self):
+        self.metrics['tasks_running'] = len(self._running)
+        self.metrics['tasks_ready'] = sum(
+            1 for _, _, task_id in self._ready if task_id not in self._finished
+        )
+        self.metrics['max_parallel_tasks'] = max(
+            self.metrics['max_parallel_tasks'], len(self._running)
+        )
+
+    def _all_done(self) -> bool:
+        return len(self._finished) == len(self._tasks)
+
+    def get_live_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the current scheduler metrics."""
+        snapshot = dict(self.metrics)
+        snapshot['agents'] = {k: dict(v) for k, v in self.metrics['agents'].items()}
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def run(self, tasks: List[Any],
+                  execute: Callable[[Any, Any], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Run tasks until every task has completed, failed or been cancelled.
+
+        Args:
+            tasks: Swarm tasks (``task_id``, ``dependencies``, ``priority``,
+                ``mcp_tools_required``)
+            execute: Coroutine ``execute(task, agent)`` returning a result dict
+                with a ``success`` flag
+
+        Returns:
+            Final metrics
+        """
+        self._condition = asyncio.Condition()
+        self._ready = []
+        self._tasks = {task.task_id: task for task in tasks}
+        self._order = {task.task_id: index for index, task in enumerate(tasks)}
+        self._running = set()
+        self._finished = set()
+        self._waiting_on = {}
+        self._dependents = {}
+        self.metrics = self._empty_metrics()
+        self.metrics['tasks_total'] = len(tasks)
+        self.metrics['started_at'] = datetime.now().isoformat()
+
+        for task in tasks:
+            self._waiting_on[task.task_id] = set(task.dependencies)
+            for dependency in task.dependencies:
+                self._dependents.setdefault(dependency, []).append(task.task_id)
+
+        for task in tasks:
+            unknown = [d for d in task.dependencies if d not in self._tasks]
+            if task.task_id in self._finished:
+                continue
+            if unknown:
+                self._finish(task, 'failed', f"Unknown dependencies: {unknown}")
+            elif not any(self._can_run(agent, task) for agent in self.agents):
+                self._finish(task, 'failed', "No suitable agent found for task")
+
+        for task in tasks:
+            if task.task_id not in self._finished and not self._waiting_on[task.task_id]:
+                self._push_ready(task.task_id)
+        self._update_gauges()
+
+        workers = [
+            asyncio.ensure_future(self._worker(agent, execute))
+            for agent in self.agents
+            for _ in range(self.max_concurrent_per_agent)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        self.metrics['finished_at'] = datetime.now().isoformat()
+        self._update_gauges()
+        return self.get_live_metrics()
+
+    async def _worker(self, agent: Any, execute: Callable[[Any, Any], Awaitable[Dict[str, Any]]]):
+        """One worker slot of an agent: pull ready tasks until the workflow is done."""
+        agent_metrics = self.metrics['agents'][agent.agent_id]
+
+        while True:
+            async with self._condition:
+                task = None
+                while True:
+                    if self._all_done():
+                        self._condition.notify_all()
+                        return
+                    task = self._take_ready_for(agent)
+                    if task is not None:
+                        break
+                    if not self._running and not self._ready:
+                        # Remaining tasks wait on each other (circular dependencies)
+                        for task_id, pending in self._tasks.items():
+                            if task_id not in self._finished:
+                                self._finish(pending, 'failed', "Unresolvable dependencies")
+                        self._condition.notify_all()
+                        return
+                    await self._condition.wait()
+
+                self._running.add(task.task_id)
+                task.status = 'running'
+                task.started_at = datetime.now()
+                task.assigned_agent = agent.role
+                agent_metrics['in_flight'] += 1
+                agent.status = 'busy'
+                agent.current_task = task.task_id
+                self._update_gauges()
+
+            started = time.perf_counter()
+            try:
+                result = await execute(task, agent)
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            elapsed = time.perf_counter() - started
+
+            async with self._condition:
+                self._running.discard(task.task_id)
+                agent_metrics['in_flight'] -= 1
+                agent_metrics['busy_seconds'] += elapsed
+                if agent_metrics['in_flight'] == 0:
+                    agent.status = 'idle'
+                    agent.current_task = None
+
+                if result.get('success'):
+                    task.result = result
+                    agent_metrics['tasks_completed'] += 1
+                    self._finish(task, 'completed')
+                else:
+                    agent_metrics['tasks_failed'] += 1
+                    self._finish(task, 'failed', result.get('error', 'Unknown error'))
+
+                self._update_gauges()
+                self._condition.notify_all()
@@ -113,6 +113,7 @@ sys.path.insert(0, str(project_root))
 from context.context_engine import ContextEngine
 from models.config import ContextConfig
 from utils.rag.document_loader import DocumentLoader
+from utils.rag.document_catalog import DocumentCatalog, entries_from_documents
 
 # Detect which Qdrant API version we have
 QDRANT_NEW_API = False
@@ -279,7 +280,7 @@ def initialize_rag_engine():
                             st.success(f"✅ Found existing vector database with {doc_count} document chunks")
                             
                             # Use the new load function
-                            st.session_state.indexed_documents = load_documents_from_qdrant()
+                            st.session_state.indexed_documents = load_document_list()
                             
                             if st.session_state.indexed_documents:
                                 st.info(f"📚 Loaded {len(st.session_state.indexed_documents)} documents from persistent storage")
@@ -345,12 +346,12 @@ def main():
                     chunk_count = collection_info.points_count
                     
                     if chunk_count > 0:
-                        # If indexed_documents is empty but Qdrant has data, load from Qdrant
+                        # If indexed_documents is empty but Qdrant has data, load from the catalog
                         if not st.session_state.indexed_documents:
-                            st.session_state.indexed_documents = load_documents_from_qdrant()
+                            st.session_state.indexed_documents = load_document_list()
                         
-                        # Get unique document count from indexed_documents
-                        doc_count = len(st.session_state.indexed_documents)
+                        # Get unique document count from the catalog
+                        doc_count = get_document_catalog().stats()['documents']
                         
                         st.sidebar.success("✅ Vector Store Active")
                         st.sidebar.info(f"📚 {doc_count} documents ({chunk_count} chunks)")
@@ -384,138 +385,113 @@ def main():
         system_settings_page()
 
 
-def load_documents_from_qdrant(show_debug=False):
-    """Load all documents from Qdrant vector database.
+DOCUMENT_PAGE_SIZE = 50
+
+
+def get_document_catalog():
+    """Get the per-document catalog of the active Qdrant collection."""
+    if not st.session_state.rag_engine:
+        return None
+    
+    collection_name = st.session_state.rag_engine.collection_name
+    catalog = st.session_state.get('document_catalog')
+    if catalog is None or catalog.collection != collection_name:
+        catalog = DocumentCatalog(collection=collection_name)
+        st.session_state.document_catalog = catalog
+    return catalog
+
+
+def rebuild_catalog_from_qdrant(show_debug=False):
+    """Rebuild the document catalog from the Qdrant collection.
+    
+    Scrolls metadata payloads only (no vectors, no page content). Needed once
+    for collections indexed before the catalog existed, or to resynchronise.
     
     Args:
         show_debug: If True, show debug information on the UI
+        
+    Returns:
+        Number of documents catalogued
     """
-    if not st.session_state.rag_engine:
-        return []
+    catalog = get_document_catalog()
+    if catalog is None or not st.session_state.rag_engine.qdrant_client:
+        return 0
     
-    if not st.session_state.rag_engine.qdrant_client:
-        return []
+    client = st.session_state.rag_engine.qdrant_client
+    collection_name = st.session_state.rag_engine.collection_name
     
     try:
-        # Check if collection exists
-        collections = st.session_state.rag_engine.qdrant_client.get_collections().collections
-        collection_names = [c.name for c in collections]
-        
-        if st.session_state.rag_engine.collection_name not in collection_names:
+        collections = client.get_collections().collections
+        if collection_name not in [c.name for c in collections]:
             if show_debug:
-                st.info(f"📁 Collection '{st.session_state.rag_engine.collection_name}' does not exist yet.")
-            return []
-        
-        # Get collection info
-        collection_info = st.session_state.rag_engine.qdrant_client.get_collection(
-            st.session_state.rag_engine.collection_name
-        )
+                st.info(f"📁 Collection '{collection_name}' does not exist yet.")
+            catalog.clear()
+            return 0
         
         if show_debug:
-            st.write(f"🔍 Found collection with {collection_info.points_count} chunks")
-        
-        if collection_info.points_count == 0:
-            if show_debug:
-                st.info("📁 Vector database exists but is empty")
-            return []
-        
-        # Scroll through all points to get documents
-        all_points = []
-        offset = None
-        while True:
-            scroll_result = st.session_state.rag_engine.qdrant_client.scroll(
-                collection_name=st.session_state.rag_engine.collection_name,
-                limit=100,
-                offset=offset,
-                with_payload=True
-            )
-            
-            points, offset = scroll_result
-            all_points.extend(points)
-            
-            if offset is None:
-                break
+            points_count = client.get_collection(collection_name).points_count
+            st.write(f"🔍 Rebuilding catalog from {points_count} chunks")
+        
+        def payloads():
+            offset = None
+            while True:
+                points, offset = client.scroll(
+                    collection_name=collection_name,
+                    limit=1000,
+                    offset=offset,
+                    with_payload=["metadata", "source", "file_path", "file_type", "source_type"],
+                    with_vectors=False
+                )
+                for point in points:
+                    yield point.payload
+                if offset is None:
+                    break
         
+        document_count = catalog.rebuild(payloads())
         if show_debug:
-            st.write(f"📊 Loaded {len(all_points)} chunks from database")
-        
-        # Extract unique documents from points
-        documents_dict = {}
-        
-        # Debug: Show first payload structure
-        if all_points and show_debug:
-            st.write(f"🔍 First payload structure: {list(all_points[0].payload.keys())}")
-            if 'metadata' in all_points[0].payload:
-                st.write(f"🔍 Metadata structure: {list(all_points[0].payload['metadata'].keys())}")
-                st.write(f"🔍 Metadata content: {all_points[0].payload['metadata']}")
-            else:
-                st.write(f"🔍 Full payload: {all_points[0].payload}")
-        
-        for point in all_points:
-            if point.payload:
-                # Try different metadata structures
-                source = None
-                metadata = {}
-                
-                if 'metadata' in point.payload:
-                    metadata = point.payload['metadata']
-                    source = metadata.get('source') or metadata.get('file_path')
-                elif 'source' in point.payload:
-                    source = point.payload.get('source')
-                    metadata = point.payload
-                elif 'file_path' in point.payload:
-                    source = point.payload.get('file_path')
-                    metadata = point.payload
-                
-                if source:
-                    if source not in documents_dict:
-                        # Determine file type from metadata
-                        file_type = metadata.get('file_type')
-                        
-                        if show_debug and len(documents_dict) == 0:  # Debug first document only
-                            st.write(f"🔍 Processing first document:")
-                            st.write(f"  - Source: {source}")
-                            st.write(f"  - file_type from metadata: {file_type}")
-                            st.write(f"  - Metadata keys: {list(metadata.keys())}")
-                        
-                        if not file_type:
-                            # Check for source_type (used by website scraper)
-                            source_type = metadata.get('source_type')
-                            if source_type == 'web':
-                                file_type = 'website'
-                                if show_debug and len(documents_dict) == 0:
-                                    st.write(f"  - Detected as website from source_type")
-                            else:
-                                # Try to infer from source/filename
-                                if source.startswith(('http://', 'https://')):
-                                    file_type = 'website'
-                                    if show_debug and len(documents_dict) == 0:
-                                        st.write(f"  - Detected as website from URL pattern")
-                                elif '.' in source:
-                                    file_type = source.rsplit('.', 1)[-1]
-                                    if show_debug and len(documents_dict) == 0:
-                                        st.write(f"  - Detected file extension: {file_type}")
-                                else:
-                                    file_type = 'unknown'
-                                    if show_debug and len(documents_dict) == 0:
-                                        st.write(f"  - Could not determine file type")
-                        
-                        documents_dict[source] = {
-                            'file_name': source,
-                            'file_type': file_type,
-                            'chunk_count': 0,
-                            'success': True
-                        }
-                    documents_dict[source]['chunk_count'] += 1
+            st.write(f"✅ Found {document_count} unique documents")
+        return document_count
         
+    except Exception as e:
         if show_debug:
-            st.write(f"✅ Found {len(documents_dict)} unique documents")
-        
-        return list(documents_dict.values())
+            st.error(f"❌ Error rebuilding document catalog from Qdrant: {e}")
+            import traceback
+            st.error(traceback.format_exc())
+        return 0
+
+
+def load_document_list(show_debug=False):
+    """Load the indexed documents from the document catalog.
+    
+    Reads one row per document instead of scrolling every chunk; the catalog
+    is built from Qdrant only the first time an existing collection is seen.
+    
+    Args:
+        show_debug: If True, show debug information on the UI
+    """
+    catalog = get_document_catalog()
+    if catalog is None:
+        return []
+    
+    try:
+        if catalog.is_empty() and st.session_state.rag_engine.qdrant_client:
+            collection_name = st.session_state.rag_engine.collection_name
+            collections = st.session_state.rag_engine.qdrant_client.get_collections().collections
+            if collection_name in [c.name for c in collections]:
+                points_count = st.session_state.rag_engine.qdrant_client.get_collection(
+                    collection_name
+                ).points_count
+                if points_count:
+                    rebuild_catalog_from_qdrant(show_debug=show_debug)
+        
+        documents = [entry.to_document_info() for entry in catalog.list_documents()]
+        if show_debug:
+            st.write(f"✅ Loaded {len(documents)} documents from catalog")
+        return documents
         
     except Exception as e:
         if show_debug:
-            st.error(f"❌ Error loading documents from Qdrant: {e}")
+            st.error(f"❌ Error loading document catalog: {e}")
             import traceback
             st.error(traceback.format_exc())
         return []
@@ -525,14 +501,16 @@ def document_upload_page():
     """Document upload interface."""
     st.markdown('<div class="sub-header">📤 Document Upload</div>', unsafe_allow_html=True)
     
-    # Load documents from Qdrant to show persisted documents
-    if st.session_state.rag_engine and st.button("🔄 Refresh Document List", help="Load all documents from vector database"):
-        st.session_state.indexed_documents = load_documents_from_qdrant(show_debug=True)
+    # Resynchronise the document catalog with the vector database
+    if st.session_state.rag_engine and st.button("🔄 Refresh Document List", help="Rebuild the document catalog from the vector database"):
+        rebuild_catalog_from_qdrant(show_debug=True)
+        st.session_state.indexed_documents = load_document_list()
+        st.session_state.doc_page_cursors = [None]
         st.rerun()
     
     # Auto-load on first visit if indexed_documents is empty
     if st.session_state.rag_engine and not st.session_state.indexed_documents:
-        st.session_state.indexed_documents = load_documents_from_qdrant()
+        st.session_state.indexed_documents = load_document_list()
     
     # File uploader
     uploaded_files = st.file_uploader(
@@ -549,17 +527,21 @@ def document_upload_page():
         if st.button("🚀 Process Documents", type="primary"):
             process_uploaded_documents(uploaded_files)
     
-    # Display indexed documents with delete option
-    if st.session_state.indexed_documents:
+    # Display indexed documents (paged from the catalog) with delete option
+    catalog = get_document_catalog()
+    catalog_stats = catalog.stats() if catalog else {'documents': 0, 'chunks': 0}
+    if catalog_stats['documents']:
         st.markdown("---")
-        st.markdown(f"### 📚 Indexed Documents ({len(st.session_state.indexed_documents)} files)")
+        st.markdown(f"### 📚 Indexed Documents ({catalog_stats['documents']} files)")
         
         # Show total chunks
-        total_chunks = sum(doc.get('chunk_count', doc.get('document_count', 0)) 
-                          for doc in st.session_state.indexed_documents)
-        st.info(f"🔢 Total chunks in vector database: {total_chunks}")
+        st.info(f"🔢 Total chunks in vector database: {catalog_stats['chunks']}")
         
-        for idx, doc_info in enumerate(st.session_state.indexed_documents):
+        page_cursors = st.session_state.setdefault('doc_page_cursors', [None])
+        page_entries, next_cursor = catalog.page(limit=DOCUMENT_PAGE_SIZE, after=page_cursors[-1])
+        
+        for idx, entry in enumerate(page_entries):
+            doc_info = entry.to_document_info()
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             
             with col1:
@@ -578,6 +560,20 @@ def document_upload_page():
                     delete_document_from_vectorstore(doc_info.get('file_name', 'Unknown'))
                     st.rerun()
         
+        # Page navigation
+        total_pages = -(-catalog_stats['documents'] // DOCUMENT_PAGE_SIZE)
+        nav_prev, nav_info, nav_next = st.columns([1, 2, 1])
+        with nav_prev:
+            if len(page_cursors) > 1 and st.button("⬅️ Previous", key="doc_page_prev"):
+                page_cursors.pop()
+                st.rerun()
+        with nav_info:
+            st.caption(f"Page {len(page_cursors)} of {total_pages}")
+        with nav_next:
+            if next_cursor and st.button("Next ➡️", key="doc_page_next"):
+                page_cursors.append(next_cursor)
+                st.rerun()
+        
         if st.button("🗑️ Clear All Documents"):
             if st.session_state.rag_engine and st.session_state.rag_engine.qdrant_client:
                 try:
@@ -613,10 +609,13 @@ def document_upload_page():
                             vectors_config=VectorParams(size=3072, distance=Distance.COSINE)
                         )
                     
-                    # Clear vector store and documents
+                    # Clear vector store, catalog and documents
                     st.session_state.rag_engine.vector_store = None
                     st.session_state.rag_engine.documents = []
                     st.session_state.indexed_documents = []
+                    st.session_state.doc_page_cursors = [None]
+                    if catalog:
+                        catalog.clear()
                     
                     st.success("✅ All documents cleared - empty collection recreated")
                     st.rerun()
@@ -632,24 +631,26 @@ def delete_document_from_vectorstore(filename: str):
     """Delete a document from vector store by metadata."""
     try:
         if st.session_state.rag_engine:
-            # Delete from Qdrant by metadata
+            # Delete from Qdrant by metadata; the catalog row goes only if that succeeds
             if st.session_state.rag_engine.qdrant_client:
                 from qdrant_client.models import Filter, FieldCondition, MatchValue
                 
-                st.session_state.rag_engine.qdrant_client.delete(
-                    collection_name=st.session_state.rag_engine.collection_name,
-                    points_selector=Filter(
-                        must=[
-                            FieldCondition(
-                                key="metadata.source",
-                                match=MatchValue(value=filename)
-                            )
-                        ]
+                with get_document_catalog().deleting(filename):
+                    st.session_state.rag_engine.qdrant_client.delete(
+                        collection_name=st.session_state.rag_engine.collection_name,
+                        points_selector=Filter(
+                            must=[
+                                FieldCondition(
+                                    key="metadata.source",
+                                    match=MatchValue(value=filename)
+                                )
+                            ]
+                        )
                     )
-                )
             
-            # Reload documents from Qdrant to refresh the list
-            st.session_state.indexed_documents = load_documents_from_qdrant()
+            # Refresh the list from the catalog
+            st.session_state.indexed_documents = load_document_list()
+            st.session_state.doc_page_cursors = [None]
             
             st.success(f"✅ Deleted {filename} from vector database")
     except Exception as e:
@@ -836,7 +837,9 @@ def process_uploaded_documents(uploaded_files):
             new_docs = [r.get('documents', []) for r in results if r['success']]
             new_docs_flat = [doc for docs in new_docs for doc in docs]
             if new_docs_flat:
-                st.session_state.rag_engine.vector_store.add_documents(new_docs_flat)
+                file_sizes = {str(temp_dir / f.name): f.size for f in uploaded_files}
+                with get_document_catalog().ingesting(entries_from_documents(new_docs_flat, file_sizes)):
+                    st.session_state.rag_engine.vector_store.add_documents(new_docs_flat)
         except Exception as e:
             st.error(f"❌ Failed to update vector store: {e}")
     
@@ -849,8 +852,8 @@ def process_uploaded_documents(uploaded_files):
     
     if successful > 0:
         st.success(f"✅ Successfully processed {successful}/{total} documents")
-        # Reload documents from Qdrant to show updated list
-        st.session_state.indexed_documents = load_documents_from_qdrant()
+        # Reload documents from the catalog to show updated list
+        st.session_state.indexed_documents = load_document_list()
     if failed > 0:
         st.error(f"❌ Failed to process {failed}/{total} documents")
 
@@ -859,14 +862,15 @@ def website_scraping_page():
     """Website scraping interface."""
     st.markdown('<div class="sub-header">🌐 Website Scraping</div>', unsafe_allow_html=True)
     
-    # Load documents from Qdrant to show persisted websites
-    if st.session_state.rag_engine and st.button("🔄 Refresh Website List", help="Load all websites from vector database"):
-        st.session_state.indexed_documents = load_documents_from_qdrant(show_debug=True)
+    # Resynchronise the document catalog with the vector database
+    if st.session_state.rag_engine and st.button("🔄 Refresh Website List", help="Rebuild the document catalog from the vector database"):
+        rebuild_catalog_from_qdrant(show_debug=True)
+        st.session_state.indexed_documents = load_document_list()
         st.rerun()
     
     # Auto-load on first visit if indexed_documents is empty
     if st.session_state.rag_engine and not st.session_state.indexed_documents:
-        st.session_state.indexed_documents = load_documents_from_qdrant()
+        st.session_state.indexed_documents = load_document_list()
     
     # URL input
     url = st.text_input(
@@ -1132,11 +1136,12 @@ def website_scraping_page():
                                         doc.metadata = {'file_type': 'website', 'source_type': 'web'}
                                     enriched_docs.append(doc)
                                 
-                                # Add enriched documents to vector store
-                                st.session_state.rag_engine.vector_store.add_documents(enriched_docs)
+                                # Add enriched documents to vector store (and the catalog on success)
+                                with get_document_catalog().ingesting(entries_from_documents(enriched_docs)):
+                                    st.session_state.rag_engine.vector_store.add_documents(enriched_docs)
                                 
-                                # Reload indexed documents from Qdrant to reflect the new website
-                                st.session_state.indexed_documents = load_documents_from_qdrant()
+                                # Reload indexed documents from the catalog to reflect the new website
+                                st.session_state.indexed_documents = load_document_list()
                                 
                             except Exception as e:
                                 st.error(f"❌ Failed to update vector store: {e}")
@@ -1781,7 +1786,7 @@ All modes use persistent thread_id for stateful conversations and LangSmith trac
     st.markdown("### 📚 Document Scope")
     
     # Load available documents
-    available_docs = load_documents_from_qdrant(show_debug=False)
+    available_docs = load_document_list(show_debug=False)
     
     if available_docs:
         doc_col1, doc_col2 = st.columns([3, 1])
@@ -2498,7 +2503,7 @@ def testing_evaluation_page():
         
         # Document Scope (same as Agent Chat)
         st.markdown("### 📚 Document Scope")
-        available_docs = load_documents_from_qdrant(show_debug=False)
+        available_docs = load_document_list(show_debug=False)
         
         if available_docs:
             doc_col1, doc_col2 = st.columns([3, 1])
@@ -3103,23 +3108,35 @@ def display_comparison_results(results: Dict):
 
 
 def run_golden_batch_test(queries: List[Dict]) -> List[Dict]:
-    """Run batch test on golden dataset."""
-    results = []
+    """Run batch test on golden dataset through the headless evaluator."""
+    from utils.rag.golden_evaluation import GoldenEvaluator
+    
+    output_path = Path("reports") / f"golden_evaluation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    evaluator = GoldenEvaluator(
+        context_engine=st.session_state.rag_engine,
+        concurrency=4,
+        output_path=str(output_path)
+    )
     
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    golden_results = run_async(evaluator.arun(queries))
+    st.session_state.golden_summary = evaluator.summary
+    st.caption(f"📄 Results written to {output_path}")
     
-    for idx, query_item in enumerate(queries):
-        status_text.text(f"Testing query {idx+1}/{len(queries)}...")
-        result = run_transparent_test(query_item['query'], False, False, False)
-        results.append({
+    return [
+        {
             'query_item': query_item,
-            'result': result
-        })
-        progress_bar.progress((idx + 1) / len(queries))
-    
-    status_text.text("✅ Batch testing complete!")
-    return results
+            'result': {
+                'success': result.success,
+                'error': result.error,
+                'response': result.response,
+                'retrieval_time': result.total_seconds,
+                'results_count': result.results_count,
+                'stage_seconds': result.stage_seconds,
+                'quality': result.quality
+            }
+        }
+        for query_item, result in zip(queries, golden_results)
+    ]
 
 
 def display_batch_results(results: List[Dict]):
@@ -3142,6 +3159,15 @@ def display_batch_results(results: List[Dict]):
     with col3:
         st.metric("Avg Time", f"{avg_time*1000:.0f}ms")
     
+    summary = st.session_state.get('golden_summary')
+    if summary and summary.get('total') == total:
+        st.markdown(
+            f"**Latency:** p50 {summary['latency']['p50_ms']:.0f}ms · "
+            f"p95 {summary['latency']['p95_ms']:.0f}ms"
+        )
+        for stage, stats in summary['stages'].items():
+            st.text(f"{stage}: p50 {stats['p50_ms']:.0f}ms · p95 {stats['p95_ms']:.0f}ms")
+    
     # Individual results
     for idx, item in enumerate(results):
         with st.expander(f"Result #{idx+1}: {item['query_item']['query'][:50]}..."):
@@ -9,6 +9,8 @@ with quality gates, reporting, and zero manual intervention.
 Features:
 - Automated test execution on commits
 - Parallel test execution for performance
+- Duration-aware file-level sharding across N pytest workers
+- Change-based test selection from the project import graph
 - Quality gates and failure blocking
 - Comprehensive reporting and metrics
 - Integration with git workflow
@@ -31,6 +33,9 @@ import sqlite3
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from utils.automated_testing.impact_analyzer import ChangeImpactAnalyzer
+from utils.automated_testing.shard_scheduler import CategoryOutcome, FileDurationStore, ShardScheduler
+
 @dataclass
 class TestResult:
     """Represents the result of a test execution."""
@@ -58,11 +63,28 @@ class PipelineResult:
 class AutomatedTestingPipeline:
     """Comprehensive automated testing pipeline."""
     
-    def __init__(self):
-        """Initialize the testing pipeline."""
+    def __init__(self, sharded: bool = True, workers: Optional[int] = None):
+        """
+        Initialize the testing pipeline.
+        
+        Args:
+            sharded: Split categories into file-level shards scheduled longest
+                first; False keeps category-level scheduling
+            workers: Concurrent pytest processes for sharded runs (default: CPU count)
+        """
         self.project_root = project_root
         self.results_dir = self.project_root / "test_results"
         self.results_dir.mkdir(exist_ok=True)
+        self.results_db_path = self.project_root / "utils" / "test_pipeline_results.db"
+        self.sharded = sharded
+        self.workers = workers
+        
+        # Test files to run; None runs every category in full
+        self.selected_tests: Optional[set] = None
+        
+        # Use Anaconda Python for consistency where it is installed
+        anaconda_python = Path("C:/App/Anaconda/python.exe")
+        self.python_executable = str(anaconda_python) if anaconda_python.exists() else sys.executable
         
         # Test categories with quality gates
         self.test_categories = {
@@ -290,16 +312,78 @@ class AutomatedTestingPipeline:
         
         return results
     
+    def select_affected_tests(self, changed_files: List[str]) -> Optional[set]:
+        """Restrict the next run to the test files the changed files can affect."""
+        selected = ChangeImpactAnalyzer(self.project_root).affected_tests(changed_files)
+        if selected is None:
+            print(f"🔁 {len(changed_files)} changed files need the full test suite")
+            self.selected_tests = None
+        else:
+            print(f"🎯 {len(changed_files)} changed files affect {len(selected)} test files")
+            self.selected_tests = set(selected)
+        return self.selected_tests
+    
+    def execute_sharded_tests(self, categories: List[str]) -> List[TestResult]:
+        """Execute categories as file-level shards on N workers, longest shard first."""
+        duration_store = FileDurationStore(str(self.results_db_path))
+        try:
+            scheduler = ShardScheduler(
+                self.project_root, duration_store,
+                workers=self.workers, python_executable=self.python_executable
+            )
+            shards = scheduler.plan(
+                {category: self.test_categories[category] for category in categories},
+                only=self.selected_tests
+            )
+            print(f"\n🧩 Executing {len(categories)} test categories as {len(shards)} shards "
+                  f"on {scheduler.workers} workers...")
+            outcomes = scheduler.aggregate(scheduler.run(shards))
+        finally:
+            duration_store.close()
+        
+        results = []
+        planned = {shard.category for shard in shards}
+        for category in categories:
+            if self.selected_tests is not None and category not in planned:
+                print(f"⏭️ {category}: no affected tests")
+                continue
+            outcome = outcomes.get(category, CategoryOutcome(category))
+            total_tests = outcome.total
+            success_rate = (outcome.passed / total_tests * 100) if total_tests > 0 else 0
+            result = TestResult(
+                category=category,
+                total_tests=total_tests,
+                passed_tests=outcome.passed,
+                failed_tests=outcome.failed,
+                skipped_tests=outcome.skipped,
+                execution_time=outcome.execution_time,
+                success_rate=success_rate,
+                details=outcome.details[-20:] if outcome.exit_code != 0 else [],
+                exit_code=outcome.exit_code
+            )
+            
+            # Check quality gate
+            quality_gate = self.test_categories[category]["quality_gate"]
+            if success_rate >= quality_gate:
+                print(f"✅ {category}: {outcome.passed}/{total_tests} passed ({success_rate:.1f}%) "
+                      f"in {outcome.shards} shards, {outcome.execution_time:.1f}s")
+            else:
+                print(f"❌ {category}: {outcome.passed}/{total_tests} passed ({success_rate:.1f}%) - "
+                      f"BELOW QUALITY GATE ({quality_gate}%)")
+            results.append(result)
+        
+        return results
+    
     def check_quality_gates(self, test_results: List[TestResult]) -> Tuple[bool, List[str]]:
         """Check if all quality gates are passed."""
         blocking_issues = []
         
-        # Check overall pass rate
+        # Check overall pass rate (nothing to check when no category was affected)
         total_tests = sum(r.total_tests for r in test_results)
         total_passed = sum(r.passed_tests for r in test_results)
         overall_pass_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
         
-        if overall_pass_rate < self.quality_gates["overall_pass_rate"]:
+        if test_results and overall_pass_rate < self.quality_gates["overall_pass_rate"]:
             blocking_issues.append(
                 f"Overall pass rate {overall_pass_rate:.1f}% below required {self.quality_gates['overall_pass_rate']}%"
             )
@@ -386,7 +470,7 @@ class AutomatedTestingPipeline:
     def save_results_to_database(self, pipeline_result: PipelineResult):
         """Save pipeline results to tracking database."""
         try:
-            db_path = self.project_root / "utils" / "test_pipeline_results.db"
+            db_path = self.results_db_path
             
             with sqlite3.connect(db_path) as conn:
                 cursor = conn.cursor()
@@ -445,15 +529,21 @@ class AutomatedTestingPipeline:
         
         all_results = []
         
-        # Execute parallel tests
-        if parallel_categories:
-            parallel_results = self.execute_parallel_tests(parallel_categories)
-            all_results.extend(parallel_results)
-        
-        # Execute sequential tests
-        if sequential_categories:
-            sequential_results = self.execute_sequential_tests(sequential_categories)
-            all_results.extend(sequential_results)
+        if self.sharded:
+            # Sequential categories become a single shard each
+            all_results.extend(self.execute_sharded_tests(list(self.test_categories)))
+        else:
+            if self.selected_tests is not None:
+                print("⚠️ Test selection needs sharded scheduling; running full categories")
+            # Execute parallel tests
+            if parallel_categories:
+                parallel_results = self.execute_parallel_tests(parallel_categories)
+                all_results.extend(parallel_results)
+            
+            # Execute sequential tests
+            if sequential_categories:
+                sequential_results = self.execute_sequential_tests(sequential_categories)
+                all_results.extend(sequential_results)
         
         total_execution_time = time.time() - start_time
         
@@ -511,9 +601,20 @@ def main():
     """Main entry point for the automated testing pipeline."""
     
     # Command line argument handling
-    mode = sys.argv[1] if len(sys.argv) > 1 else "full"
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    mode = args[0] if args else "full"
+    options = dict(arg[2:].split("=", 1) for arg in sys.argv[1:] if arg.startswith("--") and "=" in arg)
+    workers = int(options["workers"]) if "workers" in options else None
+    
+    pipeline = AutomatedTestingPipeline(sharded="--category-level" not in sys.argv, workers=workers)
     
-    pipeline = AutomatedTestingPipeline()
+    # Change-based test selection; --full always runs everything
+    if "--full" not in sys.argv and ("changed" in options or "changed-since" in options):
+        if "changed" in options:
+            changed_files = [path for path in options["changed"].split(",") if path]
+        else:
+            changed_files = ChangeImpactAnalyzer.changed_files_from_git(project_root, options["changed-since"])
+        pipeline.select_affected_tests(changed_files)
     
     if mode == "full":
         # Full pipeline execution
@@ -543,6 +644,7 @@ def main():
     else:
         print(f"❌ Unknown mode: {mode}")
         print("Available modes: full, quick, pre-commit")
+        print("Options: --workers=N, --category-level, --changed-since=REF, --changed=a.py,b.py, --full")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -6,16 +6,153 @@ PHILOSOPHY: Safety First + Boy Scout Rule
 - Never break anything during reorganization
 - Heal all links automatically
 - Leave system better than we found it
+
+Links are indexed per markdown file in ``.link_index.db`` together with a
+reverse index from target path to referencing files, so repeated scans only
+re-read changed files and a rename batch only rewrites the files it affects.
 """
 
 import os
 import re
 import shutil
+import sqlite3
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set
 import json
 from datetime import datetime
 
+# Persisted per-file links and reverse index (target path -> referencing files)
+LINK_INDEX_FILE = ".link_index.db"
+LINK_INDEX_VERSION = 1
+LINK_FIELDS = ("type", "text", "path", "line_number", "match_text")
+
+# Python and config files are searched for this marker in chunks of this size
+DOCS_MARKER = b"docs/"
+SCAN_CHUNK_SIZE = 64 * 1024
+
+# Regex group holding the link target, per link pattern
+PATH_GROUPS = {
+    "markdown_links": 2,
+    "relative_paths": 2,
+    "docs_references": 2,
+    "file_references": 1,
+    "bare_paths": 1
+}
+
+
+def line_starts(content: str) -> List[int]:
+    """Offsets of the newlines in ``content``, for line lookups by bisection."""
+    return [match.start() for match in re.finditer("\n", content)]
+
+
+def line_number(newlines: List[int], offset: int) -> int:
+    """1-based line number of ``offset`` given the newline offsets of its content."""
+    return bisect_right(newlines, offset) + 1
+
+
+def file_contains(file_path: Path, needle: bytes, chunk_size: int = SCAN_CHUNK_SIZE) -> bool:
+    """Whether a file contains ``needle``, reading it in chunks instead of whole."""
+    overlap = len(needle) - 1
+    tail = b""
+    with open(file_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return False
+            if needle in tail + chunk:
+                return True
+            tail = chunk[-overlap:] if overlap else b""
+
+
+def path_variations(link_path: str) -> List[str]:
+    """The rename-mapping keys a link path may be healed through."""
+    return [
+        link_path,
+        link_path.replace("../", ""),
+        f"docs/{link_path}" if not link_path.startswith("docs/") else link_path,
+        link_path.replace("docs/", "") if link_path.startswith("docs/") else link_path
+    ]
+
+
+class LinkIndex:
+    """
+    Links of every markdown file and the reverse index from target path to
+    referencing files, persisted in SQLite so updates only touch their rows.
+    """
+    
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(str(self.db_path))
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != LINK_INDEX_VERSION:
+            self._conn.executescript(f"""
+                DROP TABLE IF EXISTS link_files;
+                DROP TABLE IF EXISTS link_targets;
+                PRAGMA user_version = {LINK_INDEX_VERSION};
+            """)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS link_files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                links TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS link_targets (
+                target TEXT NOT NULL,
+                path TEXT NOT NULL,
+                PRIMARY KEY (target, path)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS link_targets_path ON link_targets (path);
+        """)
+        self._conn.commit()
+    
+    def file_stats(self) -> Dict[str, Tuple[int, int]]:
+        """(mtime_ns, size) of every indexed file when it was indexed."""
+        return {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self._conn.execute("SELECT path, mtime_ns, size FROM link_files")
+        }
+    
+    def links(self) -> Iterator[Tuple[str, List[Dict]]]:
+        """Indexed files and their links, by path."""
+        for path, rows in self._conn.execute("SELECT path, links FROM link_files ORDER BY path").fetchall():
+            yield path, [dict(zip(LINK_FIELDS, row), source_file=path) for row in json.loads(rows)]
+    
+    def update(self, entries: List[Tuple[str, int, int, List[Dict], Set[str]]]) -> None:
+        """Replace the links and targets of files given as (path, mtime_ns, size, links, targets)."""
+        with self._conn:
+            self._delete([path for path, _, _, _, _ in entries])
+            self._conn.executemany("INSERT INTO link_files VALUES (?, ?, ?, ?)", [
+                (path, mtime_ns, size, json.dumps([[link[field] for field in LINK_FIELDS] for link in links]))
+                for path, mtime_ns, size, links, _ in entries
+            ])
+            self._conn.executemany("INSERT INTO link_targets VALUES (?, ?)", [
+                (target, path) for path, _, _, _, targets in entries for target in targets
+            ])
+    
+    def remove(self, paths: List[str]) -> None:
+        with self._conn:
+            self._delete(paths)
+    
+    def files_referencing(self, targets: Iterable[str]) -> List[str]:
+        """Files with a link indexed under any of the targets."""
+        targets = list(targets)
+        files = set()
+        for start in range(0, len(targets), 500):
+            chunk = targets[start:start + 500]
+            files.update(path for (path,) in self._conn.execute(
+                f"SELECT DISTINCT path FROM link_targets WHERE target IN ({','.join('?' * len(chunk))})", chunk
+            ))
+        return sorted(files)
+    
+    def close(self) -> None:
+        self._conn.close()
+    
+    def _delete(self, paths: List[str]) -> None:
+        parameters = [(path,) for path in paths]
+        self._conn.executemany("DELETE FROM link_files WHERE path = ?", parameters)
+        self._conn.executemany("DELETE FROM link_targets WHERE path = ?", parameters)
+
 
 class LinkHealingSystem:
     """
@@ -40,11 +177,18 @@ class LinkHealingSystem:
             "bare_paths": r'(docs/[a-zA-Z0-9_/-]+\.md)'
         }
         
+        self._compiled_patterns = {name: re.compile(pattern) for name, pattern in self.link_patterns.items()}
+        
         # Track all discovered links
         self.all_links = {}
         self.broken_links = []
         self.file_references = {}
         
+        # Reverse link index, persisted between runs
+        self.index_path = self.project_root / LINK_INDEX_FILE
+        self._link_index: Optional[LinkIndex] = None
+        self._index_refreshed = False
+        
     def scan_all_links(self) -> Dict[str, List[Dict]]:
         """
         COMPREHENSIVE LINK DISCOVERY
@@ -60,19 +204,24 @@ class LinkHealingSystem:
             "discovered_links": []
         }
         
-        # Scan all markdown files
-        for md_file in self.docs_root.rglob("*.md"):
-            links = self._extract_links_from_file(md_file)
+        # Scan all markdown files (unchanged files come from the link index)
+        self._refresh_index()
+        for relative_path, links in self._get_link_index().links():
             if links:
                 all_links["markdown_files"].append({
-                    "file": str(md_file.relative_to(self.project_root)),
+                    "file": relative_path,
                     "links": links
                 })
                 all_links["discovered_links"].extend(links)
         
         # Scan Python files for doc references
         for py_file in self.project_root.rglob("*.py"):
-            if "docs/" in py_file.read_text(encoding='utf-8', errors='ignore'):
+            try:
+                has_doc_refs = file_contains(py_file, DOCS_MARKER)
+            except OSError as e:
+                print(f"[WARNING] Could not read {py_file}: {e}")
+                continue
+            if has_doc_refs:
                 doc_refs = self._extract_doc_references_from_python(py_file)
                 if doc_refs:
                     all_links["python_files"].append({
@@ -85,8 +234,8 @@ class LinkHealingSystem:
         for pattern in config_patterns:
             for config_file in self.project_root.rglob(pattern):
                 try:
-                    content = config_file.read_text(encoding='utf-8')
-                    if "docs/" in content:
+                    if file_contains(config_file, DOCS_MARKER):
+                        content = config_file.read_text(encoding='utf-8')
                         all_links["config_files"].append({
                             "file": str(config_file.relative_to(self.project_root)),
                             "content_preview": content[:200] + "..." if len(content) > 200 else content
@@ -101,32 +250,38 @@ class LinkHealingSystem:
         """Extract all links from a markdown file."""
         try:
             content = file_path.read_text(encoding='utf-8')
-            links = []
-            
-            for pattern_name, pattern in self.link_patterns.items():
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    if pattern_name == "markdown_links":
-                        link_text, link_path = match.groups()
-                    elif pattern_name in ["relative_paths", "docs_references"]:
-                        link_text, link_path = match.groups()
-                    else:
-                        link_path = match.group(1)
-                        link_text = ""
-                    
-                    links.append({
-                        "type": pattern_name,
-                        "text": link_text,
-                        "path": link_path,
-                        "line_number": content[:match.start()].count('\n') + 1,
-                        "match_text": match.group(0)
-                    })
-            
-            return links
-            
         except Exception as e:
             print(f"[WARNING] Error reading {file_path}: {e}")
             return []
+        
+        try:
+            source_file = str(file_path.relative_to(self.project_root))
+        except ValueError:
+            source_file = str(file_path)
+        return self._extract_links(content, source_file)
+    
+    def _extract_links(self, content: str, source_file: str) -> List[Dict]:
+        """Extract all links from markdown content, with line numbers by bisection."""
+        newlines = line_starts(content)
+        links = []
+        for pattern_name, match, path_group in self._iter_link_matches(content):
+            link_text = match.group(1) if path_group == 2 else ""
+            links.append({
+                "type": pattern_name,
+                "text": link_text,
+                "path": match.group(path_group),
+                "line_number": line_number(newlines, match.start()),
+                "match_text": match.group(0),
+                "source_file": source_file
+            })
+        return links
+    
+    def _iter_link_matches(self, content: str) -> Iterator[Tuple[str, re.Match, int]]:
+        """Matches of every link pattern, with the group holding the link path."""
+        for pattern_name, pattern in self._compiled_patterns.items():
+            path_group = PATH_GROUPS.get(pattern_name, 1)
+            for match in pattern.finditer(content):
+                yield pattern_name, match, path_group
     
     def _extract_doc_references_from_python(self, file_path: Path) -> List[str]:
         """Extract documentation references from Python files."""
@@ -234,6 +389,9 @@ class LinkHealingSystem:
         HEAL ALL LINKS
         
         Update all links to point to new file locations.
+        
+        Only the files the reverse link index lists for the renamed paths are
+        read, and each is rewritten once with all of its edits applied.
         """
         print("[INFO] Starting comprehensive link healing...")
         
@@ -243,49 +401,74 @@ class LinkHealingSystem:
             "files_processed": 0
         }
         
-        # Process all markdown files with links
-        for file_info in self.all_links.get("markdown_files", []):
-            file_path = self.project_root / file_info["file"]
+        # Only files referencing a renamed path are read
+        self._refresh_index()
+        index_updates = []
+        for relative_path in self.files_referencing(rename_mapping):
+            file_path = self.project_root / relative_path
             
             if not file_path.exists():
                 continue
                 
             original_content = file_path.read_text(encoding='utf-8')
-            updated_content = original_content
-            links_healed_in_file = 0
-            
-            # Update each link in the file
-            for link in file_info["links"]:
-                old_path = link["path"]
-                
-                # Find the new path
-                new_path = self._find_new_path(old_path, rename_mapping)
-                
-                if new_path and new_path != old_path:
-                    # Replace the link in content
-                    old_match = link["match_text"]
-                    new_match = old_match.replace(old_path, new_path)
-                    
-                    updated_content = updated_content.replace(old_match, new_match)
-                    links_healed_in_file += 1
+            edits = self._plan_link_edits(original_content, rename_mapping)
             
             # Write updated content if changes were made
-            if links_healed_in_file > 0:
+            if edits:
+                updated_content = self._apply_edits(original_content, edits)
+                
                 # Create backup
                 backup_path = file_path.with_suffix(f".backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
                 shutil.copy2(file_path, backup_path)
                 
                 # Write updated content
                 file_path.write_text(updated_content, encoding='utf-8')
+                index_updates.append(self._index_entry(relative_path, updated_content, file_path.stat()))
                 
-                print(f"[OK] Healed {links_healed_in_file} links in {file_info['file']}")
+                print(f"[OK] Healed {len(edits)} links in {relative_path}")
                 healing_stats["files_updated"] += 1
-                healing_stats["links_healed"] += links_healed_in_file
+                healing_stats["links_healed"] += len(edits)
             
             healing_stats["files_processed"] += 1
         
+        if index_updates:
+            self._get_link_index().update(index_updates)
         return healing_stats
     
+    def _plan_link_edits(self, content: str, rename_mapping: Dict[str, str]) -> List[Tuple[int, int, str]]:
+        """
+        Link path replacements for a file as (start, end, new_path), sorted by offset.
+        
+        Where patterns overlap (a bare path inside a markdown link path) the
+        outer span wins, so every character is rewritten at most once.
+        """
+        candidates = []
+        for _, match, path_group in self._iter_link_matches(content):
+            old_path = match.group(path_group)
+            new_path = self._find_new_path(old_path, rename_mapping)
+            if new_path and new_path != old_path:
+                candidates.append((match.start(path_group), -match.end(path_group), new_path))
+        
+        edits = []
+        covered_until = 0
+        for start, negative_end, new_path in sorted(candidates):
+            if start >= covered_until:
+                edits.append((start, -negative_end, new_path))
+                covered_until = -negative_end
+        return edits
+    
+    @staticmethod
+    def _apply_edits(content: str, edits: List[Tuple[int, int, str]]) -> str:
+        """Rewrite content once with non-overlapping, offset-sorted edits."""
+        parts = []
+        position = 0
+        for start, end, replacement in edits:
+            parts.append(content[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(content[position:])
+        return "".join(parts)
+    
     def _find_new_path(self, old_path: str, rename_mapping: Dict[str, str]) -> str:
         """Find the new path for a given old path."""
         
@@ -294,14 +477,7 @@ class LinkHealingSystem:
             return rename_mapping[old_path]
         
         # Try different path variations
-        variations = [
-            old_path,
-            old_path.replace("../", ""),
-            f"docs/{old_path}" if not old_path.startswith("docs/") else old_path,
-            old_path.replace("docs/", "") if old_path.startswith("docs/") else old_path
-        ]
-        
-        for variation in variations:
+        for variation in path_variations(old_path):
             if variation in rename_mapping:
                 # Convert back to the same format as original
                 new_path = rename_mapping[variation]
@@ -318,6 +494,95 @@ class LinkHealingSystem:
         
         return None
     
+    def files_referencing(self, target_paths: Iterable[str]) -> List[str]:
+        """
+        REVERSE LINK LOOKUP
+        
+        Markdown files with a link that may point at any of the given paths
+        (project-relative targets or rename-mapping keys), from the link index.
+        """
+        if not self._index_refreshed:
+            self._refresh_index()
+        keys = set()
+        for target_path in target_paths:
+            keys.update({target_path, Path(target_path).as_posix()})
+        return self._get_link_index().files_referencing(keys)
+    
+    def close(self) -> None:
+        """Close the link index."""
+        if self._link_index is not None:
+            self._link_index.close()
+            self._link_index = None
+    
+    def _get_link_index(self) -> LinkIndex:
+        if self._link_index is None:
+            self._link_index = LinkIndex(self.index_path)
+        return self._link_index
+    
+    def _refresh_index(self) -> None:
+        """Re-read only markdown files whose size or mtime changed since they were indexed."""
+        link_index = self._get_link_index()
+        indexed = link_index.file_stats()
+        
+        seen = set()
+        updates = []
+        for relative_path, full_path in self._markdown_files():
+            seen.add(relative_path)
+            try:
+                stat = os.stat(full_path)
+            except OSError as e:
+                print(f"[WARNING] Error reading {full_path}: {e}")
+                continue
+            if indexed.get(relative_path) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except Exception as e:
+                print(f"[WARNING] Error reading {full_path}: {e}")
+                content = ""
+            updates.append(self._index_entry(relative_path, content, stat))
+        
+        if updates:
+            link_index.update(updates)
+        removed = [relative_path for relative_path in indexed if relative_path not in seen]
+        if removed:
+            link_index.remove(removed)
+        self._index_refreshed = True
+    
+    def _markdown_files(self) -> Iterator[Tuple[str, str]]:
+        """(project-relative path, full path) of every markdown file under docs/."""
+        prefix_length = len(str(self.project_root)) + 1
+        for root, _, files in os.walk(self.docs_root):
+            relative_root = root[prefix_length:]
+            for name in files:
+                if name.endswith(".md"):
+                    yield os.path.join(relative_root, name), os.path.join(root, name)
+    
+    def _index_entry(self, relative_path: str, content: str, stat: os.stat_result) -> Tuple:
+        """Link index row of one markdown file: (path, mtime_ns, size, links, targets)."""
+        links = self._extract_links(content, relative_path)
+        return relative_path, stat.st_mtime_ns, stat.st_size, links, self._link_targets(links)
+    
+    @staticmethod
+    def _link_targets(links: List[Dict]) -> Set[str]:
+        """
+        Index keys of a file's links: every rename-mapping key that can heal
+        them (see ``_find_new_path``) plus their targets resolved against the
+        linking file.
+        """
+        keys = set()
+        paths = {link["path"] for link in links}
+        if not paths:
+            return keys
+        source_dir = os.path.dirname(links[0]["source_file"])
+        for target in paths:
+            keys.update(path_variations(target))
+            if not target.startswith("docs/"):
+                target = os.path.join(source_dir, target)
+            keys.add(os.path.normpath(target).replace(os.sep, "/"))
+        return keys
+    
     def generate_link_report(self) -> str:
         """Generate comprehensive link analysis report."""
         
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental user story catalog regeneration and the polling
+watch mode.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from utils.agile.user_story_catalog_manager import UserStoryCatalogManager
+
+STORY_COUNT = 5000
+STORY = """# User Story {story_id}: Story number {number}
+
+**Epic**: Catalog
+**Status**: {status}
+**Story Points**: {points}
+**Priority**: 🟠 Medium
+
+## Story Description
+Story {number} describes one unit of work.
+
+## Acceptance Criteria
+- [ ] Criterion one
+"""
+
+
+class CountingCatalogManager(UserStoryCatalogManager):
+    """Counts parsed story files and catalog updates."""
+
+    def __init__(self, project_root):
+        super().__init__(project_root)
+        self.parsed = []
+        self.updates = 0
+
+    def _parse_user_story_file(self, file_path, content=None):
+        self.parsed.append(Path(file_path).name)
+        return super()._parse_user_story_file(file_path, content)
+
+    def update_catalog(self):
+        self.updates += 1
+        return super().update_catalog()
+
+
+class TestUserStoryCatalogManager:
+    """Test suite for UserStoryCatalogManager"""
+
+    def setup_method(self):
+        self.project = Path(tempfile.mkdtemp())
+        self.sprints = self.project / "docs" / "agile" / "sprints"
+
+    def teardown_method(self):
+        shutil.rmtree(self.project, ignore_errors=True)
+
+    def _write_story(self, number, status="⏳ Pending", points=3):
+        story_id = f"US-{number:05d}"
+        path = self.sprints / f"sprint_{number % 10}" / f"{story_id}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(STORY.format(story_id=story_id, number=number, status=status, points=points),
+                        encoding='utf-8')
+        return path
+
+    def test_touching_one_story_reparses_only_that_file(self):
+        for number in range(STORY_COUNT):
+            self._write_story(number, status="✅ Completed" if number % 4 == 0 else "⏳ Pending")
+        manager = CountingCatalogManager(str(self.project))
+        assert manager.update_catalog()
+        assert len(manager.parsed) == STORY_COUNT
+        catalog_mtime = manager.catalog_file.stat().st_mtime_ns
+
+        # Touched without changes: neither parsed nor rewritten
+        touched = self.sprints / "sprint_7" / "US-00017.md"
+        stat = touched.stat()
+        os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        manager.parsed.clear()
+        assert manager.update_catalog()
+        assert manager.parsed == []
+        assert manager.catalog_file.stat().st_mtime_ns == catalog_mtime
+
+        self._write_story(17, status="🔄 In Progress", points=8)
+        manager.parsed.clear()
+        assert manager.update_catalog()
+
+        assert manager.parsed == ["US-00017.md"]
+        assert manager.last_scan_stats == {"files": STORY_COUNT, "parsed": 1,
+                                           "reused": STORY_COUNT - 1, "removed": 0}
+        stories = manager.scan_all_user_stories()
+        assert asdict(manager._metrics) == asdict(manager.calculate_metrics(stories))
+        assert manager._metrics.in_progress_stories == 1
+        catalog = manager.catalog_file.read_text(encoding='utf-8')
+        assert "| **US-00017** | **Story number 17** | Catalog | 🔄 In Progress | 8 |" in catalog
+
+    def test_removed_story_updates_metrics(self):
+        for number in range(6):
+            self._write_story(number, status="✅ Completed" if number < 2 else "⏳ Pending")
+        manager = UserStoryCatalogManager(str(self.project))
+        manager.update_catalog()
+
+        os.remove(self.sprints / "sprint_0" / "US-00000.md")
+        assert manager.refresh_stories()
+        assert manager.last_scan_stats["removed"] == 1
+        assert (manager._metrics.total_stories, manager._metrics.completed_stories) == (5, 1)
+        assert not manager.refresh_stories()
+
+    def test_watch_debounces_bursts(self):
+        for number in range(3):
+            self._write_story(number)
+        manager = CountingCatalogManager(str(self.project))
+        stop = threading.Event()
+        watcher = threading.Thread(target=manager.watch_for_changes,
+                                   kwargs={"interval": 0.02, "debounce": 0.3, "stop_event": stop})
+        watcher.start()
+        try:
+            deadline = time.monotonic() + 5
+            while manager.updates < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            for points in (5, 8, 13):
+                self._write_story(1, status="🔄 In Progress", points=points)
+                time.sleep(0.05)
+
+            deadline = time.monotonic() + 5
+            while manager.updates < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.5)
+        finally:
+            stop.set()
+            watcher.join(5)
+
+        assert manager.updates == 2
+        assert "| **US-00001** | **Story number 1** | Catalog | 🔄 In Progress | 13 |" in \
+            manager.catalog_file.read_text(encoding='utf-8')
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for change-based test selection on a small fixture package.
+"""
+
+import os
+import shutil
+import tempfile
+import textwrap
+from pathlib import Path
+
+from utils.automated_testing.impact_analyzer import ChangeImpactAnalyzer, parse_imports
+
+FIXTURE = {
+    "pkg/__init__.py": "",
+    "pkg/core.py": "import json\n\ndef helper():\n    return json.dumps({})\n",
+    "pkg/models.py": "from .core import helper\n\nclass Model:\n    pass\n",
+    "pkg/service.py": "from pkg.models import Model\n",
+    "pkg/lazy.py": "def load():\n    import pkg.core\n    return pkg.core\n",
+    "pkg/broken.py": "def broken(:\n",
+    "pkg/sub/__init__.py": "from .leaf import VALUE\n",
+    "pkg/sub/leaf.py": "VALUE = 1\n",
+    "other/standalone.py": "raise SystemExit('never imported')\n",
+    "tests/unit/helpers.py": "def make():\n    return 1\n",
+    "tests/unit/test_models.py": "from pkg.models import Model\n",
+    "tests/unit/test_service.py": "import pkg.service\n",
+    "tests/unit/test_standalone.py": "from other import standalone\n",
+    "tests/unit/test_uses_helpers.py": "from helpers import make\n",
+    "tests/unit/test_lazy.py": "try:\n    from pkg import lazy\nexcept ImportError:\n    lazy = None\n",
+    "tests/integration/conftest.py": "import pytest\n",
+    "tests/integration/test_leaf.py": "from pkg.sub.leaf import VALUE\n",
+}
+
+
+class TestChangeImpactAnalyzer:
+    """Test suite for ChangeImpactAnalyzer"""
+
+    def setup_method(self):
+        self.project = Path(tempfile.mkdtemp())
+        for path, content in FIXTURE.items():
+            self._write(path, content)
+        self.analyzer = ChangeImpactAnalyzer(self.project)
+
+    def teardown_method(self):
+        shutil.rmtree(self.project, ignore_errors=True)
+
+    def _write(self, path, content):
+        full_path = self.project / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+
+    def test_selected_tests_for_change_sets(self):
+        expectations = [
+            (["pkg/core.py"], ["tests/unit/test_lazy.py", "tests/unit/test_models.py", "tests/unit/test_service.py"]),
+            (["pkg/sub/leaf.py"], ["tests/integration/test_leaf.py"]),
+            (["pkg/__init__.py"], [
+                "tests/integration/test_leaf.py", "tests/unit/test_lazy.py",
+                "tests/unit/test_models.py", "tests/unit/test_service.py",
+            ]),
+            (["other/standalone.py"], ["tests/unit/test_standalone.py"]),
+            (["tests/unit/helpers.py"], ["tests/unit/test_uses_helpers.py"]),
+            (["tests/integration/conftest.py"], ["tests/integration/test_leaf.py"]),
+            (["tests/unit/test_models.py", "docs/notes.md"], ["tests/unit/test_models.py"]),
+            ([str(self.project / "pkg" / "service.py")], ["tests/unit/test_service.py"]),
+            (["README.md"], []),
+        ]
+        for changed, expected in expectations:
+            assert self.analyzer.affected_tests(changed) == expected, changed
+
+    def test_configuration_and_data_changes_need_full_run(self):
+        assert self.analyzer.affected_tests(["pkg/core.py", "pytest.ini"]) is None
+        assert self.analyzer.affected_tests(["requirements.txt"]) is None
+        assert self.analyzer.affected_tests(["pkg/templates/workflow.yaml"]) is None
+
+    def test_deleted_module_still_selects_its_importers(self):
+        self.analyzer.refresh()
+        os.remove(self.project / "pkg" / "models.py")
+
+        assert self.analyzer.affected_tests(["pkg/models.py"]) == [
+            "tests/unit/test_models.py", "tests/unit/test_service.py"
+        ]
+
+    def test_graph_cache_updates_incrementally_by_hash(self):
+        assert self.analyzer.refresh()["parsed"] == len(FIXTURE)
+
+        reopened = ChangeImpactAnalyzer(self.project)
+        assert reopened.refresh()["parsed"] == 0
+
+        # Touched without changes: hashed, not parsed
+        core = self.project / "pkg" / "core.py"
+        stat = core.stat()
+        os.utime(core, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert reopened.refresh()["parsed"] == 0
+
+        # service.py now also imports the leaf module
+        self._write("pkg/service.py", "from pkg.models import Model\nfrom pkg.sub import leaf\n")
+        stats = reopened.refresh()
+        assert (stats["parsed"], stats["reused"]) == (1, len(FIXTURE) - 1)
+        assert "tests/unit/test_service.py" in reopened.affected_tests(["pkg/sub/leaf.py"])
+
+    def test_parse_imports_resolves_relative_and_nested_imports(self):
+        source = textwrap.dedent("""
+            import os.path
+            from . import sibling
+            from ..shared.util import tool
+
+            def late():
+                from pkg.late import thing
+        """)
+
+        names = parse_imports(source, "pkg/sub/mod.py")
+
+        assert {"pkg", "pkg.sub", "pkg.sub.sibling", "pkg.shared.util", "pkg.shared.util.tool",
+                "pkg.late.thing", "os.path"} <= set(names)
+        assert "pkg.sub.mod" not in names
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for duration-aware sharded test scheduling.
+
+A synthetic project of sleep-based test files shows the planned makespan
+dropping when a slow category is split into file shards, compared with
+running every category as one pytest process.
+"""
+
+import heapq
+import shutil
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+from utils.automated_testing.shard_scheduler import FileDurationStore, Shard, ShardResult, ShardScheduler
+
+SLEEP_TEST = textwrap.dedent("""
+    import time
+
+    def test_sleep():
+        time.sleep({seconds})
+""")
+
+
+class IntervalScheduler(ShardScheduler):
+    """Scheduler whose shards only sleep and record when they ran."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.intervals = []
+
+    def run_shard(self, shard, report_path):
+        started = time.perf_counter()
+        time.sleep(0.05)
+        self.intervals.append((shard, started, time.perf_counter()))
+        return ShardResult(shard=shard, passed=len(shard.targets))
+
+
+class TestShardScheduler:
+    """Test suite for ShardScheduler"""
+
+    def setup_method(self):
+        self.project = Path(tempfile.mkdtemp())
+        self.store = FileDurationStore(str(self.project / "results.db"))
+        for i in range(4):
+            self._write(f"tests/slow/test_slow_{i}.py", SLEEP_TEST.format(seconds=1.5))
+        self._write("tests/fast/test_fast.py", SLEEP_TEST.format(seconds=0.2))
+        self._write("tests/mixed/test_mixed.py", textwrap.dedent("""
+            import pytest
+
+            def test_ok():
+                pass
+
+            def test_broken():
+                assert False
+
+            @pytest.mark.skip(reason="not today")
+            def test_skipped():
+                pass
+        """))
+        self.categories = {
+            "slow": {"command": "pytest tests/slow/ -q", "timeout": 60, "parallel": True},
+            "fast": {"command": "pytest tests/fast/ -q", "timeout": 60, "parallel": True},
+            "mixed": {"command": "pytest tests/mixed/ -q", "timeout": 60, "parallel": True},
+        }
+
+    def teardown_method(self):
+        self.store.close()
+        shutil.rmtree(self.project, ignore_errors=True)
+
+    def _write(self, relative_path, content):
+        path = self.project / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def _scheduler(self, workers=4):
+        return ShardScheduler(self.project, self.store, workers=workers, min_shard_duration=0.0)
+
+    @staticmethod
+    def _estimated_makespan(shards, workers):
+        """Finish time of the plan when each free worker takes the next shard."""
+        loads = [0.0] * workers
+        for shard in shards:
+            heapq.heapreplace(loads, loads[0] + shard.estimated_duration)
+        return max(loads)
+
+    def _run(self, shards):
+        scheduler = self._scheduler(workers=6)
+        started = time.perf_counter()
+        outcomes = scheduler.aggregate(scheduler.run(shards))
+        return time.perf_counter() - started, outcomes
+
+    def test_sharding_reduces_makespan(self):
+        self.store.record("slow", {f"tests/slow/test_slow_{i}.py": 1.5 for i in range(4)})
+        self.store.record("fast", {"tests/fast/test_fast.py": 0.2})
+        self.store.record("mixed", {"tests/mixed/test_mixed.py": 0.1})
+        scheduler = self._scheduler(workers=6)
+        category_plan = scheduler.plan(self.categories, split=False)
+        sharded_plan = scheduler.plan(self.categories, split=True)
+
+        slow_shards = [shard for shard in sharded_plan if shard.category == "slow"]
+        assert sorted(path for shard in slow_shards for path in shard.targets) == [
+            f"tests/slow/test_slow_{i}.py" for i in range(4)
+        ]
+        assert [len(shard.targets) for shard in slow_shards] == [1, 1, 1, 1]
+        assert [(shard.category, shard.estimated_duration) for shard in sharded_plan] == \
+            [("slow", 1.5)] * 4 + [("fast", 0.2), ("mixed", 0.1)]
+        assert self._estimated_makespan(category_plan, 6) == 6.0
+        assert self._estimated_makespan(sharded_plan, 6) == 1.5
+
+        # Wall-clock times depend on the machine, so they are only reported
+        category_level, category_outcomes = self._run(category_plan)
+        sharded, sharded_outcomes = self._run(sharded_plan)
+        print(f"\nmakespan: category-level {category_level:.2f} s, sharded {sharded:.2f} s")
+        assert sharded_outcomes["slow"].shards == 4
+        for category in self.categories:
+            assert (sharded_outcomes[category].passed, sharded_outcomes[category].failed) == \
+                (category_outcomes[category].passed, category_outcomes[category].failed)
+
+    def test_counts_come_from_junit_reports_per_category(self):
+        scheduler = self._scheduler()
+        outcomes = scheduler.aggregate(scheduler.run(scheduler.plan(self.categories)))
+
+        mixed = outcomes["mixed"]
+        assert (mixed.passed, mixed.failed, mixed.skipped) == (1, 1, 1)
+        assert mixed.exit_code != 0 and mixed.details
+        assert (outcomes["slow"].passed, outcomes["slow"].failed, outcomes["slow"].exit_code) == (4, 0, 0)
+
+    def test_recorded_durations_drive_longest_first_plan(self):
+        self.store.record("slow", {"tests/slow/test_slow_0.py": 0.5, "tests/slow/test_slow_1.py": 4.0})
+        self.store.record("fast", {"tests/fast/test_fast.py": 9.0})
+
+        shards = self._scheduler(workers=2).plan(self.categories)
+
+        assert shards[0].targets == ["tests/fast/test_fast.py"]
+        assert [shard.estimated_duration for shard in shards] == sorted(
+            (shard.estimated_duration for shard in shards), reverse=True
+        )
+        slow_files = sorted(path for shard in shards if shard.category == "slow" for path in shard.targets)
+        assert slow_files == [f"tests/slow/test_slow_{i}.py" for i in range(4)]
+
+        self.store.record("slow", {"tests/slow/test_slow_1.py": 2.0})
+        assert self.store.get(["tests/slow/test_slow_1.py"]) == {"tests/slow/test_slow_1.py": 3.0}
+
+    def test_plan_restricted_to_selected_files(self):
+        only = {"tests/slow/test_slow_2.py", "tests/mixed/test_mixed.py"}
+
+        shards = self._scheduler().plan(self.categories, only=only)
+
+        assert sorted(shard.category for shard in shards) == ["mixed", "slow"]
+        assert sorted(path for shard in shards for path in shard.targets) == sorted(only)
+        assert self._scheduler().plan(self.categories, only=set()) == []
+
+    def test_sequential_category_stays_one_shard_and_timeouts_fail(self):
+        self.categories["slow"]["parallel"] = False
+        scheduler = self._scheduler()
+
+        shards = [shard for shard in scheduler.plan(self.categories) if shard.category == "slow"]
+        assert len(shards) == 1 and len(shards[0].targets) == 4
+
+        timed_out = scheduler.run_shard(Shard("slow", shards[0].targets, 4.0, timeout=0.5),
+                                        self.project / "timeout.xml")
+        assert timed_out.failed == 1 and timed_out.exit_code == 1
+
+    def test_sequential_shard_never_overlaps_other_shards(self):
+        self.categories["mixed"]["parallel"] = False
+        scheduler = IntervalScheduler(self.project, self.store, workers=6, min_shard_duration=0.0)
+
+        shards = scheduler.plan(self.categories)
+        assert [shard.category for shard in shards if shard.sequential] == ["mixed"]
+        results = scheduler.run(shards)
+
+        assert len(results) == len(shards)
+        sequential = [(start, end) for shard, start, end in scheduler.intervals if shard.sequential]
+        pooled = [(start, end) for shard, start, end in scheduler.intervals if not shard.sequential]
+        assert len(sequential) == 1 and len(pooled) == len(shards) - 1
+        assert sequential[0][0] >= max(end for _, end in pooled)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Work-Stealing Swarm Execution Tests
+===================================
+
+Tests for the dependency-aware queue idle swarm agents pull tasks from:
+- Independent tasks run concurrently across agents
+- Dependencies are respected at run time
+- Capability matching and per-agent concurrency
+- Failure cancels dependents
+
+Author: AI Development Agent
+"""
+
+import asyncio
+import pytest
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from agents.swarm.swarm_coordinator import SwarmTask, SwarmAgent, AgentRole, TaskPriority
+    from agents.swarm.work_stealing import WorkStealingScheduler
+    SWARM_AVAILABLE = True
+except ImportError as e:
+    print(f"❌ Agent swarm import failed: {e}")
+    SWARM_AVAILABLE = False
+
+
+def _agent(agent_id, capabilities=None):
+    return SwarmAgent(agent_id=agent_id, role=AgentRole.DEVELOPMENT_AGENT,
+                      capabilities=capabilities or ["file.manage_files"])
+
+
+def _task(task_id, dependencies=None, tools=None, priority=None):
+    return SwarmTask(task_id=task_id, description=task_id,
+                     dependencies=dependencies or [],
+                     mcp_tools_required=tools or ["file.manage_files"],
+                     priority=priority or TaskPriority.MEDIUM)
+
+
+def _sleeping_executor(log, duration=0.1, fail=()):
+    async def execute(task, agent):
+        log.append(("start", task.task_id, agent.agent_id, time.perf_counter()))
+        await asyncio.sleep(duration)
+        log.append(("end", task.task_id, agent.agent_id, time.perf_counter()))
+        if task.task_id in fail:
+            return {'success': False, 'error': 'boom'}
+        return {'success': True, 'execution_time': duration}
+    return execute
+
+
+@pytest.mark.skipif(not SWARM_AVAILABLE, reason="Agent swarm components not available")
+class TestWorkStealingScheduler:
+    """Test suite for WorkStealingScheduler."""
+
+    def test_n_agents_run_n_independent_tasks_at_once(self):
+        """Four agents finish four independent tasks in about one task duration."""
+        agents = [_agent(f"agent_{i}") for i in range(4)]
+        tasks = [_task(f"task_{i}") for i in range(4)]
+        scheduler = WorkStealingScheduler(agents)
+
+        start = time.perf_counter()
+        metrics = asyncio.run(scheduler.run(tasks, _sleeping_executor([])))
+        elapsed = time.perf_counter() - start
+
+        assert metrics['tasks_completed'] == 4
+        assert metrics['max_parallel_tasks'] == 4
+        assert elapsed < 0.3
+        assert all(task.status == 'completed' for task in tasks)
+
+    def test_dependencies_respected(self):
+        """A task only starts after all of its dependencies completed."""
+        agents = [_agent(f"agent_{i}") for i in range(3)]
+        tasks = [_task("a"), _task("b"), _task("c", dependencies=["a", "b"])]
+        log = []
+
+        asyncio.run(WorkStealingScheduler(agents).run(tasks, _sleeping_executor(log)))
+
+        ends = {task_id: ts for kind, task_id, _, ts in log if kind == "end"}
+        starts = {task_id: ts for kind, task_id, _, ts in log if kind == "start"}
+        assert starts["c"] >= max(ends["a"], ends["b"])
+
+    def test_capability_matching(self):
+        """Tasks only run on agents providing the required tools."""
+        agents = [_agent("files"), _agent("tests", ["test.run_pipeline"])]
+        tasks = [_task("run_tests", tools=["test.run_pipeline"]), _task("edit")]
+        log = []
+
+        asyncio.run(WorkStealingScheduler(agents).run(tasks, _sleeping_executor(log)))
+
+        ran_on = {task_id: agent_id for kind, task_id, agent_id, _ in log if kind == "start"}
+        assert ran_on == {"run_tests": "tests", "edit": "files"}
+
+    def test_unmatched_task_fails_without_blocking(self):
+        """A task no agent can run fails instead of stalling the workflow."""
+        tasks = [_task("impossible", tools=["git.automate_workflow"]), _task("fine")]
+        metrics = asyncio.run(
+            WorkStealingScheduler([_agent("a")]).run(tasks, _sleeping_executor([], 0.01))
+        )
+
+        assert tasks[0].status == 'failed'
+        assert tasks[1].status == 'completed'
+        assert metrics['tasks_failed'] == 1
+
+    def test_per_agent_concurrency(self):
+        """One agent with three slots runs three tasks at once."""
+        tasks = [_task(f"task_{i}") for i in range(6)]
+        scheduler = WorkStealingScheduler([_agent("solo")], max_concurrent_per_agent=3)
+
+        metrics = asyncio.run(scheduler.run(tasks, _sleeping_executor([], 0.05)))
+
+        assert metrics['max_parallel_tasks'] == 3
+        assert metrics['agents']['solo']['tasks_completed'] == 6
+        assert metrics['agents']['solo']['in_flight'] == 0
+
+    def test_failure_cancels_dependents(self):
+        """Dependents of a failed task are cancelled, unrelated tasks still run."""
+        tasks = [_task("bad"), _task("child", ["bad"]), _task("grandchild", ["child"]),
+                 _task("other")]
+        metrics = asyncio.run(WorkStealingScheduler([_agent("a"), _agent("b")]).run(
+            tasks, _sleeping_executor([], 0.01, fail={"bad"})
+        ))
+
+        statuses = {task.task_id: task.status for task in tasks}
+        assert statuses == {"bad": "failed", "child": "cancelled",
+                            "grandchild": "cancelled", "other": "completed"}
+        assert metrics['tasks_cancelled'] == 2
+
+    def test_priority_order_with_single_slot(self):
+        """Higher-priority ready tasks are pulled first."""
+        tasks = [_task("low", priority=TaskPriority.LOW),
+                 _task("critical", priority=TaskPriority.CRITICAL)]
+        log = []
+
+        asyncio.run(WorkStealingScheduler([_agent("a")]).run(tasks, _sleeping_executor(log, 0.01)))
+
+        starts = [task_id for kind, task_id, _, _ in log if kind == "start"]
+        assert starts == ["critical", "low"]
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark of LinkHealingSystem on a generated docs tree of 20,000 markdown
+files: link scanning cold and with the persisted link index, and healing a
+rename batch through the reverse index against the original full pass.
+
+Run with ``pytest tests/performance/test_link_healing_performance.py -s``
+to see the numbers.
+"""
+
+import random
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts.link_healing_system import LinkHealingSystem
+
+PAGE_COUNT = 20000
+SECTIONS = 100
+LARGE_PAGES = 5
+LARGE_PAGE_LINES = 2000
+RENAMED = 20
+
+
+def _page(i):
+    return f"docs/section_{i % SECTIONS}/page_{i}.md"
+
+
+class LegacyLinkHealingSystem(LinkHealingSystem):
+    """The original scan and heal: every file read in full, line numbers by prefix counting, one replace per link."""
+
+    def _extract_links(self, content, source_file):
+        links = []
+        for pattern_name, pattern in self.link_patterns.items():
+            for match in re.finditer(pattern, content):
+                path_group = 2 if match.re.groups == 2 else 1
+                links.append({
+                    "type": pattern_name,
+                    "text": match.group(1) if path_group == 2 else "",
+                    "path": match.group(path_group),
+                    "line_number": content[:match.start()].count('\n') + 1,
+                    "match_text": match.group(0),
+                    "source_file": source_file
+                })
+        return links
+
+    def scan_all_links(self):
+        all_links = {"markdown_files": [], "python_files": [], "config_files": [], "discovered_links": []}
+        for md_file in self.docs_root.rglob("*.md"):
+            relative_path = str(md_file.relative_to(self.project_root))
+            links = self._extract_links(md_file.read_text(encoding='utf-8'), relative_path)
+            if links:
+                all_links["markdown_files"].append({"file": relative_path, "links": links})
+                all_links["discovered_links"].extend(links)
+        self.all_links = all_links
+        return all_links
+
+    def heal_all_links(self, rename_mapping):
+        stats = {"files_updated": 0, "links_healed": 0, "files_processed": 0}
+        for file_info in self.all_links.get("markdown_files", []):
+            file_path = self.project_root / file_info["file"]
+            updated_content = file_path.read_text(encoding='utf-8')
+            healed = 0
+            for link in file_info["links"]:
+                new_path = self._find_new_path(link["path"], rename_mapping)
+                if new_path and new_path != link["path"]:
+                    updated_content = updated_content.replace(
+                        link["match_text"], link["match_text"].replace(link["path"], new_path)
+                    )
+                    healed += 1
+            if healed:
+                file_path.write_text(updated_content, encoding='utf-8')
+                stats["files_updated"] += 1
+                stats["links_healed"] += healed
+            stats["files_processed"] += 1
+        return stats
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+@pytest.mark.performance
+class TestLinkHealingPerformance:
+    """Test suite for LinkHealingSystem performance at 20,000 markdown files"""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        rng = random.Random(23)
+        legacy_root = self.temp_dir / "legacy"
+        for i in range(PAGE_COUNT):
+            lines = [f"# Page {i}", ""]
+            lines += [f"Paragraph {j} of page {i} without links." for j in range(12)]
+            lines.append(f"Next: [page {i + 1}]({_page((i + 1) % PAGE_COUNT)})")
+            lines.append(f"Related: `{_page(rng.randrange(PAGE_COUNT))}`")
+            if i < LARGE_PAGES:
+                lines += [f"- [entry {j}]({_page(rng.randrange(PAGE_COUNT))}) line {j}" for j in range(LARGE_PAGE_LINES)]
+            path = legacy_root / _page(i)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        self.indexed_root = self.temp_dir / "indexed"
+        shutil.copytree(legacy_root, self.indexed_root)
+        self.legacy_root = legacy_root
+        self.rename_plan = {
+            _page(i): _page(i).replace("page_", "renamed_") for i in rng.sample(range(PAGE_COUNT), RENAMED)
+        }
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_line_numbers_by_bisection(self):
+        contents = [(self.legacy_root / _page(i)).read_text(encoding='utf-8') for i in range(LARGE_PAGES)]
+        legacy, healer = LegacyLinkHealingSystem(str(self.legacy_root)), LinkHealingSystem(str(self.indexed_root))
+
+        legacy_links, legacy_time = _timed(lambda: [legacy._extract_links(content, "docs/x.md") for content in contents])
+        links, bisect_time = _timed(lambda: [healer._extract_links(content, "docs/x.md") for content in contents])
+
+        print(f"\nline numbers of {LARGE_PAGES} pages with {LARGE_PAGE_LINES} links: "
+              f"prefix counting {legacy_time:.3f} s, bisection {bisect_time:.3f} s")
+        assert links == legacy_links
+        assert bisect_time < legacy_time / 3
+
+    def test_scan_and_rename_batch(self):
+        legacy = LegacyLinkHealingSystem(str(self.legacy_root))
+        legacy_links, legacy_scan = _timed(legacy.scan_all_links)
+        legacy_stats, legacy_heal = _timed(lambda: legacy.heal_all_links(legacy.create_rename_mapping(self.rename_plan)))
+
+        builder = LinkHealingSystem(str(self.indexed_root))
+        links, cold_scan = _timed(builder.scan_all_links)
+        builder.close()
+        healer = LinkHealingSystem(str(self.indexed_root))
+        _, warm_scan = _timed(healer.scan_all_links)
+        stats, heal = _timed(lambda: healer.heal_all_links(healer.create_rename_mapping(self.rename_plan)))
+        healer.close()
+
+        print(f"\nscan: original {legacy_scan:.2f} s, cold {cold_scan:.2f} s, indexed {warm_scan:.2f} s")
+        print(f"rename batch of {RENAMED} (scan + heal): original {legacy_scan + legacy_heal:.2f} s reading "
+              f"{legacy_stats['files_processed']} files, indexed {warm_scan + heal:.2f} s reading "
+              f"{stats['files_processed']} files")
+
+        assert len(links["discovered_links"]) == len(legacy_links["discovered_links"])
+        assert stats["files_updated"] == legacy_stats["files_updated"] > 0
+        assert stats["files_processed"] < legacy_stats["files_processed"] / 100
+        for md_file in self.legacy_root.rglob("*.md"):
+            relative_path = md_file.relative_to(self.legacy_root)
+            assert (self.indexed_root / relative_path).read_text(encoding='utf-8') == md_file.read_text(encoding='utf-8')
+        assert warm_scan < legacy_scan / 2
+        assert warm_scan + heal < (legacy_scan + legacy_heal) * 0.7
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Memory of PerformanceOptimizer under sustained traffic: 10,000,000 recorded
+operations must not grow the process beyond the first million's footprint.
+
+The run takes about a minute, so it only runs when selected explicitly:
+``pytest tests/performance/test_performance_optimizer_memory.py -m performance -s``
+"""
+
+import random
+import sys
+import time
+
+import pytest
+
+# Peak RSS via getrusage is Unix-only
+resource = pytest.importorskip("resource")
+
+from utils.quality.performance_optimizer import PerformanceOptimizer
+
+RECORDS = 10_000_000
+WARM_UP = 1_000_000
+HISTORY_SIZE = 1000
+
+
+def _max_rss_mb():
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+@pytest.mark.performance
+class TestPerformanceOptimizerMemory:
+    """Test suite for PerformanceOptimizer memory at 10,000,000 records"""
+
+    def test_memory_is_constant(self, request):
+        if "performance" not in request.config.getoption("markexpr", ""):
+            pytest.skip(f"{RECORDS:,} records; select with -m performance")
+        optimizer = PerformanceOptimizer(history_size=HISTORY_SIZE)
+        rng = random.Random(7)
+        times = [rng.lognormvariate(0, 1.5) for _ in range(10007)]
+        keys = [(f"agent_{i % 4}", f"operation_{i % 5}") for i in range(20)]
+        record = optimizer.record_performance
+
+        started = time.perf_counter()
+        for i in range(WARM_UP):
+            agent_type, operation = keys[i % 20]
+            record(agent_type, operation, times[i % 10007])
+        warm_rss = _max_rss_mb()
+        for i in range(WARM_UP, RECORDS):
+            agent_type, operation = keys[i % 20]
+            record(agent_type, operation, times[i % 10007])
+        elapsed = time.perf_counter() - started
+        final_rss = _max_rss_mb()
+
+        stats, query_time = _timed(lambda: optimizer.get_performance_stats("agent_1"))
+
+        print(f"\n{RECORDS:,} records in {elapsed:.1f} s; peak RSS {warm_rss:.1f} MB after {WARM_UP:,}, "
+              f"{final_rss:.1f} MB after {RECORDS:,}; stats query {query_time * 1000:.2f} ms")
+
+        assert len(optimizer.performance_history) == HISTORY_SIZE
+        assert optimizer.get_performance_stats()["total_operations"] == RECORDS
+        assert stats["total_operations"] == RECORDS // 4
+        assert all(len(s.sketch.buckets) <= s.sketch.max_buckets for s in optimizer.operation_stats.values())
+        assert final_rss - warm_rss < 8
+        assert query_time < 0.05
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark of PromptOptimizer throughput with a cold and a warm persistent
+cache: 2,000 prompts one by one and as a batch with duplicates, each
+repeated after a restart.
+
+Run with ``pytest tests/performance/test_prompt_optimizer_performance.py -s``
+to see the numbers.
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from utils.prompt_management.prompt_optimizer import OptimizationStrategy, PromptOptimizer
+
+PROMPT_COUNT = 2000
+STRATEGIES = list(OptimizationStrategy)
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+@pytest.mark.performance
+class TestPromptOptimizerPerformance:
+    """Test suite for PromptOptimizer cold and warm cache throughput"""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.requests = [
+            (f"Please note that it is important to analyze dataset {i} and kindly describe its trends. " * 6,
+             STRATEGIES[i % len(STRATEGIES)], {"dataset": i})
+            for i in range(PROMPT_COUNT)
+        ]
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, cache_dir, optimize):
+        optimizer = PromptOptimizer(cache_dir=str(self.temp_dir / cache_dir))
+        results, elapsed = _timed(lambda: optimize(optimizer))
+        optimizer.close()
+        return results, elapsed
+
+    def test_warm_cache_throughput(self):
+        one_by_one = lambda optimizer: [optimizer.optimize_prompt(*request) for request in self.requests]
+        cold, cold_time = self._run("single", one_by_one)
+        warm, warm_time = self._run("single", one_by_one)
+
+        # Every request twice: the batch runs each strategy once
+        batch = lambda optimizer: optimizer.optimize_prompts(self.requests + self.requests)
+        cold_batch, cold_batch_time = self._run("batch", batch)
+        warm_batch, warm_batch_time = self._run("batch", batch)
+
+        print(f"\n{PROMPT_COUNT} prompts one by one: cold {PROMPT_COUNT / cold_time:,.0f}/s, "
+              f"warm {PROMPT_COUNT / warm_time:,.0f}/s")
+        print(f"{2 * PROMPT_COUNT} prompts as a batch: cold {2 * PROMPT_COUNT / cold_batch_time:,.0f}/s, "
+              f"warm {2 * PROMPT_COUNT / warm_batch_time:,.0f}/s")
+
+        assert warm == cold
+        assert warm_batch == cold_batch
+        assert [r.optimized_prompt for r in cold_batch] == [r.optimized_prompt for r in cold + cold]
+        assert warm_time < cold_time / 2
+        assert warm_batch_time < cold_batch_time / 2
+        assert cold_batch_time < cold_time
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark of PromptTemplateSystem with 5,000 templates against the original
+eager implementation: cold-start time, render throughput and by-agent
+lookup latency.
+
+Run with ``pytest tests/performance/test_prompt_template_performance.py -s``
+to see the numbers.
+"""
+
+import json
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from utils.prompt_management.prompt_template_system import (
+    PromptTemplate, PromptTemplateSystem, TemplateStatus, TemplateType
+)
+
+TEMPLATE_COUNT = 5000
+AGENT_COUNT = 50
+RENDERS = 20000
+LOOKUPS = 500
+
+
+class LegacyPromptTemplateSystem:
+    """The original eager loader, linear by-agent scan and per-key rendering."""
+
+    def __init__(self, templates_dir):
+        self.templates = {}
+        for template_file in Path(templates_dir).glob("*.json"):
+            with open(template_file, 'r') as f:
+                self.templates[template_file.stem] = PromptTemplate.from_dict(json.load(f))
+
+    def get_templates_by_agent(self, agent_type, status=TemplateStatus.ACTIVE):
+        templates = [t for t in self.templates.values() if t.agent_type == agent_type and t.status == status]
+        return sorted(templates, key=lambda t: t.updated_at, reverse=True)
+
+    def render_template(self, template_id, context=None):
+        rendered = self.templates[template_id].template_text
+        for key, value in (context or {}).items():
+            rendered = rendered.replace(f"{{{{{key}}}}}", str(value))
+        return rendered
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+@pytest.mark.performance
+class TestPromptTemplatePerformance:
+    """Test suite for PromptTemplateSystem performance at 5,000 templates"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        base = datetime(2025, 1, 1)
+        statuses = list(TemplateStatus)
+        for i in range(TEMPLATE_COUNT):
+            template = PromptTemplate(
+                template_id=f"agent_{i % AGENT_COUNT}_template_{i}",
+                name=f"Template {i}",
+                description="Benchmark template",
+                template_type=TemplateType.CONTEXTUAL,
+                agent_type=f"agent_{i % AGENT_COUNT}",
+                template_text=("You are {{role}}. Task: {{task}}. Context: {{context}}. "
+                               "Constraints: {{constraints}}. Format: {{format}}. " * 4),
+                version="1.0.0",
+                status=statuses[i % len(statuses)],
+                created_at=base,
+                updated_at=base + timedelta(seconds=(i * 7919) % TEMPLATE_COUNT),
+                author="benchmark",
+            )
+            with open(self.test_dir / f"{template.template_id}.json", 'w') as f:
+                json.dump(template.to_dict(), f, indent=2)
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_benchmark_against_original(self):
+        agents = [f"agent_{i % AGENT_COUNT}" for i in range(LOOKUPS)]
+        context = {"role": "a reviewer", "task": "review", "context": "repo", "constraints": "none",
+                   "format": "markdown", "unused_a": 1, "unused_b": 2, "unused_c": 3}
+        template_ids = [f"agent_{i % AGENT_COUNT}_template_{i}" for i in range(0, TEMPLATE_COUNT, 50)]
+
+        legacy, legacy_start = _timed(lambda: LegacyPromptTemplateSystem(self.test_dir))
+        first, first_start = _timed(lambda: PromptTemplateSystem(str(self.test_dir)))
+        _, first_lookup = _timed(lambda: first.get_templates_by_agent("agent_0"))
+        system, warm_start = _timed(lambda: PromptTemplateSystem(str(self.test_dir)))
+        _, warm_lookup = _timed(lambda: system.get_templates_by_agent("agent_0"))
+
+        for agent_type in {*agents}:
+            assert ([t.template_id for t in system.get_templates_by_agent(agent_type)] ==
+                    [t.template_id for t in legacy.get_templates_by_agent(agent_type)])
+        for template_id in template_ids:
+            assert system.render_template(template_id, context) == legacy.render_template(template_id, context)
+
+        # Steady state: the original parsed everything at startup, the index loads on first use
+        for agent_type in {*agents}:
+            system.get_templates_by_agent(agent_type)
+        _, legacy_lookups = _timed(lambda: [legacy.get_templates_by_agent(a) for a in agents])
+        _, lookups = _timed(lambda: [system.get_templates_by_agent(a) for a in agents])
+
+        # Contexts often carry a whole state dict, most of it unused by the template
+        wide_context = {**{f"state_{i}": i for i in range(40)}, **context}
+        render_ids = [template_ids[i % len(template_ids)] for i in range(RENDERS)]
+        _, legacy_renders = _timed(lambda: [legacy.render_template(t, context) for t in render_ids])
+        _, renders = _timed(lambda: [system.render_template(t, context) for t in render_ids])
+        _, legacy_wide = _timed(lambda: [legacy.render_template(t, wide_context) for t in render_ids])
+        _, wide = _timed(lambda: [system.render_template(t, wide_context) for t in render_ids])
+
+        print(f"\nPromptTemplateSystem with {TEMPLATE_COUNT} templates")
+        print(f"  cold start (original, parses every file): {legacy_start * 1000:8.1f} ms")
+        print(f"  cold start (lazy, first process):         {first_start * 1000:8.1f} ms"
+              f" + first by-agent query {first_lookup * 1000:.1f} ms")
+        print(f"  cold start (lazy, persisted index):       {warm_start * 1000:8.1f} ms"
+              f" + first by-agent query {warm_lookup * 1000:.1f} ms")
+        print(f"  by-agent lookup: original {legacy_lookups / LOOKUPS * 1e6:8.1f} us,"
+              f" indexed {lookups / LOOKUPS * 1e6:8.1f} us")
+        print(f"  render ({len(context)} keys): original {RENDERS / legacy_renders:10.0f}/s,"
+              f" compiled {RENDERS / renders:10.0f}/s")
+        print(f"  render ({len(wide_context)} keys): original {RENDERS / legacy_wide:10.0f}/s,"
+              f" compiled {RENDERS / wide:10.0f}/s")
+
+        assert warm_start + warm_lookup < legacy_start
+        assert lookups < legacy_lookups
+        assert wide < legacy_wide
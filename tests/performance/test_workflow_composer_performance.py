@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark of WorkflowComposer with 2,000 generated templates: template
+loading with and without the parsed-template cache, and ``compose_workflow``
+latency with indexed selection against scoring every template.
+
+Run with ``pytest tests/performance/test_workflow_composer_performance.py -s``
+to see the numbers.
+"""
+
+import logging
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+import pytest
+
+from workflow.composition.workflow_composer import TEMPLATE_CATEGORY_ENTITIES, WorkflowComposer
+from workflow.models.workflow_models import ComplexityLevel, Entity, TaskAnalysis
+
+TEMPLATE_COUNT = 2000
+ANALYSES = 300
+CONTEXTS = ['@code', '@debug', '@agile', '@git', '@test', '@design', '@docs', '@optimize', '@security', '@research']
+ENTITY_TYPES = sorted({t for types in TEMPLATE_CATEGORY_ENTITIES.values() for t in types})
+
+
+class FullScanWorkflowComposer(WorkflowComposer):
+    """The original selection, scoring every loaded template."""
+
+    def select_template(self, analysis):
+        best_template, best_score = None, 0.0
+        for template in self.templates.values():
+            score = self._calculate_template_score(template, analysis)
+            if score > best_score and score >= 0.6:
+                best_template, best_score = template, score
+        return best_template
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def _latencies(composer, analyses):
+    latencies = []
+    for analysis in analyses:
+        started = time.perf_counter()
+        composer.compose_workflow(analysis)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+@pytest.mark.performance
+class TestWorkflowComposerPerformance:
+    """Test suite for WorkflowComposer performance at 2,000 templates"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        rng = random.Random(17)
+        categories = sorted(TEMPLATE_CATEGORY_ENTITIES) + ['general']
+        for i in range(TEMPLATE_COUNT):
+            phases = "".join(
+                f"  - context: '{context}'\n    phase: {context.strip('@')}_{j}\n"
+                f"    description: Generated phase\n    inputs: [spec]\n    outputs: [result]\n"
+                for j, context in enumerate(rng.sample(CONTEXTS, rng.randint(1, 7)))
+            )
+            with open(f"{self.temp_dir}/template_{i}.yaml", 'w') as f:
+                f.write(f"name: template_{i}\ndescription: Generated template {i}\n"
+                        f"category: {rng.choice(categories)}\ntags: [generated]\ncontexts:\n{phases}")
+        self.analyses = [
+            TaskAnalysis(
+                task_id=f"task_{i}",
+                description="Generated task",
+                entities=[Entity(name=t, type=t, confidence=0.9) for t in rng.sample(ENTITY_TYPES, rng.randint(0, 2))],
+                complexity=rng.choice(list(ComplexityLevel)),
+                required_contexts=rng.sample(CONTEXTS, rng.randint(1, 5)),
+                estimated_duration=60,
+                confidence=0.8,
+            )
+            for i in range(ANALYSES)
+        ]
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_benchmark_against_full_scan(self):
+        logging.disable(logging.INFO)
+        try:
+            _, cold_load = _timed(lambda: WorkflowComposer(template_directory=self.temp_dir))
+            composer, warm_load = _timed(lambda: WorkflowComposer(template_directory=self.temp_dir))
+            legacy = FullScanWorkflowComposer(template_directory=self.temp_dir)
+
+            for analysis in self.analyses:
+                assert composer.select_template(analysis) == legacy.select_template(analysis)
+
+            legacy_latencies = _latencies(legacy, self.analyses)
+            latencies = _latencies(composer, self.analyses)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        def describe(values):
+            values = sorted(values)
+            return (f"median {statistics.median(values) * 1000:7.2f} ms,"
+                    f" p95 {values[int(len(values) * 0.95)] * 1000:7.2f} ms")
+
+        print(f"\nWorkflowComposer with {TEMPLATE_COUNT} templates")
+        print(f"  load, parsing YAML:            {cold_load * 1000:8.1f} ms")
+        print(f"  load, parsed-template cache:   {warm_load * 1000:8.1f} ms")
+        print(f"  compose_workflow, full scan:   {describe(legacy_latencies)}")
+        print(f"  compose_workflow, indexed:     {describe(latencies)}")
+
+        assert warm_load < cold_load
+        assert sum(latencies) < sum(legacy_latencies)
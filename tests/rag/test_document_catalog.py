@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-document catalog that replaces full-collection scrolls
+in the RAG management app.
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from utils.rag.document_catalog import (
+    DocumentCatalog, entries_from_documents, STATUS_DELETING, STATUS_INGESTING
+)
+
+
+def _doc(source, content, **metadata):
+    return SimpleNamespace(page_content=content, metadata={"source": source, **metadata})
+
+
+class TestDocumentCatalog:
+    """Test suite for DocumentCatalog"""
+
+    def setup_method(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.catalog = DocumentCatalog("docs", str(Path(self.test_dir) / "catalog.db"))
+
+    def teardown_method(self):
+        self.catalog.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_entries_group_chunks_by_source(self):
+        entries = entries_from_documents([
+            _doc("guide.md", "a"), _doc("guide.md", "bb"),
+            _doc("https://example.com", "page", source_type="web"),
+            SimpleNamespace(page_content="orphan", metadata={}),
+        ])
+
+        assert [(e.source, e.file_type, e.chunk_count, e.size_bytes) for e in entries] == [
+            ("guide.md", "md", 2, 3),
+            ("https://example.com", "website", 1, 4),
+        ]
+        assert entries[0].content_hash != entries_from_documents([_doc("guide.md", "a")])[0].content_hash
+
+    def test_ingest_commits_only_on_success(self):
+        entries = entries_from_documents([_doc("a.txt", "x"), _doc("b.txt", "y")])
+
+        with pytest.raises(RuntimeError):
+            with self.catalog.ingesting(entries):
+                assert self.catalog.get("a.txt").status == STATUS_INGESTING
+                raise RuntimeError("vector store down")
+
+        assert self.catalog.is_empty()
+
+        with self.catalog.ingesting(entries):
+            pass
+        assert self.catalog.stats() == {"documents": 2, "chunks": 2, "size_bytes": 2}
+
+    def test_reingest_adds_chunks(self):
+        self.catalog.record_ingest(entries_from_documents([_doc("a.txt", "x")]))
+        self.catalog.record_ingest(entries_from_documents([_doc("a.txt", "y"), _doc("a.txt", "z")]))
+
+        assert self.catalog.get("a.txt").chunk_count == 3
+
+    def test_failed_delete_restores_row(self):
+        self.catalog.record_ingest(entries_from_documents([_doc("a.txt", "x")]))
+
+        with pytest.raises(RuntimeError):
+            with self.catalog.deleting("a.txt"):
+                assert self.catalog.get("a.txt").status == STATUS_DELETING
+                raise RuntimeError("qdrant unavailable")
+        assert self.catalog.contains("a.txt")
+
+        with self.catalog.deleting("a.txt"):
+            pass
+        assert not self.catalog.contains("a.txt")
+
+    def test_keyset_pagination(self):
+        self.catalog.record_ingest(entries_from_documents(
+            [_doc(f"doc_{i:03d}.txt", "x") for i in range(25)]
+        ))
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = self.catalog.page(limit=10, after=cursor)
+            seen.extend(e.source for e in page)
+            if cursor is None:
+                break
+
+        assert seen == [f"doc_{i:03d}.txt" for i in range(25)]
+
+    def test_page_filters_by_file_type(self):
+        self.catalog.record_ingest(entries_from_documents([
+            _doc("a.pdf", "x"), _doc("https://example.com", "x")
+        ]))
+
+        page, _ = self.catalog.page(file_type="website")
+        assert [e.source for e in page] == ["https://example.com"]
+
+    def test_rebuild_from_payloads(self):
+        self.catalog.record_ingest(entries_from_documents([_doc("stale.txt", "x")]))
+        payloads = ([{"metadata": {"source": "a.py"}}] * 3
+                    + [{"source": "https://example.com"}, None, {"metadata": {}}])
+
+        assert self.catalog.rebuild(iter(payloads)) == 2
+        assert [(e.source, e.file_type, e.chunk_count) for e in self.catalog.list_documents()] == [
+            ("a.py", "py", 3), ("https://example.com", "website", 1)
+        ]
+
+    def test_collections_are_isolated_and_persistent(self):
+        self.catalog.record_ingest(entries_from_documents([_doc("a.txt", "x")]))
+        other = DocumentCatalog("other", str(Path(self.test_dir) / "catalog.db"))
+        reopened = DocumentCatalog("docs", str(Path(self.test_dir) / "catalog.db"))
+        try:
+            assert other.is_empty()
+            assert reopened.contains("a.txt")
+        finally:
+            other.close()
+            reopened.close()
+
+    def test_listing_cost_independent_of_chunk_count(self):
+        """Listing reads one row per document however many chunks they have."""
+        self.catalog.record_ingest(entries_from_documents(
+            [_doc(f"doc_{i}.txt", "x") for i in range(200) for _ in range(50)]
+        ))
+
+        start = time.perf_counter()
+        page, _ = self.catalog.page(limit=50)
+        stats = self.catalog.stats()
+        elapsed = time.perf_counter() - start
+
+        assert len(page) == 50
+        assert stats["chunks"] == 10000
+        assert elapsed < 0.05
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Tests for the headless golden dataset evaluator.
+
+A small fake coordinator stands in for ``RAGSwarmCoordinator``: its nodes
+are wrapped with ``timed_stage`` and call the LLM gateway and the context
+engine, so record/replay and stage timing are exercised end to end.
+"""
+
+import asyncio
+import json
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from utils.core.llm_gateway import get_llm_gateway
+from utils.rag.golden_evaluation import (
+    FixtureMissingError, FixtureStore, GoldenEvaluator, GoldenQuery, GoldenResult,
+    main, percentile, score_answer, summarize_results
+)
+from utils.rag.stage_timing import NODE_STAGES, timed_stage
+
+
+class FakeChatModel:
+    """Live chat model double counting its calls."""
+
+    calls = 0
+
+    def __init__(self, model, temperature, **kwargs):
+        self.model = model
+
+    async def ainvoke(self, messages, **kwargs):
+        FakeChatModel.calls += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(content=f"answer about {messages}", usage_metadata=None)
+
+
+class FakeContextEngine:
+    """Vector store double returning one result per search."""
+
+    vector_store = None
+
+    def __init__(self):
+        self.searches = 0
+
+    async def semantic_search(self, query, limit=10, context_filter=None, document_filters=None):
+        self.searches += 1
+        return {"results": [{"content": f"chunk for {query}", "relevance_score": 0.9}]}
+
+
+class FakeCoordinator:
+    """Analysis -> retrieval -> writing pipeline shaped like the swarm's nodes."""
+
+    def __init__(self, context_engine, delay=0.0, tracker=None):
+        self.context_engine = context_engine
+        self.delay = delay
+        self.tracker = tracker
+        self.nodes = [timed_stage(NODE_STAGES[name], node) for name, node in (
+            ("query_analyst", self._analyse),
+            ("retrieval_specialist", self._retrieve),
+            ("writer", self._write),
+        )]
+
+    async def _analyse(self, state):
+        time.sleep(self.delay)
+        return {**state, "analysis": state["query"].lower()}
+
+    async def _retrieve(self, state):
+        results = await self.context_engine.semantic_search(state["analysis"], limit=5)
+        return {**state, "chunks": [r["content"] for r in results["results"]]}
+
+    async def _write(self, state):
+        llm = get_llm_gateway().get_client("gemini-2.5-flash", 0.0)
+        response = await llm.ainvoke(f"{state['query']} | {state['chunks']}")
+        return {**state, "response": response.content}
+
+    async def execute(self, query, document_filters=None):
+        if self.tracker is not None:
+            self.tracker.enter()
+        try:
+            if query == "boom":
+                raise RuntimeError("graph failed")
+            state = {"query": query}
+            for node in self.nodes:
+                state = await node(state)
+            retrieved = [SimpleNamespace(tool_call_id=f"retrieval_{i}") for i, _ in enumerate(state["chunks"])]
+            return {"status": "success", "response": state["response"], "messages": retrieved}
+        finally:
+            if self.tracker is not None:
+                self.tracker.exit()
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def enter(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def exit(self):
+        with self.lock:
+            self.active -= 1
+
+
+GOLDEN = [
+    {"id": 1, "query": "What is LangGraph?", "expected": "LangGraph answer", "category": "Factual"},
+    {"id": 2, "query": "How do agents hand off?", "expected": "", "category": "Conceptual"},
+    {"id": 3, "query": "Explain checkpointing", "category": "Procedural"},
+]
+
+
+class TestGoldenEvaluator:
+    """Test suite for GoldenEvaluator"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        FakeChatModel.calls = 0
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _evaluator(self, **kwargs):
+        kwargs.setdefault("coordinator_factory", lambda engine: FakeCoordinator(engine))
+        return GoldenEvaluator(**kwargs)
+
+    def test_results_keep_order_and_write_jsonl(self):
+        output = self.test_dir / "results.jsonl"
+        evaluator = self._evaluator(context_engine=FakeContextEngine(), output_path=str(output),
+                                    fixtures=FixtureStore(str(self.test_dir / "fx.jsonl"), "record"),
+                                    client_factory=FakeChatModel)
+
+        results = evaluator.run(GOLDEN)
+
+        assert [r.query_id for r in results] == [1, 2, 3]
+        assert all(r.success for r in results)
+        assert [r.results_count for r in results] == [1, 1, 1]
+        rows = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [row["type"] for row in rows] == ["result"] * 3 + ["summary"]
+        assert rows[-1]["total"] == 3 and rows[-1]["success_rate"] == 1.0
+
+    def test_stage_latency_breakdown(self):
+        evaluator = self._evaluator(
+            context_engine=FakeContextEngine(),
+            coordinator_factory=lambda engine: FakeCoordinator(engine, delay=0.02),
+            fixtures=FixtureStore(str(self.test_dir / "fx.jsonl"), "record"),
+            client_factory=FakeChatModel,
+        )
+
+        result = evaluator.run(GOLDEN[:1])[0]
+
+        assert set(result.stage_seconds) == {"analysis", "retrieval", "writing"}
+        assert result.stage_seconds["analysis"] >= 0.02
+        assert result.stage_calls == {"analysis": 1, "retrieval": 1, "writing": 1}
+        assert set(evaluator.summary["stages"]) == {"analysis", "retrieval", "writing"}
+
+    def test_record_then_replay_offline(self):
+        fixture_path = str(self.test_dir / "fixtures.jsonl")
+        engine = FakeContextEngine()
+        recorded = self._evaluator(context_engine=engine, client_factory=FakeChatModel,
+                                   fixtures=FixtureStore(fixture_path, "record")).run(GOLDEN)
+        assert FakeChatModel.calls == 3
+        assert engine.searches == 3
+
+        replay_store = FixtureStore(fixture_path, "replay")
+        replayed = self._evaluator(fixtures=replay_store).run(GOLDEN)
+
+        assert FakeChatModel.calls == 3
+        assert [r.response for r in replayed] == [r.response for r in recorded]
+        assert replay_store.hits == 6
+
+    def test_replay_of_unknown_query_fails_that_query_only(self):
+        fixture_path = str(self.test_dir / "fixtures.jsonl")
+        self._evaluator(context_engine=FakeContextEngine(), client_factory=FakeChatModel,
+                        fixtures=FixtureStore(fixture_path, "record")).run(GOLDEN[:1])
+
+        results = self._evaluator(fixtures=FixtureStore(fixture_path, "replay")).run(
+            GOLDEN[:1] + [{"query": "never recorded"}]
+        )
+
+        assert results[0].success
+        assert not results[1].success and "No recorded" in results[1].error
+
+    def test_replay_store_raises_for_missing_fixture(self):
+        fixture_path = str(self.test_dir / "fixtures.jsonl")
+        store = FixtureStore(fixture_path, "record")
+        assert store.lookup("llm", "abc") is None
+        store.record("llm", "abc", "recorded")
+
+        replay_store = FixtureStore(fixture_path, "replay")
+
+        assert replay_store.lookup("llm", "abc") == "recorded"
+        with pytest.raises(FixtureMissingError):
+            replay_store.lookup("llm", "never recorded")
+
+    def test_replay_requires_existing_fixture_file(self):
+        with pytest.raises(FileNotFoundError):
+            FixtureStore(str(self.test_dir / "missing.jsonl"), "replay")
+
+    def test_concurrency_is_bounded(self):
+        tracker = ConcurrencyTracker()
+        evaluator = self._evaluator(
+            context_engine=FakeContextEngine(), concurrency=2,
+            coordinator_factory=lambda engine: FakeCoordinator(engine, delay=0.05, tracker=tracker),
+            fixtures=FixtureStore(str(self.test_dir / "fx.jsonl"), "record"),
+            client_factory=FakeChatModel,
+        )
+
+        evaluator.run([{"query": f"question {i}"} for i in range(6)])
+
+        assert tracker.peak == 2
+
+    def test_errors_are_reported_not_raised(self):
+        evaluator = self._evaluator(context_engine=FakeContextEngine(),
+                                    fixtures=FixtureStore(str(self.test_dir / "fx.jsonl"), "record"),
+                                    client_factory=FakeChatModel)
+
+        result = evaluator.run([{"query": "boom"}])[0]
+
+        assert result.status == "error" and result.error == "graph failed"
+        assert evaluator.summary["success_rate"] == 0.0
+
+    def test_cli_replay(self):
+        fixture_path = str(self.test_dir / "fixtures.jsonl")
+        self._evaluator(context_engine=FakeContextEngine(), client_factory=FakeChatModel,
+                        fixtures=FixtureStore(fixture_path, "record")).run(GOLDEN)
+        dataset = self.test_dir / "golden.json"
+        dataset.write_text(json.dumps(GOLDEN))
+        output = self.test_dir / "cli.jsonl"
+
+        import utils.rag.golden_evaluation as golden_evaluation
+        original = golden_evaluation._default_coordinator_factory
+        golden_evaluation._default_coordinator_factory = lambda engine: FakeCoordinator(engine)
+        try:
+            code = main([str(dataset), "-o", str(output), "--fixtures", fixture_path,
+                         "--fixture-mode", "replay"])
+        finally:
+            golden_evaluation._default_coordinator_factory = original
+
+        assert code == 0
+        assert len(output.read_text().splitlines()) == 4
+
+
+class TestGoldenMetrics:
+    """Test suite for golden evaluation metrics"""
+
+    def test_percentile_interpolates(self):
+        values = [0.1, 0.2, 0.3, 0.4, 0.5]
+        assert percentile(values, 50) == pytest.approx(0.3)
+        assert percentile(values, 95) == pytest.approx(0.48)
+        assert percentile([], 95) == 0.0
+
+    def test_score_answer(self):
+        scores = score_answer("LangGraph builds stateful agent graphs", "stateful agent graphs")
+        assert scores["answered"] == 1.0
+        assert scores["expected_recall"] == 1.0
+        assert 0 < scores["expected_f1"] < 1
+        assert score_answer("Error: quota", "")["answered"] == 0.0
+        assert "expected_recall" not in score_answer("anything", "")
+
+    def test_summary_aggregates(self):
+        results = [
+            GoldenResult(query_id=i, query="q", category="", success=i != 3, status="success",
+                         total_seconds=i / 10, stage_seconds={"retrieval": i / 100},
+                         quality={"answered": 1.0})
+            for i in range(1, 4)
+        ]
+
+        summary = summarize_results(results)
+
+        assert summary["succeeded"] == 2
+        assert summary["latency"]["p50_ms"] == pytest.approx(200)
+        assert summary["stages"]["retrieval"]["p95_ms"] == pytest.approx(29)
+        assert summary["quality"]["answered"] == 1.0
+
+    def test_golden_query_from_app_dict(self):
+        item = GoldenQuery.from_dict({"id": 7, "query": "q", "expected": None,
+                                      "category": "Factual", "created": "2025-01-01"})
+        assert (item.id, item.expected, item.category) == (7, "", "Factual")
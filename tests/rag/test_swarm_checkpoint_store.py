@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for the durable RAG swarm checkpoint store and the node replay that
+lets a restarted ``RAGSwarmCoordinator`` skip already-completed nodes.
+"""
+
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from utils.rag.swarm_checkpoint_store import BLOB_REF, SwarmCheckpointStore
+
+
+DOCUMENT = "LangGraph checkpointers persist graph state between steps. " * 40
+
+
+class TestSwarmCheckpointStore:
+    """Test suite for SwarmCheckpointStore"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.test_dir / "checkpoints.db"
+        self.store = SwarmCheckpointStore(str(self.db_path))
+
+    def teardown_method(self):
+        self.store.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_inputs_and_deltas_survive_reopen(self):
+        self.store.record_input("t1", "start", {"query": "what is rag?", "document_filters": None})
+        self.store.record_node("t1", 0, "query_analyst", {"messages": [{"type": "ai", "data": {"content": "plan"}}]})
+        self.store.record_input("t1", "resume", "approve")
+        self.store.close()
+
+        self.store = SwarmCheckpointStore(str(self.db_path))
+        assert self.store.inputs("t1") == [
+            ("start", {"query": "what is rag?", "document_filters": None}),
+            ("resume", "approve"),
+        ]
+        assert self.store.node_deltas("t1") == [
+            ("query_analyst", {"messages": [{"type": "ai", "data": {"content": "plan"}}]})
+        ]
+        assert self.store.threads() == ["t1"]
+
+    def test_large_documents_are_stored_once(self):
+        delta = {"messages": [{"type": "tool", "data": {"content": DOCUMENT}}]}
+        self.store.record_node("t1", 0, "retrieval_specialist", delta)
+        self.store.record_node("t1", 1, "document_grader", {"messages": [delta["messages"][0]] * 2})
+        self.store.record_node("t2", 0, "retrieval_specialist", delta)
+
+        stats = self.store.get_statistics()
+        assert stats['blobs'] == 1
+        assert stats['deduplicated_bytes'] == 2 * len(DOCUMENT)
+        assert stats['stored_bytes'] < len(DOCUMENT)
+
+        raw = self.store._conn.execute("SELECT delta FROM swarm_node_deltas WHERE step = 1").fetchone()[0]
+        assert BLOB_REF in raw and DOCUMENT not in raw
+        assert self.store.node_deltas("t1")[1][1]["messages"][1]["data"]["content"] == DOCUMENT
+
+    def test_recording_a_step_replaces_later_history(self):
+        for step, node in enumerate(["query_analyst", "retrieval_specialist", "writer"]):
+            self.store.record_node("t1", step, node, {"messages": [node]})
+
+        self.store.record_node("t1", 1, "rewrite_question", {"messages": ["rewrite"]})
+
+        assert [node for node, _ in self.store.node_deltas("t1")] == ["query_analyst", "rewrite_question"]
+
+    def test_unreferenced_blobs_are_removed(self):
+        self.store.record_node("t1", 0, "retrieval_specialist", {"content": DOCUMENT})
+        self.store.record_node("t2", 0, "retrieval_specialist", {"content": DOCUMENT})
+
+        self.store.delete_thread("t1")
+        assert self.store.get_statistics()['blobs'] == 1
+        assert self.store.node_deltas("t2")[0][1] == {"content": DOCUMENT}
+
+        self.store.truncate("t2", 0)
+        assert self.store.get_statistics()['blobs'] == 0
+
+        self.store.record_node("t3", 0, "retrieval_specialist", {"content": DOCUMENT})
+        assert self.store.node_deltas("t3")[0][1] == {"content": DOCUMENT}
+
+
+class TestDurableNodeReplay:
+    """Test suite for RAGSwarmCoordinator durable node replay"""
+
+    def setup_method(self):
+        pytest.importorskip("langgraph")
+        from agents.rag.rag_swarm_coordinator import RAGSwarmCoordinator, _active_thread
+
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.db_path = str(self.test_dir / "checkpoints.db")
+        self.active_thread = _active_thread
+        self.coordinator_class = RAGSwarmCoordinator
+        self.calls = []
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _coordinator(self):
+        coordinator = self.coordinator_class.__new__(self.coordinator_class)
+        coordinator.checkpoint_store = SwarmCheckpointStore(self.db_path)
+        coordinator._threads = OrderedDict()
+        return coordinator
+
+    def _node(self, name):
+        from langchain_core.messages import AIMessage
+
+        def node(state):
+            self.calls.append(name)
+            return {"messages": [AIMessage(content=f"{name}: {DOCUMENT}")]}
+        return node
+
+    def _run(self, coordinator, names, thread_id="thread-1"):
+        token = self.active_thread.set(thread_id)
+        try:
+            return [coordinator._stage_node(name, self._node(name))({"messages": []}) for name in names]
+        finally:
+            self.active_thread.reset(token)
+
+    def test_restarted_thread_skips_completed_nodes(self):
+        first = self._run(self._coordinator(), ["query_analyst", "retrieval_specialist"])
+
+        restarted = self._coordinator()
+        restarted._thread_replay("thread-1").cursor = 0
+        replayed = self._run(restarted, ["query_analyst", "retrieval_specialist", "writer"])
+
+        assert self.calls == ["query_analyst", "retrieval_specialist", "writer"]
+        assert [d["messages"][0].content for d in replayed[:2]] == [d["messages"][0].content for d in first]
+        assert [node for node, _ in restarted.checkpoint_store.node_deltas("thread-1")] == [
+            "query_analyst", "retrieval_specialist", "writer"
+        ]
+
+    def test_diverging_thread_reruns_from_divergence(self):
+        self._run(self._coordinator(), ["query_analyst", "retrieval_specialist", "writer"])
+
+        restarted = self._coordinator()
+        restarted._thread_replay("thread-1").cursor = 0
+        self._run(restarted, ["query_analyst", "rewrite_question"])
+
+        assert self.calls[3:] == ["rewrite_question"]
+        assert [node for node, _ in restarted.checkpoint_store.node_deltas("thread-1")] == [
+            "query_analyst", "rewrite_question"
+        ]
+
+    def test_evicted_node_log_is_reloaded(self, monkeypatch):
+        monkeypatch.setattr("agents.rag.rag_swarm_coordinator.NODE_LOG_CACHE_SIZE", 1)
+        coordinator = self._coordinator()
+        self._run(coordinator, ["query_analyst", "retrieval_specialist"])
+        self._run(coordinator, ["query_analyst"], thread_id="thread-2")
+
+        # Log and cursor of thread-1 are evicted together
+        assert list(coordinator._threads) == ["thread-2"]
+
+        coordinator._thread_replay("thread-1").cursor = 0
+        self._run(coordinator, ["query_analyst", "retrieval_specialist", "writer"])
+
+        assert self.calls == ["query_analyst", "retrieval_specialist", "query_analyst", "writer"]
+        assert [node for node, _ in coordinator._threads["thread-1"].log] == [
+            "query_analyst", "retrieval_specialist", "writer"
+        ]
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for LinkHealingSystem link scanning, the reverse link index and
+offset-sorted link healing.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from scripts.link_healing_system import LINK_INDEX_FILE, LinkHealingSystem, file_contains
+
+REFERENCING = (
+    "# Guide\n"
+    "See [Old](docs/a/old.md) and `docs/a/old.md`.\n"
+    "\n"
+    "Back [up](../a/old.md), keep [other](docs/b/other.md).\n"
+    "Again [Old](docs/a/old.md)\n"
+)
+
+
+class CountingLinkHealingSystem(LinkHealingSystem):
+    """Counts markdown files parsed for links."""
+
+    parsed = 0
+
+    def _extract_links(self, content, source_file):
+        type(self).parsed += 1
+        return super()._extract_links(content, source_file)
+
+
+class TestLinkHealingSystem:
+    """Test suite for LinkHealingSystem"""
+
+    def setup_method(self):
+        self.project = Path(tempfile.mkdtemp())
+        self._write("docs/a/old.md", "# Old\n")
+        self._write("docs/a/ref.md", REFERENCING)
+        self._write("docs/b/other.md", "# Other\n[sibling](sibling.md)\n")
+        self._write("docs/b/sibling.md", "# Sibling\n")
+        CountingLinkHealingSystem.parsed = 0
+
+    def teardown_method(self):
+        shutil.rmtree(self.project, ignore_errors=True)
+
+    def _write(self, path, content):
+        full_path = self.project / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content, encoding='utf-8')
+
+    def test_links_carry_line_numbers_and_source_file(self):
+        healer = LinkHealingSystem(str(self.project))
+        links = healer._extract_links_from_file(self.project / "docs/a/ref.md")
+
+        assert {link["source_file"] for link in links} == {"docs/a/ref.md"}
+        assert {(link["type"], link["line_number"]) for link in links if link["path"] == "../a/old.md"} == {
+            ("markdown_links", 4), ("relative_paths", 4)
+        }
+        assert sorted(link["line_number"] for link in links if link["type"] == "docs_references") == [2, 4, 5]
+
+    def test_file_contains_finds_marker_across_chunk_boundaries(self):
+        path = self.project / "module.py"
+        path.write_bytes(b"x" * 1021 + b'"docs/a.md"')
+
+        assert file_contains(path, b"docs/", chunk_size=1024)
+        assert file_contains(path, b"docs/", chunk_size=7)
+        assert not file_contains(path, b"guides/", chunk_size=7)
+
+    def test_heal_rewrites_only_referencing_files_once(self):
+        healer = LinkHealingSystem(str(self.project))
+        healer.scan_all_links()
+        other_before = (self.project / "docs/b/other.md").stat().st_mtime_ns
+
+        mapping = healer.create_rename_mapping({"docs/a/old.md": "docs/a/new.md"})
+        stats = healer.heal_all_links(mapping)
+
+        assert stats == {"files_updated": 1, "links_healed": 4, "files_processed": 1}
+        assert (self.project / "docs/a/ref.md").read_text(encoding='utf-8') == (
+            "# Guide\n"
+            "See [Old](docs/a/new.md) and `docs/a/new.md`.\n"
+            "\n"
+            "Back [up](../a/new.md), keep [other](docs/b/other.md).\n"
+            "Again [Old](docs/a/new.md)\n"
+        )
+        assert (self.project / "docs/b/other.md").stat().st_mtime_ns == other_before
+        assert healer.files_referencing(["docs/a/new.md"]) == ["docs/a/ref.md"]
+        assert healer.files_referencing(["docs/a/old.md"]) == []
+
+    def test_reverse_index_is_persisted_and_refreshed_incrementally(self):
+        CountingLinkHealingSystem(str(self.project)).scan_all_links()
+        assert CountingLinkHealingSystem.parsed == 4
+        assert (self.project / LINK_INDEX_FILE).exists()
+
+        reopened = CountingLinkHealingSystem(str(self.project))
+        assert reopened.files_referencing(["docs/a/old.md"]) == ["docs/a/ref.md"]
+        assert reopened.files_referencing(["docs/b/sibling.md"]) == ["docs/b/other.md"]
+        assert CountingLinkHealingSystem.parsed == 4
+
+        self._write("docs/b/third.md", "[old](../a/old.md)\n")
+        (self.project / "docs/a/ref.md").unlink()
+        reopened.scan_all_links()
+
+        assert CountingLinkHealingSystem.parsed == 5
+        assert reopened.files_referencing(["docs/a/old.md"]) == ["docs/b/third.md"]
+
+    def test_validation_resolves_links_against_their_file(self):
+        healer = LinkHealingSystem(str(self.project))
+        healer.scan_all_links()
+
+        results = healer.validate_all_links()
+
+        valid = {(link["source_file"], link["path"]) for link in results["valid_links"]}
+        assert ("docs/b/other.md", "sibling.md") in valid
+        assert ("docs/a/ref.md", "docs/b/other.md") in valid
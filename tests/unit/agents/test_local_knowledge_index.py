@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent local knowledge index used by
+ComprehensiveResearchAgent, and for its concurrent research sources.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from agents.research.local_knowledge_index import LocalKnowledgeIndex
+
+
+class TestLocalKnowledgeIndex:
+    """Test suite for LocalKnowledgeIndex"""
+
+    def setup_method(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "docs" / "guides").mkdir(parents=True)
+        (self.root / "docs" / "guides" / "testing.md").write_text("Pytest FIXTURES and mocks")
+        (self.root / "docs" / "caching.md").write_text("LRU eviction")
+        (self.root / "agents").mkdir()
+        (self.root / "agents" / "testing_agent.py").write_text("")
+        (self.root / "agents" / "cache.json").write_text("{}")
+        (self.root / ".git").mkdir()
+        (self.root / ".git" / "testing_hook.py").write_text("")
+        self.db_path = self.root / "index.db"
+
+    def teardown_method(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_queries(self):
+        index = LocalKnowledgeIndex(self.root, self.db_path, refresh_interval=0)
+
+        assert index.relevant_documents("how do fixtures work") == [
+            str(self.root / "docs" / "guides" / "testing.md")
+        ]
+        assert index.files_matching("testing", suffix=".py", min_word_length=3) == [
+            str(self.root / "agents" / "testing_agent.py")
+        ]
+        assert index.files_matching("cache") == [str(self.root / "agents" / "cache.json")]
+        index.close()
+
+    def test_only_changed_documents_are_reread(self):
+        index = LocalKnowledgeIndex(self.root, self.db_path, refresh_interval=0)
+        index.refresh()
+        assert index.documents_read == 2
+
+        index.refresh()
+        assert index.documents_read == 2
+
+        doc = self.root / "docs" / "caching.md"
+        doc.write_text("LRU eviction with write-through persistence")
+        os.utime(doc, (time.time() + 5, time.time() + 5))
+        assert index.relevant_documents("persistence") == [str(doc)]
+        assert index.documents_read == 3
+        index.close()
+
+    def test_contents_persist_across_instances(self):
+        LocalKnowledgeIndex(self.root, self.db_path, refresh_interval=0).refresh()
+
+        reopened = LocalKnowledgeIndex(self.root, self.db_path, refresh_interval=0)
+        assert reopened.relevant_documents("eviction") == [str(self.root / "docs" / "caching.md")]
+        assert reopened.documents_read == 0
+        reopened.close()
+
+    def test_deleted_documents_drop_out(self):
+        index = LocalKnowledgeIndex(self.root, self.db_path, refresh_interval=0)
+        assert index.relevant_documents("eviction")
+
+        (self.root / "docs" / "caching.md").unlink()
+        assert index.relevant_documents("eviction") == []
+        index.close()
+
+    def test_refresh_interval_throttles_walks(self):
+        index = LocalKnowledgeIndex(self.root, refresh_interval=60)
+        assert index.files_matching("newfile") == []
+
+        (self.root / "newfile.txt").write_text("")
+        assert index.files_matching("newfile") == []
+
+        index.refresh(force=True)
+        assert index.files_matching("newfile") == [str(self.root / "newfile.txt")]
+
+
+class TestConcurrentResearchSources:
+    """Test suite for ComprehensiveResearchAgent source fan-out"""
+
+    def setup_method(self):
+        pytest.importorskip("pydantic")
+        from agents.research.comprehensive_research_agent import ComprehensiveResearchAgent
+        self.root = Path(tempfile.mkdtemp())
+        self.agent = ComprehensiveResearchAgent(project_root=str(self.root))
+
+    def teardown_method(self):
+        self.agent.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_sources_run_concurrently_with_timeouts(self):
+        from agents.research.comprehensive_research_agent import ResearchDomain, ResearchStatus
+
+        async def slow(query, delay, name):
+            await asyncio.sleep(delay)
+            return {"findings": {name: True}, "sources": [{"type": name}], "confidence": 0.8}
+
+        self.agent.web_search_enabled = True
+        self.agent._research_domain_specific = lambda q: slow(q, 0.2, "domain")
+        self.agent._research_local_knowledge = lambda q: slow(q, 0.2, "local")
+        self.agent._research_web_search = lambda q: slow(q, 5, "web")
+        self.agent.source_timeouts["web_search"] = 0.3
+
+        started = time.perf_counter()
+        result = asyncio.run(self.agent.research("caching strategies", ResearchDomain.TECHNOLOGY,
+                                                 use_cache=False))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.6
+        assert result.status == ResearchStatus.COMPLETED
+        assert set(result.findings) == {"domain", "local"}
+        assert "web_search" in result.metadata["source_errors"]
+
+    def test_result_cache_served_from_memory(self):
+        from agents.research.comprehensive_research_agent import ResearchDomain, ResearchStatus
+
+        first = asyncio.run(self.agent.research("caching strategies", ResearchDomain.TECHNOLOGY))
+        self.agent._cache_result(first)
+        self.agent._connection().execute("DELETE FROM research_results")
+
+        cached = asyncio.run(self.agent.research("caching strategies", ResearchDomain.TECHNOLOGY))
+        assert cached.status == ResearchStatus.CACHED
+        assert self.agent.research_cache[first.query_id].status != ResearchStatus.CACHED
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent PromptOptimizer result cache: warm restarts,
+size-based LRU eviction, concurrent writers and batch optimization.
+"""
+
+import shutil
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from utils.prompt_management.prompt_optimizer import (
+    OPTIMIZATION_CACHE_FILE, OptimizationStrategy, PromptOptimizer
+)
+
+PROMPT = "Please note that it is important to analyze the quarterly data thoroughly."
+
+
+class CountingPromptOptimizer(PromptOptimizer):
+    """Counts strategy runs."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.runs = 0
+
+    def _run_optimization(self, prompt, strategy, context=None):
+        self.runs += 1
+        return super()._run_optimization(prompt, strategy, context)
+
+
+def _write_prompts(cache_dir, worker):
+    optimizer = PromptOptimizer(cache_dir=cache_dir)
+    requests = [(f"Analyze dataset {i % 40} for worker-independent insights.", OptimizationStrategy.CLARITY_ENHANCEMENT)
+                for i in range(worker, worker + 60)]
+    for prompt, strategy in requests[:20]:
+        optimizer.optimize_prompt(prompt, strategy)
+    optimizer.optimize_prompts(requests[20:])
+    return len(requests)
+
+
+class TestPromptOptimizerCache:
+    """Test suite for the PromptOptimizer persistent cache"""
+
+    def setup_method(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_results_survive_restart(self):
+        first = CountingPromptOptimizer(cache_dir=str(self.cache_dir))
+        result = first.optimize_prompt(PROMPT, OptimizationStrategy.CONTEXT_OPTIMIZATION, {"team": "finance"})
+        assert first.runs == 1
+
+        restarted = CountingPromptOptimizer(cache_dir=str(self.cache_dir))
+        cached = restarted.optimize_prompt(PROMPT, OptimizationStrategy.CONTEXT_OPTIMIZATION, {"team": "finance"})
+
+        assert restarted.runs == 0
+        assert cached == result
+        assert cached.strategy is OptimizationStrategy.CONTEXT_OPTIMIZATION
+        # Other context, other entry
+        restarted.optimize_prompt(PROMPT, OptimizationStrategy.CONTEXT_OPTIMIZATION, {"team": "sales"})
+        assert restarted.runs == 1
+        assert [path.name for path in self.cache_dir.iterdir() if path.suffix == ".json"] == []
+
+    def test_least_recently_used_results_are_evicted(self):
+        optimizer = PromptOptimizer(cache_dir=str(self.cache_dir))
+        prompts = [f"Prompt number {i:02d} asks to explain a topic in detail." for i in range(12)]
+        optimizer.optimize_prompt(prompts[0], OptimizationStrategy.TOKEN_REDUCTION)
+        cache = optimizer.optimization_cache
+        # Room for seven results
+        cache.max_bytes = cache.total_bytes() * 15 // 2
+        for prompt in prompts[1:6]:
+            optimizer.optimize_prompt(prompt, OptimizationStrategy.TOKEN_REDUCTION)
+        # Reading the first prompt makes it the most recently used
+        optimizer.optimize_prompt(prompts[0], OptimizationStrategy.TOKEN_REDUCTION)
+        for prompt in prompts[6:]:
+            optimizer.optimize_prompt(prompt, OptimizationStrategy.TOKEN_REDUCTION)
+
+        stored = [optimizer._generate_cache_key(prompt, OptimizationStrategy.TOKEN_REDUCTION) in cache
+                  for prompt in prompts]
+        assert stored == [True] + [False] * 5 + [True] * 6
+        assert 0 < cache.total_bytes() <= cache.max_bytes
+        with sqlite3.connect(str(self.cache_dir / OPTIMIZATION_CACHE_FILE)) as conn:
+            assert conn.execute("SELECT SUM(size) FROM optimizations").fetchone()[0] == cache.total_bytes()
+
+    def test_concurrent_writers_share_one_store(self):
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            counts = list(executor.map(_write_prompts, [str(self.cache_dir)] * 4, range(0, 40, 10)))
+
+        assert counts == [60] * 4
+        optimizer = CountingPromptOptimizer(cache_dir=str(self.cache_dir))
+        results = optimizer.optimize_prompts([
+            (f"Analyze dataset {i} for worker-independent insights.", OptimizationStrategy.CLARITY_ENHANCEMENT)
+            for i in range(40)
+        ])
+        assert optimizer.runs == 0
+        assert len(optimizer.optimization_cache) == 40
+        assert all(result.optimized_prompt.startswith("Instructions:") for result in results)
+
+    def test_batch_deduplicates_and_history_is_bounded(self):
+        optimizer = CountingPromptOptimizer(cache_dir=str(self.cache_dir), history_size=3)
+        requests = [
+            (PROMPT, OptimizationStrategy.TOKEN_REDUCTION),
+            (PROMPT, OptimizationStrategy.CLARITY_ENHANCEMENT),
+            (PROMPT, OptimizationStrategy.TOKEN_REDUCTION, None),
+            (PROMPT, OptimizationStrategy.TOKEN_REDUCTION, {}),
+            ("Describe the deployment.", OptimizationStrategy.PERFORMANCE_TUNING),
+        ]
+
+        results = optimizer.optimize_prompts(requests)
+
+        assert optimizer.runs == 3
+        assert [result.strategy for result in results] == [request[1] for request in requests]
+        assert results[0] == results[2] == results[3]
+        assert results == [optimizer.optimize_prompt(*request) for request in requests]
+        assert optimizer.runs == 3
+
+        for i in range(5):
+            optimizer.optimize_prompt(f"Explain step {i}.", OptimizationStrategy.TOKEN_REDUCTION)
+        assert [result.original_prompt for result in optimizer.get_optimization_history()] == [
+            "Explain step 2.", "Explain step 3.", "Explain step 4."
+        ]
+        assert len(optimizer.get_optimization_history(limit=2)) == 2
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy loading, compiled rendering and secondary indexes of
+PromptTemplateSystem.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from utils.prompt_management.prompt_template_system import (
+    INDEX_FILE_NAME, CompiledTemplate, PromptTemplateSystem, TemplateStatus, TemplateType
+)
+
+
+def legacy_render(text, context):
+    """The original per-key ``str.replace`` rendering."""
+    for key, value in context.items():
+        text = text.replace(f"{{{{{key}}}}}", str(value))
+    return text
+
+
+class TestCompiledTemplate:
+    """Test suite for CompiledTemplate"""
+
+    def test_matches_sequential_replace(self):
+        cases = [
+            ("Hello {{name}}, analyze {{data}}.", {"name": "Alice", "data": "sales"}),
+            ("{{a}}{{a}} {{missing}} {{ a }}", {"a": 1}),
+            ("{{{x}}} and {{x}}}}", {"x": "X"}),
+            ("no placeholders", {"x": 1}),
+            ("{{1}} {{}}", {1: "one", "": "empty"}),
+            ("{{x}}", {}),
+        ]
+        for text, context in cases:
+            assert CompiledTemplate(text).render(context) == legacy_render(text, context)
+
+    def test_parses_placeholders_once(self):
+        compiled = CompiledTemplate("A {{x}} B {{y}}")
+
+        assert compiled.names == ["x", "y"]
+        assert compiled.literals == ["A ", " B ", ""]
+
+
+class TestPromptTemplateIndex:
+    """Test suite for PromptTemplateSystem lazy loading and indexes"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.system = PromptTemplateSystem(templates_dir=str(self.test_dir), validate_interval=0)
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _create(self, name, agent_type="agent_a", text="Prompt {{x}}"):
+        return self.system.create_template(
+            name=name, description=name, template_type=TemplateType.SIMPLE,
+            agent_type=agent_type, template_text=text, author="test_user"
+        )
+
+    def _activate_all(self):
+        for template_id in list(self.system.templates):
+            self.system.update_template(template_id, {'status': TemplateStatus.ACTIVE})
+
+    def test_by_agent_index_follows_updates_and_deletes(self):
+        first = self._create("first")
+        second = self._create("second")
+        other = self._create("other", agent_type="agent_b")
+        self._activate_all()
+
+        assert [t.template_id for t in self.system.get_templates_by_agent("agent_a")] == [second, first]
+
+        self.system.update_template(first, {'description': 'touched'})
+        assert [t.template_id for t in self.system.get_templates_by_agent("agent_a")] == [first, second]
+
+        self.system.update_template(second, {'status': TemplateStatus.DEPRECATED})
+        assert [t.template_id for t in self.system.get_templates_by_agent("agent_a")] == [first]
+        assert [t.template_id for t in self.system.get_templates_by_agent(
+            "agent_a", TemplateStatus.DEPRECATED)] == [second]
+
+        self.system.delete_template(first)
+        assert self.system.get_templates_by_agent("agent_a") == []
+        assert [t.template_id for t in self.system.get_templates_by_agent("agent_b")] == [other]
+
+    def test_cold_start_is_lazy_and_uses_persisted_index(self):
+        for i in range(5):
+            self._create(f"template {i}", agent_type=f"agent_{i % 2}")
+        self._activate_all()
+        self.system.get_templates_by_agent("agent_0")
+        assert (self.test_dir / INDEX_FILE_NAME).exists()
+
+        reopened = PromptTemplateSystem(templates_dir=str(self.test_dir), validate_interval=0)
+        assert len(reopened.templates) == 5
+        assert reopened.templates.files_parsed == 0
+
+        result = reopened.get_templates_by_agent("agent_1")
+        assert [t.template_id for t in result] == [
+            t.template_id for t in self.system.get_templates_by_agent("agent_1")
+        ]
+        assert reopened.templates.files_parsed == len(result)
+
+    def test_changed_files_are_reloaded(self):
+        template_id = self._create("edited", text="Old {{x}}")
+        assert self.system.render_template(template_id, {"x": 1}) == "Old 1"
+
+        path = self.test_dir / f"{template_id}.json"
+        data = json.loads(path.read_text())
+        data['template_text'] = "New text for {{x}}"
+        data['status'] = 'active'
+        path.write_text(json.dumps(data))
+        os.utime(path, (time.time() + 5, time.time() + 5))
+
+        assert self.system.render_template(template_id, {"x": 2}) == "New text for 2"
+        assert [t.template_id for t in self.system.get_templates_by_agent("agent_a")] == [template_id]
+
+    def test_stale_persisted_index_entries_are_reparsed(self):
+        template_id = self._create("stale")
+        self._activate_all()
+        self.system.get_templates_by_agent("agent_a")
+
+        path = self.test_dir / f"{template_id}.json"
+        data = json.loads(path.read_text())
+        data['agent_type'] = 'agent_z'
+        path.write_text(json.dumps(data, indent=4))
+
+        reopened = PromptTemplateSystem(templates_dir=str(self.test_dir), validate_interval=0)
+        assert reopened.get_templates_by_agent("agent_a") == []
+        assert [t.template_id for t in reopened.get_templates_by_agent("agent_z")] == [template_id]
+
+    def test_unparseable_files_are_skipped(self):
+        self._create("good")
+        (self.test_dir / "broken.json").write_text("{not json")
+
+        reopened = PromptTemplateSystem(templates_dir=str(self.test_dir), validate_interval=0)
+        assert reopened.get_template("broken") is None
+        assert [t.name for t in reopened.templates.values()] == ["good"]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for BrokenWindowsDetector incremental scans: cached per-file results,
+link checks that follow renamed targets, and process-pool scanning.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from utils.quality.broken_windows_detector import SCAN_CACHE_FILE, BrokenWindowsDetector, DisorderType
+
+GUIDE = (
+    "# Guide\n\n"
+    "Read the [setup notes](setup/install.md) and the [API](/docs/api.md) first.\n"
+    "Then visit <a href=\"missing.html\">the index</a> or [home](https://example.com).\n"
+)
+
+
+def _signature(disorders):
+    return sorted((d.file_path, d.disorder_type.value, d.description) for d in disorders)
+
+
+class TestBrokenWindowsDetector:
+    """Test suite for BrokenWindowsDetector"""
+
+    def setup_method(self):
+        self.project = Path(tempfile.mkdtemp())
+        self._write("docs/guide.md", GUIDE)
+        self._write("docs/api.md", "# API\n\nTODO: document the endpoints.\n")
+        self._write("docs/setup/old_install.md", "# Install\n")
+        self._write("src/module.py", "def run():\n    return 1  # FIXME\n")
+
+    def teardown_method(self):
+        shutil.rmtree(self.project, ignore_errors=True)
+
+    def _write(self, path, content):
+        full_path = self.project / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content, encoding='utf-8')
+
+    def _broken_links(self, disorders):
+        return sorted(d.description for d in disorders if d.disorder_type == DisorderType.BROKEN_LINK)
+
+    def test_links_resolve_against_project_root(self):
+        disorders = BrokenWindowsDetector(str(self.project)).detect_all_disorders()
+
+        assert self._broken_links(disorders) == [
+            "Broken link: 'missing.html' → 'missing.html'",
+            "Broken link: 'setup notes' → 'setup/install.md'",
+        ]
+        # An href link no longer aborts the rest of the file's checks
+        assert (os.path.join("docs", "guide.md"), DisorderType.INCOMPLETE_DOCUMENT) in {
+            (d.file_path, d.disorder_type) for d in disorders
+        }
+        assert {d.file_path for d in disorders if d.disorder_type == DisorderType.PLACEHOLDER_CONTENT} == {
+            os.path.join("docs", "api.md"), os.path.join("src", "module.py")
+        }
+
+    def test_unchanged_files_come_from_cache(self):
+        first = BrokenWindowsDetector(str(self.project))
+        baseline = _signature(first.detect_all_disorders())
+        assert first.last_scan_stats == {"files": 4, "scanned": 4, "cached": 0}
+        assert (self.project / SCAN_CACHE_FILE).exists()
+
+        reopened = BrokenWindowsDetector(str(self.project))
+        assert _signature(reopened.detect_all_disorders()) == baseline
+        assert reopened.last_scan_stats["scanned"] == 0
+
+        # Touched without changes: hashed, not rescanned
+        api = self.project / "docs" / "api.md"
+        stat = api.stat()
+        os.utime(api, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert _signature(reopened.detect_all_disorders()) == baseline
+        assert reopened.last_scan_stats["scanned"] == 0
+
+        self._write("docs/api.md", "# API\n\nThe endpoints are documented below.\n")
+        disorders = reopened.detect_all_disorders()
+        assert reopened.last_scan_stats == {"files": 4, "scanned": 1, "cached": 3}
+        assert os.path.join("docs", "api.md") not in {
+            d.file_path for d in disorders if d.disorder_type == DisorderType.PLACEHOLDER_CONTENT
+        }
+
+    def test_renamed_target_fixes_and_breaks_cached_links(self):
+        detector = BrokenWindowsDetector(str(self.project))
+        assert "Broken link: 'setup notes' → 'setup/install.md'" in self._broken_links(detector.detect_all_disorders())
+
+        os.rename(self.project / "docs/setup/old_install.md", self.project / "docs/setup/install.md")
+        fixed = self._broken_links(detector.detect_all_disorders())
+        assert "Broken link: 'setup notes' → 'setup/install.md'" not in fixed
+        # guide.md itself was not rescanned, only its link re-checked
+        assert detector.last_scan_stats["scanned"] == 1
+
+        os.remove(self.project / "docs/api.md")
+        broken = self._broken_links(BrokenWindowsDetector(str(self.project)).detect_all_disorders())
+        assert "Broken link: 'API' → '/docs/api.md'" in broken
+
+    def test_process_pool_matches_serial_scan(self):
+        for i in range(12):
+            self._write(f"notes/Note {i}.md", f"# Note {i}\n\nSee [next](Note {i + 1}.md). PLACEHOLDER\n")
+
+        cache_dir = Path(tempfile.mkdtemp())
+        serial = BrokenWindowsDetector(str(self.project), cache_path=str(cache_dir / "serial.json"),
+                                       max_workers=1)
+        pooled = BrokenWindowsDetector(str(self.project), cache_path=str(cache_dir / "pooled.json"),
+                                       max_workers=2, parallel_threshold=1)
+
+        try:
+            assert _signature(pooled.detect_all_disorders()) == _signature(serial.detect_all_disorders())
+            assert pooled.last_scan_stats["scanned"] == 16
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def test_changed_rules_invalidate_cache(self):
+        BrokenWindowsDetector(str(self.project)).detect_all_disorders()
+
+        detector = BrokenWindowsDetector(str(self.project))
+        detector.placeholder_patterns.append(r'\bendpoints\b')
+        disorders = detector.detect_all_disorders()
+
+        assert detector.last_scan_stats["scanned"] == 4
+        assert any("endpoints" in d.description for d in disorders)
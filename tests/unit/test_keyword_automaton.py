@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the Aho-Corasick keyword automaton and the detectors built on it.
+
+The detectors are checked against the original nested substring scans so
+single-pass matching keeps their exact detection semantics.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from utils.keyword_automaton import ConfigSignature, KeywordAutomaton
+
+
+CONFIG = {
+    'foundation_rules': {},
+    'contexts': {
+        'CODING': {
+            'priority': 2,
+            'detection_patterns': {
+                'keywords': ['@code', '@implement'],
+                'message': ['implement', 'refactor'],
+                'confidence_threshold': 0.7,
+            },
+            'rules': {'foundation': ['safety_first_principle'], 'context': ['tdd']},
+        },
+        'DEBUGGING': {
+            'priority': 3,
+            'detection_patterns': {
+                'keywords': ['@debug'],
+                'message': ['bug', 'debug', 'failing'],
+                'confidence_threshold': 0.6,
+            },
+            'rules': {'context': ['root_cause_analysis']},
+        },
+        'SECURITY': {
+            'detection_patterns': {
+                'keywords': ['@secure'],
+                'message': ['vulnerability'],
+                'confidence_threshold': 0.9,
+            },
+            'rules': {'context': ['threat_modeling']},
+        },
+    },
+}
+
+
+def naive_unified_matches(keywords_map, message):
+    """The original per-keyword scan of UnifiedKeywordDetector."""
+    message_lower = message.lower()
+    detected = []
+    for keyword, config in keywords_map.items():
+        if keyword.lower() in message_lower:
+            detected.append((keyword, 'direct_keyword'))
+            continue
+        for pattern in config.get('message_patterns', []):
+            if pattern.lower() in message_lower and config.get('confidence_threshold', 0.7) <= 0.8:
+                first = next(p for p in config['message_patterns'] if p.lower() in message_lower)
+                detected.append((keyword, f'pattern_match:{first}'))
+                break
+    return detected
+
+
+class TestKeywordAutomaton:
+    """Test suite for KeywordAutomaton"""
+
+    def test_overlapping_and_nested_patterns(self):
+        automaton = KeywordAutomaton([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+
+        matches = sorted(automaton.iter_matches("uSHErs"))
+
+        assert matches == [(1, "she"), (2, "he"), (2, "hers")]
+        assert sorted(automaton.payloads("ushers")) == [1, 2, 4]
+
+    def test_duplicate_patterns_keep_every_payload(self):
+        automaton = KeywordAutomaton([("test", "A"), ("Test", "B"), ("bug", "C")])
+
+        assert len(automaton) == 2
+        assert sorted(automaton.payloads("failing TEST, failing test")) == ["A", "B"]
+        assert automaton.search("a bug and a bug") == {"bug": 2}
+
+    def test_matches_substring_semantics(self):
+        rng = random.Random(7)
+        patterns = ["".join(rng.choice("abc@") for _ in range(rng.randint(1, 4))) for _ in range(40)]
+        automaton = KeywordAutomaton((pattern, pattern) for pattern in patterns)
+
+        for _ in range(200):
+            text = "".join(rng.choice("abcAB@ ") for _ in range(rng.randint(0, 30)))
+            expected = {pattern.lower() for pattern in patterns if pattern.lower() in text.lower()}
+            assert set(automaton.search(text)) == expected
+
+    def test_patterns_added_after_build(self):
+        automaton = KeywordAutomaton([("alpha", 1)])
+        automaton.add("pha", 2)
+
+        assert sorted(automaton.payloads("alphabet")) == [1, 2]
+
+    def test_config_signature(self):
+        test_dir = Path(tempfile.mkdtemp())
+        try:
+            path = test_dir / "config.yaml"
+            path.write_text("a: 1\n")
+            signature = ConfigSignature(str(path))
+            assert not signature.changed()
+
+            path.write_text("a: 12\n")
+            assert signature.changed()
+            assert not signature.changed()
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+
+class TestKeywordDetectors:
+    """Test suite for automaton-backed keyword detectors"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config_path = self.test_dir / "mappings.yaml"
+        self.config_path.write_text(yaml.safe_dump(CONFIG))
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_unified_detector_matches_original_scan(self):
+        from utils.unified_keyword_detector import UnifiedKeywordDetector
+
+        detector = UnifiedKeywordDetector(config_path=str(self.config_path))
+        messages = [
+            "@CODE the parser", "refactor then debug the failing bug",
+            "found a vulnerability", "@secure it", "please analyze and examine", "nothing here",
+        ]
+
+        for message in messages:
+            detected = detector._detect_keywords(message)
+            expected = naive_unified_matches(detector.keywords_map, message)
+            expected.sort(key=lambda item: detector.keywords_map[item[0]]['priority'], reverse=True)
+            assert [(d['keyword'], d['detection_method']) for d in detected] == expected
+
+        detected = detector._detect_keywords("refactor then debug the failing bug")
+        assert len({d['event_id'] for d in detected}) == len(detected)
+        assert len({d['timestamp'] for d in detected}) == 1
+
+    def test_unified_detector_rebuilds_when_yaml_changes(self):
+        from utils.unified_keyword_detector import UnifiedKeywordDetector
+
+        detector = UnifiedKeywordDetector(config_path=str(self.config_path))
+        automaton = detector.automaton
+        detector._detect_keywords("@docs please")
+        assert detector.automaton is automaton
+
+        config = yaml.safe_load(self.config_path.read_text())
+        config['contexts']['DOCS'] = {'detection_patterns': {'keywords': ['@docs']}, 'rules': {}}
+        self.config_path.write_text(yaml.safe_dump(config))
+        os.utime(self.config_path, (time.time() + 5, time.time() + 5))
+
+        detected = detector._detect_keywords("@docs please")
+        assert [d['keyword'] for d in detected] == ['@docs']
+        assert detector.automaton is not automaton
+
+    def test_yaml_detector_matches_original_scan(self):
+        from utils.yaml_based_keyword_detector import YamlBasedKeywordDetector
+
+        detector = YamlBasedKeywordDetector(config_path=str(self.config_path))
+        for message in ["implement @debug", "vulnerability", "@secure", "@monitor it", "hello"]:
+            expected = [keyword for keyword, _ in naive_unified_matches(detector.keywords_map, message)]
+            assert [keyword for keyword, _ in detector._matching_keywords(message)] == expected
+
+
+class TestIntelligentContextDetector:
+    """Test suite for automaton-backed IntelligentContextDetector"""
+
+    def setup_method(self):
+        pytest.importorskip("numpy")
+        from utils.rule_system.intelligent_context_detector import IntelligentContextDetector
+        self.detector = IntelligentContextDetector()
+
+    def test_explicit_keyword_uses_mapping_order(self):
+        message = "run @debug then @code"
+        expected = next(context for keyword, context in self.detector.keyword_map.items()
+                        if keyword in message)
+
+        assert self.detector._check_explicit_keywords(message) == expected
+
+    def test_auto_detection_scores_match_original(self):
+        message = "I need to debug this failing test and fix the bug"
+        weights = self.detector.detection_config.get("scoring_weights", {"message_patterns": 2})
+        scores = {name: 0 for name in self.detector.contexts}
+        for name, config in self.detector.contexts.items():
+            for pattern in config.get("auto_detect_patterns", {}).get("message", []):
+                if pattern.lower() in message.lower():
+                    scores[name] += weights["message_patterns"]
+        best = max(scores.items(), key=lambda item: item[1])
+
+        context, confidence = self.detector._auto_detect_context(message, [], "")
+
+        if best[1]:
+            assert context == best[0]
+            assert confidence > 0
+        else:
+            assert confidence == 0.0
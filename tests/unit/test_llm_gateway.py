@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared LLM gateway.
+
+Runs against a fake chat model injected through ``client_factory`` so no
+API key or network access is needed.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from utils.core.llm_gateway import LLMGateway, TokenBucket, prompt_cache_key
+
+
+class FakeChatModel:
+    """Chat model double returning canned responses with usage metadata."""
+
+    def __init__(self, model, temperature, delay=0.0, **kwargs):
+        self.model = model
+        self.temperature = temperature
+        self.delay = delay
+        self.calls = 0
+
+    def _respond(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content=f"echo: {messages}",
+                               usage_metadata={"input_tokens": 7, "output_tokens": 3})
+
+    def invoke(self, messages, **kwargs):
+        time.sleep(self.delay)
+        return self._respond(messages)
+
+    async def ainvoke(self, messages, **kwargs):
+        await asyncio.sleep(self.delay)
+        return self._respond(messages)
+
+
+def _gateway(delay=0.0, **kwargs):
+    kwargs.setdefault("rate_limits", {})
+    return LLMGateway(client_factory=lambda model, temperature, **kw:
+                      FakeChatModel(model, temperature, delay, **kw), **kwargs)
+
+
+class TestLLMGateway:
+    """Test suite for LLMGateway"""
+
+    def setup_method(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_clients_are_pooled_per_model_and_temperature(self):
+        gateway = _gateway()
+        first = gateway.get_client("gemini-2.5-flash", 0.1, max_tokens=8192)
+
+        assert gateway.get_client("gemini-2.5-flash", 0.1, max_tokens=8192) is first
+        assert gateway.get_client("gemini-2.5-flash", 0.0, max_tokens=8192) is not first
+        assert gateway.get_metrics()["pooled_clients"] == 2
+
+    def test_identical_in_flight_prompts_are_coalesced(self):
+        gateway = _gateway(delay=0.05)
+
+        async def run():
+            return await asyncio.gather(*[
+                gateway.ainvoke("same prompt", "fake", agent_name=f"agent_{i % 2}")
+                for i in range(5)
+            ])
+
+        responses = asyncio.run(run())
+
+        assert len({id(response) for response in responses}) == 1
+        assert gateway.get_client("fake").calls == 1
+        assert gateway.get_metrics()["totals"]["coalesced"] == 4
+
+    def test_sync_calls_from_threads_are_coalesced(self):
+        gateway = _gateway(delay=0.1)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(gateway.invoke("hi", "fake")))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4
+        assert gateway.get_client("fake").calls == 1
+
+    def test_response_cache_hits_and_expires(self):
+        gateway = _gateway(cache_ttl_seconds=0.1)
+
+        gateway.invoke("cache me", "fake", agent_name="analyst")
+        gateway.invoke("cache me", "fake", agent_name="analyst")
+        assert gateway.get_client("fake").calls == 1
+        assert gateway.get_metrics("analyst")["cache_hits"] == 1
+
+        time.sleep(0.15)
+        gateway.invoke("cache me", "fake", agent_name="analyst")
+        assert gateway.get_client("fake").calls == 2
+
+    def test_use_cache_false_bypasses_cache(self):
+        gateway = _gateway(cache_ttl_seconds=60)
+
+        gateway.invoke("prompt", "fake")
+        gateway.invoke("prompt", "fake", use_cache=False)
+        assert gateway.get_client("fake").calls == 2
+
+    def test_cache_persists_to_disk(self):
+        cache_path = str(Path(self.test_dir) / "llm_cache.db")
+        first = _gateway(cache_ttl_seconds=60, cache_path=cache_path)
+        original = first.invoke("persist me", "fake")
+        first.cache.close()
+
+        second = _gateway(cache_ttl_seconds=60, cache_path=cache_path)
+        restored = second.invoke("persist me", "fake")
+
+        assert restored.content == original.content
+        assert second.get_client("fake").calls == 0
+
+    def test_cache_key_depends_on_model_and_prompt(self):
+        base = prompt_cache_key("a", 0.0, "prompt")
+
+        assert base == prompt_cache_key("a", 0.0, [("human", "prompt")])
+        assert base != prompt_cache_key("b", 0.0, "prompt")
+        assert base != prompt_cache_key("a", 0.5, "prompt")
+        assert base != prompt_cache_key("a", 0.0, "other prompt")
+
+    def test_cache_key_depends_on_tool_call_args(self):
+        messages = pytest.importorskip("langchain_core.messages")
+
+        def history(city):
+            return [
+                messages.HumanMessage(content="weather?"),
+                messages.AIMessage(content="", tool_calls=[
+                    {"name": "get_weather", "args": {"city": city}, "id": "call_1"}
+                ]),
+                messages.ToolMessage(content="sunny", tool_call_id="call_1"),
+            ]
+
+        assert prompt_cache_key("a", 0.0, history("Paris")) == prompt_cache_key("a", 0.0, history("Paris"))
+        assert prompt_cache_key("a", 0.0, history("Paris")) != prompt_cache_key("a", 0.0, history("Rome"))
+
+        answered = history("Paris")
+        answered[2] = messages.ToolMessage(content="sunny", tool_call_id="call_2")
+        assert prompt_cache_key("a", 0.0, history("Paris")) != prompt_cache_key("a", 0.0, answered)
+
+    def test_rate_limit_spaces_out_requests(self):
+        gateway = _gateway(rate_limits={"fake": (20.0, 1)})
+
+        start = time.perf_counter()
+        for i in range(3):
+            gateway.invoke(f"prompt {i}", "fake")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.09
+        assert gateway.get_metrics()["totals"]["rate_limit_wait_seconds"] > 0
+
+    def test_per_agent_token_and_latency_metrics(self):
+        gateway = _gateway(delay=0.01)
+
+        gateway.invoke("one", "fake", agent_name="coder")
+        gateway.invoke("two", "fake", agent_name="coder")
+        gateway.invoke("three", "fake", agent_name="reviewer")
+
+        metrics = gateway.get_metrics()
+        assert metrics["agents"]["coder"]["llm_calls"] == 2
+        assert metrics["agents"]["coder"]["input_tokens"] == 14
+        assert metrics["agents"]["coder"]["output_tokens"] == 6
+        assert metrics["agents"]["coder"]["avg_latency_ms"] >= 10
+        assert metrics["totals"]["llm_calls"] == 3
+
+    def test_errors_are_counted_and_propagated(self):
+        def factory(model, temperature, **kwargs):
+            client = FakeChatModel(model, temperature)
+            client.invoke = lambda messages, **kw: (_ for _ in ()).throw(RuntimeError("quota"))
+            return client
+
+        gateway = LLMGateway(client_factory=factory, rate_limits={})
+        with pytest.raises(RuntimeError):
+            gateway.invoke("prompt", "fake", agent_name="flaky")
+        assert gateway.get_metrics("flaky")["errors"] == 1
+
+
+class ToolCallingFakeChatModel(FakeChatModel):
+    """Answers with a call of the first bound tool, like a provider model."""
+
+    def invoke(self, messages, tools=None, tool_choice=None, **kwargs):
+        from langchain_core.messages import AIMessage
+
+        self.calls += 1
+        self.tools = tools
+        return AIMessage(content="", tool_calls=[{
+            "name": tools[0]["function"]["name"], "args": {"binary_score": "yes"}, "id": f"call_{self.calls}"
+        }], usage_metadata={"input_tokens": 5, "output_tokens": 2, "total_tokens": 7})
+
+
+class TestGatewayChatModel:
+    """Test suite for GatewayChatModel"""
+
+    def test_structured_output_goes_through_gateway(self):
+        pytest.importorskip("langchain_core")
+        from pydantic import BaseModel, Field
+
+        class GradeDocuments(BaseModel):
+            """Binary relevance score of a retrieved document."""
+            binary_score: str = Field(description="'yes' or 'no'")
+
+        clients = []
+
+        def factory(model, temperature, **kwargs):
+            clients.append(ToolCallingFakeChatModel(model, temperature))
+            return clients[-1]
+
+        gateway = LLMGateway(client_factory=factory, rate_limits={"fake": (20.0, 1)}, cache_ttl_seconds=60)
+        grader = gateway.get_chat_model("fake", agent_name="grader").with_structured_output(GradeDocuments)
+
+        start = time.perf_counter()
+        grades = [grader.invoke(f"Is document {i} relevant?") for i in range(3)]
+        elapsed = time.perf_counter() - start
+
+        assert grades == [GradeDocuments(binary_score="yes")] * 3
+        assert clients[0].tools[0]["function"]["name"] == "GradeDocuments"
+        metrics = gateway.get_metrics("grader")
+        assert (metrics["requests"], metrics["llm_calls"], metrics["input_tokens"]) == (3, 3, 15)
+        assert elapsed >= 0.09
+        assert metrics["rate_limit_wait_seconds"] > 0
+
+        # Cached like any other prompt, tools included in the key
+        assert grader.invoke("Is document 0 relevant?") == grades[0]
+        assert gateway.get_metrics("grader")["cache_hits"] == 1
+        assert clients[0].calls == 3
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket"""
+
+    def test_burst_then_throttle(self):
+        bucket = TokenBucket(rate=10.0, capacity=2)
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() > 0.0
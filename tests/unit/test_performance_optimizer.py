@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for PerformanceOptimizer streaming statistics against exact
+computation over the same samples.
+"""
+
+import json
+import math
+import random
+import statistics
+
+from utils.quality.performance_optimizer import PerformanceOptimizer, QuantileSketch
+
+OPERATIONS = [("coder", "generate"), ("coder", "review"), ("tester", "generate")]
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestPerformanceOptimizer:
+    """Test suite for PerformanceOptimizer"""
+
+    def setup_method(self):
+        self.optimizer = PerformanceOptimizer(history_size=100)
+        self.optimizer.optimization_settings["timeout_seconds"] = 20
+        rng = random.Random(49)
+        self.samples = []
+        for _ in range(30000):
+            agent_type, operation = rng.choice(OPERATIONS)
+            execution_time = rng.lognormvariate(0.5, 1.0)
+            success = rng.random() > 0.02
+            self.samples.append((agent_type, operation, execution_time, success))
+            self.optimizer.record_performance(agent_type, operation, execution_time, success)
+
+    def _assert_matches_exact(self, stats, samples):
+        times = [execution_time for _, _, execution_time, _ in samples]
+        successes = sum(success for *_, success in samples)
+        assert stats["total_operations"] == len(samples)
+        assert stats["successful_operations"] == successes
+        assert stats["failed_operations"] == len(samples) - successes
+        assert math.isclose(stats["success_rate"], successes / len(samples) * 100)
+        assert math.isclose(stats["average_execution_time"], statistics.fmean(times), rel_tol=1e-9)
+        assert math.isclose(stats["execution_time_stddev"], statistics.pstdev(times), rel_tol=1e-9)
+        assert (stats["min_execution_time"], stats["max_execution_time"]) == (min(times), max(times))
+        assert stats["performance_threshold_violations"] == sum(t > 20 for t in times)
+        for q in (0.50, 0.95, 0.99):
+            exact = _exact_quantile(times, q)
+            assert abs(stats[f"p{int(q * 100)}_execution_time"] - exact) <= exact * 0.0101
+
+    def test_stats_match_exact_computation(self):
+        self._assert_matches_exact(self.optimizer.get_performance_stats(), self.samples)
+        self._assert_matches_exact(
+            self.optimizer.get_performance_stats("coder"),
+            [s for s in self.samples if s[0] == "coder"]
+        )
+        self._assert_matches_exact(
+            self.optimizer.get_performance_stats(operation="generate"),
+            [s for s in self.samples if s[1] == "generate"]
+        )
+        self._assert_matches_exact(
+            self.optimizer.get_performance_stats("tester", "generate"),
+            [s for s in self.samples if s[:2] == ("tester", "generate")]
+        )
+        assert self.optimizer.get_performance_stats("missing") == {
+            "total_operations": 0, "success_rate": 0.0, "average_execution_time": 0.0
+        }
+
+    def test_history_keeps_recent_samples_for_export(self):
+        exported = json.loads(self.optimizer.export_metrics("json"))
+
+        assert len(exported) == 100
+        assert [(m["agent_type"], m["operation"], m["execution_time"], m["success"]) for m in exported] == \
+            [tuple(sample) for sample in self.samples[-100:]]
+        assert len(self.optimizer.export_metrics("csv").splitlines()) == 101
+
+        self.optimizer.clear_history()
+        assert self.optimizer.get_performance_stats()["total_operations"] == 0
+
+    def test_sketch_stays_within_bucket_limit(self):
+        sketch = QuantileSketch(max_buckets=64)
+        for exponent in range(-300, 300):
+            sketch.add(1.1 ** exponent)
+        sketch.add(0.0)
+
+        assert len(sketch.buckets) <= 64 and sketch.count == 601
+        # Collapsing only coarsens the smallest values
+        assert math.isclose(sketch.quantile(1.0), 1.1 ** 299, rel_tol=0.0101)
+        assert sketch.quantile(0.0) == 0.0
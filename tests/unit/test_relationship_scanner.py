@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass relationship scanner behind the Holistic
+Relationship Tracker, and for incremental re-discovery in the tracker.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from utils.integrity.relationship_scanner import FileScanCache, scan_content, scan_file
+
+
+PYTHON_SOURCE = '''import os
+from utils.helpers import load
+from . import sibling
+
+
+class Child(Base, mixins.Mixin):
+    def run(self, value):
+        return helper("docs/guide.md")
+'''
+
+MARKDOWN_SOURCE = '''# Guide
+
+See [the tracker](utils/tracker.py) and <docs/other.md>.
+
+## Wu Wei
+Covered by US-CORE-001 in SPRINT_5.
+'''
+
+
+def _types(scan):
+    return [(rel_type, reference, line) for rel_type, reference, line, _ in scan["matches"]]
+
+
+class TestRelationshipScanner:
+    """Test suite for relationship_scanner"""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_python_uses_ast_for_imports_and_inheritance(self):
+        scan = scan_content(PYTHON_SOURCE, "pkg/child.py", ".py")
+        matches = _types(scan)
+
+        assert ("import_dependency", "os", 1) in matches
+        assert ("import_dependency", "utils.helpers", 2) in matches
+        assert ("class_inheritance", "Base, mixins.Mixin", 6) in matches
+        assert ("file_reference", "docs/guide.md", 8) in matches
+        assert ("function_call", "helper", 8) in matches
+        assert not [m for m in matches if m[0] == "import_dependency" and m[2] == 3]
+        assert {e[0] for e in scan["entities"]} == {"class:pkg/child.py:Child",
+                                                     "function:pkg/child.py:run"}
+
+    def test_markdown_in_one_pass(self):
+        scan = scan_content(MARKDOWN_SOURCE, "docs/guide.md", ".md")
+        matches = _types(scan)
+
+        assert ("hyperlink", "the tracker", 3) in matches
+        assert ("hyperlink", "docs/other.md", 3) in matches
+        assert ("concept_reference", "Wu Wei", 5) in matches
+        assert ("agile_reference", "US-CORE-001", 6) in matches
+        assert ("agile_reference", "SPRINT_5", 6) in matches
+        assert [e[3]["title"] for e in scan["entities"]] == ["Guide", "Wu Wei"]
+        assert all(context for _, _, _, context in scan["matches"])
+
+    def test_unparseable_python_falls_back_to_regex(self):
+        scan = scan_content("import json\nclass Broken(Base):\n    def (\n", "bad.py", ".py")
+
+        assert scan["error"]
+        assert ("import_dependency", "json", 1) in _types(scan)
+        assert ("class_inheritance", "Base", 2) in _types(scan)
+
+    def test_matches_stay_within_a_line(self):
+        scan = scan_content("foo\n(bar)\nimport\nos\n", "notes.txt", ".txt")
+
+        assert _types(scan) == []
+
+    def test_cache_reuses_unchanged_files(self):
+        path = self.test_dir / "module.py"
+        path.write_text(PYTHON_SOURCE)
+        cache = FileScanCache(str(self.test_dir / "cache.json"))
+
+        assert cache.lookup("module.py", str(path)) is None
+        cache.store("module.py", scan_file(str(path), "module.py"))
+        assert cache.lookup("module.py", str(path)) is not None
+
+        # Touched but identical content is still a hit (content hash check)
+        os.utime(path, (time.time() + 10, time.time() + 10))
+        assert cache.lookup("module.py", str(path)) is not None
+
+        path.write_text(PYTHON_SOURCE + "\nimport sys\n")
+        assert cache.lookup("module.py", str(path)) is None
+
+    def test_cache_persists_and_drops_deleted_files(self):
+        path = self.test_dir / "a.md"
+        path.write_text(MARKDOWN_SOURCE)
+        cache = FileScanCache(str(self.test_dir / "cache.json"))
+        cache.store("a.md", scan_file(str(path), "a.md"))
+        cache.store("gone.md", scan_file(str(path), "a.md"))
+        cache.retain(["a.md"])
+        cache.save()
+
+        reloaded = FileScanCache(str(self.test_dir / "cache.json"))
+        assert len(reloaded) == 1
+        assert _types(reloaded.lookup("a.md", str(path))) == _types(scan_content(MARKDOWN_SOURCE, "a.md", ".md"))
+
+
+class TestIncrementalDiscovery:
+    """Test suite for HolisticRelationshipTracker re-discovery"""
+
+    def setup_method(self):
+        pytest.importorskip("networkx")
+        pytest.importorskip("matplotlib")
+        self.test_dir = Path(tempfile.mkdtemp())
+        (self.test_dir / "utils").mkdir()
+        (self.test_dir / "utils" / "helpers.py").write_text("def load():\n    return 1\n")
+        (self.test_dir / "main.py").write_text("from utils.helpers import load\nprint(load())\n")
+        (self.test_dir / "README.md").write_text("# Readme\nSee 'main.py'.\n")
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_rerun_scans_only_changed_files(self):
+        from utils.integrity.holistic_relationship_tracker import HolisticRelationshipTracker
+
+        tracker = HolisticRelationshipTracker(str(self.test_dir),
+                                              cache_path=str(self.test_dir / "scan_cache.json"))
+        first = tracker.discover_all_relationships()
+        assert tracker.last_scan_stats == {"files": 3, "scanned": 3, "cached": 0}
+        assert "file:README.md:file_reference:file:main.py:2" in tracker.relationships
+
+        (self.test_dir / "README.md").write_text("# Readme\nNothing here.\n")
+        second = tracker.discover_all_relationships()
+
+        assert tracker.last_scan_stats == {"files": 3, "scanned": 1, "cached": 2}
+        assert second.total_relationships == first.total_relationships - 1
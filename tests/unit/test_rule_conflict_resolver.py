@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the indexed Rule Conflict Resolver.
+"""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from utils.rule_system.rule_conflict_resolver import (
+    ConflictIndex,
+    ConflictSeverity,
+    ResolutionStrategy,
+    RuleConflictResolver
+)
+
+
+KISS = "Keep It Small and Simple (KISS) Rule"
+DRY = "Don't Repeat Yourself (DRY) Rule"
+
+
+class TestRuleConflictResolver:
+    """Test suite for RuleConflictResolver."""
+
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.resolution_file = self.test_dir / "resolutions.json"
+        self.resolver = RuleConflictResolver(self.resolution_file)
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_known_conflicts_are_order_independent(self):
+        forward = self.resolver.detect_conflicts([KISS, "Boy Scout Rule", DRY], {})
+        backward = self.resolver.detect_conflicts([DRY, KISS], {})
+
+        assert [(c.rule_a, c.rule_b, c.conflict_type) for c in forward] == [(KISS, DRY, 'abstraction_tension')]
+        assert [(c.rule_a, c.rule_b) for c in backward] == [(DRY, KISS)]
+        assert forward[0].severity == ConflictSeverity.LOW
+
+    def test_class_conflicts_follow_rule_order(self):
+        rules = ["Immediate Hotfix Rule", "Thorough Review Rule", "Simple Design Rule", "Comprehensive Coverage Rule"]
+
+        conflicts = self.resolver.detect_conflicts(rules, {})
+
+        assert [(c.rule_a, c.rule_b, c.conflict_type) for c in conflicts] == [
+            ("Immediate Hotfix Rule", "Thorough Review Rule", 'timing_conflict'),
+            ("Simple Design Rule", "Comprehensive Coverage Rule", 'scope_conflict'),
+        ]
+        assert conflicts[0].description.startswith("Immediate Hotfix Rule requires immediate action")
+        assert self.resolver.detect_conflicts(list(reversed(rules)), {}) == []
+
+    def test_known_conflict_takes_precedence_over_classes(self):
+        conflicts = self.resolver.detect_conflicts(
+            ["No Premature Victory Declaration Rule", "Clean Repository Focus Rule"], {}
+        )
+
+        assert len(conflicts) == 1
+        assert conflicts[0].description == 'Cleanup timing conflicts with thorough validation'
+
+    def test_detection_scales_with_active_set_not_pairs(self):
+        rules = [f"Catalog Rule {i}" for i in range(400)] + [KISS, DRY]
+
+        conflicts = self.resolver.detect_conflicts(rules, {'task_type': 'testing'})
+
+        assert [(c.rule_a, c.rule_b) for c in conflicts] == [(KISS, DRY)]
+        assert conflicts[0].context == {'task_type': 'testing'}
+
+    def test_resolutions_are_memoized_and_saved_once(self):
+        conflicts = self.resolver.detect_conflicts(
+            [KISS, DRY, "Immediate Hotfix Rule", "Thorough Review Rule"], {'task_type': 'testing'}
+        )
+
+        first = self.resolver.resolve_conflicts(conflicts)
+        second = self.resolver.resolve_conflicts(conflicts)
+
+        assert [r.strategy for r in first] == [ResolutionStrategy.MERGE_APPROACHES,
+                                               ResolutionStrategy.SEQUENTIAL_APPLICATION]
+        assert [r.application_sequence for r in first] == [r.application_sequence for r in second]
+        second[0].application_sequence.append("mutated")
+        assert "mutated" not in self.resolver.resolve_conflicts(conflicts)[0].application_sequence
+
+        history = json.loads(self.resolution_file.read_text())
+        assert len(history) == 6
+        assert history[0]['conflict']['severity'] == 'low'
+
+    def test_index_is_persisted_and_reused(self):
+        index_file = self.resolution_file.with_name('rule_conflict_index.json')
+        self.resolver.detect_conflicts(["Simple Design Rule"], {})
+        saved = json.loads(index_file.read_text())
+
+        assert saved['rule_classes']["Simple Design Rule"] == ['simple']
+        assert [DRY, KISS, 'abstraction_tension', 'low',
+                'KISS favors simplicity while DRY promotes abstraction'] in saved['pairs']
+
+        reloaded = ConflictIndex(list(self.resolver.rule_hierarchy), index_file)
+        assert reloaded.rule_classes["Simple Design Rule"] == frozenset({'simple'})
+        assert reloaded.pair_conflicts[KISS][DRY]['severity'] == ConflictSeverity.LOW
+
+    def test_stale_index_is_rebuilt(self):
+        index_file = self.test_dir / "index.json"
+        index_file.write_text(json.dumps({'signature': 'outdated', 'pairs': [], 'rule_classes': {}}))
+
+        index = ConflictIndex(["Simple Design Rule"], index_file)
+
+        assert index.pair_conflicts[KISS][DRY]['type'] == 'abstraction_tension'
+        assert json.loads(index_file.read_text())['signature'] == index.signature
@@ -7,6 +7,7 @@ intelligently chooses only the most relevant rules for each task.
 """
 
 import pytest
+import sqlite3
 import tempfile
 import shutil
 from pathlib import Path
@@ -532,6 +533,91 @@ class TestStrategicRuleSelector:
         assert "EFFICIENCY GAINS" in report
         assert "OPTIMIZATION RECOMMENDATIONS" in report
 
+    def test_selection_cache_is_bounded_lru(self, temp_db_path, file_operation_context):
+        """Test that the selection cache evicts least recently used entries."""
+        selector = StrategicRuleSelector(db_path=temp_db_path, cache_size=2)
+        
+        selector.select_strategic_rules("Organize files", file_operation_context)
+        selector.select_strategic_rules("Move folders", file_operation_context)
+        selector.select_strategic_rules("Organize files", file_operation_context)
+        selector.select_strategic_rules("Delete directory", file_operation_context)
+        
+        assert len(selector.selection_cache) == 2
+        first_hash = selector._generate_task_hash("Organize files", file_operation_context)
+        assert first_hash in selector.selection_cache
+    
+    def test_cache_validity_checks(self, selector, file_operation_context):
+        """Test that expired entries and changed profiles or settings bypass the cache."""
+        task_description = "Organize project files"
+        first = selector.select_strategic_rules(task_description, file_operation_context)
+        assert selector.select_strategic_rules(task_description, file_operation_context) is first
+        
+        selector.cache_ttl = 0.0
+        assert selector.select_strategic_rules(task_description, file_operation_context) is not first
+        
+        selector.cache_ttl = 3600.0
+        second = selector.select_strategic_rules(task_description, file_operation_context)
+        selector.max_rules_per_task = 2
+        third = selector.select_strategic_rules(task_description, file_operation_context)
+        assert third is not second
+        assert len(third.selected_rules) <= 2
+        
+        selector.update_rule_profiles({})
+        assert selector.select_strategic_rules(task_description, file_operation_context) is not third
+    
+    def test_cache_key_includes_risk_and_quality(self, selector, file_operation_context):
+        """Test that risk and quality thresholds produce distinct selections."""
+        task_description = "Organize project files"
+        low_risk = selector.select_strategic_rules(task_description, file_operation_context)
+        
+        file_operation_context.risk_level = 0.9
+        high_risk = selector.select_strategic_rules(task_description, file_operation_context)
+        
+        assert "No Premature Victory Declaration Rule" not in low_risk.selected_rules + low_risk.excluded_rules
+        assert "No Premature Victory Declaration Rule" in high_risk.selected_rules + high_risk.excluded_rules
+    
+    def test_single_pass_feature_scan(self, selector):
+        """Test that one scan yields every task feature."""
+        analysis = selector._analyze_task(
+            "Urgent: fix the critical production bug in the auth-token module before the deadline",
+            None
+        )
+        
+        assert {'debugging', 'fix', 'bug', 'security', 'auth'} <= set(analysis['keywords'])
+        assert analysis['intent'] in ('modify', 'debug')
+        assert analysis['urgency_indicators'] == ['urgency'] * 3
+        assert analysis['risk_indicators'] == ['risk']
+        assert analysis['scope_indicators'] == ['scope']
+    
+    def test_vectorized_scores_match_rule_formula(self, selector, code_implementation_context):
+        """Test that matrix scoring equals the per-rule scoring formula."""
+        analysis = selector._analyze_task("Implement and test a fast api endpoint", code_implementation_context)
+        scores = selector._score_rules(list(selector.rule_profiles) + ["Unknown Rule"], analysis,
+                                       code_implementation_context)
+        
+        for name, profile in selector.rule_profiles.items():
+            patterns = profile.applicability_patterns
+            keyword_relevance = (sum(1 for p in patterns if any(p in k for k in analysis['keywords'])) / len(patterns)
+                                 if patterns else 0.5)
+            expected = (profile.effectiveness_score
+                        + profile.context_relevance.get(code_implementation_context.task_type.value, 0.5) * 0.3
+                        + selector._calculate_complexity_alignment(profile, code_implementation_context) * 0.2
+                        + keyword_relevance * 0.2
+                        + 0.5 * 0.1
+                        + (1.0 - profile.token_cost / 1000) * 0.1)
+            assert scores[name] == pytest.approx(min(1.0, max(0.0, expected)))
+        assert scores["Unknown Rule"] == 0.5
+    
+    def test_history_is_written_off_thread(self, selector, file_operation_context):
+        """Test that selections are queued and written by the batched writer."""
+        for i in range(5):
+            selector.select_strategic_rules(f"Organize files batch {i}", file_operation_context)
+        
+        assert selector.history_writer.flush()
+        with sqlite3.connect(str(selector.db_path)) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM rule_selections").fetchone()[0]
+        assert count == 5
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass incremental JSON parser used for streamed LLM outputs.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from utils.parsing.streaming_json_parser import (
+    StreamingJSONParser, StreamingJSONError, iter_json_objects, parse_json_stream, parse_json_text
+)
+from utils.parsing.enhanced_output_parsers import EnhancedOutputParser
+
+
+CODE_OUTPUT = {
+    "source_files": {
+        "main.py": "import re\nPATTERN = re.compile(r\"\\d+\")\nprint('hello')\n",
+        "models.py": "class User:\n    name = \"\u00e9\"\n",
+    },
+    "dependencies": ["fastapi", "pydantic"],
+    "ready": True,
+    "confidence": 0.85,
+    "notes": None,
+}
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestStreamingJSONParser:
+    """Test suite for StreamingJSONParser"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 100000])
+    def test_result_independent_of_chunking(self, chunk_size):
+        text = "Here is the code:\n```json\n" + json.dumps(CODE_OUTPUT, indent=2) + "\n```\nDone."
+        parser = StreamingJSONParser()
+        for chunk in _chunks(text, chunk_size):
+            parser.feed(chunk)
+
+        assert parser.finish() == CODE_OUTPUT
+        assert not parser.repaired
+
+    def test_files_reported_as_soon_as_their_string_closes(self):
+        text = json.dumps(CODE_OUTPUT)
+        cut = text.index('"models.py"')
+        parser = StreamingJSONParser(watch=[("source_files", "*")])
+
+        first = parser.feed(text[:cut])
+        rest = parser.feed(text[cut:])
+
+        assert [(e.path, e.value) for e in first] == [
+            (("source_files", "main.py"), CODE_OUTPUT["source_files"]["main.py"])
+        ]
+        assert [e.path for e in rest] == [("source_files", "models.py")]
+
+    def test_validator_rejects_values(self):
+        parser = StreamingJSONParser(
+            watch=[("source_files", "*")],
+            validator=lambda path, value: len(value) > 50
+        )
+        events = parser.feed(json.dumps(CODE_OUTPUT))
+
+        assert [e.path for e in events] == [("source_files", "main.py")]
+        assert [e.path for e in parser.rejected] == [("source_files", "models.py")]
+
+    def test_every_truncation_point_is_repaired(self):
+        text = json.dumps(CODE_OUTPUT)
+        for cut in range(1, len(text)):
+            value = parse_json_text(text[:cut])
+            assert isinstance(value, dict)
+
+    def test_truncation_repairs(self):
+        assert parse_json_text('{"a": "unterminated') == {"a": "unterminated"}
+        assert parse_json_text('{"a": [1, {"b": tru') == {"a": [1, {"b": True}]}
+        assert parse_json_text('{"a": 1, "dangling":') == {"a": 1}
+        assert parse_json_text('{"a": 1, "dang') == {"a": 1}
+        assert parse_json_text('{"a": 12.') == {"a": 12}
+        assert parse_json_text('{"a": "x\\') == {"a": "x"}
+
+    def test_trailing_commas_and_raw_newlines(self):
+        assert parse_json_text('{"a": [1, 2,], "b": "line1\nline2",}') == {
+            "a": [1, 2], "b": "line1\nline2"
+        }
+
+    def test_braces_in_leading_prose_are_skipped(self):
+        assert parse_json_text('Use {placeholders} like this: {"a": 1}') == {"a": 1}
+
+    def test_largest_object_wins_over_empty_example(self):
+        assert parse_json_text('Use {} as a placeholder. Result: {"a": 1}') == {"a": 1}
+
+    def test_top_level_array(self):
+        assert parse_json_text('[1, 2]') == [1, 2]
+        assert parse_json_text(' [{"a": 1}]\n') == [{"a": 1}]
+
+    def test_iter_json_objects(self):
+        assert list(iter_json_objects('{"a": 1} and then {"b": 2}')) == [{"a": 1}, {"b": 2}]
+
+    def test_snapshot_includes_value_in_progress(self):
+        parser = StreamingJSONParser()
+        parser.feed('{"source_files": {"main.py": "print(')
+
+        assert parser.snapshot() == {"source_files": {"main.py": "print("}}
+        assert not parser.done
+
+    def test_no_json_raises(self):
+        with pytest.raises(StreamingJSONError):
+            parse_json_text("no json here")
+        with pytest.raises(StreamingJSONError):
+            parse_json_text('{"a": data}')
+
+    def test_parse_json_stream_with_message_chunks(self):
+        class Chunk:
+            def __init__(self, content):
+                self.content = content
+
+        async def stream():
+            for chunk in _chunks(json.dumps(CODE_OUTPUT), 7):
+                await asyncio.sleep(0)
+                yield Chunk(chunk)
+
+        seen = []
+        result = asyncio.run(parse_json_stream(
+            stream(), on_value=lambda event: seen.append(event.path),
+            watch=[("source_files", "*")]
+        ))
+
+        assert result == CODE_OUTPUT
+        assert seen == [("source_files", "main.py"), ("source_files", "models.py")]
+
+
+class TestEnhancedOutputParserStreaming:
+    """EnhancedOutputParser on top of the incremental parser"""
+
+    def test_parse_skips_invalid_candidates(self):
+        parser = EnhancedOutputParser(schema={"required": ["code"]})
+        result = parser.parse('{"other": 1}\n```json\n{"code": "x = 1"}\n```')
+
+        assert result == {"code": "x = 1"}
+
+    def test_aparse_stream(self):
+        async def stream():
+            for chunk in _chunks(json.dumps(CODE_OUTPUT), 11):
+                yield chunk
+
+        parser = EnhancedOutputParser(schema={"required": ["source_files"]})
+        result = asyncio.run(parser.aparse_stream(stream()))
+
+        assert result == CODE_OUTPUT
+        assert parser.get_parsing_stats()["successes"] == 1
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the asynchronous telemetry pipeline.
+
+Tests batched per-database writes, flush semantics, backpressure handling
+and the MultiDatabaseLogger integration.
+"""
+
+import sqlite3
+import tempfile
+import shutil
+from pathlib import Path
+
+import pytest
+
+from utils.system.telemetry_pipeline import TelemetryPipeline, BackpressurePolicy
+from utils.system.multi_database_logger import MultiDatabaseLogger
+
+
+def _create_table(db_path: str):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE events (id TEXT PRIMARY KEY, agent_id TEXT)")
+
+
+def _count(db_path: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+class TracingPipeline(TelemetryPipeline):
+    """Pipeline recording every SQL statement its writer connections run."""
+
+    def __init__(self, *args, **kwargs):
+        self.statements = []
+        super().__init__(*args, **kwargs)
+
+    def _get_connection(self, db_path: str) -> sqlite3.Connection:
+        conn = super()._get_connection(db_path)
+        conn.set_trace_callback(self.statements.append)
+        return conn
+
+
+class TestTelemetryPipeline:
+    """Test suite for TelemetryPipeline."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_batches_one_transaction_per_database(self, temp_dir):
+        """Events for several databases are committed in one batch each."""
+        db_paths = [str(temp_dir / f"db_{i}.db") for i in range(3)]
+        for db_path in db_paths:
+            _create_table(db_path)
+
+        pipeline = TelemetryPipeline(batch_size=1000, flush_interval_ms=10000)
+        try:
+            for i in range(50):
+                for db_path in db_paths:
+                    assert pipeline.submit(db_path, "events", {"id": f"e{i}", "agent_id": "a"})
+
+            assert pipeline.flush(timeout=5)
+            metrics = pipeline.get_metrics()
+        finally:
+            pipeline.shutdown()
+
+        assert all(_count(db_path) == 50 for db_path in db_paths)
+        assert metrics["written"] == 150
+        assert metrics["batches"] == 1
+        assert metrics["transactions"] == 3
+        assert metrics["queue_depth"] == 0
+
+    def test_table_groups_share_one_commit(self, temp_dir):
+        """Several tables of one database are committed together."""
+        db_path = str(temp_dir / "tables.db")
+        _create_table(db_path)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE switches (id TEXT PRIMARY KEY)")
+
+        pipeline = TracingPipeline(batch_size=1000, flush_interval_ms=10000)
+        try:
+            for i in range(5):
+                pipeline.submit(db_path, "events", {"id": f"e{i}", "agent_id": "a"})
+                pipeline.submit(db_path, "switches", {"id": f"s{i}"})
+            assert pipeline.flush(timeout=5)
+        finally:
+            pipeline.shutdown()
+
+        transaction_control = [sql for sql in pipeline.statements
+                               if sql.split()[0] in ("BEGIN", "COMMIT", "SAVEPOINT", "RELEASE")]
+        assert transaction_control == ["BEGIN"] + ["SAVEPOINT telemetry_group", "RELEASE telemetry_group"] * 2 + ["COMMIT"]
+        assert _count(db_path) == 5
+
+    def test_shutdown_flushes_pending_events(self, temp_dir):
+        """Pending events are written when the pipeline shuts down."""
+        db_path = str(temp_dir / "shutdown.db")
+        _create_table(db_path)
+
+        pipeline = TelemetryPipeline(batch_size=1000, flush_interval_ms=10000)
+        for i in range(10):
+            pipeline.submit(db_path, "events", {"id": f"e{i}", "agent_id": "a"})
+        pipeline.shutdown()
+
+        assert _count(db_path) == 10
+        assert not pipeline.submit(db_path, "events", {"id": "late", "agent_id": "a"})
+
+    def test_bad_rows_do_not_discard_batch(self, temp_dir):
+        """A constraint violation only rejects the offending row."""
+        db_path = str(temp_dir / "dupes.db")
+        _create_table(db_path)
+
+        pipeline = TelemetryPipeline(batch_size=1000, flush_interval_ms=10000)
+        try:
+            pipeline.submit(db_path, "events", {"id": "same", "agent_id": "a"})
+            pipeline.submit(db_path, "events", {"id": "same", "agent_id": "b"})
+            pipeline.submit(db_path, "events", {"id": "other", "agent_id": "c"})
+            pipeline.flush()
+            metrics = pipeline.get_metrics()
+        finally:
+            pipeline.shutdown()
+
+        assert _count(db_path) == 2
+        assert metrics["failed"] == 1
+
+    def test_drop_policy_caps_queue(self, temp_dir):
+        """With the DROP policy events beyond the queue size are rejected."""
+        pipeline = TelemetryPipeline(max_queue_size=5, batch_size=1000,
+                                     flush_interval_ms=10000,
+                                     backpressure=BackpressurePolicy.DROP)
+        try:
+            accepted = [pipeline.submit(str(temp_dir / "x.db"), "events", {"id": str(i)})
+                        for i in range(8)]
+            metrics = pipeline.get_metrics()
+        finally:
+            pipeline.shutdown(timeout=0.1)
+
+        assert accepted.count(True) == 5
+        assert metrics["dropped"] == 3
+        assert metrics["max_queue_depth"] == 5
+
+    def test_sample_policy_thins_events_above_watermark(self, temp_dir):
+        """With the SAMPLE policy only one in N events is kept above the watermark."""
+        pipeline = TelemetryPipeline(max_queue_size=1000, batch_size=10000,
+                                     flush_interval_ms=10000,
+                                     backpressure=BackpressurePolicy.SAMPLE,
+                                     high_watermark=0.01, sample_every=5)
+        try:
+            for i in range(110):
+                pipeline.submit(str(temp_dir / "x.db"), "events", {"id": str(i)})
+            metrics = pipeline.get_metrics()
+        finally:
+            pipeline.shutdown(timeout=0.1)
+
+        # 10 events below the watermark, then 1 in 5 of the remaining 100
+        assert metrics["enqueued"] == 30
+        assert metrics["sampled_out"] == 80
+
+    def test_multi_database_logger_uses_pipeline(self, temp_dir):
+        """MultiDatabaseLogger queues one row per database instead of writing inline."""
+        pipeline = TelemetryPipeline(batch_size=1000, flush_interval_ms=10000)
+        logger = MultiDatabaseLogger.__new__(MultiDatabaseLogger)
+        logger.databases = {
+            "first": str(temp_dir / "first.db"),
+            "second": str(temp_dir / "second.db"),
+        }
+        logger.pipeline = pipeline
+        logger._ensure_databases_exist()
+
+        try:
+            logger.log_agent_registration("test_agent", "base_agent")
+            assert pipeline.get_metrics()["queue_depth"] == 2
+            assert logger.flush()
+            status = logger.get_database_status()
+        finally:
+            pipeline.shutdown()
+
+        assert status["databases"]["first"]["record_count"] == 1
+        assert status["databases"]["second"]["record_count"] == 1
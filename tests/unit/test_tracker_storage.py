@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the UniversalAgentTracker storage layer.
+
+Tests WAL setup, index creation, schema migration and keyset pagination
+of the merged agent timeline.
+"""
+
+import sqlite3
+import tempfile
+import shutil
+from pathlib import Path
+
+import pytest
+
+from utils.system.universal_agent_tracker import UniversalAgentTracker, AgentType, ContextType
+
+
+class TestTrackerStorage:
+    """Test suite for TrackerStorage via UniversalAgentTracker."""
+
+    @pytest.fixture
+    def tracker(self):
+        temp_dir = tempfile.mkdtemp()
+        tracker = UniversalAgentTracker(db_path=str(Path(temp_dir) / "tracking.db"))
+        yield tracker
+        tracker.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_wal_mode_and_indexes(self, tracker):
+        """Database runs in WAL mode with session/timestamp indexes."""
+        with sqlite3.connect(tracker.db_path) as conn:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            indexes = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index'"
+            )}
+
+        assert journal_mode == "wal"
+        assert "idx_context_switches_session" in indexes
+        assert "idx_context_switches_timestamp" in indexes
+        assert "idx_agent_sessions_session_timestamp" in indexes
+
+    def test_migrates_legacy_context_switch_table(self):
+        """Databases created by older trackers gain the trigger columns."""
+        temp_dir = tempfile.mkdtemp()
+        db_path = Path(temp_dir) / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE context_switches (
+                    switch_id TEXT PRIMARY KEY, session_id TEXT,
+                    from_context TEXT, to_context TEXT, timestamp TEXT
+                )
+            """)
+
+        tracker = UniversalAgentTracker(db_path=str(db_path))
+        try:
+            session_id = tracker.register_agent("legacy", AgentType.CUSTOM_AGENT)
+            tracker.record_context_switch(session_id, ContextType.TESTING,
+                                          trigger_details={"keyword": "@test"})
+            timeline = tracker.get_agent_timeline()
+        finally:
+            tracker.close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        assert timeline[0]["details"]["keyword"] == "@test"
+
+    def test_timeline_keyset_pagination(self, tracker):
+        """Paging with next_cursor visits every event exactly once, newest first."""
+        session_id = tracker.register_agent("pager", AgentType.CUSTOM_AGENT)
+        for _ in range(12):
+            tracker.record_context_switch(session_id, ContextType.CODING)
+        for i in range(5):
+            tracker.record_rule_activation(session_id, f"rule_{i}")
+
+        seen = []
+        cursor = None
+        while True:
+            page = tracker.get_timeline_page(limit=5, cursor=cursor)
+            seen.extend(page["events"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        ids = [event["switch_id"] for event in seen]
+        assert len(ids) == 17
+        assert len(set(ids)) == 17
+        timestamps = [event["timestamp"] for event in seen]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    def test_timeline_filters_by_session(self, tracker):
+        """Session filter only returns that session's events."""
+        first = tracker.register_agent("first", AgentType.CUSTOM_AGENT)
+        second = tracker.register_agent("second", AgentType.CUSTOM_AGENT)
+        tracker.record_context_switch(first, ContextType.AGILE)
+        tracker.record_context_switch(second, ContextType.TESTING)
+        tracker.record_context_switch(second, ContextType.DEBUGGING)
+
+        page = tracker.get_timeline_page(session_id=second)
+
+        assert len(page["events"]) == 2
+        assert {event["session_id"] for event in page["events"]} == {second}
+        assert page["next_cursor"] is None
+
+    def test_agent_timeline_caps_context_switches(self, tracker):
+        """Dashboard timeline shows at most 20 context switches."""
+        session_id = tracker.register_agent("busy", AgentType.CUSTOM_AGENT)
+        for _ in range(30):
+            tracker.record_context_switch(session_id, ContextType.CODING)
+
+        assert len(tracker.get_agent_timeline()) == 20
+        assert len(tracker.get_timeline_page(limit=50)["events"]) == 30
+
+    def test_decoded_details_are_not_shared(self, tracker):
+        """Mutating a returned event does not leak into later reads."""
+        session_id = tracker.register_agent("mutator", AgentType.CUSTOM_AGENT)
+        tracker.record_context_switch(session_id, ContextType.TESTING,
+                                      trigger_details={"keyword": "@test"})
+
+        tracker.get_agent_timeline()[0]["details"]["keyword"] = "changed"
+
+        assert tracker.get_agent_timeline()[0]["details"]["keyword"] == "@test"
+
+    def test_table_created_after_first_read_joins_timeline(self, tracker):
+        """A timeline table created by another connection is picked up later."""
+        assert tracker.get_agent_timeline() == []
+
+        with sqlite3.connect(tracker.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE agent_events (
+                    event_id TEXT PRIMARY KEY, timestamp TEXT, event_type TEXT, session_id TEXT
+                )
+            """)
+            conn.execute("INSERT INTO agent_events VALUES ('e1', '2026-01-01T00:00:00', 'started', 's1')")
+
+        timeline = tracker.get_agent_timeline()
+        assert [event["event_id"] for event in timeline] == ["e1"]
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for the ready-queue DAG scheduler used by WorkflowOrchestrationEngine.
+
+Covers dependency ordering, eager start of independent successors,
+critical-path priority, max parallelism, timeouts and downstream cancellation.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from workflow.orchestration.dag_scheduler import DagScheduler, StepOutcome
+
+
+@dataclass
+class Step:
+    id: str
+    dependencies: List[str] = field(default_factory=list)
+    estimated_effort: int = 1
+    duration: float = 0.01
+
+
+def _executor(log):
+    async def execute(step):
+        log.append(("start", step.id, time.perf_counter()))
+        await asyncio.sleep(step.duration)
+        log.append(("end", step.id, time.perf_counter()))
+        return step.id
+    return execute
+
+
+class TestDagScheduler:
+    """Test suite for DagScheduler"""
+
+    def test_topological_levels(self):
+        """Levels respect dependencies"""
+        steps = [Step("a"), Step("b", ["a"]), Step("c", ["a"]), Step("d", ["b", "c"])]
+        levels = DagScheduler().topological_levels(steps)
+        assert [[s.id for s in level] for level in levels] == [["a"], ["b", "c"], ["d"]]
+
+    def test_cycle_detection(self):
+        """Circular dependencies are rejected"""
+        steps = [Step("a", ["b"]), Step("b", ["a"])]
+        with pytest.raises(ValueError):
+            DagScheduler().topological_levels(steps)
+
+    def test_successor_starts_without_waiting_for_slow_sibling(self):
+        """A step starts as soon as its own dependencies finish"""
+        steps = [
+            Step("slow", duration=0.3),
+            Step("fast", duration=0.01),
+            Step("after_fast", ["fast"], duration=0.01),
+        ]
+        log = []
+        results = asyncio.run(DagScheduler().run(steps, _executor(log)))
+
+        assert all(r.outcome == StepOutcome.COMPLETED for r in results.values())
+        ends = {step_id: ts for kind, step_id, ts in log if kind == "end"}
+        assert ends["after_fast"] < ends["slow"]
+
+    def test_wide_workflow_approaches_critical_path(self):
+        """Makespan tracks the critical path, not the sum of levels' maxima"""
+        steps = [Step("root", duration=0.01)]
+        # Two chains with alternating long/short steps per level
+        steps += [Step("a1", ["root"], duration=0.2), Step("a2", ["a1"], duration=0.01)]
+        steps += [Step("b1", ["root"], duration=0.01), Step("b2", ["b1"], duration=0.2)]
+
+        start = time.perf_counter()
+        asyncio.run(DagScheduler().run(steps, _executor([])))
+        elapsed = time.perf_counter() - start
+
+        # Level-synchronous batching would need ~0.41s
+        assert elapsed < 0.35
+
+    def test_critical_path_first_with_limited_parallelism(self):
+        """With one slot, the head of the longest chain runs first"""
+        steps = [
+            Step("short", estimated_effort=1),
+            Step("long_head", estimated_effort=1),
+            Step("long_tail", ["long_head"], estimated_effort=5),
+        ]
+        log = []
+        asyncio.run(DagScheduler(max_parallelism=1).run(steps, _executor(log)))
+
+        starts = [step_id for kind, step_id, _ in log if kind == "start"]
+        assert starts[0] == "long_head"
+
+    def test_max_parallelism(self):
+        """No more than max_parallelism steps run at once"""
+        steps = [Step(f"s{i}", duration=0.02) for i in range(8)]
+        active = 0
+        peak = 0
+
+        async def execute(step):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(step.duration)
+            active -= 1
+
+        asyncio.run(DagScheduler(max_parallelism=3).run(steps, execute))
+        assert peak == 3
+
+    def test_timeout_cancels_downstream(self):
+        """A timed-out step cancels its dependents but not unrelated steps"""
+        steps = [
+            Step("hangs", duration=5),
+            Step("child", ["hangs"]),
+            Step("grandchild", ["child"]),
+            Step("independent"),
+        ]
+        results = asyncio.run(DagScheduler(step_timeout=0.05).run(steps, _executor([])))
+
+        assert results["hangs"].outcome == StepOutcome.TIMED_OUT
+        assert results["child"].outcome == StepOutcome.CANCELLED
+        assert results["grandchild"].outcome == StepOutcome.CANCELLED
+        assert results["independent"].outcome == StepOutcome.COMPLETED
+
+    def test_unsuccessful_result_counts_as_failure(self):
+        """is_success turns a returned result into a failure"""
+        steps = [Step("bad"), Step("child", ["bad"])]
+        results = asyncio.run(DagScheduler().run(
+            steps, _executor([]), is_success=lambda result: result != "bad"
+        ))
+
+        assert results["bad"].outcome == StepOutcome.FAILED
+        assert results["child"].outcome == StepOutcome.CANCELLED
+
+    def test_failure_without_downstream_cancellation(self):
+        """Dependents still run when downstream cancellation is disabled"""
+        steps = [Step("bad"), Step("child", ["bad"])]
+
+        async def execute(step):
+            if step.id == "bad":
+                raise RuntimeError("boom")
+            return step.id
+
+        results = asyncio.run(
+            DagScheduler(cancel_downstream_on_failure=False).run(steps, execute)
+        )
+        assert results["bad"].outcome == StepOutcome.FAILED
+        assert results["bad"].error == "boom"
+        assert results["child"].outcome == StepOutcome.COMPLETED
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Equivalence tests for the single-scan TaskAnalyzer.
+
+``LegacyTaskAnalyzer`` keeps the original per-pattern ``re`` scans; every
+``TaskAnalysis`` field except the generated task ID and timestamp must match.
+The benchmark (``-m performance -s``) times both on 10,000 synthetic tasks.
+"""
+
+import logging
+import random
+import re
+import time
+
+import pytest
+
+from workflow.composition.task_analyzer import TaskAnalyzer, _required_literals, sre_parse
+from workflow.models.workflow_models import ComplexityLevel, Entity
+
+
+class LegacyTaskAnalyzer(TaskAnalyzer):
+    """TaskAnalyzer with the original scanning stages and no memo."""
+
+    def analyze_task(self, task_description, context=None):
+        self.analysis_cache.clear()
+        return super().analyze_task(task_description, context)
+
+    def extract_entities(self, task_description):
+        entities = []
+        text_lower = task_description.lower()
+        for entity_type, patterns in self.entity_patterns.items():
+            for pattern in patterns:
+                for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+                    entity_name = match.group(1) if match.groups() else match.group(0)
+                    confidence = self._calculate_entity_confidence(entity_name, entity_type, text_lower)
+                    entities.append(Entity(
+                        name=entity_name.strip(),
+                        type=entity_type,
+                        confidence=confidence,
+                        attributes={"position": match.start(), "length": len(entity_name)}
+                    ))
+        entities = self._deduplicate_entities(entities)
+        entities.sort(key=lambda e: e.confidence, reverse=True)
+        return entities[:20]
+
+    def assess_complexity(self, entities, task_description, context):
+        complexity_score = len(entities) * 0.1
+        for entity in entities:
+            if entity.type in {"system", "architecture", "integration", "security", "performance"}:
+                complexity_score += 0.3
+            elif entity.type in {"feature", "component", "service", "api"}:
+                complexity_score += 0.2
+            else:
+                complexity_score += 0.1
+        text_lower = task_description.lower()
+        for indicator, weight in self.complexity_indicators.items():
+            if indicator in text_lower:
+                complexity_score += weight * text_lower.count(indicator)
+        word_count = len(task_description.split())
+        if word_count > 200:
+            complexity_score += 1.0
+        elif word_count > 100:
+            complexity_score += 0.5
+        if context.get("project_size") == "large":
+            complexity_score += 0.2
+        elif context.get("project_size") == "small":
+            complexity_score -= 0.1
+        if context.get("team_experience") == "junior":
+            complexity_score += 0.1
+        elif context.get("team_experience") == "senior":
+            complexity_score -= 0.1
+        if complexity_score >= 2.0:
+            return ComplexityLevel.COMPLEX
+        elif complexity_score >= 1.0:
+            return ComplexityLevel.MEDIUM
+        return ComplexityLevel.SIMPLE
+
+    def identify_contexts(self, entities, task_description, complexity):
+        text_lower = task_description.lower()
+        contexts = set()
+        for context, patterns in self.context_patterns.items():
+            for pattern in patterns:
+                if re.search(pattern, text_lower, re.IGNORECASE):
+                    contexts.add(context)
+        entity_context_mapping = {
+            "feature": ["@agile", "@design", "@code", "@test"],
+            "bug": ["@debug", "@test", "@code"],
+            "security": ["@security", "@code", "@test"],
+            "performance": ["@optimize", "@test", "@code"],
+            "documentation": ["@docs"],
+            "deployment": ["@git", "@test"],
+            "architecture": ["@design", "@code"],
+            "api": ["@code", "@test", "@docs"],
+            "database": ["@code", "@test", "@security"],
+            "ui": ["@code", "@test", "@design"],
+            "integration": ["@code", "@test", "@debug"]
+        }
+        for entity in entities:
+            if entity.type in entity_context_mapping:
+                contexts.update(entity_context_mapping[entity.type])
+        if complexity == ComplexityLevel.COMPLEX:
+            contexts.update(["@design", "@security", "@test"])
+        elif complexity == ComplexityLevel.MEDIUM:
+            contexts.update(["@test"])
+        if not contexts:
+            contexts.add("@code")
+        if "@docs" not in contexts or len(contexts) > 1:
+            contexts.add("@git")
+        return sorted(list(contexts))
+
+    def identify_dependencies(self, entities, task_description):
+        dependencies = []
+        text_lower = task_description.lower()
+        for pattern in [r"depends on ([^,\.]+)", r"requires ([^,\.]+)", r"needs ([^,\.]+)",
+                        r"after ([^,\.]+)", r"once ([^,\.]+) is complete"]:
+            for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+                dependency = match.group(1).strip()
+                if dependency and len(dependency) < 100:
+                    dependencies.append(dependency)
+        for entity in entities:
+            if entity.type in ["prerequisite", "dependency", "requirement"]:
+                dependencies.append(entity.name)
+        return list(set(dependencies))
+
+
+VOCABULARY = (
+    "fix the login bug in payment service api endpoint users dashboard feature implement "
+    "build create add security vulnerability performance optimization slow database table "
+    "schema model ui page screen interface frontend client web rest graphql http sql mysql "
+    "component module class UserService PaymentComponent complex distributed enterprise "
+    "microservice integration migration refactor architecture system authentication many "
+    "very several depends on requires needs after once is complete not working broken failing "
+    "test coverage qa document readme deploy release git merge branch sprint backlog user story "
+    "design pattern benchmark latency , . # / été ſecurity"
+).split(" ")
+
+
+def synthetic_descriptions(count, seed=42):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+
+def comparable(analysis):
+    data = analysis.model_dump(exclude={"task_id", "created_at"})
+    data["dependencies"] = sorted(data["dependencies"])
+    return data
+
+
+class TestTaskAnalyzerSinglePass:
+    """Test suite for single-scan TaskAnalyzer equivalence"""
+
+    def setup_method(self):
+        self.analyzer = TaskAnalyzer()
+        self.legacy = LegacyTaskAnalyzer()
+
+    def test_analysis_identical_to_per_pattern_scans(self):
+        contexts = [{}, {"project_size": "large", "team_experience": "junior"},
+                    {"project_size": "small", "team_experience": "senior"}]
+        for i, description in enumerate(synthetic_descriptions(600)):
+            context = contexts[i % len(contexts)]
+            assert comparable(self.analyzer.analyze_task(description, context)) == \
+                comparable(self.legacy.analyze_task(description, context)), description
+
+    def test_memoized_analysis_is_fresh_and_independent(self):
+        first = self.analyzer.analyze_task("Fix the login bug in the payment API")
+        first.entities[0].name = "mutated"
+        first.required_contexts.append("@research")
+
+        second = self.analyzer.analyze_task("FIX the login bug in the payment API")
+
+        assert second.task_id != first.task_id
+        assert second.description == "FIX the login bug in the payment API"
+        assert "mutated" not in [e.name for e in second.entities]
+        assert "@research" not in second.required_contexts
+        assert len(self.analyzer.analysis_cache) == 1
+
+    def test_context_fields_are_part_of_memo_key(self):
+        description = "Refactor the distributed payment service architecture"
+        plain = self.analyzer.analyze_task(description, {})
+        large = self.analyzer.analyze_task(description, {"project_size": "large", "unrelated": object()})
+
+        assert len(self.analyzer.analysis_cache) == 2
+        assert comparable(large) == comparable(self.legacy.analyze_task(description, {"project_size": "large"}))
+        assert comparable(plain) == comparable(self.legacy.analyze_task(description, {}))
+
+    def test_analyze_tasks_batch(self):
+        descriptions = ["Fix login bug", "Write API documentation", "Fix login bug"]
+
+        results = self.analyzer.analyze_tasks(descriptions, {"team_experience": "senior"})
+
+        assert [r.description for r in results] == descriptions
+        assert len(self.analyzer.analysis_cache) == 2
+        assert comparable(results[0]) == comparable(results[2])
+
+    def test_cache_is_bounded(self):
+        analyzer = TaskAnalyzer(cache_size=3)
+        analyzer.analyze_tasks([f"task number {i}" for i in range(5)])
+
+        assert len(analyzer.analysis_cache) == 3
+
+    @pytest.mark.parametrize("pattern,expected", [
+        (r"\b(feature|functionality)\s+([a-z\s]+)", {"feature", "functionality"}),
+        (r"\b([a-z\s]+)\s+feature\b", {"feature"}),
+        (r"\b([A-Z][a-z]*Component|[A-Z][a-z]*Service)\b", {"component", "service"}),
+        (r"once ([^,\.]+) is complete", {" is complete"}),
+        (r"\b([a-z\s]+)\b", None),
+    ])
+    def test_required_literals(self, pattern, expected):
+        assert _required_literals(sre_parse.parse(pattern, re.IGNORECASE)) == expected
+
+
+@pytest.mark.performance
+class TestTaskAnalyzerBenchmark:
+    """Test suite for single-scan TaskAnalyzer throughput"""
+
+    def test_benchmark_10k_descriptions(self):
+        descriptions = synthetic_descriptions(10000, seed=7)
+        # Task streams repeat: replay a fifth of them
+        repeated = descriptions[:2000]
+        logging.disable(logging.INFO)
+        try:
+            legacy = LegacyTaskAnalyzer()
+            started = time.perf_counter()
+            legacy_results = [legacy.analyze_task(d) for d in descriptions]
+            legacy_seconds = time.perf_counter() - started
+
+            analyzer = TaskAnalyzer(cache_size=0)
+            started = time.perf_counter()
+            results = [analyzer.analyze_task(d) for d in descriptions]
+            scan_seconds = time.perf_counter() - started
+
+            memoized = TaskAnalyzer(cache_size=20000)
+            memoized.analyze_tasks(descriptions)
+            started = time.perf_counter()
+            memoized.analyze_tasks(repeated)
+            memo_seconds = time.perf_counter() - started
+        finally:
+            logging.disable(logging.NOTSET)
+
+        assert [comparable(r) for r in results] == [comparable(r) for r in legacy_results]
+        print(f"\nTaskAnalyzer on {len(descriptions)} synthetic descriptions")
+        print(f"  per-pattern scans: {legacy_seconds:6.2f} s ({len(descriptions) / legacy_seconds:8.0f}/s)")
+        print(f"  single scan:       {scan_seconds:6.2f} s ({len(descriptions) / scan_seconds:8.0f}/s)")
+        print(f"  memo hits:         {memo_seconds:6.2f} s ({len(repeated) / memo_seconds:8.0f}/s)")
+        assert scan_seconds < legacy_seconds
+        assert memo_seconds / len(repeated) < scan_seconds / len(descriptions)
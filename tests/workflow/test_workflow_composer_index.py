@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for indexed template selection and the parsed-template cache of
+WorkflowComposer.
+"""
+
+import json
+import os
+import random
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import yaml
+
+from workflow.composition.workflow_composer import (
+    TEMPLATE_CACHE_FILE, TEMPLATE_CATEGORY_ENTITIES, TEMPLATE_MATCH_THRESHOLD, WorkflowComposer
+)
+from workflow.models.workflow_models import (
+    ComplexityLevel, Entity, TaskAnalysis, WorkflowPhase, WorkflowTemplate
+)
+
+CONTEXTS = ['@code', '@debug', '@agile', '@git', '@test', '@design', '@docs', '@optimize', '@security', '@research']
+ENTITY_TYPES = sorted({t for types in TEMPLATE_CATEGORY_ENTITIES.values() for t in types} | {'database', 'system'})
+CATEGORIES = sorted(TEMPLATE_CATEGORY_ENTITIES) + ['general', 'research']
+
+
+def random_template(rng, i):
+    contexts = rng.sample(CONTEXTS, rng.randint(0, 7))
+    return WorkflowTemplate(
+        template_id=f"template_{i}",
+        name=f"template_{i}",
+        description="Generated template",
+        category=rng.choice(CATEGORIES),
+        phases=[WorkflowPhase(phase_id=f"p{j}", context=c, name=c, description="", inputs=[], outputs=[])
+                for j, c in enumerate(contexts)],
+        success_rate=rng.choice([0.0, 0.5, 0.9, 1.0]),
+    )
+
+
+def random_analysis(rng, i):
+    return TaskAnalysis(
+        task_id=f"task_{i}",
+        description="Generated task",
+        entities=[Entity(name=t, type=t, confidence=0.9) for t in rng.sample(ENTITY_TYPES, rng.randint(0, 3))],
+        complexity=rng.choice(list(ComplexityLevel)),
+        required_contexts=rng.sample(CONTEXTS, rng.randint(0, 6)),
+        estimated_duration=60,
+        confidence=0.8,
+    )
+
+
+def write_template_file(directory, name, contexts, category="development"):
+    data = {
+        "name": name,
+        "description": f"Template {name}",
+        "category": category,
+        "contexts": [{"context": c, "phase": c.strip("@")} for c in contexts],
+    }
+    with open(os.path.join(directory, f"{name}.yaml"), 'w') as f:
+        yaml.dump(data, f)
+
+
+class TestIndexedTemplateSelection:
+    """Test suite for indexed, early-stopping template selection"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.composer = WorkflowComposer(template_directory=self.temp_dir)
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _full_scan(self, analysis):
+        """The original selection: score every template, first best wins."""
+        best_template, best_score = None, 0.0
+        for template in self.composer.templates.values():
+            score = self.composer._calculate_template_score(template, analysis)
+            if score > best_score and score >= TEMPLATE_MATCH_THRESHOLD:
+                best_template, best_score = template, score
+        return best_template
+
+    def test_selection_identical_to_full_scan(self):
+        rng = random.Random(3)
+        for i in range(300):
+            template = random_template(rng, i)
+            self.composer.templates[template.template_id] = template
+
+        for i in range(500):
+            analysis = random_analysis(rng, i)
+            assert self.composer.select_template(analysis) is self._full_scan(analysis), analysis
+
+    def test_rank_templates_matches_sorted_scores(self):
+        rng = random.Random(5)
+        for i in range(200):
+            template = random_template(rng, i)
+            self.composer.templates[template.template_id] = template
+        positions = {template_id: i for i, template_id in enumerate(self.composer.templates)}
+
+        for i in range(100):
+            analysis = random_analysis(rng, i)
+            expected = sorted(
+                ((t, self.composer._calculate_template_score(t, analysis)) for t in self.composer.templates.values()),
+                key=lambda pair: (-pair[1], positions[pair[0].template_id])
+            )
+            expected = [pair for pair in expected if pair[1] >= TEMPLATE_MATCH_THRESHOLD][:5]
+            ranked = self.composer.rank_templates(analysis, top_k=5)
+            assert [(t.template_id, s) for t, s in ranked] == [(t.template_id, s) for t, s in expected]
+
+    def test_only_plausible_templates_are_scored(self):
+        rng = random.Random(11)
+        for i in range(500):
+            template = random_template(rng, i)
+            self.composer.templates[template.template_id] = template
+        analysis = TaskAnalysis(
+            task_id="t", description="Fix bug", complexity=ComplexityLevel.SIMPLE,
+            entities=[Entity(name="bug", type="bug", confidence=0.9)],
+            required_contexts=["@debug", "@test"], estimated_duration=30, confidence=0.9,
+        )
+
+        with patch.object(self.composer, '_calculate_template_score',
+                          wraps=self.composer._calculate_template_score) as scorer:
+            selected = self.composer.select_template(analysis)
+
+        assert selected is self._full_scan(analysis)
+        assert 0 < scorer.call_count < len(self.composer.templates) // 4
+
+    def test_index_follows_template_changes(self):
+        analysis = TaskAnalysis(
+            task_id="t", description="Write docs", complexity=ComplexityLevel.SIMPLE,
+            entities=[Entity(name="guide", type="documentation", confidence=0.9)],
+            required_contexts=["@docs"], estimated_duration=30, confidence=0.9,
+        )
+        docs = WorkflowTemplate(
+            template_id="docs", name="docs", description="", category="documentation",
+            phases=[WorkflowPhase(phase_id="d", context="@docs", name="Docs", description="", inputs=[], outputs=[])]
+        )
+        assert self.composer.select_template(analysis) is None
+
+        self.composer.templates["docs"] = docs
+        assert self.composer.select_template(analysis) is docs
+
+        del self.composer.templates["docs"]
+        assert self.composer.select_template(analysis) is None
+
+
+class TestTemplateCache:
+    """Test suite for the parsed-template cache"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        write_template_file(self.temp_dir, "feature", ["@agile", "@code", "@test"])
+        os.makedirs(os.path.join(self.temp_dir, "nested"))
+        write_template_file(os.path.join(self.temp_dir, "nested"), "bugfix", ["@debug", "@code"], "bug_fix")
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_unchanged_files_are_not_reparsed(self):
+        first = WorkflowComposer(template_directory=self.temp_dir)
+        assert os.path.exists(os.path.join(self.temp_dir, TEMPLATE_CACHE_FILE))
+
+        with patch('workflow.composition.workflow_composer.yaml.safe_load') as safe_load:
+            second = WorkflowComposer(template_directory=self.temp_dir)
+
+        safe_load.assert_not_called()
+        assert list(second.templates) == list(first.templates)
+        for template_id, template in first.templates.items():
+            assert second.templates[template_id].model_dump() == template.model_dump()
+
+    def test_changed_files_are_reparsed(self):
+        WorkflowComposer(template_directory=self.temp_dir)
+        path = os.path.join(self.temp_dir, "feature.yaml")
+        write_template_file(self.temp_dir, "feature", ["@agile", "@code", "@test", "@git"])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        composer = WorkflowComposer(template_directory=self.temp_dir)
+
+        assert [phase.context for phase in composer.templates["feature"].phases] == [
+            "@agile", "@code", "@test", "@git"
+        ]
+
+    def test_corrupt_cache_is_ignored(self):
+        WorkflowComposer(template_directory=self.temp_dir)
+        with open(os.path.join(self.temp_dir, TEMPLATE_CACHE_FILE), 'w') as f:
+            f.write("{not json")
+
+        composer = WorkflowComposer(template_directory=self.temp_dir)
+
+        assert sorted(composer.templates) == ["bugfix", "feature"]
+        with open(os.path.join(self.temp_dir, TEMPLATE_CACHE_FILE)) as f:
+            assert sorted(json.load(f)) == ["feature.yaml", os.path.join("nested", "bugfix.yaml")]
@@ -8,6 +8,11 @@ whenever user stories are created, modified, or their status changes.
 
 This ensures 100% transparency and up-to-date project visibility for all stakeholders.
 
+Watch mode polls the sprint directories (no external watcher service),
+debounces bursts of edits, re-parses only stories whose content changed,
+updates the catalog metrics incrementally and rewrites the catalog
+atomically only when its rendered content changes.
+
 Author: AI-Dev-Agent Team with Agile Excellence
 Created: 2024
 License: Open Source - For transparent project management
@@ -17,13 +22,19 @@ import os
 import re
 import json
 import time
+import hashlib
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from .temporal_authority import get_temporal_authority, temporal_compliance_decorator
 from collections import defaultdict
-import glob
+
+# Lines that change on every render; ignored when deciding whether the catalog changed
+VOLATILE_CATALOG_LINES = re.compile(
+    r'^(\*\*Last Updated\*\*|\*\*Last Scan\*\*|- \*\*Last Updated\*\*):.*$', re.MULTILINE
+)
 
 @dataclass
 class UserStory:
@@ -78,23 +89,23 @@ class UserStoryCatalogManager:
             "cancelled": ["❌ Cancelled", "Cancelled", "🚫 Cancelled"]
         }
         
+        # Parsed stories by file path: (mtime_ns, size, content hash, story or None)
+        self._story_cache: Dict[str, Tuple[int, int, str, Optional[UserStory]]] = {}
+        # Metrics of the cached stories, adjusted story by story
+        self._metrics = self.calculate_metrics([])
+        self.last_scan_stats: Dict[str, int] = {}
+        
         print("User Story Catalog Manager initialized for real-time updates")
     
     def scan_all_user_stories(self) -> List[UserStory]:
         """Scan all user stories across all sprints and gather complete information."""
         
-        user_stories = []
-        
-        # Find all user story files
-        story_pattern = str(self.user_stories_dir / "**" / "US-*.md")
-        story_files = glob.glob(story_pattern, recursive=True)
-        
-        print(f"Scanning {len(story_files)} user story files...")
+        self.refresh_stories()
+        stats = self.last_scan_stats
+        print(f"Scanning {stats['files']} user story files... "
+              f"({stats['parsed']} parsed, {stats['reused']} unchanged)")
         
-        for file_path in story_files:
-            story = self._parse_user_story_file(file_path)
-            if story:
-                user_stories.append(story)
+        user_stories = [entry[3] for entry in self._story_cache.values() if entry[3] is not None]
         
         # Sort by story ID
         user_stories.sort(key=lambda s: s.story_id)
@@ -102,12 +113,102 @@ class UserStoryCatalogManager:
         print(f"Successfully parsed {len(user_stories)} user stories")
         return user_stories
     
-    def _parse_user_story_file(self, file_path: str) -> Optional[UserStory]:
+    def refresh_stories(self, snapshot: Optional[Dict[str, Tuple[int, int]]] = None) -> bool:
+        """
+        Bring the parsed story cache up to date with the story files.
+        
+        Files with unchanged stat are reused as-is; otherwise the content hash
+        decides whether the file is parsed again. Metrics are adjusted for
+        each added, changed or removed story only.
+        
+        Args:
+            snapshot: Story file stats from ``_snapshot_story_files`` (taken if omitted)
+        
+        Returns:
+            True when any story was added, changed or removed
+        """
+        if snapshot is None:
+            snapshot = self._snapshot_story_files()
+        stats = {"files": len(snapshot), "parsed": 0, "reused": 0, "removed": 0}
+        changed = False
+        
+        for file_path in [path for path in self._story_cache if path not in snapshot]:
+            self._adjust_metrics(self._story_cache.pop(file_path)[3], -1)
+            stats["removed"] += 1
+            changed = True
+        
+        for file_path, (mtime_ns, size) in snapshot.items():
+            cached = self._story_cache.get(file_path)
+            if cached is not None and cached[:2] == (mtime_ns, size):
+                stats["reused"] += 1
+                continue
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error reading {file_path}: {e}")
+                continue
+            content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+            if cached is not None and cached[2] == content_hash:
+                # Touched without changes
+                self._story_cache[file_path] = (mtime_ns, size, content_hash, cached[3])
+                stats["reused"] += 1
+                continue
+            
+            story = self._parse_user_story_file(file_path, content)
+            stats["parsed"] += 1
+            if cached is not None:
+                self._adjust_metrics(cached[3], -1)
+            self._adjust_metrics(story, 1)
+            self._story_cache[file_path] = (mtime_ns, size, content_hash, story)
+            changed = True
+        
+        self.last_scan_stats = stats
+        return changed
+    
+    def _snapshot_story_files(self) -> Dict[str, Tuple[int, int]]:
+        """(mtime_ns, size) of every US-*.md file under the sprint directories."""
+        snapshot = {}
+        for root, _, filenames in os.walk(self.user_stories_dir):
+            for filename in filenames:
+                if filename.startswith("US-") and filename.endswith(".md"):
+                    file_path = os.path.join(root, filename)
+                    try:
+                        stat = os.stat(file_path)
+                    except OSError:
+                        continue  # Deleted while walking
+                    snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+    
+    def _adjust_metrics(self, story: Optional[UserStory], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one story from the running metrics."""
+        if story is None:
+            return
+        metrics = self._metrics
+        status = story.status.lower()
+        
+        metrics.total_stories += sign
+        metrics.total_points += sign * story.points
+        if "completed" in status:
+            metrics.completed_stories += sign
+            metrics.completed_points += sign * story.points
+        if "progress" in status:
+            metrics.in_progress_stories += sign
+            metrics.in_progress_points += sign * story.points
+        if "pending" in status:
+            metrics.pending_stories += sign
+            metrics.pending_points += sign * story.points
+        
+        metrics.completion_rate = (metrics.completed_stories / max(metrics.total_stories, 1)) * 100
+        metrics.points_completion_rate = (metrics.completed_points / max(metrics.total_points, 1)) * 100
+    
+    def _parse_user_story_file(self, file_path: str, content: Optional[str] = None) -> Optional[UserStory]:
         """Parse a single user story file and extract all metadata."""
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
             # Extract basic information
             story_id = self._extract_story_id(file_path, content)
@@ -512,26 +613,28 @@ This catalog is maintained automatically by the User Story Catalog Manager. For
         return content
     
     def update_catalog(self) -> bool:
-        """Update the USER_STORY_CATALOG.md with current information."""
+        """
+        Update the USER_STORY_CATALOG.md with current information.
+        
+        The catalog is replaced atomically, and only when its content changed
+        apart from the scan timestamps.
+        """
         
         try:
             print("Updating User Story Catalog...")
             
-            # Scan all user stories
+            # Scan all user stories (only changed files are parsed)
             user_stories = self.scan_all_user_stories()
             
-            # Calculate metrics
-            metrics = self.calculate_metrics(user_stories)
+            # Metrics are maintained incrementally by the scan
+            metrics = CatalogMetrics(**asdict(self._metrics))
             
             # Generate content
             catalog_content = self.generate_catalog_content(user_stories, metrics)
             
-            # Ensure directory exists
-            self.catalog_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write updated catalog
-            with open(self.catalog_file, 'w', encoding='utf-8') as f:
-                f.write(catalog_content)
+            if not self._write_catalog_if_changed(catalog_content):
+                print("User Story Catalog unchanged")
+                return True
             
             print("User Story Catalog updated successfully")
             print(f"- {metrics.total_stories} stories, {metrics.total_points} points")
@@ -544,14 +647,61 @@ This catalog is maintained automatically by the User Story Catalog Manager. For
             print(f"Error updating catalog: {e}")
             return False
     
-    def watch_for_changes(self) -> None:
-        """Watch for changes in user story files and auto-update catalog."""
+    def _write_catalog_if_changed(self, catalog_content: str) -> bool:
+        """Atomically replace the catalog unless only its timestamps would change."""
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                current_content = f.read()
+        except (OSError, UnicodeDecodeError):
+            current_content = None
+        if current_content is not None and (
+            VOLATILE_CATALOG_LINES.sub('', current_content) == VOLATILE_CATALOG_LINES.sub('', catalog_content)
+        ):
+            return False
+        
+        # Ensure directory exists
+        self.catalog_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_file = self.catalog_file.with_suffix(self.catalog_file.suffix + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(catalog_content)
+        os.replace(tmp_file, self.catalog_file)
+        return True
+    
+    def watch_for_changes(self, interval: float = 2.0, debounce: float = 1.0,
+                          stop_event: Optional[threading.Event] = None) -> None:
+        """
+        Watch for changes in user story files and auto-update catalog.
+        
+        Polls the story files' stat every ``interval`` seconds. After a change
+        the catalog is regenerated once the files have been quiet for
+        ``debounce`` seconds, so a burst of edits causes a single update.
+        
+        Args:
+            interval: Seconds between polls
+            debounce: Quiet period required after the last change
+            stop_event: Stops watching when set (runs until interrupted otherwise)
+        """
         print("Starting user story change monitoring...")
-        print("(In a real implementation, this would use file system watchers)")
+        stop_event = stop_event or threading.Event()
         
-        # This would use file system watchers like watchdog in a real implementation
-        # For now, we'll just update the catalog once
+        snapshot = self._snapshot_story_files()
         self.update_catalog()
+        last_change = None
+        
+        try:
+            while not stop_event.wait(interval if last_change is None else min(interval, debounce)):
+                current = self._snapshot_story_files()
+                if current != snapshot:
+                    snapshot = current
+                    last_change = time.monotonic()
+                    continue
+                if last_change is not None and time.monotonic() - last_change >= debounce:
+                    last_change = None
+                    self.update_catalog()
+        except KeyboardInterrupt:
+            pass
+        print("Stopped user story change monitoring")
 
 def main():
     """Demonstrate the User Story Catalog Manager."""
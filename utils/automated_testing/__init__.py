@@ -10,6 +10,8 @@ Components:
 - CommitHookManager: Manages Git hooks for automated test execution
 - TestReporter: Generates reports and sends notifications
 - DeploymentBlocker: Blocks deployments when quality gates fail
+- ShardScheduler: Runs test files as duration-balanced shards on N workers
+- ChangeImpactAnalyzer: Selects the tests affected by changed files from the import graph
 """
 
 from .pipeline_manager import AutomatedTestingPipeline
@@ -17,11 +19,16 @@ from .coverage_tracker import CoverageTracker
 from .commit_hooks import CommitHookManager
 from .test_reporter import AutomatedTestReporter
 from .deployment_blocker import DeploymentBlocker
+from .shard_scheduler import FileDurationStore, ShardScheduler
+from .impact_analyzer import ChangeImpactAnalyzer
 
 __all__ = [
     'AutomatedTestingPipeline',
     'CoverageTracker', 
     'CommitHookManager',
     'AutomatedTestReporter',
-    'DeploymentBlocker'
+    'DeploymentBlocker',
+    'FileDurationStore',
+    'ShardScheduler',
+    'ChangeImpactAnalyzer'
 ]
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Change Impact Analyzer - Test Selection from Changed Files
+==========================================================
+
+Builds the module import graph of the project with ``ast`` (nothing is
+imported) and selects the test files a set of changed files can affect.
+
+Features:
+- Import graph from ``import``/``from ... import`` statements anywhere in a
+  file, relative imports resolved, package ``__init__`` and ancestor
+  ``conftest.py`` files treated as dependencies
+- Transitive selection of affected test files from changed files, either
+  ``git diff --name-only`` output or an explicit list
+- Deleted modules still reach the files that imported them
+- Full-run fallback (``None``) for changes the graph cannot see, such as
+  pytest or dependency configuration and non-Python data files
+- Cached graph, updated incrementally by file hash
+"""
+
+import ast
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import subprocess
+from collections import deque
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = ".test_impact_cache.json"
+CACHE_VERSION = 1
+
+DEFAULT_EXCLUDED_DIRS = {
+    "__pycache__", "node_modules", "venv", "env", "build", "dist", "generated_projects", "test_results"
+}
+
+# Changes that can affect any test: always run everything
+FULL_RUN_FILES = {"pytest.ini", "pyproject.toml", "setup.py", "setup.cfg", "tox.ini", "requirements.txt"}
+
+# Changes that cannot affect tests
+IGNORED_SUFFIXES = {".md", ".rst", ".txt"}
+
+
+def module_name(path: str) -> str:
+    """Dotted module name of a project-relative ``.py`` path (``a/b/__init__.py`` -> ``a.b``)."""
+    parts = list(PurePosixPath(path).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _with_parents(name: str) -> List[str]:
+    """``a.b.c`` -> ``a``, ``a.b``, ``a.b.c``: importing a module runs its packages first."""
+    parts = name.split(".")
+    return [".".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+def parse_imports(source: str, path: str) -> List[str]:
+    """
+    Module names a file may import, including implicit dependencies.
+
+    Names are candidates: they are matched against project modules when the
+    graph is queried, so third-party imports simply never match.
+    """
+    module = module_name(path)
+    is_package = PurePosixPath(path).name == "__init__.py"
+    directory = ".".join(PurePosixPath(path).parent.parts)
+    package_parts = module.split(".") if is_package else module.split(".")[:-1]
+
+    names: Set[str] = set()
+    # The packages a module lives in are imported before it
+    if len(package_parts) > 0:
+        names.update(_with_parents(".".join(package_parts)))
+
+    try:
+        tree = ast.parse(source, filename=path)
+    except (SyntaxError, ValueError) as e:
+        logger.debug(f"Cannot parse {path}: {e}")
+        return sorted(names)
+
+    def add(name: str, sibling: bool) -> None:
+        names.update(_with_parents(name))
+        # Scripts and tests import siblings through sys.path[0] / rootdir insertion
+        if sibling and directory:
+            names.update(_with_parents(f"{directory}.{name}"))
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                add(alias.name, sibling=True)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package_parts[:len(package_parts) - (node.level - 1)] if node.level > 1 else package_parts
+                base = ".".join(base_parts + ([node.module] if node.module else []))
+                sibling = False
+            else:
+                base = node.module or ""
+                sibling = True
+            if base:
+                add(base, sibling)
+            for alias in node.names:
+                if alias.name != "*":
+                    add(f"{base}.{alias.name}" if base else alias.name, sibling)
+
+    names.discard(module)
+    return sorted(names)
+
+
+class ChangeImpactAnalyzer:
+    """Selects the test files affected by a set of changed files."""
+
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = None,
+                 test_roots: Iterable[str] = ("tests",), test_patterns: Iterable[str] = ("test_*.py",),
+                 excluded_dirs: Optional[Set[str]] = None):
+        """
+        Initialize analyzer.
+
+        Args:
+            project_root: Root the import graph and all paths are relative to
+            cache_path: JSON file holding the parsed graph (default: in project root)
+            test_roots: Directories holding test files
+            test_patterns: File name patterns of test files
+            excluded_dirs: Directory names never scanned (hidden directories always are)
+        """
+        self.project_root = Path(project_root)
+        self.cache_path = Path(cache_path) if cache_path else self.project_root / CACHE_FILE_NAME
+        self.test_roots = tuple(PurePosixPath(root).as_posix().rstrip("/") for root in test_roots)
+        self.test_patterns = tuple(test_patterns)
+        self.excluded_dirs = DEFAULT_EXCLUDED_DIRS if excluded_dirs is None else set(excluded_dirs)
+
+        # path -> {"mtime_ns", "size", "hash", "imports"}
+        self._entries: Dict[str, Dict] = {}
+        self._importers: Optional[Dict[str, Set[str]]] = None
+        self._load_cache()
+
+    # ------------------------------------------------------------------
+    # Graph
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the graph up to date, re-parsing only files whose content changed."""
+        stats = {"files": 0, "parsed": 0, "reused": 0, "removed": 0}
+        seen: Set[str] = set()
+        changed = False
+
+        for path, full_path in self._python_files():
+            seen.add(path)
+            stats["files"] += 1
+            try:
+                stat = full_path.stat()
+                entry = self._entries.get(path)
+                if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    stats["reused"] += 1
+                    continue
+                data = full_path.read_bytes()
+            except OSError as e:
+                logger.debug(f"Cannot read {path}: {e}")
+                continue
+
+            digest = hashlib.sha256(data).hexdigest()
+            if entry and entry["hash"] == digest:
+                # Touched, not changed
+                stats["reused"] += 1
+            else:
+                entry = {"hash": digest, "imports": self._imports_of(path, data)}
+                stats["parsed"] += 1
+            entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            self._entries[path] = entry
+            changed = True
+
+        for path in set(self._entries) - seen:
+            del self._entries[path]
+            stats["removed"] += 1
+            changed = True
+
+        if changed or not self.cache_path.exists():
+            self._importers = None
+            self._save_cache()
+        logger.info(f"🕸️ Import graph: {stats['files']} files, {stats['parsed']} parsed, "
+                    f"{stats['reused']} reused, {stats['removed']} removed")
+        return stats
+
+    def _imports_of(self, path: str, data: bytes) -> List[str]:
+        names = set(parse_imports(data.decode("utf-8", errors="replace"), path))
+        # pytest loads every conftest.py between the test root and the file
+        if self._in_test_root(path):
+            directory = PurePosixPath(path).parent
+            for ancestor in [directory, *directory.parents]:
+                names.add(".".join([*ancestor.parts, "conftest"]))
+        names.discard(module_name(path))
+        return sorted(names)
+
+    def _python_files(self):
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d not in self.excluded_dirs)
+            for file in sorted(files):
+                if file.endswith(".py"):
+                    full_path = Path(root) / file
+                    yield full_path.relative_to(self.project_root).as_posix(), full_path
+
+    def _get_importers(self) -> Dict[str, Set[str]]:
+        """Module name -> files importing it."""
+        if self._importers is None:
+            self._importers = {}
+            for path, entry in self._entries.items():
+                for name in entry["imports"]:
+                    self._importers.setdefault(name, set()).add(path)
+        return self._importers
+
+    def dependents(self, paths: Iterable[str]) -> Set[str]:
+        """Files that import any of ``paths``, directly or transitively (including the paths)."""
+        importers = self._get_importers()
+        affected: Set[str] = set()
+        queue = deque(self._normalize(path) for path in paths)
+        while queue:
+            path = queue.popleft()
+            if path in affected:
+                continue
+            affected.add(path)
+            queue.extend(importers.get(module_name(path), ()))
+        return affected
+
+    # ------------------------------------------------------------------
+    # Test selection
+    # ------------------------------------------------------------------
+
+    def affected_tests(self, changed_files: Iterable[str]) -> Optional[List[str]]:
+        """
+        Test files affected by the changed files.
+
+        Returns:
+            Sorted project-relative test paths, or None when a change needs the
+            full suite (configuration or non-Python files the graph cannot see)
+        """
+        python_changes: List[str] = []
+        for changed in changed_files:
+            path = self._normalize(changed)
+            if not path:
+                continue
+            name = PurePosixPath(path).name
+            suffix = PurePosixPath(path).suffix
+            if name in FULL_RUN_FILES:
+                logger.info(f"🔁 {path} changed: running the full suite")
+                return None
+            if suffix == ".py":
+                python_changes.append(path)
+            elif suffix not in IGNORED_SUFFIXES:
+                logger.info(f"🔁 {path} is not Python source: running the full suite")
+                return None
+
+        self.refresh()
+        return sorted(
+            path for path in self.dependents(python_changes)
+            if self.is_test_file(path) and (self.project_root / path).exists()
+        )
+
+    def is_test_file(self, path: str) -> bool:
+        name = PurePosixPath(path).name
+        return self._in_test_root(path) and any(fnmatch.fnmatch(name, pattern) for pattern in self.test_patterns)
+
+    def _in_test_root(self, path: str) -> bool:
+        return any(path == root or path.startswith(root + "/") for root in self.test_roots)
+
+    def _normalize(self, path: str) -> str:
+        candidate = Path(path)
+        if candidate.is_absolute():
+            try:
+                candidate = candidate.relative_to(self.project_root)
+            except ValueError:
+                return ""
+        posix = PurePosixPath(candidate.as_posix()).as_posix()
+        return "" if posix == "." else posix
+
+    @staticmethod
+    def changed_files_from_git(project_root: Path, base: str = "HEAD") -> List[str]:
+        """Files changed against ``base`` (``git diff --name-only``) plus untracked files."""
+        changed: List[str] = []
+        for command in (["git", "diff", "--name-only", base],
+                        ["git", "ls-files", "--others", "--exclude-standard"]):
+            result = subprocess.run(command, cwd=project_root, capture_output=True, text=True, check=True)
+            changed.extend(line.strip() for line in result.stdout.splitlines() if line.strip())
+        return changed
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _load_cache(self) -> None:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._entries = data.get("files", {})
+
+    def _save_cache(self) -> None:
+        try:
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"version": CACHE_VERSION, "files": self._entries}))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to save import graph cache: {e}")
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Shard Scheduler - Duration-Aware Sharded Test Execution
+=======================================================
+
+Splits test categories into file-level shards and runs them on N pytest
+worker subprocesses, so one slow category no longer dominates wall time.
+
+Features:
+- Per-test-file durations recorded in the pipeline results database
+- Categories split into shards of similar estimated duration
+- Longest-processing-time-first (LPT) dispatch to the workers
+- Results read from ``--junitxml`` reports instead of scraping stdout
+- Per-category aggregation, so quality gates stay per category
+- Sequential (``parallel: False``) categories run alone after the pool drains
+"""
+
+import heapq
+import logging
+import math
+import os
+import shlex
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Shard:
+    """A batch of test files from one category, run by one pytest process."""
+    category: str
+    targets: List[str]
+    estimated_duration: float
+    timeout: float
+    extra_args: List[str] = field(default_factory=list)
+    sequential: bool = False
+
+
+@dataclass
+class ShardResult:
+    """Outcome of one shard, read from its JUnit XML report."""
+    shard: Shard
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    duration: float = 0.0
+    exit_code: int = 0
+    file_durations: Dict[str, float] = field(default_factory=dict)
+    details: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CategoryOutcome:
+    """Shard results of a category added up, for per-category quality gates."""
+    category: str
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    execution_time: float = 0.0
+    exit_code: int = 0
+    shards: int = 0
+    details: List[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return self.passed + self.failed + self.skipped
+
+
+class FileDurationStore:
+    """Per-test-file durations (smoothed over runs) in the pipeline results database."""
+
+    def __init__(self, db_path: str, smoothing: float = 0.5):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite database, shared with the pipeline execution history
+            smoothing: Weight of the newest run in the moving average
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS test_file_durations (
+                path TEXT PRIMARY KEY,
+                category TEXT NOT NULL,
+                duration REAL NOT NULL,
+                runs INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, paths: List[str]) -> Dict[str, float]:
+        """Recorded durations of the given files (files never run are absent)."""
+        durations: Dict[str, float] = {}
+        with self._lock:
+            for start in range(0, len(paths), 500):
+                chunk = paths[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT path, duration FROM test_file_durations WHERE path IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                durations.update(rows)
+        return durations
+
+    def record(self, category: str, file_durations: Dict[str, float]) -> None:
+        """Fold the durations of one run into the moving averages."""
+        if not file_durations:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO test_file_durations (path, category, duration, runs, updated_at)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    category = excluded.category,
+                    duration = ? * excluded.duration + (1 - ?) * duration,
+                    runs = runs + 1,
+                    updated_at = excluded.updated_at
+            """, [(path, category, duration, now, self.smoothing, self.smoothing)
+                  for path, duration in file_durations.items()])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ShardScheduler:
+    """Plans file-level shards and runs them longest first on N pytest workers."""
+
+    def __init__(self, project_root: Path, duration_store: FileDurationStore,
+                 workers: Optional[int] = None, python_executable: Optional[str] = None,
+                 default_duration: float = 1.0, min_shard_duration: float = 5.0):
+        """
+        Initialize scheduler.
+
+        Args:
+            project_root: Directory pytest runs in; test paths are relative to it
+            duration_store: Where per-file durations are read and recorded
+            workers: Concurrent pytest processes (default: CPU count)
+            python_executable: Interpreter running pytest (default: this one)
+            default_duration: Estimate in seconds for files without history
+            min_shard_duration: Shards are not split below this many estimated
+                seconds, since every shard pays pytest start-up
+        """
+        self.project_root = Path(project_root)
+        self.duration_store = duration_store
+        self.workers = max(1, workers or os.cpu_count() or 4)
+        self.python_executable = python_executable or sys.executable
+        self.default_duration = default_duration
+        self.min_shard_duration = min_shard_duration
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def discover(self, command: str) -> Tuple[List[str], List[str]]:
+        """Test files and extra pytest options of a category ``pytest <paths> <options>`` command."""
+        tokens = shlex.split(command)
+        if "pytest" in tokens:
+            tokens = tokens[tokens.index("pytest") + 1:]
+        paths = [token for token in tokens if not token.startswith("-")]
+        options = [token for token in tokens if token.startswith("-")]
+
+        files: List[str] = []
+        for path in paths:
+            full_path = self.project_root / path
+            found = []
+            if full_path.is_dir():
+                found = [
+                    test_file.relative_to(self.project_root).as_posix()
+                    for test_file in sorted(full_path.rglob("test_*.py"))
+                    if "__pycache__" not in test_file.parts
+                ]
+            # Missing paths and directories without test files go to pytest as given
+            files.extend(found or [path])
+        return files, options
+
+    def plan(self, categories: Dict[str, Dict], split: bool = True,
+             only: Optional[Set[str]] = None) -> List[Shard]:
+        """
+        Split categories into shards, longest estimated first.
+
+        Categories with ``parallel: False`` stay in one sequential shard, which
+        ``run`` executes alone once every parallel shard has finished. With ``split=False`` every
+        category is a single shard (category-level scheduling). With ``only``
+        just those test files run, and categories without any get no shard.
+        """
+        discovered = {category: self.discover(config["command"]) for category, config in categories.items()}
+        if only is not None:
+            discovered = {
+                category: ([path for path in files if path in only], options)
+                for category, (files, options) in discovered.items()
+            }
+            discovered = {category: found for category, found in discovered.items() if found[0]}
+        all_files = [path for files, _ in discovered.values() for path in files]
+        history = self.duration_store.get(all_files)
+        estimates = {path: history.get(path, self.default_duration) for path in all_files}
+        target = max(self.min_shard_duration, sum(estimates.values()) / (2 * self.workers)) or 1.0
+
+        shards: List[Shard] = []
+        for category, (files, options) in discovered.items():
+            config = categories[category]
+            total = sum(estimates.get(path, self.default_duration) for path in files)
+            count = 1
+            if split and config.get("parallel", True):
+                count = max(1, min(len(files), math.ceil(total / target)))
+            for targets, estimate in self._pack(files, estimates, count):
+                shards.append(Shard(category, targets, estimate, config.get("timeout", 300), options,
+                                    sequential=not config.get("parallel", True)))
+
+        shards.sort(key=lambda shard: shard.estimated_duration, reverse=True)
+        return shards
+
+    def _pack(self, files: List[str], estimates: Dict[str, float], count: int) -> List[Tuple[List[str], float]]:
+        """Distribute files over ``count`` bins, longest file first into the lightest bin."""
+        bins = [(0.0, index, []) for index in range(count)]
+        for path in sorted(files, key=lambda p: estimates.get(p, self.default_duration), reverse=True):
+            load, index, members = heapq.heappop(bins)
+            members.append(path)
+            heapq.heappush(bins, (load + estimates.get(path, self.default_duration), index, members))
+        return [(sorted(members), load) for load, _, members in sorted(bins, key=lambda b: b[1]) if members]
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run(self, shards: List[Shard]) -> List[ShardResult]:
+        """
+        Run shards on the workers in the given (longest first) order.
+
+        Each free worker takes the next shard, which is LPT list scheduling
+        that also absorbs estimation errors at run time. Sequential shards
+        then run one at a time, never alongside any other shard, as they may
+        share resources (database files, ports, temp dirs).
+        """
+        pooled = [shard for shard in shards if not shard.sequential]
+        sequential = [shard for shard in shards if shard.sequential]
+        logger.info(f"🧩 Running {len(pooled)} shards on {self.workers} workers, "
+                    f"then {len(sequential)} sequentially")
+        results: List[ShardResult] = []
+        with tempfile.TemporaryDirectory(prefix="shards_") as reports_dir:
+            if pooled:
+                with ThreadPoolExecutor(max_workers=min(self.workers, len(pooled))) as executor:
+                    futures = {
+                        executor.submit(self.run_shard, shard, Path(reports_dir) / f"shard_{index}.xml"): shard
+                        for index, shard in enumerate(pooled)
+                    }
+                    for future in as_completed(futures):
+                        results.append(self._record(future.result()))
+            for index, shard in enumerate(sequential, start=len(pooled)):
+                results.append(self._record(self.run_shard(shard, Path(reports_dir) / f"shard_{index}.xml")))
+        return results
+
+    def _record(self, result: ShardResult) -> ShardResult:
+        self.duration_store.record(result.shard.category, result.file_durations)
+        return result
+
+    def run_shard(self, shard: Shard, report_path: Path) -> ShardResult:
+        """Run one shard in a pytest subprocess and read its JUnit XML report."""
+        command = [
+            self.python_executable, "-m", "pytest", *shard.targets, *shard.extra_args,
+            f"--rootdir={self.project_root}", f"--junitxml={report_path}", "-o", "junit_family=xunit1",
+        ]
+        start_time = time.time()
+        try:
+            process = subprocess.run(
+                command, capture_output=True, text=True, timeout=shard.timeout, cwd=self.project_root
+            )
+        except subprocess.TimeoutExpired:
+            return ShardResult(shard, failed=1, duration=time.time() - start_time, exit_code=1,
+                               details=[f"Shard {shard.targets} timed out after {shard.timeout}s"])
+        except Exception as e:
+            return ShardResult(shard, failed=1, duration=time.time() - start_time, exit_code=1,
+                               details=[f"Shard {shard.targets} failed to run: {e}"])
+
+        result = ShardResult(shard, duration=time.time() - start_time, exit_code=process.returncode)
+        try:
+            self._read_report(report_path, result)
+        except (OSError, ET.ParseError) as e:
+            result.failed = max(result.failed, 1)
+            result.details.append(f"No JUnit report for {shard.targets}: {e}")
+        if process.returncode != 0:
+            result.details.extend(process.stdout.splitlines()[-20:])
+        return result
+
+    def _read_report(self, report_path: Path, result: ShardResult) -> None:
+        test_time: Dict[str, float] = {target: 0.0 for target in result.shard.targets}
+        for testcase in ET.parse(report_path).getroot().iter("testcase"):
+            outcomes = {child.tag for child in testcase}
+            if outcomes & {"failure", "error"}:
+                result.failed += 1
+            elif "skipped" in outcomes:
+                result.skipped += 1
+            else:
+                result.passed += 1
+            path = Path(testcase.get("file", "")).as_posix()
+            if path in test_time:
+                test_time[path] += float(testcase.get("time", 0.0) or 0.0)
+
+        # Start-up, collection and fixtures outside test bodies are shared out evenly
+        overhead = max(0.0, result.duration - sum(test_time.values())) / max(1, len(test_time))
+        result.file_durations = {
+            path: seconds + overhead for path, seconds in test_time.items() if path.endswith(".py")
+        }
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def aggregate(results: List[ShardResult]) -> Dict[str, CategoryOutcome]:
+        """Add up shard results per category."""
+        outcomes: Dict[str, CategoryOutcome] = {}
+        for result in results:
+            category = result.shard.category
+            outcome = outcomes.setdefault(category, CategoryOutcome(category))
+            outcome.passed += result.passed
+            outcome.failed += result.failed
+            outcome.skipped += result.skipped
+            outcome.execution_time += result.duration
+            outcome.shards += 1
+            outcome.details.extend(result.details)
+            if outcome.exit_code == 0:
+                outcome.exit_code = result.exit_code
+        return outcomes
@@ -419,13 +419,9 @@ def get_llm_model(task_complexity="simple", task_type=None):
         task_type (str): Task type for backward compatibility (optional)
         
     Returns:
-        ChatGoogleGenerativeAI: Configured LLM instance
+        Chat model from the shared LLM gateway
     """
-    import streamlit as st
-    from langchain_google_genai import ChatGoogleGenerativeAI
-    
-    # Get API key from Streamlit secrets
-    api_key = st.secrets["GEMINI_API_KEY"]
+    from utils.core.llm_gateway import get_llm_gateway
     
     # If task_type is provided, map it to complexity
     if task_type:
@@ -447,10 +443,10 @@ def get_llm_model(task_complexity="simple", task_type=None):
     else:
         model_name = "gemini-2.5-flash-lite"
     
-    return ChatGoogleGenerativeAI(
-        model=model_name,
-        google_api_key=api_key,
+    return get_llm_gateway().get_chat_model(
+        model_name,
         temperature=0.1,
+        agent_name=task_type or task_complexity,
         max_tokens=8192
     )
 
@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+LLM Gateway - Shared Chat Model Clients
+=======================================
+
+One process-wide entry point for every chat model call. Agents, coordinators
+and helpers ask the gateway for a model instead of constructing their own
+``ChatGoogleGenerativeAI`` clients.
+
+Features:
+- Pooled clients per (model, temperature, client options); API key resolved once
+- Token-bucket rate limit per model
+- Coalescing of identical in-flight prompts (one LLM call, many waiters)
+- Optional content-addressed response cache (prompt hash -> completion)
+  with TTL and SQLite persistence
+- Per-agent latency, token and cache metrics
+- Injectable ``client_factory`` so tests can run against a fake chat model
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+    from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+    from langchain_core.utils.function_calling import convert_to_openai_tool
+    LANGCHAIN_AVAILABLE = True
+except ImportError:
+    LANGCHAIN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Requests per second and burst size per model
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "gemini-2.5-flash": (10.0, 10),
+    "gemini-2.5-flash-lite": (15.0, 15),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and wait for it."""
+
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+@dataclass
+class CachedResponse:
+    """Completion restored from disk when it was not a LangChain message."""
+    content: Any
+    usage_metadata: Optional[Dict[str, Any]] = None
+
+
+def serialize_response(response: Any) -> str:
+    """Encode a completion (LangChain message, text or response object) as JSON."""
+    if LANGCHAIN_AVAILABLE and isinstance(response, BaseMessage):
+        return json.dumps({"kind": "message", "data": message_to_dict(response)})
+    if isinstance(response, str):
+        return json.dumps({"kind": "text", "content": response})
+    return json.dumps({
+        "kind": "response",
+        "content": getattr(response, "content", None),
+        "usage_metadata": getattr(response, "usage_metadata", None),
+    })
+
+
+def deserialize_response(payload: str) -> Any:
+    """Decode a completion encoded by ``serialize_response``."""
+    data = json.loads(payload)
+    if data["kind"] == "message":
+        if not LANGCHAIN_AVAILABLE:
+            return CachedResponse(content=data["data"]["data"].get("content"))
+        return messages_from_dict([data["data"]])[0]
+    if data["kind"] == "text":
+        return data["content"]
+    return CachedResponse(content=data["content"], usage_metadata=data.get("usage_metadata"))
+
+
+class ResponseCache:
+    """In-memory LRU of completions with TTL and optional SQLite persistence."""
+
+    def __init__(self, ttl_seconds: float = 3600.0, max_entries: int = 1000,
+                 path: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM llm_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self._expired(row[1]):
+                self._conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            value = deserialize_response(row[0])
+            self._remember(key, row[1], value)
+            return value
+
+    def put(self, key: str, value: Any):
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, value)
+            if self._conn is None:
+                return
+            try:
+                payload = serialize_response(value)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Response not persisted to cache: {e}")
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache (key, payload, created_at) VALUES (?, ?, ?)",
+                (key, payload, created_at)
+            )
+            self._conn.commit()
+
+    def _remember(self, key: str, created_at: float, value: Any):
+        self._entries[key] = (created_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_response_cache")
+                self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _canonical_messages(messages: Any) -> Any:
+    """Reduce a prompt (string, prompt value or message list) to plain JSON data."""
+    if isinstance(messages, str):
+        return [["human", messages]]
+    if hasattr(messages, "to_messages"):
+        messages = messages.to_messages()
+    canonical = []
+    for message in messages:
+        if isinstance(message, (tuple, list)) and len(message) == 2:
+            canonical.append([str(message[0]), message[1]])
+        elif isinstance(message, dict):
+            canonical.append([message.get("role", "human"), message.get("content"),
+                              *_canonical_tool_fields(message.get)])
+        else:
+            canonical.append([
+                getattr(message, "type", type(message).__name__),
+                getattr(message, "content", str(message)),
+                getattr(message, "additional_kwargs", None) or None,
+                *_canonical_tool_fields(lambda name: getattr(message, name, None)),
+            ])
+    return canonical
+
+
+def _canonical_tool_fields(get: Callable[[str], Any]) -> List[Dict[str, Any]]:
+    """Tool calls of an AI turn and the call a tool result answers (empty if neither)."""
+    fields: Dict[str, Any] = {}
+    tool_calls = get("tool_calls")
+    if tool_calls:
+        fields["tool_calls"] = [
+            [call.get("name"), call.get("args"), call.get("id")] if isinstance(call, dict) else call
+            for call in tool_calls
+        ]
+    if get("tool_call_id"):
+        fields["tool_call_id"] = get("tool_call_id")
+    return [fields] if fields else []
+
+
+def prompt_cache_key(model: str, temperature: float, messages: Any,
+                     client_kwargs: Optional[Dict[str, Any]] = None,
+                     invoke_kwargs: Optional[Dict[str, Any]] = None) -> str:
+    """Content address of a prompt: SHA-256 over model, options and messages."""
+    payload = {
+        "model": model,
+        "temperature": float(temperature),
+        "client": client_kwargs or {},
+        "invoke": invoke_kwargs or {},
+        "messages": _canonical_messages(messages),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _freeze(kwargs: Dict[str, Any]) -> Tuple:
+    return tuple(sorted((key, repr(value)) for key, value in kwargs.items()))
+
+
+@dataclass
+class AgentLLMMetrics:
+    """Counters for the LLM calls made on behalf of one agent."""
+    requests: int = 0
+    llm_calls: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    total_latency_seconds: float = 0.0
+    rate_limit_wait_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "llm_calls": self.llm_calls,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "cache_hit_rate": self.cache_hits / self.requests if self.requests else 0.0,
+            "avg_latency_ms": (self.total_latency_seconds / self.llm_calls * 1000
+                               if self.llm_calls else 0.0),
+            "total_latency_seconds": self.total_latency_seconds,
+            "rate_limit_wait_seconds": self.rate_limit_wait_seconds,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+
+class LLMGateway:
+    """Process-wide pool of chat model clients with rate limiting and caching."""
+
+    def __init__(self,
+                 client_factory: Optional[Callable[..., Any]] = None,
+                 rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 cache_ttl_seconds: Optional[float] = None,
+                 cache_path: Optional[str] = None,
+                 cache_max_entries: int = 1000):
+        """
+        Initialize gateway.
+
+        Args:
+            client_factory: ``factory(model, temperature, **client_kwargs)``
+                returning a chat model with ``invoke``/``ainvoke``; defaults to
+                ``ChatGoogleGenerativeAI``
+            rate_limits: ``{model: (requests_per_second, burst)}``; models not
+                listed are not rate limited
+            cache_ttl_seconds: Enables the response cache when set
+            cache_path: SQLite file persisting cached responses across runs
+            cache_max_entries: Size of the in-memory LRU in front of the disk
+        """
+        self.client_factory = client_factory or self._default_client_factory
+        self.rate_limits = dict(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits)
+        self.cache: Optional[ResponseCache] = None
+        if cache_ttl_seconds is not None:
+            self.cache = ResponseCache(cache_ttl_seconds, cache_max_entries, cache_path)
+
+        self._lock = threading.RLock()
+        self._clients: Dict[Tuple, Any] = {}
+        self._chat_models: Dict[Tuple, Any] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._inflight_async: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._inflight_sync: Dict[str, Future] = {}
+        self._metrics: Dict[str, AgentLLMMetrics] = {}
+        self._api_key: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+
+    @property
+    def api_key(self) -> str:
+        """Gemini API key from the environment or Streamlit secrets, read once."""
+        if self._api_key is None:
+            api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+            if not api_key:
+                try:
+                    import streamlit as st
+                    api_key = st.secrets.get("GEMINI_API_KEY")
+                except Exception:
+                    api_key = None
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment or Streamlit secrets")
+            self._api_key = api_key
+        return self._api_key
+
+    def _default_client_factory(self, model: str, temperature: float, **client_kwargs):
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        return ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=self.api_key,
+            temperature=temperature,
+            **client_kwargs
+        )
+
+    def get_client(self, model: str, temperature: float = 0.0, **client_kwargs) -> Any:
+        """Pooled raw client for (model, temperature, client options)."""
+        key = (model, float(temperature), _freeze(client_kwargs))
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self.client_factory(model, temperature, **client_kwargs)
+                    self._clients[key] = client
+                    logger.info(f"✅ LLM client created: {model} (temperature={temperature})")
+        return client
+
+    def get_chat_model(self, model: str, temperature: float = 0.0,
+                       agent_name: str = "default", use_cache: Optional[bool] = None,
+                       **client_kwargs) -> Any:
+        """
+        Chat model routed through the gateway.
+
+        Returns a LangChain chat model whose calls go through rate limiting,
+        coalescing, caching and metrics. Without ``langchain_core`` the pooled
+        raw client is returned.
+        """
+        client = self.get_client(model, temperature, **client_kwargs)
+        if not LANGCHAIN_AVAILABLE:
+            return client
+
+        key = (model, float(temperature), _freeze(client_kwargs), agent_name, use_cache)
+        with self._lock:
+            chat_model = self._chat_models.get(key)
+            if chat_model is None:
+                chat_model = GatewayChatModel(
+                    gateway=self,
+                    model=model,
+                    temperature=temperature,
+                    agent_name=agent_name,
+                    use_cache=use_cache,
+                    client_kwargs=client_kwargs,
+                )
+                self._chat_models[key] = chat_model
+        return chat_model
+
+    # ------------------------------------------------------------------
+    # Rate limiting
+    # ------------------------------------------------------------------
+
+    def configure_rate_limit(self, model: str, requests_per_second: Optional[float],
+                             burst: int = 1):
+        """Set or (with ``None``) remove the rate limit of a model."""
+        with self._lock:
+            self._buckets.pop(model, None)
+            if requests_per_second is None:
+                self.rate_limits.pop(model, None)
+            else:
+                self.rate_limits[model] = (requests_per_second, burst)
+
+    def _bucket(self, model: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(model)
+        if bucket is None and model in self.rate_limits:
+            with self._lock:
+                bucket = self._buckets.get(model)
+                if bucket is None:
+                    bucket = TokenBucket(*self.rate_limits[model])
+                    self._buckets[model] = bucket
+        return bucket
+
+    def acquire(self, model: str) -> float:
+        """Block until the model's rate limit admits one request."""
+        bucket = self._bucket(model)
+        return bucket.acquire() if bucket else 0.0
+
+    async def acquire_async(self, model: str) -> float:
+        bucket = self._bucket(model)
+        return await bucket.acquire_async() if bucket else 0.0
+
+    # ------------------------------------------------------------------
+    # Invocation
+    # ------------------------------------------------------------------
+
+    def _cache_enabled(self, use_cache: Optional[bool]) -> bool:
+        return self.cache is not None and use_cache is not False
+
+    def _record(self, agent_name: str, **deltas):
+        with self._lock:
+            metrics = self._metrics.setdefault(agent_name, AgentLLMMetrics())
+            for name, delta in deltas.items():
+                setattr(metrics, name, getattr(metrics, name) + delta)
+
+    def _record_call(self, agent_name: str, response: Any, latency: float, waited: float):
+        usage = getattr(response, "usage_metadata", None) or {}
+        self._record(
+            agent_name,
+            llm_calls=1,
+            total_latency_seconds=latency,
+            rate_limit_wait_seconds=waited,
+            input_tokens=int(usage.get("input_tokens", 0) or 0),
+            output_tokens=int(usage.get("output_tokens", 0) or 0),
+        )
+
+    def invoke(self, messages: Any, model: str, temperature: float = 0.0,
+               agent_name: str = "default", use_cache: Optional[bool] = None,
+               client_kwargs: Optional[Dict[str, Any]] = None, **invoke_kwargs) -> Any:
+        """Synchronous call; identical concurrent prompts from other threads share it."""
+        client_kwargs = client_kwargs or {}
+        client = self.get_client(model, temperature, **client_kwargs)
+        key = prompt_cache_key(model, temperature, messages, client_kwargs, invoke_kwargs)
+        self._record(agent_name, requests=1)
+
+        if self._cache_enabled(use_cache):
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._record(agent_name, cache_hits=1)
+                return cached
+
+        with self._lock:
+            pending = self._inflight_sync.get(key)
+            if pending is None:
+                future = Future()
+                self._inflight_sync[key] = future
+        if pending is not None:
+            self._record(agent_name, coalesced=1)
+            return pending.result()
+
+        try:
+            waited = self.acquire(model)
+            started = time.perf_counter()
+            try:
+                response = client.invoke(messages, **invoke_kwargs)
+            except Exception:
+                self._record(agent_name, errors=1)
+                raise
+            self._record_call(agent_name, response, time.perf_counter() - started, waited)
+            if self._cache_enabled(use_cache):
+                self.cache.put(key, response)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight_sync.pop(key, None)
+
+    async def ainvoke(self, messages: Any, model: str, temperature: float = 0.0,
+                      agent_name: str = "default", use_cache: Optional[bool] = None,
+                      client_kwargs: Optional[Dict[str, Any]] = None, **invoke_kwargs) -> Any:
+        """Asynchronous call; identical in-flight prompts on the same loop share it."""
+        client_kwargs = client_kwargs or {}
+        client = self.get_client(model, temperature, **client_kwargs)
+        key = prompt_cache_key(model, temperature, messages, client_kwargs, invoke_kwargs)
+        self._record(agent_name, requests=1)
+
+        if self._cache_enabled(use_cache):
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._record(agent_name, cache_hits=1)
+                return cached
+
+        loop = asyncio.get_running_loop()
+        inflight_key = (id(loop), key)
+        pending = self._inflight_async.get(inflight_key)
+        if pending is not None:
+            self._record(agent_name, coalesced=1)
+            return await asyncio.shield(pending)
+
+        future = loop.create_future()
+        self._inflight_async[inflight_key] = future
+        try:
+            waited = await self.acquire_async(model)
+            started = time.perf_counter()
+            try:
+                response = await client.ainvoke(messages, **invoke_kwargs)
+            except Exception:
+                self._record(agent_name, errors=1)
+                raise
+            self._record_call(agent_name, response, time.perf_counter() - started, waited)
+            if self._cache_enabled(use_cache):
+                self.cache.put(key, response)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            self._inflight_async.pop(inflight_key, None)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_metrics(self, agent_name: Optional[str] = None) -> Dict[str, Any]:
+        """Per-agent metrics plus totals, or the metrics of one agent."""
+        with self._lock:
+            if agent_name is not None:
+                return self._metrics.get(agent_name, AgentLLMMetrics()).to_dict()
+
+            totals = AgentLLMMetrics()
+            for metrics in self._metrics.values():
+                for name in totals.__dataclass_fields__:
+                    setattr(totals, name, getattr(totals, name) + getattr(metrics, name))
+            return {
+                "agents": {name: m.to_dict() for name, m in self._metrics.items()},
+                "totals": totals.to_dict(),
+                "pooled_clients": len(self._clients),
+                "cache_enabled": self.cache is not None,
+                "cache_entries": len(self.cache) if self.cache is not None else 0,
+            }
+
+    def reset_metrics(self):
+        with self._lock:
+            self._metrics.clear()
+
+
+if LANGCHAIN_AVAILABLE:
+
+    class GatewayChatModel(BaseChatModel):
+        """
+        LangChain chat model backed by an ``LLMGateway``.
+
+        ``invoke``/``ainvoke`` (and chains built on them) go through the
+        gateway. Streaming is rate limited but neither cached nor coalesced.
+        ``bind_tools`` binds OpenAI-format tool schemas on this model, so
+        tool calls and ``with_structured_output`` (LangChain's tool-calling
+        implementation) are rate limited, coalesced, cached and counted too.
+        """
+
+        gateway: Any
+        model: str
+        temperature: float = 0.0
+        agent_name: str = "default"
+        use_cache: Optional[bool] = None
+        client_kwargs: Dict[str, Any] = {}
+
+        @property
+        def _llm_type(self) -> str:
+            return "llm_gateway"
+
+        @property
+        def _identifying_params(self) -> Dict[str, Any]:
+            return {"model": self.model, "temperature": self.temperature,
+                    "agent_name": self.agent_name}
+
+        @property
+        def client(self) -> Any:
+            return self.gateway.get_client(self.model, self.temperature, **self.client_kwargs)
+
+        def _call_options(self, stop, kwargs) -> Dict[str, Any]:
+            if stop:
+                kwargs["stop"] = stop
+            return dict(agent_name=self.agent_name, use_cache=self.use_cache,
+                        client_kwargs=self.client_kwargs, **kwargs)
+
+        @staticmethod
+        def _result(message: Any) -> "ChatResult":
+            # Cached and coalesced messages are shared; LangChain mutates ids
+            if hasattr(message, "model_copy"):
+                message = message.model_copy()
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+        def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+            message = self.gateway.invoke(messages, self.model, self.temperature,
+                                          **self._call_options(stop, kwargs))
+            return self._result(message)
+
+        async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+            message = await self.gateway.ainvoke(messages, self.model, self.temperature,
+                                                 **self._call_options(stop, kwargs))
+            return self._result(message)
+
+        def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+            self.gateway.acquire(self.model)
+            for chunk in self.client.stream(messages, stop=stop, **kwargs):
+                yield ChatGenerationChunk(message=chunk)
+
+        async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+            await self.gateway.acquire_async(self.model)
+            async for chunk in self.client.astream(messages, stop=stop, **kwargs):
+                yield ChatGenerationChunk(message=chunk)
+
+        def bind_tools(self, tools, *, tool_choice=None, **kwargs):
+            # Passed on to the client's invoke, and part of the cache key
+            formatted_tools = [convert_to_openai_tool(tool) for tool in tools]
+            if tool_choice is not None:
+                kwargs["tool_choice"] = tool_choice
+            return self.bind(tools=formatted_tools, **kwargs)
+
+
+# Global gateway instance
+_llm_gateway: Optional[LLMGateway] = None
+_llm_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the process-wide LLM gateway."""
+    global _llm_gateway
+    if _llm_gateway is None:
+        with _llm_gateway_lock:
+            if _llm_gateway is None:
+                _llm_gateway = LLMGateway()
+    return _llm_gateway
+
+
+def set_llm_gateway(gateway: Optional[LLMGateway]) -> Optional[LLMGateway]:
+    """Replace the process-wide gateway (e.g. with one using a fake model); returns the old one."""
+    global _llm_gateway
+    with _llm_gateway_lock:
+        previous, _llm_gateway = _llm_gateway, gateway
+    return previous
@@ -16,10 +16,8 @@ License: Open Source - For universal harmony and interconnectedness
 """
 
 import os
-import re
 import json
 import time
-import hashlib
 from typing import Dict, List, Set, Tuple, Any, Optional, Union
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -27,7 +25,12 @@ from collections import defaultdict, deque
 import networkx as nx
 import matplotlib.pyplot as plt
 from datetime import datetime
-import ast
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.integrity.relationship_scanner import FileScanCache, scan_file
+
+# Per-file scan cache of the command line run, at the project root
+SCAN_CACHE_FILE = ".relationship_scan_cache.json"
 
 @dataclass
 class Relationship:
@@ -80,7 +83,18 @@ class HolisticRelationshipTracker:
     Combines mathematical graph theory with loving care for system harmony.
     """
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", cache_path: Optional[str] = None,
+                 max_workers: Optional[int] = None, parallel_threshold: int = 64):
+        """
+        Initialize tracker.
+        
+        Args:
+            project_root: Root directory to analyze
+            cache_path: JSON file persisting per-file scans between runs, so a
+                re-run only rescans changed files
+            max_workers: Process pool size for scanning (1 disables the pool)
+            parallel_threshold: Minimum number of changed files worth a process pool
+        """
         self.project_root = Path(project_root)
         self.relationship_graph = nx.DiGraph()
         self.entities: Dict[str, Entity] = {}
@@ -101,52 +115,52 @@ class HolisticRelationshipTracker:
             ".venv", "venv", ".env", "build", "dist", "*.pyc"
         ]
         
+        # Per-file scans keyed by content hash; kept across discovery runs
+        self.scan_cache = FileScanCache(cache_path)
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self.last_scan_stats: Dict[str, int] = {}
+        self._file_matches: Dict[str, List] = {}
+        
         print("🕸️ Holistic Relationship Tracker initialized with love and mathematical precision!")
     
     def _initialize_relationship_types(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize different types of relationships we can detect."""
+        """Initialize relationship types; their patterns are ``RELATIONSHIP_PATTERNS`` in the scanner."""
         return {
             "import_dependency": {
                 "strength": 0.9,
                 "bidirectional": False,
-                "description": "Python import relationships",
-                "patterns": [r"^import\s+([a-zA-Z_][a-zA-Z0-9_.]*)", r"^from\s+([a-zA-Z_][a-zA-Z0-9_.]*)\s+import"]
+                "description": "Python import relationships"
             },
             "file_reference": {
                 "strength": 0.8,
                 "bidirectional": False,
-                "description": "File path references",
-                "patterns": [r"['\"]([^'\"]*\.(py|md|json|yaml|yml|txt|rst))['\"]"]
+                "description": "File path references"
             },
             "hyperlink": {
                 "strength": 0.7,
                 "bidirectional": False,
-                "description": "Markdown hyperlinks",
-                "patterns": [r"\[([^\]]+)\]\(([^)]+)\)", r"<([^>]+\.(md|py|json|yaml|yml))>"]
+                "description": "Markdown hyperlinks"
             },
             "class_inheritance": {
                 "strength": 0.95,
                 "bidirectional": False,
-                "description": "Class inheritance relationships",
-                "patterns": [r"class\s+\w+\(([^)]+)\):"]
+                "description": "Class inheritance relationships"
             },
             "function_call": {
                 "strength": 0.6,
                 "bidirectional": False,
-                "description": "Function call relationships",
-                "patterns": [r"([a-zA-Z_][a-zA-Z0-9_]*)\s*\("]
+                "description": "Function call relationships"
             },
             "concept_reference": {
                 "strength": 0.5,
                 "bidirectional": True,
-                "description": "Conceptual relationships",
-                "patterns": [r"(?i)(wu\s*wei|confucian|sun\s*tzu|nada\s*brahma|mandelbrot|fractal)"]
+                "description": "Conceptual relationships"
             },
             "agile_reference": {
                 "strength": 0.8,
                 "bidirectional": False,
-                "description": "Agile artifact references",
-                "patterns": [r"(US-[A-Z0-9]+-[0-9]+|EPIC-[0-9]+-[A-Z-]+|SPRINT_[0-9]+)"]
+                "description": "Agile artifact references"
             }
         }
     
@@ -186,185 +200,156 @@ class HolisticRelationshipTracker:
     def _discover_entities(self) -> None:
         """Discover all entities in the project with mathematical precision."""
         
-        for pattern in self.analyzable_patterns:
-            for file_path in self.project_root.glob(pattern):
+        files = self._collect_files()
+        self.scan_cache.retain(files)
+        
+        # Only new or changed files are scanned; the rest come from the cache
+        scans: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        for relative_path, absolute_path in files.items():
+            cached = self.scan_cache.lookup(relative_path, absolute_path)
+            if cached is not None:
+                scans[relative_path] = cached
+            else:
+                pending.append((absolute_path, relative_path))
+        
+        self.last_scan_stats = {"files": len(files), "scanned": len(pending),
+                                "cached": len(files) - len(pending)}
+        print(f"   📂 {len(files)} files: {len(pending)} scanned, {len(files) - len(pending)} from cache")
+        
+        for relative_path, scan in self._scan_files(pending):
+            self.scan_cache.store(relative_path, scan)
+            scans[relative_path] = scan
+        self.scan_cache.save()
+        
+        self._file_matches = {}
+        for relative_path in files:
+            self._add_file_entities(relative_path, files[relative_path], scans[relative_path])
+    
+    def _collect_files(self) -> Dict[str, str]:
+        """Analyzable files (relative path -> absolute path) in one directory walk."""
+        
+        extensions = [pattern.rsplit('.', 1)[-1] for pattern in self.analyzable_patterns]
+        by_extension: Dict[str, List[Tuple[str, str]]] = {f".{ext}": [] for ext in extensions}
+        cache_file = os.path.abspath(self.scan_cache.path) if self.scan_cache.path else None
+        
+        for directory, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [d for d in dirnames if d not in self.ignore_patterns]
+            for filename in filenames:
+                bucket = by_extension.get(os.path.splitext(filename)[1])
+                if bucket is None:
+                    continue
+                absolute_path = os.path.join(directory, filename)
+                if os.path.abspath(absolute_path) == cache_file:
+                    continue  # The scan cache itself changes on every run
+                relative_path = str(Path(absolute_path).relative_to(self.project_root))
                 # Skip ignored patterns
-                if any(ignore in str(file_path) for ignore in self.ignore_patterns):
+                if any(ignore in relative_path for ignore in self.ignore_patterns):
                     continue
-                
-                if file_path.is_file():
-                    self._analyze_file_entity(file_path)
+                bucket.append((relative_path, absolute_path))
+        
+        files: Dict[str, str] = {}
+        for bucket in by_extension.values():
+            for relative_path, absolute_path in sorted(bucket):
+                files[relative_path] = absolute_path
+        return files
     
-    def _analyze_file_entity(self, file_path: Path) -> None:
-        """Analyze a single file to extract entities."""
+    def _scan_files(self, pending: List[Tuple[str, str]]):
+        """Scan changed files, in a process pool when there are enough of them."""
+        
+        if len(pending) < self.parallel_threshold or self.max_workers == 1:
+            for absolute_path, relative_path in pending:
+                yield relative_path, scan_file(absolute_path, relative_path)
+            return
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Calculate content hash for change detection
-            content_hash = hashlib.md5(content.encode()).hexdigest()
-            
-            # Create file entity
-            relative_path = str(file_path.relative_to(self.project_root))
-            entity_id = f"file:{relative_path}"
-            
-            entity = Entity(
-                entity_id=entity_id,
-                entity_type="file",
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                absolute_paths = [absolute for absolute, _ in pending]
+                relative_paths = [relative for _, relative in pending]
+                chunksize = max(1, len(pending) // ((self.max_workers or os.cpu_count() or 1) * 4))
+                results = list(executor.map(scan_file, absolute_paths, relative_paths, chunksize=chunksize))
+        except (OSError, RuntimeError) as e:
+            print(f"⚠️ Process pool unavailable ({e}), scanning serially")
+            results = [scan_file(absolute, relative) for absolute, relative in pending]
+        
+        yield from zip((relative for _, relative in pending), results)
+    
+    def _add_file_entities(self, relative_path: str, absolute_path: str, scan: Dict[str, Any]) -> None:
+        """Create the entities of one scanned file."""
+        
+        if scan.get("error"):
+            print(f"⚠️ {scan['error']}")
+        if scan.get("failed"):
+            return
+        
+        entity_id = f"file:{relative_path}"
+        self.entities[entity_id] = Entity(
+            entity_id=entity_id,
+            entity_type="file",
+            file_path=relative_path,
+            content_hash=scan["content_hash"],
+            metadata={
+                "size": scan["size"],
+                "lines": scan["lines"],
+                "extension": Path(relative_path).suffix,
+                "absolute_path": absolute_path
+            }
+        )
+        
+        for child_id, entity_type, content_hash, metadata in scan["entities"]:
+            self.entities[child_id] = Entity(
+                entity_id=child_id,
+                entity_type=entity_type,
                 file_path=relative_path,
                 content_hash=content_hash,
-                metadata={
-                    "size": len(content),
-                    "lines": content.count('\n') + 1,
-                    "extension": file_path.suffix,
-                    "absolute_path": str(file_path)
-                }
+                metadata=metadata
             )
-            
-            self.entities[entity_id] = entity
-            
-            # For Python files, extract additional entities
-            if file_path.suffix == '.py':
-                self._extract_python_entities(file_path, content)
-            
-            # For Markdown files, extract section entities
-            elif file_path.suffix == '.md':
-                self._extract_markdown_entities(file_path, content)
-                
-        except Exception as e:
-            print(f"⚠️ Error analyzing {file_path}: {e}")
-    
-    def _extract_python_entities(self, file_path: Path, content: str) -> None:
-        """Extract Python-specific entities (classes, functions, etc.)."""
         
-        try:
-            tree = ast.parse(content)
-            relative_path = str(file_path.relative_to(self.project_root))
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    entity_id = f"class:{relative_path}:{node.name}"
-                    entity = Entity(
-                        entity_id=entity_id,
-                        entity_type="class",
-                        file_path=relative_path,
-                        content_hash=hashlib.md5(f"{node.name}:{node.lineno}".encode()).hexdigest(),
-                        metadata={
-                            "name": node.name,
-                            "line_number": node.lineno,
-                            "bases": [base.id if hasattr(base, 'id') else str(base) for base in node.bases]
-                        }
-                    )
-                    self.entities[entity_id] = entity
-                
-                elif isinstance(node, ast.FunctionDef):
-                    entity_id = f"function:{relative_path}:{node.name}"
-                    entity = Entity(
-                        entity_id=entity_id,
-                        entity_type="function",
-                        file_path=relative_path,
-                        content_hash=hashlib.md5(f"{node.name}:{node.lineno}".encode()).hexdigest(),
-                        metadata={
-                            "name": node.name,
-                            "line_number": node.lineno,
-                            "args": [arg.arg for arg in node.args.args]
-                        }
-                    )
-                    self.entities[entity_id] = entity
-                    
-        except Exception as e:
-            print(f"⚠️ Error parsing Python file {file_path}: {e}")
-    
-    def _extract_markdown_entities(self, file_path: Path, content: str) -> None:
-        """Extract Markdown-specific entities (sections, links, etc.)."""
-        
-        relative_path = str(file_path.relative_to(self.project_root))
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            # Extract headers as entities
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if header_match:
-                level = len(header_match.group(1))
-                title = header_match.group(2).strip()
-                entity_id = f"section:{relative_path}:{line_num}:{title}"
-                
-                entity = Entity(
-                    entity_id=entity_id,
-                    entity_type="section",
-                    file_path=relative_path,
-                    content_hash=hashlib.md5(f"{title}:{line_num}".encode()).hexdigest(),
-                    metadata={
-                        "title": title,
-                        "level": level,
-                        "line_number": line_num
-                    }
-                )
-                self.entities[entity_id] = entity
+        self._file_matches[entity_id] = scan["matches"]
     
     def _analyze_relationships(self) -> None:
         """Analyze relationships between all discovered entities."""
         
-        for entity_id, entity in self.entities.items():
-            if entity.entity_type == "file":
-                self._analyze_file_relationships(entity)
-    
-    def _analyze_file_relationships(self, entity: Entity) -> None:
-        """Analyze relationships within a file."""
-        
-        file_path = self.project_root / entity.file_path
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            
-            for line_num, line in enumerate(lines, 1):
-                for rel_type, rel_config in self.relationship_types.items():
-                    for pattern in rel_config["patterns"]:
-                        matches = re.finditer(pattern, line)
-                        for match in matches:
-                            self._create_relationship_from_match(
-                                entity, line, line_num, match, rel_type, rel_config
-                            )
-                            
-        except Exception as e:
-            print(f"⚠️ Error analyzing relationships in {entity.file_path}: {e}")
+        resolved: Dict[Tuple[str, str], Optional[str]] = {}
+        for entity_id, matches in self._file_matches.items():
+            entity = self.entities[entity_id]
+            source_dir = str(Path(entity.file_path).parent)
+            for rel_type, reference, line_num, context in matches:
+                # Resolution depends only on the reference and the source directory
+                key = (reference, source_dir)
+                if key not in resolved:
+                    resolved[key] = self._resolve_target_entity(reference, entity)
+                if resolved[key]:
+                    self._create_relationship(entity, context, line_num, resolved[key],
+                                              rel_type, self.relationship_types[rel_type])
     
-    def _create_relationship_from_match(self, source_entity: Entity, line: str, line_num: int,
-                                       match: re.Match, rel_type: str, rel_config: Dict[str, Any]) -> None:
-        """Create a relationship from a regex match."""
-        
-        target_reference = match.group(1) if match.groups() else match.group(0)
+    def _create_relationship(self, source_entity: Entity, context: str, line_num: int,
+                             target_entity_id: str, rel_type: str, rel_config: Dict[str, Any]) -> None:
+        """Create a relationship to a resolved target entity."""
+        
+        relationship_id = f"{source_entity.entity_id}:{rel_type}:{target_entity_id}:{line_num}"
+        now = time.time()
+        
+        relationship = Relationship(
+            source_entity=source_entity.entity_id,
+            target_entity=target_entity_id,
+            relationship_type=rel_type,
+            relationship_strength=rel_config["strength"],
+            bidirectional=rel_config["bidirectional"],
+            context=context,
+            file_location=source_entity.file_path,
+            line_number=line_num,
+            discovered_time=now,
+            last_verified=now,
+            verification_count=1
+        )
         
-        # Try to resolve the target entity
-        target_entity_id = self._resolve_target_entity(target_reference, source_entity)
+        self.relationships[relationship_id] = relationship
         
-        if target_entity_id:
-            relationship_id = f"{source_entity.entity_id}:{rel_type}:{target_entity_id}:{line_num}"
-            
-            relationship = Relationship(
-                source_entity=source_entity.entity_id,
-                target_entity=target_entity_id,
-                relationship_type=rel_type,
-                relationship_strength=rel_config["strength"],
-                bidirectional=rel_config["bidirectional"],
-                context=line.strip(),
-                file_location=source_entity.file_path,
-                line_number=line_num,
-                discovered_time=time.time(),
-                last_verified=time.time(),
-                verification_count=1
-            )
-            
-            self.relationships[relationship_id] = relationship
-            
-            # Add to entity relationship lists
-            source_entity.relationships.append(relationship)
-            if target_entity_id in self.entities:
-                self.entities[target_entity_id].relationships.append(relationship)
+        # Add to entity relationship lists
+        source_entity.relationships.append(relationship)
+        if target_entity_id in self.entities:
+            self.entities[target_entity_id].relationships.append(relationship)
     
     def _resolve_target_entity(self, reference: str, source_entity: Entity) -> Optional[str]:
         """Try to resolve a reference to an actual entity."""
@@ -722,7 +707,7 @@ def main():
     print("="*60)
     
     # Initialize tracker
-    tracker = HolisticRelationshipTracker()
+    tracker = HolisticRelationshipTracker(cache_path=SCAN_CACHE_FILE)
     
     # Discover all relationships
     print("\n🌐 Discovering all relationships in the AI-Dev-Agent ecosystem...")
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Relationship Scanner
+====================
+
+Single-pass, cacheable per-file scan used by the Holistic Relationship
+Tracker. Each file is read once and yields its entities (file, Python
+classes/functions, Markdown sections) and its raw relationship references
+(type, reference, line, context). Resolving references against the entity
+set stays in the tracker, so a scan depends only on the file's content and
+can be reused while its ``content_hash`` is unchanged.
+
+- One compiled alternation with a named group per relationship type
+  instead of one ``re.finditer`` per pattern per line
+- Python imports and inheritance come from the AST the entity pass parses anyway
+- ``FileScanCache`` skips unchanged files by (mtime, size), then by content hash,
+  optionally persisted as JSON between runs
+- ``scan_file`` is a module-level function with plain-data results so it
+  can run in a process pool
+"""
+
+import ast
+import bisect
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# (relationship type, pattern) in priority order; each pattern's first group
+# is the reference. Earlier alternatives win where matches overlap.
+RELATIONSHIP_PATTERNS: List[Tuple[str, str]] = [
+    ("import_dependency", r"^import[ \t]+([a-zA-Z_][a-zA-Z0-9_.]*)"),
+    ("import_dependency", r"^from[ \t]+([a-zA-Z_][a-zA-Z0-9_.]*)[ \t]+import"),
+    ("class_inheritance", r"class[ \t]+\w+\(([^)\n]+)\):"),
+    ("hyperlink", r"\[([^\]\n]+)\]\(([^)\n]+)\)"),
+    ("hyperlink", r"<([^>\n]+\.(md|py|json|yaml|yml))>"),
+    ("file_reference", r"['\"]([^'\"\n]*\.(py|md|json|yaml|yml|txt|rst))['\"]"),
+    ("agile_reference", r"(US-[A-Z0-9]+-[0-9]+|EPIC-[0-9]+-[A-Z-]+|SPRINT_[0-9]+)"),
+    ("concept_reference", r"(?i:(wu[ \t]*wei|confucian|sun[ \t]*tzu|nada[ \t]*brahma|mandelbrot|fractal))"),
+    ("function_call", r"([a-zA-Z_][a-zA-Z0-9_]*)[ \t]*\("),
+]
+
+# Found through the AST for Python files that parse
+AST_RELATIONSHIP_TYPES = {"import_dependency", "class_inheritance"}
+
+_FIRST_GROUP = re.compile(r"(?<!\\)\((?!\?)")
+
+
+def _compile_alternation(excluded: frozenset = frozenset()) -> Tuple[re.Pattern, Dict[str, Tuple[str, str]]]:
+    """Combine the patterns into one regex; returns it and ``{branch: (type, reference group)}``."""
+    branches = []
+    groups = {}
+    for index, (rel_type, pattern) in enumerate(RELATIONSHIP_PATTERNS):
+        if rel_type in excluded:
+            continue
+        name = f"r{index}"
+        reference = f"{name}_ref"
+        named = _FIRST_GROUP.sub(f"(?P<{reference}>", pattern, count=1)
+        branches.append(f"(?P<{name}>{named})")
+        groups[name] = (rel_type, reference)
+    return re.compile("|".join(branches), re.MULTILINE), groups
+
+
+def _finditer(pattern: re.Pattern, groups: Dict[str, Tuple[str, str]], content: str,
+              line_starts: List[int], lines: List[str]) -> List[Tuple[str, str, int, str]]:
+    matches = []
+    contexts: Dict[int, str] = {}
+    for match in pattern.finditer(content):
+        rel_type, reference = groups[match.lastgroup]
+        line_num = bisect.bisect_right(line_starts, match.start())
+        context = contexts.get(line_num)
+        if context is None:
+            context = contexts[line_num] = lines[line_num - 1].strip()
+        matches.append((rel_type, match.group(reference), line_num, context))
+    return matches
+
+
+_ALL_PATTERN, _ALL_GROUPS = _compile_alternation()
+_TEXT_PATTERN, _TEXT_GROUPS = _compile_alternation(frozenset(AST_RELATIONSHIP_TYPES))
+_MARKDOWN_HEADER = re.compile(r"^(#{1,6})[ \t]+(.+)$", re.MULTILINE)
+
+
+def _iter_statements(tree: ast.AST):
+    """Statements at any nesting depth, without descending into expressions."""
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        for name in ("body", "orelse", "finalbody", "handlers", "cases"):
+            children = getattr(node, name, None)
+            if isinstance(children, list):
+                stack.extend(reversed(children))
+
+
+def _python_scan(tree: ast.AST, relative_path: str, lines: List[str]) -> Tuple[List, List]:
+    entities = []
+    matches = []
+
+    def context(lineno: int) -> str:
+        return lines[lineno - 1].strip() if 0 < lineno <= len(lines) else ""
+
+    for node in _iter_statements(tree):
+        if isinstance(node, ast.ClassDef):
+            entities.append((
+                f"class:{relative_path}:{node.name}", "class",
+                hashlib.md5(f"{node.name}:{node.lineno}".encode()).hexdigest(),
+                {
+                    "name": node.name,
+                    "line_number": node.lineno,
+                    "bases": [base.id if hasattr(base, 'id') else str(base) for base in node.bases]
+                }
+            ))
+            if node.bases:
+                reference = ", ".join(ast.unparse(base) for base in node.bases)
+                matches.append(("class_inheritance", reference, node.lineno, context(node.lineno)))
+
+        elif isinstance(node, ast.FunctionDef):
+            entities.append((
+                f"function:{relative_path}:{node.name}", "function",
+                hashlib.md5(f"{node.name}:{node.lineno}".encode()).hexdigest(),
+                {
+                    "name": node.name,
+                    "line_number": node.lineno,
+                    "args": [arg.arg for arg in node.args.args]
+                }
+            ))
+
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                matches.append(("import_dependency", alias.name, node.lineno, context(node.lineno)))
+
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            matches.append(("import_dependency", node.module, node.lineno, context(node.lineno)))
+
+    return entities, matches
+
+
+def scan_content(content: str, relative_path: str, suffix: str) -> Dict[str, Any]:
+    """Entities and raw relationship references of one file's content."""
+    lines = content.split('\n')
+    line_starts = [0]
+    for line in lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    entities = []
+    matches = []
+    text_pattern, text_groups = _ALL_PATTERN, _ALL_GROUPS
+    error = None
+
+    if suffix == '.py':
+        try:
+            tree = ast.parse(content)
+        except Exception as e:
+            error = f"Error parsing Python file {relative_path}: {e}"
+        else:
+            entities, matches = _python_scan(tree, relative_path, lines)
+            text_pattern, text_groups = _TEXT_PATTERN, _TEXT_GROUPS
+
+    elif suffix == '.md':
+        for match in _MARKDOWN_HEADER.finditer(content):
+            line_num = bisect.bisect_right(line_starts, match.start())
+            title = match.group(2).strip()
+            entities.append((
+                f"section:{relative_path}:{line_num}:{title}", "section",
+                hashlib.md5(f"{title}:{line_num}".encode()).hexdigest(),
+                {"title": title, "level": len(match.group(1)), "line_number": line_num}
+            ))
+
+    matches.extend(_finditer(text_pattern, text_groups, content, line_starts, lines))
+    matches.sort(key=lambda m: m[2])
+
+    return {
+        "content_hash": hashlib.md5(content.encode()).hexdigest(),
+        "size": len(content),
+        "lines": content.count('\n') + 1,
+        "entities": entities,
+        "matches": matches,
+        "error": error,
+    }
+
+
+def scan_file(absolute_path: str, relative_path: str) -> Dict[str, Any]:
+    """Read a file once and scan it (process-pool entry point)."""
+    try:
+        with open(absolute_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        stat = os.stat(absolute_path)
+    except Exception as e:
+        return {"error": f"Error analyzing {relative_path}: {e}", "failed": True}
+    scan = scan_content(content, relative_path, Path(relative_path).suffix)
+    scan["mtime_ns"] = stat.st_mtime_ns
+    scan["file_size"] = stat.st_size
+    return scan
+
+
+class FileScanCache:
+    """Per-file scan results keyed by relative path and validated by content hash."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._scans: Dict[str, Dict[str, Any]] = {}
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._scans = json.load(f).get("files", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable scan cache {self.path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._scans)
+
+    def lookup(self, relative_path: str, absolute_path: str) -> Optional[Dict[str, Any]]:
+        """Cached scan when the file is unchanged (stat first, then content hash)."""
+        cached = self._scans.get(relative_path)
+        if cached is None:
+            return None
+        try:
+            stat = os.stat(absolute_path)
+        except OSError:
+            return None
+        if stat.st_mtime_ns == cached.get("mtime_ns") and stat.st_size == cached.get("file_size"):
+            return cached
+        try:
+            with open(absolute_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError:
+            return None
+        if hashlib.md5(content.encode()).hexdigest() != cached.get("content_hash"):
+            return None
+        cached["mtime_ns"] = stat.st_mtime_ns
+        cached["file_size"] = stat.st_size
+        return cached
+
+    def store(self, relative_path: str, scan: Dict[str, Any]):
+        if not scan.get("failed"):
+            self._scans[relative_path] = scan
+
+    def retain(self, relative_paths):
+        """Drop entries of files that no longer exist."""
+        keep = set(relative_paths)
+        for relative_path in list(self._scans):
+            if relative_path not in keep:
+                del self._scans[relative_path]
+
+    def save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "files": self._scans}, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Keyword Automaton - Multi-Pattern Matching for Keyword/Context Detection
+========================================================================
+
+Aho-Corasick automaton shared by the keyword and context detectors
+(``UnifiedKeywordDetector``, ``YamlBasedKeywordDetector``,
+``IntelligentContextDetector``).
+
+- Built once from the YAML-derived keyword/pattern catalog
+- Finds every keyword and message pattern in one pass over the message,
+  so detection cost stays flat as the catalog grows
+- Case-insensitive substring semantics, identical to ``pattern.lower() in message.lower()``
+- ``ConfigSignature`` tells detectors when their YAML changed and the
+  automaton must be rebuilt
+"""
+
+import os
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over lowercased patterns.
+
+    Each pattern carries one or more payloads (e.g. the keyword or context
+    it belongs to); adding the same pattern twice appends a payload.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own: List[List[int]] = [[]]
+        self._output: List[List[int]] = [[]]
+        self._patterns: List[str] = []
+        self._payloads: List[List[Any]] = []
+        self._pattern_ids: Dict[str, int] = {}
+        self._built = True
+
+        for pattern, payload in patterns:
+            self.add(pattern, payload)
+        self.build()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, pattern: str, payload: Any = None) -> None:
+        """Add a pattern (matched case-insensitively) with its payload."""
+        pattern = pattern.lower()
+        pattern_id = self._pattern_ids.get(pattern)
+        if pattern_id is None:
+            pattern_id = self._pattern_ids[pattern] = len(self._patterns)
+            self._patterns.append(pattern)
+            self._payloads.append([])
+
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._own.append([])
+                state = next_state
+            if pattern:
+                self._own[state].append(pattern_id)
+            self._built = False
+
+        self._payloads[pattern_id].append(payload)
+
+    def build(self) -> None:
+        """Compute failure links; called automatically before searching."""
+        self._output = [list(own) for own in self._own]
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+
+        # Breadth-first, so a state's failure target is complete before it
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield ``(start, pattern)`` for every (possibly overlapping) occurrence."""
+        if not self._built:
+            self.build()
+
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self._patterns
+        state = 0
+        for index, char in enumerate(text.lower()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                pattern = patterns[pattern_id]
+                yield index - len(pattern) + 1, pattern
+
+    def search(self, text: str) -> Dict[str, int]:
+        """Matched patterns mapped to the position of their first occurrence."""
+        found: Dict[str, int] = {}
+        for start, pattern in self.iter_matches(text):
+            if pattern not in found or start < found[pattern]:
+                found[pattern] = start
+        if "" in self._pattern_ids:
+            found[""] = 0
+        return found
+
+    def payloads(self, text: str) -> List[Any]:
+        """Payloads of every pattern found in ``text`` (each pattern counted once)."""
+        return [payload
+                for pattern in self.search(text)
+                for payload in self._payloads[self._pattern_ids[pattern]]]
+
+
+class ConfigSignature:
+    """(mtime, size) of a config file, used to rebuild an automaton only on change."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.value = self.read()
+
+    def read(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def changed(self) -> bool:
+        """True (and remembers the new signature) when the file changed since last check."""
+        current = self.read()
+        if current == self.value:
+            return False
+        self.value = current
+        return True
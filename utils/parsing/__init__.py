@@ -8,6 +8,7 @@ JSON parsing, enhanced parsing, and structured output handling.
 Modules:
 - output_parsers: Basic output parsing functionality
 - enhanced_output_parsers: Advanced parsing with error recovery
+- streaming_json_parser: Single-pass incremental parsing of streamed JSON
 
 Author: AI-Dev-Agent System
 Version: 1.0
@@ -35,6 +36,16 @@ from .enhanced_output_parsers import (
     get_enhanced_parser_stats
 )
 
+from .streaming_json_parser import (
+    StreamingJSONParser,
+    StreamingJSONError,
+    ParsedValue,
+    iter_json_objects,
+    parse_json_text,
+    astream_json,
+    parse_json_stream
+)
+
 __all__ = [
     # Basic parsers
     "OutputParser",
@@ -54,5 +65,14 @@ __all__ = [
     "RequirementsEnhancedParser", 
     "EnhancedOutputParserFactory",
     "parse_with_enhanced_parser",
-    "get_enhanced_parser_stats"
+    "get_enhanced_parser_stats",
+    
+    # Streaming parsers
+    "StreamingJSONParser",
+    "StreamingJSONError",
+    "ParsedValue",
+    "iter_json_objects",
+    "parse_json_text",
+    "astream_json",
+    "parse_json_stream"
 ]
@@ -10,14 +10,14 @@ Version: 1.0
 Last Updated: Current Session
 """
 
-import json
 import logging
 import re
-from typing import Dict, Any, Optional, Type, List, Union
+from typing import Dict, Any, AsyncIterable, Callable, Optional, Tuple, Type, List, Union
 from abc import ABC, abstractmethod
 from datetime import datetime
 
 from .output_parsers import OutputParser, JSONOutputParser
+from .streaming_json_parser import ParsedValue, chunk_text, iter_json_objects, parse_json_stream
 
 logger = logging.getLogger(__name__)
 
@@ -40,61 +40,67 @@ class EnhancedOutputParser(OutputParser):
         start_time = datetime.now()
         
         try:
-            # First attempt: direct JSON parsing
-            result = self._parse_direct(raw_output)
+            # Single incremental pass: skips prose/fences, repairs truncation
+            result = self._parse_incremental(raw_output)
             self._record_success(raw_output, result, start_time)
             return result
             
         except Exception as e1:
-            logger.warning(f"Direct parsing failed: {e1}")
+            logger.warning(f"Incremental parsing failed: {e1}")
             
             try:
-                # Second attempt: intelligent extraction
-                result = self._parse_with_extraction(raw_output)
+                # Fallback: pattern-based recovery
+                result = self._parse_with_patterns(raw_output)
                 self._record_success(raw_output, result, start_time)
                 return result
                 
             except Exception as e2:
-                logger.warning(f"Extraction parsing failed: {e2}")
-                
-                try:
-                    # Third attempt: pattern-based recovery
-                    result = self._parse_with_patterns(raw_output)
-                    self._record_success(raw_output, result, start_time)
-                    return result
-                    
-                except Exception as e3:
-                    logger.error(f"All parsing attempts failed: {e3}")
-                    self._record_failure(raw_output, [e1, e2, e3], start_time)
-                    raise ValueError(f"Enhanced parsing failed: {e3}")
+                logger.error(f"All parsing attempts failed: {e2}")
+                self._record_failure(raw_output, [e1, e2], start_time)
+                raise ValueError(f"Enhanced parsing failed: {e2}")
     
-    def _parse_direct(self, raw_output: str) -> Dict[str, Any]:
-        """Direct JSON parsing attempt."""
-        cleaned = self._clean_output(raw_output)
-        parsed = json.loads(cleaned)
+    async def aparse_stream(self, chunks: AsyncIterable[Any],
+                            on_value: Optional[Callable[[ParsedValue], Any]] = None,
+                            watch: Optional[List[Tuple]] = None) -> Dict[str, Any]:
+        """
+        Parse a streamed completion (e.g. ``llm.astream(prompt)``) as it arrives.
         
-        if not isinstance(parsed, dict):
-            raise ValueError("Output is not a dictionary")
+        Args:
+            chunks: Async iterable of text or message chunks
+            on_value: Called (or awaited) for each completed value, e.g. every
+                generated file as soon as its string closes
+            watch: Path patterns to report, e.g. ``[("source_files", "*")]``
+            
+        Returns:
+            Dict: Parsed and validated content
+        """
+        start_time = datetime.now()
+        received: List[str] = []
         
-        if not self.validate(parsed):
-            raise ValueError("Validation failed")
+        async def text_chunks():
+            async for chunk in chunks:
+                text = chunk_text(chunk)
+                received.append(text)
+                yield text
         
-        return parsed
-    
-    def _parse_with_extraction(self, raw_output: str) -> Dict[str, Any]:
-        """Intelligent content extraction and parsing."""
-        # Extract JSON from mixed content
-        json_candidates = self._extract_json_candidates(raw_output)
+        try:
+            result = await parse_json_stream(text_chunks(), on_value=on_value, watch=watch)
+            if not isinstance(result, dict) or not self.validate(result):
+                raise ValueError("Validation failed")
+        except Exception as e:
+            self._record_failure("".join(received), [e], start_time)
+            raise ValueError(f"Streaming parsing failed: {e}")
         
-        for candidate in json_candidates:
-            try:
-                parsed = json.loads(candidate)
-                if isinstance(parsed, dict) and self.validate(parsed):
-                    return parsed
-            except:
-                continue
+        self._record_success("".join(received), result, start_time)
+        return result
+    
+    def _parse_incremental(self, raw_output: str) -> Dict[str, Any]:
+        """Parse the first valid JSON object in one left-to-right pass."""
+        for parsed in iter_json_objects(raw_output):
+            if isinstance(parsed, dict) and self.validate(parsed):
+                return parsed
         
-        raise ValueError("No valid JSON found in extraction")
+        raise ValueError("No valid JSON object found")
     
     def _parse_with_patterns(self, raw_output: str) -> Dict[str, Any]:
         """Pattern-based parsing for malformed content."""
@@ -123,53 +129,6 @@ class EnhancedOutputParser(OutputParser):
         
         raise ValueError("Pattern-based parsing failed")
     
-    def _extract_json_candidates(self, raw_output: str) -> List[str]:
-        """Extract potential JSON objects from text."""
-        candidates = []
-        
-        # Find all potential JSON objects
-        brace_count = 0
-        start_pos = None
-        
-        for i, char in enumerate(raw_output):
-            if char == '{':
-                if brace_count == 0:
-                    start_pos = i
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0 and start_pos is not None:
-                    candidate = raw_output[start_pos:i+1]
-                    candidates.append(candidate)
-                    start_pos = None
-        
-        return candidates
-    
-    def _clean_output(self, raw_output: str) -> str:
-        """Enhanced output cleaning."""
-        cleaned = raw_output.strip()
-        
-        # Remove various markdown formats
-        patterns = [
-            r'```json\s*',
-            r'```\s*',
-            r'`{3,}\s*',
-            r'^.*?(?=\{)',  # Remove text before first {
-            r'\}.*?$',      # Remove text after last }
-        ]
-        
-        for pattern in patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.MULTILINE | re.DOTALL)
-        
-        # Find the main JSON object
-        start = cleaned.find('{')
-        end = cleaned.rfind('}')
-        
-        if start != -1 and end != -1 and start < end:
-            cleaned = cleaned[start:end+1]
-        
-        return cleaned.strip()
-    
     def validate(self, parsed_output: Dict[str, Any]) -> bool:
         """Enhanced validation with schema support."""
         if not isinstance(parsed_output, dict):
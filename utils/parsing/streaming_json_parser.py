@@ -0,0 +1,467 @@
+"""
+Streaming JSON Parsing Utilities
+================================
+
+Single-pass incremental JSON parser for LLM outputs.
+
+The parser consumes text chunks as they arrive (e.g. from ``llm.astream``)
+and reports every value the moment it is complete, so downstream stages can
+start on the first generated file while the model is still writing the rest.
+It tolerates what LLMs typically wrap around or break in JSON:
+
+- leading prose and markdown fences (everything before the first ``{``)
+- trailing text after the root object
+- trailing commas and raw newlines inside strings
+- truncation: ``finish()`` closes open strings and containers, completes
+  literal prefixes (``tru`` -> ``true``) and drops dangling keys
+
+Author: AI-Dev-Agent System
+Version: 1.0
+"""
+
+import copy
+import inspect
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+PathType = Tuple[Union[str, int], ...]
+
+_UNSET = object()
+
+# Tokenizer modes
+_SEEK = "seek"
+_STRUCTURE = "structure"
+_STRING = "string"
+_LITERAL = "literal"
+_DONE = "done"
+
+# Container states
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_COMMA = "comma"
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_WHITESPACE = re.compile(r'[ \t\r\n]*')
+_LITERAL_CHARS = re.compile(r'[-+.\w]*')
+_ESCAPE = re.compile(r'\\(?:u[0-9a-fA-F]{4}|["\\/bfnrt])|\\')
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class StreamingJSONError(ValueError):
+    """Raised when the stream contains JSON that cannot be repaired."""
+
+
+@dataclass
+class ParsedValue:
+    """A value that just completed, with its path from the root object."""
+    path: PathType
+    value: Any
+
+
+class _Frame:
+    """An open object or array on the parser stack."""
+    __slots__ = ("container", "is_dict", "key", "state")
+
+    def __init__(self, container: Any):
+        self.container = container
+        self.is_dict = isinstance(container, dict)
+        self.key: Optional[str] = None
+        self.state = _KEY if self.is_dict else _VALUE
+
+
+def _decode_string(raw: str) -> str:
+    try:
+        return json.loads('"' + raw + '"', strict=False)
+    except json.JSONDecodeError:
+        # LLMs emit unescaped backslashes in code, e.g. "\d" in a regex
+        escaped = _ESCAPE.sub(lambda m: m.group() if len(m.group()) > 1 else "\\\\", raw)
+        return json.loads('"' + escaped + '"', strict=False)
+
+
+def _decode_literal(text: str) -> Any:
+    if text in _LITERALS:
+        return _LITERALS[text]
+    try:
+        value = json.loads(text)
+    except json.JSONDecodeError:
+        raise StreamingJSONError(f"Invalid literal: {text!r}")
+    if not isinstance(value, (int, float)):
+        raise StreamingJSONError(f"Invalid literal: {text!r}")
+    return value
+
+
+def _complete_literal(text: str) -> Any:
+    """Best completion of a literal cut off by truncation, or ``_UNSET``."""
+    for word, value in _LITERALS.items():
+        if text and word.startswith(text):
+            return value
+    text = text.rstrip(".eE+-")
+    try:
+        return _decode_literal(text) if text else _UNSET
+    except StreamingJSONError:
+        return _UNSET
+
+
+def _path_matches(pattern: PathType, path: PathType) -> bool:
+    return len(pattern) == len(path) and all(
+        part == "*" or part == actual for part, actual in zip(pattern, path)
+    )
+
+
+class StreamingJSONParser:
+    """
+    Incremental JSON object parser.
+
+    Every character is looked at once; string bodies are copied in slices.
+    ``feed`` returns the values completed by the chunk, in completion order
+    (children before their parents).
+    """
+
+    def __init__(self,
+                 watch: Optional[Iterable[Sequence[Union[str, int]]]] = None,
+                 validator: Optional[Callable[[PathType, Any], bool]] = None):
+        """
+        Initialize parser.
+
+        Args:
+            watch: Path patterns to report (``"*"`` matches any key or index),
+                e.g. ``[("source_files", "*")]``; ``None`` reports every value
+            validator: ``validator(path, value)``; values failing it are
+                collected in ``rejected`` instead of being reported
+        """
+        self.watch = [tuple(pattern) for pattern in watch] if watch is not None else None
+        self.validator = validator
+        self.rejected: List[ParsedValue] = []
+
+        self.root: Any = _UNSET
+        self.done = False
+        self.repaired = False
+        self.root_offset: Optional[int] = None
+        self.end_offset: Optional[int] = None
+
+        self._mode = _SEEK
+        self._stack: List[_Frame] = []
+        self._string_parts: List[str] = []
+        self._string_is_key = False
+        self._escape_pending = False
+        self._literal_parts: List[str] = []
+        self._offset = 0
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def feed(self, chunk: str) -> List[ParsedValue]:
+        """Consume the next chunk of text and return the values it completed."""
+        events: List[ParsedValue] = []
+        i = 0
+        n = len(chunk)
+
+        while i < n and self._mode != _DONE:
+            mode = self._mode
+            if mode == _STRING:
+                i = self._consume_string(chunk, i, events)
+            elif mode == _STRUCTURE:
+                i = _WHITESPACE.match(chunk, i).end()
+                if i < n:
+                    self._structural(chunk[i], self._offset + i, events)
+                    i += 1
+            elif mode == _LITERAL:
+                end = _LITERAL_CHARS.match(chunk, i).end()
+                self._literal_parts.append(chunk[i:end])
+                i = end
+                if i < n:
+                    self._finish_literal(events)
+            else:
+                start = chunk.find("{", i)
+                if start == -1:
+                    i = n
+                else:
+                    self.root_offset = self._offset + start
+                    self._mode = _STRUCTURE
+                    i = start
+
+        if self.done and self.end_offset is None:
+            self.end_offset = self._offset + i
+        self._offset += n
+        return events
+
+    def _structural(self, char: str, position: int, events: List[ParsedValue]):
+        if not self._stack:
+            self._begin_value(char, position, events)
+            return
+
+        frame = self._stack[-1]
+        state = frame.state
+        if state == _COMMA:
+            if char == ",":
+                frame.state = _KEY if frame.is_dict else _VALUE
+            elif char == ("}" if frame.is_dict else "]"):
+                self._close(events)
+            else:
+                self._unexpected(char, position)
+        elif state == _KEY:
+            if char == '"':
+                self._begin_string(is_key=True)
+            elif char == "}":
+                self._close(events)
+            else:
+                self._unexpected(char, position)
+        elif state == _COLON:
+            if char == ":":
+                frame.state = _VALUE
+            else:
+                self._unexpected(char, position)
+        elif char == "]" and not frame.is_dict:
+            self._close(events)
+        else:
+            self._begin_value(char, position, events)
+
+    def _begin_value(self, char: str, position: int, events: List[ParsedValue]):
+        if char == "{" or char == "[":
+            container = {} if char == "{" else []
+            self._attach(container)
+            self._stack.append(_Frame(container))
+        elif char == '"':
+            self._begin_string(is_key=False)
+        elif char == "-" or char.isdigit() or char in "tfn":
+            self._mode = _LITERAL
+            self._literal_parts = [char]
+        else:
+            self._unexpected(char, position)
+
+    def _begin_string(self, is_key: bool):
+        self._mode = _STRING
+        self._string_is_key = is_key
+        self._string_parts = []
+
+    def _consume_string(self, chunk: str, i: int, events: List[ParsedValue]) -> int:
+        parts = self._string_parts
+        if self._escape_pending:
+            parts.append(chunk[i])
+            self._escape_pending = False
+            i += 1
+
+        while True:
+            match = _STRING_SPECIAL.search(chunk, i)
+            if match is None:
+                parts.append(chunk[i:])
+                return len(chunk)
+            j = match.start()
+            if chunk[j] == '"':
+                parts.append(chunk[i:j])
+                self._finish_string(events)
+                return j + 1
+            if j + 1 < len(chunk):
+                parts.append(chunk[i:j + 2])
+                i = j + 2
+            else:
+                parts.append(chunk[i:])
+                self._escape_pending = True
+                return len(chunk)
+
+    def _finish_string(self, events: List[ParsedValue]):
+        value = _decode_string("".join(self._string_parts))
+        self._string_parts = []
+        self._mode = _STRUCTURE
+        if self._string_is_key:
+            frame = self._stack[-1]
+            frame.key = value
+            frame.state = _COLON
+        else:
+            self._complete(value, events)
+
+    def _finish_literal(self, events: List[ParsedValue]):
+        value = _decode_literal("".join(self._literal_parts))
+        self._literal_parts = []
+        self._mode = _STRUCTURE
+        self._complete(value, events)
+
+    # ------------------------------------------------------------------
+    # Tree building
+    # ------------------------------------------------------------------
+
+    def _attach(self, value: Any):
+        if not self._stack:
+            self.root = value
+            return
+        frame = self._stack[-1]
+        if frame.is_dict:
+            frame.container[frame.key] = value
+        else:
+            frame.container.append(value)
+
+    def _path(self) -> PathType:
+        return tuple(
+            frame.key if frame.is_dict else len(frame.container) - 1
+            for frame in self._stack
+        )
+
+    def _complete(self, value: Any, events: List[ParsedValue], attach: bool = True):
+        if attach:
+            self._attach(value)
+        self._emit(self._path(), value, events)
+        if self._stack:
+            self._stack[-1].state = _COMMA
+        else:
+            self.done = True
+            self._mode = _DONE
+
+    def _close(self, events: List[ParsedValue]):
+        frame = self._stack.pop()
+        self._complete(frame.container, events, attach=False)
+
+    def _emit(self, path: PathType, value: Any, events: List[ParsedValue]):
+        if self.watch is not None and not any(_path_matches(p, path) for p in self.watch):
+            return
+        if self.validator is not None and not self.validator(path, value):
+            self.rejected.append(ParsedValue(path, value))
+            return
+        events.append(ParsedValue(path, value))
+
+    def _unexpected(self, char: str, position: int):
+        raise StreamingJSONError(f"Unexpected character {char!r} at offset {position}")
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def _repair(self):
+        """Close whatever is still open after the stream ended."""
+        if self._mode == _STRING and not self._string_is_key:
+            raw = "".join(self._string_parts)
+            if self._escape_pending:
+                raw = raw[:-1]
+            self._attach(_decode_string(raw))
+        elif self._mode == _LITERAL:
+            value = _complete_literal("".join(self._literal_parts))
+            if value is not _UNSET:
+                self._attach(value)
+        # Dangling keys were never attached; open containers already are
+        self._stack = []
+        self._mode = _DONE
+        self.done = True
+        self.repaired = True
+
+    def snapshot(self) -> Any:
+        """Copy of the object parsed so far, including the value in progress."""
+        if self.root is _UNSET:
+            return None
+        clone = copy.deepcopy(self)
+        if not clone.done:
+            clone._repair()
+        return clone.root
+
+    def finish(self) -> Any:
+        """
+        End the stream and return the root object, repairing truncation.
+
+        Raises:
+            StreamingJSONError: If no JSON object was found
+        """
+        if self.root is _UNSET:
+            raise StreamingJSONError("No JSON object found in output")
+        if not self.done:
+            self._repair()
+        return self.root
+
+
+def iter_json_objects(text: str, **parser_kwargs) -> Iterator[Any]:
+    """
+    Yield every top-level JSON object in ``text`` in one left-to-right pass.
+
+    A ``{`` that does not start valid JSON (e.g. in leading prose) is
+    skipped; a truncated final object is repaired.
+    """
+    position = 0
+    while position < len(text):
+        parser = StreamingJSONParser(**parser_kwargs)
+        try:
+            parser.feed(text[position:] if position else text)
+        except StreamingJSONError:
+            if parser.root_offset is None:
+                return
+            position += parser.root_offset + 1
+            continue
+        if parser.root is _UNSET:
+            return
+        yield parser.finish()
+        if parser.end_offset is None:
+            return
+        position += parser.end_offset
+
+
+def parse_json_text(text: str, **parser_kwargs) -> Any:
+    """
+    Parse the JSON object in a complete LLM output.
+
+    An output that is entirely one JSON array is returned as is. Otherwise
+    the largest object wins, so an example like ``{}`` in leading prose does
+    not shadow the actual answer.
+
+    Raises:
+        StreamingJSONError: If the output contains no usable JSON object
+    """
+    if text.lstrip().startswith("["):
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    best, best_size = _UNSET, -1
+    for value in iter_json_objects(text, **parser_kwargs):
+        size = len(json.dumps(value))
+        if size > best_size:
+            best, best_size = value, size
+    if best is _UNSET:
+        raise StreamingJSONError("No JSON object found in output")
+    return best
+
+
+def chunk_text(chunk: Any) -> str:
+    """Text of a streamed chunk (``str``, ``AIMessageChunk`` or content parts)."""
+    if isinstance(chunk, str):
+        return chunk
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, list):
+        return "".join(
+            part if isinstance(part, str) else part.get("text", "")
+            for part in content if isinstance(part, (str, dict))
+        )
+    return content if isinstance(content, str) else str(content)
+
+
+async def astream_json(chunks: AsyncIterable[Any],
+                       parser: Optional[StreamingJSONParser] = None) -> AsyncIterator[ParsedValue]:
+    """
+    Yield values from an async chunk stream as soon as they complete.
+
+    Pass your own ``parser`` to call ``parser.finish()`` for the full object
+    once the stream is exhausted.
+    """
+    parser = parser if parser is not None else StreamingJSONParser()
+    async for chunk in chunks:
+        for event in parser.feed(chunk_text(chunk)):
+            yield event
+
+
+async def parse_json_stream(chunks: AsyncIterable[Any],
+                            on_value: Optional[Callable[[ParsedValue], Any]] = None,
+                            **parser_kwargs) -> Any:
+    """
+    Consume an async chunk stream and return the (repaired) root object.
+
+    Args:
+        chunks: e.g. ``llm.astream(prompt)``
+        on_value: Called (or awaited) for every reported value while streaming
+        **parser_kwargs: ``watch``/``validator`` for ``StreamingJSONParser``
+    """
+    parser = StreamingJSONParser(**parser_kwargs)
+    async for event in astream_json(chunks, parser):
+        if on_value is not None:
+            result = on_value(event)
+            if inspect.isawaitable(result):
+                await result
+    return parser.finish()
@@ -23,6 +23,7 @@ from .prompt_manager import PromptManager, get_prompt_manager
 from .prompt_template_system import (
     PromptTemplateSystem, 
     PromptTemplate, 
+    CompiledTemplate,
     TemplateType, 
     TemplateStatus,
     get_template_system
@@ -593,7 +594,7 @@ def get_prompt_management_system() -> PromptManagementSystem:
 __all__ = [
     # Core components
     "PromptManager", "get_prompt_manager",
-    "PromptTemplateSystem", "get_template_system",
+    "PromptTemplateSystem", "get_template_system", "CompiledTemplate",
     "PromptOptimizer", "get_prompt_optimizer",
     "PromptABTesting", "get_ab_testing",
     
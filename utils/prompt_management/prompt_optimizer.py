@@ -6,6 +6,10 @@ Provides comprehensive performance optimization, caching, and monitoring
 capabilities for AI agent prompts. This is a core component of the prompt
 engineering system for US-PE-01.
 
+Optimization results are cached in one SQLite file per cache directory,
+addressed by a hash of prompt, strategy and context, shared by concurrent
+processes and evicted least-recently-used beyond a size limit.
+
 Author: AI-Dev-Agent System
 Version: 1.0
 Last Updated: Current Session
@@ -15,8 +19,12 @@ import logging
 import time
 import hashlib
 import json
+import sqlite3
+import threading
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Deque, Dict, Any, Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import asyncio
@@ -24,6 +32,11 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+OPTIMIZATION_CACHE_FILE = "optimizations.db"
+OPTIMIZATION_CACHE_VERSION = 1
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_HISTORY_SIZE = 1000
+
 
 class OptimizationStrategy(Enum):
     """Prompt optimization strategies."""
@@ -66,21 +79,201 @@ class PerformanceMetrics:
             self.metadata = {}
 
 
+class OptimizationCache:
+    """
+    Persistent optimization results keyed by content hash.
+    
+    Several optimizers and processes can share one file: WAL mode lets
+    readers proceed while a writer holds the lock, and writes run in
+    ``BEGIN IMMEDIATE`` transactions. Once the stored results exceed
+    ``max_bytes`` the least recently used ones are deleted. Reads record
+    their access time in memory and write it with the next store (or after
+    ``touch_batch`` reads), so a cache hit does not cost a write.
+    """
+    
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES, touch_batch: int = 256):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.touch_batch = touch_batch
+        self._pending_touches: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._write() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != OPTIMIZATION_CACHE_VERSION:
+                conn.execute("DROP TABLE IF EXISTS optimizations")
+                conn.execute("DROP TABLE IF EXISTS cache_meta")
+                conn.execute(f"PRAGMA user_version = {OPTIMIZATION_CACHE_VERSION}")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS optimizations (
+                    cache_key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS optimizations_last_access ON optimizations (last_access)")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO cache_meta VALUES ('total_bytes', 0)")
+    
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction holding the database lock from the start (no upgrade deadlocks)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+    
+    def get(self, cache_key: str) -> Optional[OptimizationResult]:
+        """Cached result for the key, marked as recently used."""
+        return self.get_many([cache_key]).get(cache_key)
+    
+    def get_many(self, cache_keys: Sequence[str]) -> Dict[str, OptimizationResult]:
+        """Cached results of the keys that are present, all marked as recently used."""
+        found: Dict[str, OptimizationResult] = {}
+        keys = list(dict.fromkeys(cache_keys))
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT cache_key, result FROM optimizations WHERE cache_key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for cache_key, data in rows:
+                    found[cache_key] = self._deserialize(data)
+            now = time.time_ns()
+            for cache_key in found:
+                self._pending_touches[cache_key] = now
+            flush = len(self._pending_touches) >= self.touch_batch
+        if flush:
+            self.flush()
+        return found
+    
+    def put(self, cache_key: str, result: OptimizationResult) -> None:
+        """Store one result."""
+        self.put_many({cache_key: result})
+    
+    def put_many(self, results: Dict[str, OptimizationResult]) -> None:
+        """Store results in one transaction, then evict down to max_bytes."""
+        if not results:
+            return
+        rows = [(cache_key, self._serialize(result)) for cache_key, result in results.items()]
+        now = time.time_ns()
+        with self._write() as conn:
+            self._apply_touches(conn)
+            total = conn.execute("SELECT value FROM cache_meta WHERE key = 'total_bytes'").fetchone()[0]
+            for cache_key, data in rows:
+                previous = conn.execute("SELECT size FROM optimizations WHERE cache_key = ?", (cache_key,)).fetchone()
+                size = len(data.encode('utf-8'))
+                conn.execute("INSERT OR REPLACE INTO optimizations VALUES (?, ?, ?, ?)", (cache_key, data, size, now))
+                total += size - (previous[0] if previous else 0)
+            total = self._evict(conn, total)
+            conn.execute("UPDATE cache_meta SET value = ? WHERE key = 'total_bytes'", (total,))
+    
+    def flush(self) -> None:
+        """Write the access times of recent reads."""
+        if self._pending_touches:
+            with self._write() as conn:
+                self._apply_touches(conn)
+    
+    def close(self) -> None:
+        """Flush access times and close the connection."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+    
+    def _apply_touches(self, conn: sqlite3.Connection) -> None:
+        conn.executemany("UPDATE optimizations SET last_access = MAX(last_access, ?) WHERE cache_key = ?",
+                         [(accessed, cache_key) for cache_key, accessed in self._pending_touches.items()])
+        self._pending_touches.clear()
+    
+    def _evict(self, conn: sqlite3.Connection, total: int) -> int:
+        """Delete least recently used results until the total fits; returns the new total."""
+        while total > self.max_bytes:
+            victims = conn.execute(
+                "SELECT cache_key, size FROM optimizations ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not victims:
+                return 0
+            evicted = []
+            for cache_key, size in victims:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((cache_key,))
+                total -= size
+            conn.executemany("DELETE FROM optimizations WHERE cache_key = ?", evicted)
+        return total
+    
+    def total_bytes(self) -> int:
+        """Size of the stored results."""
+        with self._lock:
+            return self._conn.execute("SELECT value FROM cache_meta WHERE key = 'total_bytes'").fetchone()[0]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM optimizations").fetchone()[0]
+    
+    def __contains__(self, cache_key: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM optimizations WHERE cache_key = ?", (cache_key,)
+            ).fetchone() is not None
+    
+    @staticmethod
+    def _serialize(result: OptimizationResult) -> str:
+        data = asdict(result)
+        data["strategy"] = result.strategy.value
+        return json.dumps(data, default=str)
+    
+    @staticmethod
+    def _deserialize(data: str) -> OptimizationResult:
+        fields = json.loads(data)
+        fields["strategy"] = OptimizationStrategy(fields["strategy"])
+        return OptimizationResult(**fields)
+
+
 class PromptOptimizer:
     """Core prompt optimization engine."""
     
-    def __init__(self, cache_dir: str = "prompts/cache"):
+    def __init__(self, cache_dir: str = "prompts/cache", cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                 history_size: int = DEFAULT_HISTORY_SIZE):
         """
         Initialize the prompt optimizer.
         
         Args:
             cache_dir: Directory for optimization cache
+            cache_max_bytes: Size limit of the persistent result cache
+            history_size: Number of recent optimizations kept in history
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.optimization_cache: Dict[str, OptimizationResult] = {}
+        self.cache_max_bytes = cache_max_bytes
+        self._optimization_cache: Optional[OptimizationCache] = None
         self.performance_metrics: List[PerformanceMetrics] = []
-        self.optimization_history: List[OptimizationResult] = []
+        self.optimization_history: Deque[OptimizationResult] = deque(maxlen=history_size)
+    
+    @property
+    def optimization_cache(self) -> OptimizationCache:
+        """Persistent result cache of the current cache directory."""
+        db_path = Path(self.cache_dir) / OPTIMIZATION_CACHE_FILE
+        if self._optimization_cache is None or self._optimization_cache.db_path != db_path:
+            if self._optimization_cache is not None:
+                self._optimization_cache.close()
+            self._optimization_cache = OptimizationCache(db_path, self.cache_max_bytes)
+        return self._optimization_cache
+    
+    def close(self) -> None:
+        """Close the persistent result cache."""
+        if self._optimization_cache is not None:
+            self._optimization_cache.close()
+            self._optimization_cache = None
     
     def optimize_prompt(self, prompt: str, strategy: OptimizationStrategy,
                        context: Dict[str, Any] = None) -> OptimizationResult:
@@ -95,13 +288,60 @@ class PromptOptimizer:
         Returns:
             OptimizationResult: Optimization result
         """
-        start_time = time.time()
-        
         # Check cache first
         cache_key = self._generate_cache_key(prompt, strategy, context)
-        if cache_key in self.optimization_cache:
+        cached = self.optimization_cache.get(cache_key)
+        if cached is not None:
             logger.info(f"Using cached optimization for {cache_key}")
-            return self.optimization_cache[cache_key]
+            return cached
+        
+        result = self._run_optimization(prompt, strategy, context)
+        
+        # Cache result
+        self.optimization_history.append(result)
+        self._save_optimization_result(result, cache_key)
+        
+        logger.info(f"Optimized prompt with {strategy.value}: {result.token_reduction} tokens reduced")
+        return result
+    
+    def optimize_prompts(self, requests: Sequence[Tuple]) -> List[OptimizationResult]:
+        """
+        Optimize a batch of prompts.
+        
+        Identical requests are optimized once, cached results are read in one
+        query and new results are stored in one transaction.
+        
+        Args:
+            requests: ``(prompt, strategy)`` or ``(prompt, strategy, context)`` tuples
+            
+        Returns:
+            Optimization results in request order
+        """
+        keys = []
+        unique: Dict[str, Tuple[str, OptimizationStrategy, Optional[Dict[str, Any]]]] = {}
+        for request in requests:
+            prompt, strategy, context = (tuple(request) + (None,))[:3]
+            cache_key = self._generate_cache_key(prompt, strategy, context)
+            keys.append(cache_key)
+            unique.setdefault(cache_key, (prompt, strategy, context))
+        
+        results = self.optimization_cache.get_many(list(unique))
+        computed = {}
+        for cache_key, (prompt, strategy, context) in unique.items():
+            if cache_key not in results:
+                computed[cache_key] = self._run_optimization(prompt, strategy, context)
+        
+        self.optimization_history.extend(computed.values())
+        self.optimization_cache.put_many(computed)
+        results.update(computed)
+        
+        logger.info(f"Optimized {len(requests)} prompts: {len(unique)} unique, {len(computed)} computed")
+        return [results[cache_key] for cache_key in keys]
+    
+    def _run_optimization(self, prompt: str, strategy: OptimizationStrategy,
+                          context: Dict[str, Any] = None) -> OptimizationResult:
+        """Apply the strategy and measure the result."""
+        start_time = time.time()
         
         # Apply optimization strategy
         if strategy == OptimizationStrategy.TOKEN_REDUCTION:
@@ -133,14 +373,6 @@ class PromptOptimizer:
             metadata={"context": context}
         )
         
-        # Cache result
-        self.optimization_cache[cache_key] = result
-        self.optimization_history.append(result)
-        
-        # Save to file
-        self._save_optimization_result(result, cache_key)
-        
-        logger.info(f"Optimized prompt with {strategy.value}: {token_reduction} tokens reduced")
         return result
     
     def get_optimization_history(self, limit: int = 100) -> List[OptimizationResult]:
@@ -153,7 +385,8 @@ class PromptOptimizer:
         Returns:
             List of optimization results
         """
-        return self.optimization_history[-limit:]
+        history = list(self.optimization_history)
+        return history[-limit:] if limit > 0 else []
     
     def get_performance_metrics(self, prompt_id: str = None, 
                               since: datetime = None) -> List[PerformanceMetrics]:
@@ -492,17 +725,13 @@ class PromptOptimizer:
     
     def _generate_cache_key(self, prompt: str, strategy: OptimizationStrategy,
                            context: Dict[str, Any] = None) -> str:
-        """Generate cache key for optimization result."""
-        content = f"{prompt}:{strategy.value}:{json.dumps(context or {}, sort_keys=True)}"
-        return hashlib.md5(content.encode()).hexdigest()
+        """Generate cache key for optimization result (hash of prompt, strategy and context)."""
+        content = json.dumps([prompt, strategy.value, context or {}], sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
     
     def _save_optimization_result(self, result: OptimizationResult, cache_key: str):
-        """Save optimization result to file."""
-        # Ensure directory exists
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        with open(cache_file, 'w') as f:
-            json.dump(asdict(result), f, indent=2, default=str)
+        """Save optimization result to the persistent cache."""
+        self.optimization_cache.put(cache_key, result)
 
 
 # Global optimizer instance
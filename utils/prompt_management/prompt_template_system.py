@@ -6,6 +6,16 @@ Provides comprehensive template management, version control, and dynamic loading
 capabilities for AI agent prompts. This is a core component of the prompt engineering
 system for US-PE-01.
 
+Performance:
+- Templates are discovered by file name and parsed lazily on first access;
+  each access re-validates the file's mtime/size and reloads it if changed
+- A persisted index (agent type, status, updated_at per file) lets by-agent
+  queries run without parsing template files that have not changed
+- Secondary indexes keyed by ``(agent_type, status)`` are kept sorted by
+  ``updated_at`` as templates are created, updated and deleted
+- ``{{variable}}`` placeholders are parsed once into a ``CompiledTemplate``
+  that renders in a single join
+
 Author: AI-Dev-Agent System
 Version: 1.0
 Last Updated: Current Session
@@ -14,14 +24,26 @@ Last Updated: Current Session
 import logging
 import json
 import hashlib
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+import os
+import re
+import time
+from bisect import bisect_left, insort
+from collections.abc import MutableMapping
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Persisted per-file metadata; not a template, so it does not end in .json
+INDEX_FILE_NAME = ".template_index"
+
+# {{name}} placeholder (names never contain braces)
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{([^{}]*)\}\}")
+_MISSING = object()
+
 
 class TemplateType(Enum):
     """Types of prompt templates."""
@@ -84,21 +106,324 @@ class PromptTemplate:
         return cls(**data)
 
 
+class CompiledTemplate:
+    """
+    Template text with its ``{{variable}}`` placeholders parsed once.
+    
+    The text is compiled to a positional ``str.format`` string, so rendering
+    is a single C-level pass. Placeholders without a context value are kept
+    verbatim.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.literals: List[str] = []
+        self.names: List[str] = []
+        
+        position = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(text):
+            self.literals.append(text[position:match.start()])
+            self.names.append(match.group(1))
+            position = match.end()
+        self.literals.append(text[position:])
+        
+        # Each distinct name becomes one positional field
+        self.fields: List[str] = list(dict.fromkeys(self.names))
+        slots = {name: index for index, name in enumerate(self.fields)}
+        escaped = [literal.replace("{", "{{").replace("}", "}}") for literal in self.literals]
+        self._format = escaped[0] + "".join(
+            f"{{{slots[name]}}}{literal}" for name, literal in zip(self.names, escaped[1:])
+        )
+    
+    def render(self, context: Dict[str, Any]) -> str:
+        """Substitute context values for placeholders in one formatting pass."""
+        if not self.fields or not context:
+            return self.text
+        
+        values = [context.get(name, _MISSING) for name in self.fields]
+        if _MISSING in values and not all(type(key) is str for key in context):
+            # Placeholders always hold text; match keys such as ints by their str()
+            context = {str(key): value for key, value in context.items()}
+            values = [context.get(name, _MISSING) for name in self.fields]
+        return self._format.format(*[
+            f"{{{{{name}}}}}" if value is _MISSING else value
+            for name, value in zip(self.fields, values)
+        ])
+
+
+def _updated_at_key(updated_at: datetime) -> int:
+    """Exact sortable microseconds for ``updated_at`` (aware values converted to naive UTC)."""
+    if updated_at.tzinfo is not None:
+        updated_at = updated_at.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = updated_at - datetime(1970, 1, 1)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class _TemplateEntry:
+    """A known template: file signature, index metadata and the lazily parsed template."""
+    
+    __slots__ = ('seq', 'signature', 'checked_at', 'agent_type', 'status', 'updated_at',
+                 'template', 'compiled', 'index_key')
+    
+    def __init__(self, seq: int, signature: Optional[Tuple[int, int]] = None):
+        self.seq = seq
+        self.signature = signature
+        self.checked_at = float('-inf')
+        self.agent_type: Optional[str] = None
+        self.status: Optional[str] = None
+        self.updated_at: Optional[int] = None
+        self.template: Optional[PromptTemplate] = None
+        self.compiled: Optional[CompiledTemplate] = None
+        self.index_key: Optional[Tuple[Tuple[str, str], Tuple[int, int, str]]] = None
+    
+    def set_template(self, template: PromptTemplate):
+        self.template = template
+        self.agent_type = template.agent_type
+        self.status = template.status.value
+        self.updated_at = _updated_at_key(template.updated_at)
+
+
+class TemplateMap(MutableMapping):
+    """
+    ``template_id -> PromptTemplate`` mapping over a templates directory.
+    
+    Files are listed on construction but parsed on first access, and
+    re-parsed when their mtime/size change (checked at most every
+    ``validate_interval`` seconds per template). Templates are also indexed
+    by ``(agent_type, status)`` in ``updated_at`` order.
+    """
+    
+    def __init__(self, templates_dir: Path, validate_interval: float = 2.0):
+        self.templates_dir = templates_dir
+        self.index_file = templates_dir / INDEX_FILE_NAME
+        self._dir = str(templates_dir)
+        self.validate_interval = validate_interval
+        self._entries: Dict[str, _TemplateEntry] = {}
+        self._index: Dict[Tuple[str, str], List[Tuple[int, int, str]]] = {}
+        self._index_built = False
+        self._index_dirty = False
+        self.files_parsed = 0
+        
+        names = sorted(entry.name for entry in os.scandir(templates_dir) if entry.name.endswith(".json"))
+        for seq, name in enumerate(names):
+            self._entries[name[:-5]] = _TemplateEntry(seq)
+        self._next_seq = len(names)
+    
+    # Mapping protocol -------------------------------------------------
+    
+    def __getitem__(self, template_id: str) -> PromptTemplate:
+        return self._entry(template_id).template
+    
+    def __setitem__(self, template_id: str, template: PromptTemplate):
+        entry = self._entries.get(template_id)
+        if entry is None:
+            entry = self._entries[template_id] = _TemplateEntry(self._next_seq)
+            self._next_seq += 1
+        entry.set_template(template)
+        entry.compiled = None
+        self._reindex(template_id, entry)
+    
+    def __delitem__(self, template_id: str):
+        entry = self._entries.pop(template_id)
+        self._unindex(entry)
+        self._index_dirty = True
+    
+    def __contains__(self, template_id) -> bool:
+        return template_id in self._entries
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def values(self) -> List[PromptTemplate]:
+        """All templates that parse, loading any not yet loaded."""
+        templates = []
+        for template_id in list(self._entries):
+            try:
+                templates.append(self[template_id])
+            except KeyError:
+                continue
+        return templates
+    
+    # Loading ------------------------------------------------------------
+    
+    def _entry(self, template_id: str) -> _TemplateEntry:
+        """Entry with its template loaded and (within the interval) validated; KeyError if unloadable."""
+        entry = self._entries[template_id]
+        now = time.monotonic()
+        if entry.template is None or now - entry.checked_at >= self.validate_interval:
+            entry.checked_at = now
+            self._validate(template_id, entry)
+        if entry.template is None:
+            raise KeyError(template_id)
+        return entry
+    
+    def _file_signature(self, template_id: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(os.path.join(self._dir, template_id + ".json"))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _validate(self, template_id: str, entry: _TemplateEntry):
+        """Parse the template if not loaded yet or if its file changed on disk."""
+        signature = self._file_signature(template_id)
+        if signature is None:
+            # File gone: keep what is in memory (unsaved or deleted externally)
+            return
+        if signature == entry.signature and (entry.template is not None or entry.agent_type is None):
+            # Unchanged: loaded already, or this version failed to parse
+            return
+        self._load(template_id, entry, signature)
+    
+    def _load(self, template_id: str, entry: _TemplateEntry, signature: Optional[Tuple[int, int]]):
+        entry.signature = signature
+        self.files_parsed += 1
+        try:
+            with open(os.path.join(self._dir, template_id + ".json"), 'r') as f:
+                template = PromptTemplate.from_dict(json.load(f))
+        except Exception as e:
+            logger.error(f"Failed to load template {template_id}: {e}")
+            return
+        entry.set_template(template)
+        entry.compiled = None
+        self._reindex(template_id, entry)
+    
+    def saved(self, template_id: str):
+        """Record the signature of a file this process just wrote."""
+        entry = self._entries.get(template_id)
+        if entry is not None:
+            entry.signature = self._file_signature(template_id)
+            entry.checked_at = time.monotonic()
+            self._index_dirty = True
+    
+    def compiled(self, template_id: str) -> CompiledTemplate:
+        """Compiled form of a template, recompiled when its text changed."""
+        entry = self._entry(template_id)
+        text = entry.template.template_text
+        if entry.compiled is None or entry.compiled.text != text:
+            entry.compiled = CompiledTemplate(text)
+        return entry.compiled
+    
+    # Secondary indexes ---------------------------------------------------
+    
+    def by_agent(self, agent_type: str, status: str) -> List[PromptTemplate]:
+        """
+        Templates of an agent type and status, most recently updated first.
+        
+        Members of the group are loaded/validated first, so a member edited
+        on disk moves to its new group or position before the read.
+        """
+        self._ensure_index()
+        group = (agent_type, status)
+        for _, _, template_id in list(self._index.get(group, [])):
+            try:
+                self._entry(template_id)
+            except KeyError:
+                continue
+        return [self._entries[template_id].template for _, _, template_id in self._index.get(group, [])]
+    
+    def _unindex(self, entry: _TemplateEntry):
+        if entry.index_key is None:
+            return
+        group, key = entry.index_key
+        keys = self._index.get(group, [])
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+        entry.index_key = None
+    
+    def _reindex(self, template_id: str, entry: _TemplateEntry):
+        self._index_dirty = True
+        if not self._index_built:
+            return
+        self._unindex(entry)
+        if entry.agent_type is None:
+            return
+        group = (entry.agent_type, entry.status)
+        key = (-entry.updated_at, entry.seq, template_id)
+        insort(self._index.setdefault(group, []), key)
+        entry.index_key = (group, key)
+    
+    def refresh_entry(self, template_id: str):
+        """Re-index a template after its fields were changed in place."""
+        entry = self._entries.get(template_id)
+        if entry is not None and entry.template is not None:
+            entry.set_template(entry.template)
+            self._reindex(template_id, entry)
+    
+    def _ensure_index(self):
+        """Build the secondary indexes, parsing only files the persisted index cannot vouch for."""
+        if self._index_built:
+            return
+        
+        persisted = self._read_index_file()
+        for template_id, entry in self._entries.items():
+            if entry.template is not None:
+                continue
+            signature = self._file_signature(template_id)
+            meta = persisted.get(template_id)
+            if signature is not None and meta is not None and tuple(meta[:2]) == signature:
+                entry.signature = signature
+                entry.agent_type, entry.status, entry.updated_at = meta[2:]
+            elif signature is not None:
+                self._load(template_id, entry, signature)
+                entry.checked_at = time.monotonic()
+        
+        self._index_built = True
+        for template_id, entry in self._entries.items():
+            if entry.agent_type is not None:
+                group = (entry.agent_type, entry.status)
+                key = (-entry.updated_at, entry.seq, template_id)
+                self._index.setdefault(group, []).append(key)
+                entry.index_key = (group, key)
+        for keys in self._index.values():
+            keys.sort()
+        self.save_index()
+    
+    def _read_index_file(self) -> Dict[str, list]:
+        try:
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save_index(self):
+        """Persist per-file metadata so the next process can skip parsing unchanged files."""
+        if not (self._index_built and self._index_dirty):
+            return
+        data = {
+            template_id: [*entry.signature, entry.agent_type, entry.status, entry.updated_at]
+            for template_id, entry in self._entries.items()
+            if entry.signature is not None and entry.agent_type is not None
+        }
+        try:
+            tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps(data))
+            os.replace(tmp_file, self.index_file)
+            self._index_dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save template index: {e}")
+
+
 class PromptTemplateSystem:
     """Core prompt template management system."""
     
-    def __init__(self, templates_dir: str = "prompts/templates"):
+    def __init__(self, templates_dir: str = "prompts/templates", validate_interval: float = 2.0):
         """
         Initialize the prompt template system.
         
         Args:
             templates_dir: Directory to store template files
+            validate_interval: Seconds between mtime checks of a loaded template's file
         """
         self.templates_dir = Path(templates_dir)
         self.templates_dir.mkdir(parents=True, exist_ok=True)
-        self.templates: Dict[str, PromptTemplate] = {}
-        self.template_cache: Dict[str, PromptTemplate] = {}
-        self._load_templates()
+        self.validate_interval = validate_interval
+        self.templates = TemplateMap(self.templates_dir, validate_interval)
     
     def create_template(self, name: str, description: str, template_type: TemplateType,
                        agent_type: str, template_text: str, author: str,
@@ -155,21 +480,18 @@ class PromptTemplateSystem:
         Returns:
             PromptTemplate or None if not found
         """
-        # Check cache first
-        if template_id in self.template_cache:
-            return self.template_cache[template_id]
-        
-        # Check memory
+        # Known template: loaded lazily and reloaded if its file changed
         if template_id in self.templates:
-            template = self.templates[template_id]
-            self.template_cache[template_id] = template
-            return template
+            try:
+                return self.templates[template_id]
+            except KeyError:
+                return None
         
-        # Load from file
+        # File written since startup (e.g. by another process)
         template = self._load_template_file(template_id)
         if template:
             self.templates[template_id] = template
-            self.template_cache[template_id] = template
+            self.templates.saved(template_id)
         
         return template
     
@@ -185,13 +507,7 @@ class PromptTemplateSystem:
         Returns:
             List of templates
         """
-        templates = []
-        for template in self.templates.values():
-            if (template.agent_type == agent_type and 
-                template.status == status):
-                templates.append(template)
-        
-        return sorted(templates, key=lambda t: t.updated_at, reverse=True)
+        return self.templates.by_agent(agent_type, status.value)
     
     def get_all_templates(self) -> List[PromptTemplate]:
         """
@@ -232,12 +548,10 @@ class PromptTemplateSystem:
         # Update timestamp
         template.updated_at = datetime.utcnow()
         
-        # Save updated template
+        # Save updated template and move it within the secondary indexes
+        self.templates.refresh_entry(template_id)
         self._save_template(template)
         
-        # Update cache
-        self.template_cache[template_id] = template
-        
         logger.info(f"Updated template {template_id}")
         return True
     
@@ -301,14 +615,10 @@ class PromptTemplateSystem:
         if not template:
             return False
         
-        # Remove from memory
+        # Remove from memory and indexes
         if template_id in self.templates:
             del self.templates[template_id]
         
-        # Remove from cache
-        if template_id in self.template_cache:
-            del self.template_cache[template_id]
-        
         # Remove file
         template_file = self.templates_dir / f"{template_id}.json"
         if template_file.exists():
@@ -328,21 +638,15 @@ class PromptTemplateSystem:
         Returns:
             str: Rendered template
         """
-        template = self.get_template(template_id)
-        if not template:
+        if template_id not in self.templates and not self.get_template(template_id):
             raise ValueError(f"Template {template_id} not found")
         
-        context = context or {}
-        
-        # Simple template rendering with variable substitution
-        rendered = template.template_text
-        
-        # Replace variables in format {{variable_name}}
-        for key, value in context.items():
-            placeholder = f"{{{{{key}}}}}"
-            rendered = rendered.replace(placeholder, str(value))
-        
-        return rendered
+        # Replace variables in format {{variable_name}} using the compiled form
+        try:
+            compiled = self.templates.compiled(template_id)
+        except KeyError:
+            raise ValueError(f"Template {template_id} not found") from None
+        return compiled.render(context or {})
     
     def _generate_template_id(self, name: str, agent_type: str) -> str:
         """Generate a unique template ID."""
@@ -357,6 +661,7 @@ class PromptTemplateSystem:
         template_file = self.templates_dir / f"{template.template_id}.json"
         with open(template_file, 'w') as f:
             json.dump(template.to_dict(), f, indent=2)
+        self.templates.saved(template.template_id)
     
     def _load_template_file(self, template_id: str) -> Optional[PromptTemplate]:
         """Load template from file."""
@@ -373,15 +678,8 @@ class PromptTemplateSystem:
             return None
     
     def _load_templates(self):
-        """Load all templates from files."""
-        for template_file in self.templates_dir.glob("*.json"):
-            try:
-                template_id = template_file.stem
-                template = self._load_template_file(template_id)
-                if template:
-                    self.templates[template_id] = template
-            except Exception as e:
-                logger.error(f"Failed to load template from {template_file}: {e}")
+        """Re-scan the templates directory; templates are parsed lazily on access."""
+        self.templates = TemplateMap(self.templates_dir, self.validate_interval)
 
 
 # Global template system instance
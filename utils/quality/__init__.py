@@ -26,6 +26,8 @@ from .quality_assurance import (
 from .performance_optimizer import (
     PerformanceOptimizer,
     PerformanceMetrics,
+    OperationStats,
+    QuantileSketch,
     get_performance_optimizer,
     record_agent_performance,
     get_agent_performance_stats,
@@ -44,6 +46,8 @@ __all__ = [
     "get_quality_assurance_system",
     "PerformanceOptimizer",
     "PerformanceMetrics",
+    "OperationStats",
+    "QuantileSketch",
     "get_performance_optimizer",
     "record_agent_performance",
     "get_agent_performance_stats",
@@ -20,6 +20,8 @@ Features:
 - Zero tolerance policy implementation
 - Entropy prevention and order maintenance
 - Psychological environment management
+- Incremental scans: per-file results cached by path, mtime, size and
+  content hash; only changed files are re-read, in a process pool
 """
 
 import os
@@ -27,13 +29,45 @@ import re
 import sys
 import json
 import time
+import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Any, Dict, Iterable, List, Tuple, Optional, Set
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from enum import Enum
 
+SCAN_EXTENSIONS = ('.md', '.py', '.txt', '.rst', '.html', '.json', '.yaml', '.yml')
+STANDARD_UPPERCASE_FILES = ['README.md', 'LICENSE', 'Dockerfile', 'Makefile']
+EXTERNAL_LINK_PREFIXES = ('http://', 'https://', 'mailto:', '#')
+
+# Per-file scan results, persisted between runs
+SCAN_CACHE_FILE = ".broken_windows_cache.json"
+SCAN_CACHE_VERSION = 1
+
+# Placeholder content patterns that signal disorder
+PLACEHOLDER_PATTERNS = [
+    r'\bTODO\b',
+    r'\bFIXME\b',
+    r'\bHACK\b',
+    r'\bCOMING\s+SOON\b',
+    r'\bPLACEHOLDER\b',
+    r'\bTEMP\b',
+    r'\bNOT\s+IMPLEMENTED\b',
+    r'\bUNDER\s+CONSTRUCTION\b',
+    r'\.\.\.+',  # Multiple dots indicating incomplete content
+    r'\b(?:lorem|ipsum)\b',  # Lorem ipsum placeholder text
+]
+
+# Link patterns; the last group is the link target
+BROKEN_LINK_PATTERNS = [
+    r'\[([^\]]+)\]\(([^)]+)\)',  # Markdown links
+    r'\[([^\]]+)\]:\s*(.+)',    # Reference links
+    r'href=["\']([^"\']+)["\']', # HTML links
+]
+
 
 class DisorderType(Enum):
     """Types of disorder that signal broken windows."""
@@ -90,12 +124,196 @@ class OrderRestorationPlan:
     success_criteria: List[str]
 
 
+def _finding(disorder_type: DisorderType, severity: SeverityLevel, description: str, evidence: str,
+             impact_assessment: str, fix_estimate_hours: float, auto_fixable: bool) -> Dict[str, Any]:
+    """A disorder without timestamps, as plain data for the scan cache and process pool."""
+    return {
+        "disorder_type": disorder_type.value,
+        "severity": severity.value,
+        "description": description,
+        "evidence": evidence,
+        "impact_assessment": impact_assessment,
+        "fix_estimate_hours": fix_estimate_hours,
+        "auto_fixable": auto_fixable
+    }
+
+
+def scan_content(content: str, relative_path: str, placeholder_patterns: List[str],
+                 link_patterns: List[str]) -> Dict[str, Any]:
+    """
+    Run the detectors that only depend on one file's content and name.
+
+    Whether a link is broken depends on other files, so links are returned
+    as ``[text, target, evidence]`` and checked against the file system on
+    every run.
+    """
+    findings = []
+    links = []
+    
+    for pattern in link_patterns:
+        compiled = re.compile(pattern, re.IGNORECASE)
+        for match in compiled.finditer(content):
+            link_target = match.group(compiled.groups)
+            if not link_target.startswith(EXTERNAL_LINK_PREFIXES):
+                links.append([match.group(1), link_target, match.group(0)])
+    
+    # Placeholder content that signals incomplete work
+    for pattern in placeholder_patterns:
+        for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
+            # Get context around the match
+            start = max(0, match.start() - 50)
+            end = min(len(content), match.end() + 50)
+            context = content[start:end].replace('\n', ' ')
+            findings.append(_finding(
+                DisorderType.PLACEHOLDER_CONTENT, SeverityLevel.MEDIUM,
+                f"Placeholder content found: {match.group(0)}",
+                f"Context: ...{context}...",
+                "Placeholder content signals incomplete work and unprofessional appearance",
+                2.0, False
+            ))
+    
+    # Documents that appear incomplete or minimal
+    if relative_path.endswith('.md'):
+        word_count = len(content.split())
+        if word_count < 50:
+            lines = content.strip().split('\n')
+            findings.append(_finding(
+                DisorderType.INCOMPLETE_DOCUMENT, SeverityLevel.MEDIUM,
+                f"Document appears incomplete ({word_count} words, {len(lines)} lines)",
+                f"Content preview: {content[:200]}...",
+                "Incomplete documents provide poor user experience and signal low quality",
+                4.0, False
+            ))
+    
+    # Naming convention violations
+    filename = os.path.basename(relative_path)
+    violations = []
+    if ' ' in filename:
+        violations.append("Contains spaces")
+    if filename != filename.lower() and filename not in STANDARD_UPPERCASE_FILES:
+        violations.append("Non-standard capitalization")
+    if re.search(r'[^a-zA-Z0-9._-]', filename):
+        violations.append("Contains special characters")
+    for violation in violations:
+        findings.append(_finding(
+            DisorderType.NAMING_VIOLATION, SeverityLevel.LOW,
+            f"Naming violation: {violation}",
+            f"Filename: {filename}",
+            "Naming violations create inconsistency and break automation",
+            0.25, True
+        ))
+    
+    return {
+        "content_hash": hashlib.md5(content.encode()).hexdigest(),
+        "findings": findings,
+        "links": links
+    }
+
+
+def scan_file(absolute_path: str, relative_path: str, placeholder_patterns: List[str],
+              link_patterns: List[str]) -> Dict[str, Any]:
+    """Read a file once and scan it (process-pool entry point)."""
+    try:
+        with open(absolute_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        stat = os.stat(absolute_path)
+    except Exception as e:
+        return {"error": f"Error scanning {absolute_path}: {e}", "failed": True}
+    scan = scan_content(content, relative_path, placeholder_patterns, link_patterns)
+    scan["mtime_ns"] = stat.st_mtime_ns
+    scan["file_size"] = stat.st_size
+    return scan
+
+
+class DisorderScanCache:
+    """
+    Per-file scan results keyed by relative path and validated by (mtime,
+    size), then content hash. Results of other detector rules are discarded.
+    """
+    
+    def __init__(self, path: Optional[Path], rules: str):
+        self.path = Path(path) if path else None
+        self.rules = rules
+        self._scans: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == SCAN_CACHE_VERSION and data.get("rules") == rules:
+                    self._scans = data.get("files", {})
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"⚠️  Ignoring unreadable scan cache {self.path}: {e}")
+    
+    def __len__(self) -> int:
+        return len(self._scans)
+    
+    def lookup(self, relative_path: str, absolute_path: str) -> Optional[Dict[str, Any]]:
+        """Cached scan when the file is unchanged (stat first, then content hash)."""
+        cached = self._scans.get(relative_path)
+        if cached is None:
+            return None
+        try:
+            stat = os.stat(absolute_path)
+        except OSError:
+            return None
+        if stat.st_mtime_ns == cached.get("mtime_ns") and stat.st_size == cached.get("file_size"):
+            return cached
+        try:
+            with open(absolute_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError:
+            return None
+        if hashlib.md5(content.encode()).hexdigest() != cached.get("content_hash"):
+            return None
+        cached["mtime_ns"] = stat.st_mtime_ns
+        cached["file_size"] = stat.st_size
+        self._dirty = True
+        return cached
+    
+    def store(self, relative_path: str, scan: Dict[str, Any]) -> None:
+        if not scan.get("failed"):
+            self._scans[relative_path] = scan
+            self._dirty = True
+    
+    def retain(self, relative_paths: Iterable[str]) -> None:
+        """Drop entries of files that no longer exist."""
+        keep = set(relative_paths)
+        for relative_path in list(self._scans):
+            if relative_path not in keep:
+                del self._scans[relative_path]
+                self._dirty = True
+    
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        try:
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": SCAN_CACHE_VERSION, "rules": self.rules, "files": self._scans}, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"⚠️  Could not save scan cache {self.path}: {e}")
+
+
 class BrokenWindowsDetector:
     """
     Main detector implementing Broken Windows Theory for software systems.
     """
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", cache_path: Optional[str] = None,
+                 max_workers: Optional[int] = None, parallel_threshold: int = 64):
+        """
+        Initialize detector.
+        
+        Args:
+            project_root: Root directory to scan
+            cache_path: JSON file persisting per-file scans between runs
+                (default: ``.broken_windows_cache.json`` in the project root)
+            max_workers: Process pool size for scanning changed files (1 disables the pool)
+            parallel_threshold: Minimum number of changed files worth a process pool
+        """
         self.project_root = Path(project_root).resolve()
         self.disorders: List[DisorderSignal] = []
         
@@ -108,41 +326,62 @@ class BrokenWindowsDetector:
         }
         
         # Placeholder content patterns that signal disorder
-        self.placeholder_patterns = [
-            r'\bTODO\b',
-            r'\bFIXME\b',
-            r'\bHACK\b',
-            r'\bCOMING\s+SOON\b',
-            r'\bPLACEHOLDER\b',
-            r'\bTEMP\b',
-            r'\bNOT\s+IMPLEMENTED\b',
-            r'\bUNDER\s+CONSTRUCTION\b',
-            r'\.\.\.+',  # Multiple dots indicating incomplete content
-            r'\b(?:lorem|ipsum)\b',  # Lorem ipsum placeholder text
-        ]
+        self.placeholder_patterns = list(PLACEHOLDER_PATTERNS)
         
         # Broken link patterns
-        self.broken_link_patterns = [
-            r'\[([^\]]+)\]\(([^)]+)\)',  # Markdown links
-            r'\[([^\]]+)\]:\s*(.+)',    # Reference links
-            r'href=["\']([^"\']+)["\']', # HTML links
-        ]
+        self.broken_link_patterns = list(BROKEN_LINK_PATTERNS)
+        
+        # Incremental scanning
+        self.cache_path = Path(cache_path) if cache_path else self.project_root / SCAN_CACHE_FILE
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self.last_scan_stats: Dict[str, int] = {}
+        self._scan_cache: Optional[DisorderScanCache] = None
+        # Link target existence, valid for one detection run only
+        self._link_target_exists: Dict[str, bool] = {}
     
     def detect_all_disorders(self) -> List[DisorderSignal]:
         """
         Comprehensive disorder detection across the entire system.
+        
+        Unchanged files come from the scan cache; links are re-checked on
+        every run, since their targets may have been created or deleted.
         """
         print("🔍 Scanning for broken windows and disorder signals...")
         self.disorders = []
-        
-        for root, dirs, files in os.walk(self.project_root):
-            # Skip hidden and cache directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
-            
-            for file in files:
-                if self._should_scan_file(file):
-                    file_path = Path(root) / file
-                    self._scan_file_for_disorders(file_path)
+        self._link_target_exists = {}
+        
+        files = self._collect_files()
+        scan_cache = self._get_scan_cache()
+        scan_cache.retain(files)
+        
+        # Only new or changed files are scanned; the rest come from the cache
+        scans: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        for relative_path, absolute_path in files.items():
+            cached = scan_cache.lookup(relative_path, absolute_path)
+            if cached is not None:
+                scans[relative_path] = cached
+            else:
+                pending.append((absolute_path, relative_path))
+        
+        self.last_scan_stats = {"files": len(files), "scanned": len(pending),
+                                "cached": len(files) - len(pending)}
+        print(f"   📂 {len(files)} files: {len(pending)} scanned, {len(files) - len(pending)} from cache")
+        
+        for relative_path, scan in self._scan_files(pending):
+            if scan.get("failed"):
+                print(f"⚠️  {scan['error']}")
+                continue
+            scan_cache.store(relative_path, scan)
+            scans[relative_path] = scan
+        scan_cache.save()
+        
+        deadlines = {severity: self._calculate_sla_deadline(severity) for severity in SeverityLevel}
+        detected_timestamp = datetime.now().isoformat()
+        for relative_path in files:
+            if relative_path in scans:
+                self._add_scan_disorders(relative_path, scans[relative_path], detected_timestamp, deadlines)
         
         # Sort by severity and then by SLA deadline
         self.disorders.sort(key=lambda d: (d.severity.value, d.sla_deadline))
@@ -151,154 +390,121 @@ class BrokenWindowsDetector:
     
     def _should_scan_file(self, filename: str) -> bool:
         """Determine if file should be scanned for disorders."""
-        scan_extensions = {'.md', '.py', '.txt', '.rst', '.html', '.json', '.yaml', '.yml'}
-        return any(filename.endswith(ext) for ext in scan_extensions)
+        return filename.endswith(SCAN_EXTENSIONS)
+    
+    def _collect_files(self) -> Dict[str, str]:
+        """Relative path -> absolute path of every file to scan, in walk order."""
+        cache_file = str(self.cache_path.resolve())
+        prefix_length = len(str(self.project_root)) + 1
+        files: Dict[str, str] = {}
+        for root, dirs, filenames in os.walk(self.project_root):
+            # Skip hidden and cache directories
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
+            relative_root = root[prefix_length:]
+            
+            for file in filenames:
+                if self._should_scan_file(file):
+                    absolute_path = os.path.join(root, file)
+                    if absolute_path == cache_file:
+                        continue  # The scan cache itself changes on every run
+                    files[os.path.join(relative_root, file)] = absolute_path
+        return files
+    
+    def _get_scan_cache(self) -> DisorderScanCache:
+        """Scan cache for the current detector rules (patterns may be changed after init)."""
+        rules = hashlib.md5(json.dumps(
+            [SCAN_CACHE_VERSION, self.placeholder_patterns, self.broken_link_patterns, list(SCAN_EXTENSIONS)]
+        ).encode()).hexdigest()
+        if self._scan_cache is None or self._scan_cache.rules != rules:
+            self._scan_cache = DisorderScanCache(self.cache_path, rules)
+        return self._scan_cache
+    
+    def _scan_files(self, pending: List[Tuple[str, str]]):
+        """Scan changed files, in a process pool when there are enough of them."""
+        patterns = (self.placeholder_patterns, self.broken_link_patterns)
+        if len(pending) < self.parallel_threshold or self.max_workers == 1:
+            for absolute_path, relative_path in pending:
+                yield relative_path, scan_file(absolute_path, relative_path, *patterns)
+            return
+        
+        absolute_paths = [absolute for absolute, _ in pending]
+        relative_paths = [relative for _, relative in pending]
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                chunksize = max(1, len(pending) // ((self.max_workers or os.cpu_count() or 1) * 4))
+                results = list(executor.map(scan_file, absolute_paths, relative_paths,
+                                            repeat(patterns[0]), repeat(patterns[1]), chunksize=chunksize))
+        except (OSError, RuntimeError) as e:
+            print(f"⚠️  Process pool unavailable ({e}), scanning serially")
+            results = [scan_file(absolute, relative, *patterns) for absolute, relative in pending]
+        
+        yield from zip(relative_paths, results)
     
     def _scan_file_for_disorders(self, file_path: Path) -> None:
         """Scan individual file for all types of disorders."""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            rel_path = file_path.relative_to(self.project_root)
-            
-            # Detect different types of disorders
-            self._detect_broken_links(rel_path, content)
-            self._detect_placeholder_content(rel_path, content)
-            self._detect_incomplete_documents(rel_path, content)
-            self._detect_naming_violations(rel_path)
-            self._detect_orphaned_files(rel_path, content)
-            
-        except Exception as e:
-            print(f"⚠️  Error scanning {file_path}: {e}")
-    
-    def _detect_broken_links(self, file_path: Path, content: str) -> None:
-        """Detect broken hyperlinks and references."""
-        for pattern in self.broken_link_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                link_text = match.group(1)
-                link_target = match.group(2)
-                
-                # Check if link target exists
-                if self._is_broken_link(file_path, link_target):
-                    disorder = DisorderSignal(
-                        file_path=str(file_path),
-                        disorder_type=DisorderType.BROKEN_LINK,
-                        severity=SeverityLevel.HIGH,
-                        description=f"Broken link: '{link_text}' → '{link_target}'",
-                        evidence=match.group(0),
-                        impact_assessment="Broken navigation affects user experience and credibility",
-                        fix_estimate_hours=0.5,
-                        auto_fixable=True,
-                        detected_timestamp=datetime.now().isoformat(),
-                        sla_deadline=self._calculate_sla_deadline(SeverityLevel.HIGH)
-                    )
-                    self.disorders.append(disorder)
+        relative_path = str(file_path.relative_to(self.project_root))
+        scan = scan_file(str(file_path), relative_path, self.placeholder_patterns, self.broken_link_patterns)
+        if scan.get("failed"):
+            print(f"⚠️  {scan['error']}")
+            return
+        deadlines = {severity: self._calculate_sla_deadline(severity) for severity in SeverityLevel}
+        self._add_scan_disorders(relative_path, scan, datetime.now().isoformat(), deadlines)
+    
+    def _add_scan_disorders(self, relative_path: str, scan: Dict[str, Any], detected_timestamp: str,
+                            deadlines: Dict[SeverityLevel, str]) -> None:
+        """Turn one file's scan into disorder signals, checking its links now."""
+        file_path = Path(relative_path)
+        for link_text, link_target, evidence in scan["links"]:
+            if self._is_broken_link(file_path, link_target):
+                self.disorders.append(DisorderSignal(
+                    file_path=relative_path,
+                    disorder_type=DisorderType.BROKEN_LINK,
+                    severity=SeverityLevel.HIGH,
+                    description=f"Broken link: '{link_text}' → '{link_target}'",
+                    evidence=evidence,
+                    impact_assessment="Broken navigation affects user experience and credibility",
+                    fix_estimate_hours=0.5,
+                    auto_fixable=True,
+                    detected_timestamp=detected_timestamp,
+                    sla_deadline=deadlines[SeverityLevel.HIGH]
+                ))
+        
+        for finding in scan["findings"]:
+            severity = SeverityLevel(finding["severity"])
+            self.disorders.append(DisorderSignal(
+                file_path=relative_path,
+                disorder_type=DisorderType(finding["disorder_type"]),
+                severity=severity,
+                description=finding["description"],
+                evidence=finding["evidence"],
+                impact_assessment=finding["impact_assessment"],
+                fix_estimate_hours=finding["fix_estimate_hours"],
+                auto_fixable=finding["auto_fixable"],
+                detected_timestamp=detected_timestamp,
+                sla_deadline=deadlines[severity]
+            ))
     
     def _is_broken_link(self, file_path: Path, link_target: str) -> bool:
         """Check if a link target is broken."""
         # Skip external URLs and anchors
-        if link_target.startswith(('http://', 'https://', 'mailto:', '#')):
+        if link_target.startswith(EXTERNAL_LINK_PREFIXES):
             return False
         
-        # Resolve relative path
+        # Resolve relative path (against the project root, not the working directory)
         if link_target.startswith('/'):
-            target_path = self.project_root / link_target.lstrip('/')
+            target = link_target.lstrip('/')
         else:
-            target_path = file_path.parent / link_target
+            target = os.path.join(str(file_path.parent), link_target)
         
         # Remove URL fragments and query parameters
-        target_path = Path(str(target_path).split('#')[0].split('?')[0])
-        
-        return not target_path.exists()
-    
-    def _detect_placeholder_content(self, file_path: Path, content: str) -> None:
-        """Detect placeholder content that signals incomplete work."""
-        for pattern in self.placeholder_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
-                # Get context around the match
-                start = max(0, match.start() - 50)
-                end = min(len(content), match.end() + 50)
-                context = content[start:end].replace('\n', ' ')
-                
-                disorder = DisorderSignal(
-                    file_path=str(file_path),
-                    disorder_type=DisorderType.PLACEHOLDER_CONTENT,
-                    severity=SeverityLevel.MEDIUM,
-                    description=f"Placeholder content found: {match.group(0)}",
-                    evidence=f"Context: ...{context}...",
-                    impact_assessment="Placeholder content signals incomplete work and unprofessional appearance",
-                    fix_estimate_hours=2.0,
-                    auto_fixable=False,
-                    detected_timestamp=datetime.now().isoformat(),
-                    sla_deadline=self._calculate_sla_deadline(SeverityLevel.MEDIUM)
-                )
-                self.disorders.append(disorder)
-    
-    def _detect_incomplete_documents(self, file_path: Path, content: str) -> None:
-        """Detect documents that appear incomplete or minimal."""
-        lines = content.strip().split('\n')
-        word_count = len(content.split())
-        
-        # Check for minimal content
-        if file_path.suffix == '.md' and word_count < 50:
-            disorder = DisorderSignal(
-                file_path=str(file_path),
-                disorder_type=DisorderType.INCOMPLETE_DOCUMENT,
-                severity=SeverityLevel.MEDIUM,
-                description=f"Document appears incomplete ({word_count} words, {len(lines)} lines)",
-                evidence=f"Content preview: {content[:200]}...",
-                impact_assessment="Incomplete documents provide poor user experience and signal low quality",
-                fix_estimate_hours=4.0,
-                auto_fixable=False,
-                detected_timestamp=datetime.now().isoformat(),
-                sla_deadline=self._calculate_sla_deadline(SeverityLevel.MEDIUM)
-            )
-            self.disorders.append(disorder)
-    
-    def _detect_naming_violations(self, file_path: Path) -> None:
-        """Detect naming convention violations."""
-        filename = file_path.name
-        
-        # Check for common naming violations
-        violations = []
-        
-        # Check for spaces in filenames
-        if ' ' in filename:
-            violations.append("Contains spaces")
-        
-        # Check for uppercase in non-standard files
-        if filename != filename.lower() and not self._is_standard_uppercase_file(filename):
-            violations.append("Non-standard capitalization")
-        
-        # Check for special characters
-        if re.search(r'[^a-zA-Z0-9._-]', filename):
-            violations.append("Contains special characters")
-        
-        for violation in violations:
-            disorder = DisorderSignal(
-                file_path=str(file_path),
-                disorder_type=DisorderType.NAMING_VIOLATION,
-                severity=SeverityLevel.LOW,
-                description=f"Naming violation: {violation}",
-                evidence=f"Filename: {filename}",
-                impact_assessment="Naming violations create inconsistency and break automation",
-                fix_estimate_hours=0.25,
-                auto_fixable=True,
-                detected_timestamp=datetime.now().isoformat(),
-                sla_deadline=self._calculate_sla_deadline(SeverityLevel.LOW)
-            )
-            self.disorders.append(disorder)
-    
-    def _is_standard_uppercase_file(self, filename: str) -> bool:
-        """Check if file follows standard uppercase conventions."""
-        uppercase_standards = ['README.md', 'LICENSE', 'Dockerfile', 'Makefile']
-        return filename in uppercase_standards
-    
-    def _detect_orphaned_files(self, file_path: Path, content: str) -> None:
-        """Detect files that may be orphaned or unreferenced."""
-        # This is a simplified check - in practice, would need comprehensive reference analysis
-        pass
+        target = target.split('#')[0].split('?')[0]
+        target_path = os.path.normpath(os.path.join(self.project_root, target))
+        
+        # Existence is memoized for this run only, so created or deleted targets are seen next run
+        exists = self._link_target_exists.get(target_path)
+        if exists is None:
+            exists = self._link_target_exists[target_path] = os.path.exists(target_path)
+        return not exists
     
     def _calculate_sla_deadline(self, severity: SeverityLevel) -> str:
         """Calculate SLA deadline based on severity."""
@@ -507,13 +713,15 @@ Examples:
                        help='Generate comprehensive disorder report')
     parser.add_argument('--json-output',
                        help='Save JSON report to file')
+    parser.add_argument('--workers', type=int,
+                       help='Processes for scanning changed files (default: CPU count)')
     
     args = parser.parse_args()
     
     if not (args.scan or args.monitor):
         parser.error("Must specify either --scan or --monitor")
     
-    detector = BrokenWindowsDetector(args.root)
+    detector = BrokenWindowsDetector(args.root, max_workers=args.workers)
     
     def run_detection():
         """Run disorder detection and reporting."""
@@ -5,15 +5,22 @@ Performance Optimization Module
 Provides performance monitoring, optimization utilities, and metrics recording
 for AI agent operations.
 
+Statistics are aggregated as they are recorded, in fixed memory: per
+(agent_type, operation) counters, Welford mean and variance, min/max and a
+log-bucketed quantile sketch for p50/p95/p99. Only the most recent raw
+samples are kept, in a ring buffer.
+
 Author: AI-Dev-Agent System
 Version: 1.0
 Last Updated: Current Session
 """
 
 import logging
+import math
 import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
@@ -34,12 +41,132 @@ class PerformanceMetrics:
     additional_metrics: Dict[str, Any] = field(default_factory=dict)
 
 
+class QuantileSketch:
+    """
+    Fixed-memory quantile estimates with bounded relative error.
+    
+    Values are counted in logarithmic buckets, so any quantile is within
+    ``relative_accuracy`` of the exact value. Sketches merge by adding
+    bucket counts. Beyond ``max_buckets`` the lowest buckets are collapsed,
+    which only affects the smallest values.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048,
+                 min_value: float = 1e-9):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+    
+    def add(self, value: float) -> None:
+        """Count one value."""
+        self.count += 1
+        if value <= self.min_value:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse()
+    
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add another sketch's counts (same relative accuracy)."""
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for index, bucket_count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + bucket_count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+    
+    def quantile(self, q: float) -> float:
+        """Estimated value at quantile ``q`` (0..1); 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+    
+    def _collapse(self) -> None:
+        """Fold the lowest buckets into one to stay within max_buckets."""
+        indexes = sorted(self.buckets)
+        excess = len(indexes) - self.max_buckets
+        folded = sum(self.buckets.pop(index) for index in indexes[:excess + 1])
+        self.buckets[indexes[excess]] = folded
+
+
+@dataclass
+class OperationStats:
+    """Running statistics of one (agent_type, operation) pair."""
+    count: int = 0
+    successful: int = 0
+    threshold_violations: int = 0
+    mean: float = 0.0
+    m2: float = 0.0  # Sum of squared deviations from the mean (Welford)
+    min_time: float = math.inf
+    max_time: float = -math.inf
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    
+    def add(self, execution_time: float, success: bool, violation: bool) -> None:
+        """Account for one operation."""
+        self.count += 1
+        if success:
+            self.successful += 1
+        if violation:
+            self.threshold_violations += 1
+        delta = execution_time - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (execution_time - self.mean)
+        if execution_time < self.min_time:
+            self.min_time = execution_time
+        if execution_time > self.max_time:
+            self.max_time = execution_time
+        self.sketch.add(execution_time)
+    
+    def merge(self, other: "OperationStats") -> None:
+        """Combine with another pair's statistics (Chan et al. parallel variance)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.successful += other.successful
+        self.threshold_violations += other.threshold_violations
+        self.min_time = min(self.min_time, other.min_time)
+        self.max_time = max(self.max_time, other.max_time)
+        self.sketch.merge(other.sketch)
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of the execution times."""
+        return self.m2 / self.count if self.count else 0.0
+
+
 class PerformanceOptimizer:
     """Performance optimization and monitoring system."""
     
-    def __init__(self):
-        """Initialize the performance optimizer."""
-        self.performance_history: List[PerformanceMetrics] = []
+    def __init__(self, history_size: int = 1000):
+        """
+        Initialize the performance optimizer.
+        
+        Args:
+            history_size: Number of recent raw samples kept for export
+        """
+        # Recent raw samples only; statistics cover every recorded operation
+        self.performance_history: Deque[PerformanceMetrics] = deque(maxlen=history_size)
+        self.operation_stats: Dict[Tuple[str, str], OperationStats] = {}
         self.optimization_settings = self._init_optimization_settings()
         
         logger.info("Performance Optimizer initialized")
@@ -87,14 +214,21 @@ class PerformanceOptimizer:
             
             self.performance_history.append(metrics)
             
+            violation = execution_time > self.optimization_settings["timeout_seconds"]
+            key = (agent_type, operation)
+            stats = self.operation_stats.get(key)
+            if stats is None:
+                stats = self.operation_stats[key] = OperationStats()
+            stats.add(execution_time, success, violation)
+            
             # Log performance issues
-            if execution_time > self.optimization_settings["timeout_seconds"]:
+            if violation:
                 logger.warning(f"Slow operation detected: {agent_type}.{operation} took {execution_time:.2f}s")
             
             if not success:
                 logger.error(f"Failed operation: {agent_type}.{operation} - {error_message}")
             
-            logger.debug(f"Recorded performance for {agent_type}.{operation}: {execution_time:.2f}s")
+            logger.debug("Recorded performance for %s.%s: %.2fs", agent_type, operation, execution_time)
             return True
             
         except Exception as e:
@@ -113,16 +247,16 @@ class PerformanceOptimizer:
         Returns:
             Dict containing performance statistics
         """
-        # Filter metrics
-        filtered_metrics = self.performance_history
-        
-        if agent_type:
-            filtered_metrics = [m for m in filtered_metrics if m.agent_type == agent_type]
+        # Merge the running statistics of the matching pairs
+        combined = OperationStats()
+        for (stats_agent_type, stats_operation), stats in self.operation_stats.items():
+            if agent_type and stats_agent_type != agent_type:
+                continue
+            if operation and stats_operation != operation:
+                continue
+            combined.merge(stats)
         
-        if operation:
-            filtered_metrics = [m for m in filtered_metrics if m.operation == operation]
-        
-        if not filtered_metrics:
+        if combined.count == 0:
             return {
                 "total_operations": 0,
                 "success_rate": 0.0,
@@ -130,29 +264,25 @@ class PerformanceOptimizer:
             }
         
         # Calculate statistics
-        total_operations = len(filtered_metrics)
-        successful_operations = len([m for m in filtered_metrics if m.success])
+        total_operations = combined.count
+        successful_operations = combined.successful
         failed_operations = total_operations - successful_operations
         
         success_rate = (successful_operations / total_operations) * 100
         
-        execution_times = [m.execution_time for m in filtered_metrics]
-        average_execution_time = sum(execution_times) / len(execution_times)
-        min_execution_time = min(execution_times)
-        max_execution_time = max(execution_times)
-        
         return {
             "total_operations": total_operations,
             "successful_operations": successful_operations,
             "failed_operations": failed_operations,
             "success_rate": success_rate,
-            "average_execution_time": average_execution_time,
-            "min_execution_time": min_execution_time,
-            "max_execution_time": max_execution_time,
-            "performance_threshold_violations": len([
-                m for m in filtered_metrics 
-                if m.execution_time > self.optimization_settings["timeout_seconds"]
-            ])
+            "average_execution_time": combined.mean,
+            "min_execution_time": combined.min_time,
+            "max_execution_time": combined.max_time,
+            "execution_time_stddev": math.sqrt(combined.variance),
+            "p50_execution_time": combined.sketch.quantile(0.50),
+            "p95_execution_time": combined.sketch.quantile(0.95),
+            "p99_execution_time": combined.sketch.quantile(0.99),
+            "performance_threshold_violations": combined.threshold_violations
         }
     
     def get_optimization_recommendations(self, agent_type: str) -> List[str]:
@@ -232,13 +362,14 @@ class PerformanceOptimizer:
         return optimized_settings
     
     def clear_history(self):
-        """Clear performance history."""
+        """Clear performance history and statistics."""
         self.performance_history.clear()
+        self.operation_stats.clear()
         logger.info("Performance history cleared")
     
     def export_metrics(self, format: str = "json") -> str:
         """
-        Export performance metrics.
+        Export the recent raw performance samples.
         
         Args:
             format: Export format ('json' or 'csv')
@@ -9,6 +9,9 @@ Utilities for RAG (Retrieval-Augmented Generation) system including:
 - Progress tracking
 - Adaptive chunk retrieval
 - Query analysis
+- Per-document catalog of vector store collections
+- Headless golden dataset evaluation of the RAG swarm
+- Durable node checkpoints for RAG swarm threads
 
 All built on LangChain for maximum compatibility and robustness.
 """
@@ -16,6 +19,9 @@ All built on LangChain for maximum compatibility and robustness.
 # Import core components (always available)
 from .query_analyzer import QueryAnalyzer, QueryAnalysis
 from .adaptive_retrieval_strategy import AdaptiveRetrievalStrategy, RetrievalContext
+from .document_catalog import DocumentCatalog, CatalogEntry, entries_from_documents
+from .golden_evaluation import GoldenEvaluator, GoldenQuery, GoldenResult, FixtureStore
+from .swarm_checkpoint_store import SwarmCheckpointStore
 
 # Import document loader conditionally (requires langchain-community)
 try:
@@ -46,5 +52,13 @@ __all__ = [
     'QueryAnalysis',
     'AdaptiveRetrievalStrategy',
     'RetrievalContext',
+    'DocumentCatalog',
+    'CatalogEntry',
+    'entries_from_documents',
+    'GoldenEvaluator',
+    'GoldenQuery',
+    'GoldenResult',
+    'FixtureStore',
+    'SwarmCheckpointStore',
     'DOCUMENT_LOADER_AVAILABLE'
 ]
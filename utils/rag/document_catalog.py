@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+RAG Document Catalog
+====================
+
+Persistent per-document sidecar for a vector store collection.
+
+Listing documents used to mean scrolling every point of the Qdrant collection
+with its full payload and grouping chunks by source - O(total chunks) network
+and memory on every refresh. The catalog keeps one row per source document
+(chunk count, content hash, size, timestamps) in SQLite, so the document list
+is a keyset-paginated index scan independent of the number of chunks.
+
+Consistency with the vector store:
+- ``ingesting()`` registers new sources as pending, and commits chunk counts
+  in one transaction only after the vector store write succeeded
+- ``deleting()`` marks the source, removes the row only after the vector
+  store delete succeeded and restores it otherwise
+- rows left pending by a crash are reported by ``pending()``; ``rebuild()``
+  re-derives the catalog from collection payloads in one transaction
+
+Database Location: data/rag_document_catalog.db
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_INDEXED = "indexed"
+STATUS_INGESTING = "ingesting"
+STATUS_DELETING = "deleting"
+
+_COLUMNS = ("source, file_type, chunk_count, content_hash, size_bytes, "
+            "status, created_at, updated_at")
+
+
+@dataclass
+class CatalogEntry:
+    """One source document of a collection."""
+    source: str
+    file_type: str
+    chunk_count: int
+    content_hash: Optional[str] = None
+    size_bytes: int = 0
+    status: str = STATUS_INDEXED
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    def to_document_info(self) -> Dict[str, Any]:
+        """Dict in the shape the RAG management UI renders."""
+        info = asdict(self)
+        info['file_name'] = self.source
+        info['success'] = True
+        return info
+
+
+def infer_file_type(source: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+    """File type from chunk metadata, falling back to the source name."""
+    metadata = metadata or {}
+    file_type = metadata.get('file_type')
+    if file_type:
+        return file_type
+    if metadata.get('source_type') == 'web' or source.startswith(('http://', 'https://')):
+        return 'website'
+    if '.' in source:
+        return source.rsplit('.', 1)[-1]
+    return 'unknown'
+
+
+def source_of(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Source key of a chunk (``metadata.source`` or ``metadata.file_path``)."""
+    if not metadata:
+        return None
+    return metadata.get('source') or metadata.get('file_path')
+
+
+def entries_from_documents(documents: Iterable[Any],
+                           sizes: Optional[Dict[str, int]] = None) -> List[CatalogEntry]:
+    """
+    Group LangChain chunks by source into catalog entries.
+
+    Args:
+        documents: Chunks with ``page_content`` and ``metadata``
+        sizes: Optional original file size per source; defaults to the UTF-8
+            size of the chunk texts
+
+    Returns:
+        One entry per source, in first-seen order
+    """
+    grouped: Dict[str, Dict[str, Any]] = {}
+    for document in documents:
+        metadata = getattr(document, 'metadata', None) or {}
+        source = source_of(metadata)
+        if not source:
+            continue
+        group = grouped.get(source)
+        if group is None:
+            group = grouped[source] = {
+                'file_type': infer_file_type(source, metadata),
+                'chunks': 0,
+                'hash': hashlib.sha256(),
+                'size': 0,
+            }
+        content = (getattr(document, 'page_content', '') or '').encode('utf-8')
+        group['chunks'] += 1
+        group['hash'].update(content)
+        group['size'] += len(content)
+
+    sizes = sizes or {}
+    return [
+        CatalogEntry(
+            source=source,
+            file_type=group['file_type'],
+            chunk_count=group['chunks'],
+            content_hash=group['hash'].hexdigest(),
+            size_bytes=sizes.get(source, group['size']),
+        )
+        for source, group in grouped.items()
+    ]
+
+
+class DocumentCatalog:
+    """SQLite-backed per-document catalog of one vector store collection."""
+
+    def __init__(self, collection: str, db_path: str = "data/rag_document_catalog.db"):
+        """
+        Initialize catalog.
+
+        Args:
+            collection: Vector store collection the catalog describes
+            db_path: Path to SQLite database (shared by all collections)
+        """
+        self.collection = collection
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_database()
+
+    def _init_database(self):
+        """Initialize database schema."""
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS catalog_documents (
+                    collection TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    file_type TEXT NOT NULL,
+                    chunk_count INTEGER NOT NULL,
+                    content_hash TEXT,
+                    size_bytes INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (collection, source)
+                )
+            """)
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_catalog_type
+                ON catalog_documents(collection, file_type, source)
+            """)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _row_to_entry(row: Tuple) -> CatalogEntry:
+        return CatalogEntry(*row)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record_ingest(self, entries: Iterable[CatalogEntry]):
+        """
+        Add ingested chunks in one transaction.
+
+        Re-ingesting an existing source adds to its chunk count and replaces
+        hash and size.
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (self.collection, e.source, e.file_type, e.chunk_count, e.content_hash,
+             e.size_bytes, STATUS_INDEXED, now, now)
+            for e in entries
+        ]
+        with self._transaction() as conn:
+            # Pending rows inserted by ingesting() hold no chunks yet
+            conn.executemany("""
+                INSERT INTO catalog_documents
+                (collection, source, file_type, chunk_count, content_hash, size_bytes,
+                 status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(collection, source) DO UPDATE SET
+                    file_type = excluded.file_type,
+                    chunk_count = catalog_documents.chunk_count + excluded.chunk_count,
+                    content_hash = excluded.content_hash,
+                    size_bytes = excluded.size_bytes,
+                    status = excluded.status,
+                    updated_at = excluded.updated_at
+            """, rows)
+        logger.debug(f"Catalog recorded {len(rows)} document(s) in {self.collection}")
+
+    @contextmanager
+    def ingesting(self, entries: List[CatalogEntry]):
+        """
+        Wrap a vector store write of ``entries``.
+
+        New sources are visible as pending while the block runs; chunk counts
+        are committed only when it succeeds, and pending rows are removed if
+        it raises.
+        """
+        now = datetime.now().isoformat()
+        with self._transaction() as conn:
+            conn.executemany("""
+                INSERT OR IGNORE INTO catalog_documents
+                (collection, source, file_type, chunk_count, content_hash, size_bytes,
+                 status, created_at, updated_at)
+                VALUES (?, ?, ?, 0, NULL, 0, ?, ?, ?)
+            """, [(self.collection, e.source, e.file_type, STATUS_INGESTING, now, now)
+                  for e in entries])
+        try:
+            yield
+        except BaseException:
+            with self._transaction() as conn:
+                conn.executemany("""
+                    DELETE FROM catalog_documents
+                    WHERE collection = ? AND source = ? AND status = ?
+                """, [(self.collection, e.source, STATUS_INGESTING) for e in entries])
+            raise
+        self.record_ingest(entries)
+
+    @contextmanager
+    def deleting(self, source: str):
+        """
+        Wrap a vector store delete of ``source``.
+
+        The row is removed when the block succeeds and restored if it raises.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT status FROM catalog_documents WHERE collection = ? AND source = ?",
+                (self.collection, source)
+            ).fetchone()
+            conn.execute(
+                "UPDATE catalog_documents SET status = ? WHERE collection = ? AND source = ?",
+                (STATUS_DELETING, self.collection, source)
+            )
+        try:
+            yield
+        except BaseException:
+            if row is not None:
+                with self._transaction() as conn:
+                    conn.execute(
+                        "UPDATE catalog_documents SET status = ? WHERE collection = ? AND source = ?",
+                        (row[0], self.collection, source)
+                    )
+            raise
+        self.remove(source)
+
+    def remove(self, source: str) -> bool:
+        """Remove one source; returns True if it was catalogued."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM catalog_documents WHERE collection = ? AND source = ?",
+                (self.collection, source)
+            )
+            return cursor.rowcount > 0
+
+    def clear(self):
+        """Remove every document of the collection."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM catalog_documents WHERE collection = ?", (self.collection,))
+
+    def rebuild(self, payloads: Iterable[Optional[Dict[str, Any]]]) -> int:
+        """
+        Replace the catalog with one derived from chunk payloads.
+
+        Args:
+            payloads: Point payloads of the collection (``{"metadata": {...}}``
+                or flat metadata), streamed page by page
+
+        Returns:
+            Number of documents catalogued
+        """
+        counts: Dict[str, List] = {}
+        for payload in payloads:
+            if not payload:
+                continue
+            metadata = payload.get('metadata') if 'metadata' in payload else payload
+            source = source_of(metadata)
+            if not source:
+                continue
+            entry = counts.get(source)
+            if entry is None:
+                counts[source] = [infer_file_type(source, metadata), 1]
+            else:
+                entry[1] += 1
+
+        now = datetime.now().isoformat()
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM catalog_documents WHERE collection = ?", (self.collection,))
+            conn.executemany("""
+                INSERT INTO catalog_documents
+                (collection, source, file_type, chunk_count, content_hash, size_bytes,
+                 status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, NULL, 0, ?, ?, ?)
+            """, [(self.collection, source, file_type, chunks, STATUS_INDEXED, now, now)
+                  for source, (file_type, chunks) in counts.items()])
+        logger.info(f"📚 Catalog rebuilt for {self.collection}: {len(counts)} documents")
+        return len(counts)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, source: str) -> Optional[CatalogEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM catalog_documents WHERE collection = ? AND source = ?",
+                (self.collection, source)
+            ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def contains(self, source: str) -> bool:
+        entry = self.get(source)
+        return entry is not None and entry.status != STATUS_DELETING
+
+    def page(self, limit: int = 50, after: Optional[str] = None,
+             file_type: Optional[str] = None) -> Tuple[List[CatalogEntry], Optional[str]]:
+        """
+        One page of indexed documents ordered by source.
+
+        Args:
+            limit: Page size
+            after: Cursor returned by the previous page
+            file_type: Only documents of this type (e.g. ``"website"``)
+
+        Returns:
+            (entries, next cursor or None on the last page)
+        """
+        query = f"SELECT {_COLUMNS} FROM catalog_documents WHERE collection = ? AND status = ?"
+        params: List[Any] = [self.collection, STATUS_INDEXED]
+        if file_type is not None:
+            query += " AND file_type = ?"
+            params.append(file_type)
+        if after is not None:
+            query += " AND source > ?"
+            params.append(after)
+        query += " ORDER BY source LIMIT ?"
+        params.append(limit + 1)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        entries = [self._row_to_entry(row) for row in rows[:limit]]
+        next_cursor = entries[-1].source if len(rows) > limit else None
+        return entries, next_cursor
+
+    def list_documents(self, file_type: Optional[str] = None) -> List[CatalogEntry]:
+        """All indexed documents (one row per document, not per chunk)."""
+        entries: List[CatalogEntry] = []
+        cursor = None
+        while True:
+            page, cursor = self.page(limit=1000, after=cursor, file_type=file_type)
+            entries.extend(page)
+            if cursor is None:
+                return entries
+
+    def pending(self) -> List[CatalogEntry]:
+        """Documents left mid-ingest or mid-delete (e.g. by a crash)."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM catalog_documents WHERE collection = ? AND status != ?",
+                (self.collection, STATUS_INDEXED)
+            ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Document, chunk and byte totals of the collection."""
+        with self._lock:
+            row = self._conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(chunk_count), 0), COALESCE(SUM(size_bytes), 0)
+                FROM catalog_documents WHERE collection = ? AND status = ?
+            """, (self.collection, STATUS_INDEXED)).fetchone()
+        return {"documents": row[0], "chunks": row[1], "size_bytes": row[2]}
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM catalog_documents WHERE collection = ? LIMIT 1",
+                (self.collection,)
+            ).fetchone()
+        return row is None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+"""
+Golden Evaluation - Headless RAG Swarm Evaluation Runner
+========================================================
+
+Runs a golden dataset of queries through ``RAGSwarmCoordinator.execute``
+outside of Streamlit, as a library or from the command line.
+
+Features:
+- Bounded concurrency (each query runs on its own worker thread/event loop)
+- Record/replay fixtures for LLM and retrieval calls, so a recorded run can
+  be replayed offline without API keys or a vector store
+- Per-stage latency breakdown (analysis, retrieval, grading, rerank, writing, ...)
+- Aggregate p50/p95 latencies and answer quality metrics
+- Results streamed to JSONL, one line per query plus a summary line
+
+Usage:
+    python -m utils.rag.golden_evaluation golden.jsonl --output results.jsonl \\
+        --fixtures fixtures.jsonl --fixture-mode record --concurrency 4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from utils.core.llm_gateway import (
+    LLMGateway, deserialize_response, prompt_cache_key, serialize_response, set_llm_gateway
+)
+from utils.rag.stage_timing import trace_stages
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_MODES = ("off", "record", "replay")
+
+
+# ----------------------------------------------------------------------
+# Record/replay fixtures
+# ----------------------------------------------------------------------
+
+class FixtureMissingError(KeyError):
+    """Replay requested a call that was never recorded."""
+
+
+class FixtureStore:
+    """
+    JSONL file of recorded LLM completions and retrieval results.
+
+    In ``record`` mode calls already in the file are served from it and new
+    ones are appended; in ``replay`` mode a missing call raises
+    ``FixtureMissingError``.
+    """
+
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Fixture mode must be 'record' or 'replay', got {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self._entries: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.recorded = 0
+
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[(entry["kind"], entry["key"])] = entry["value"]
+        elif mode == "replay":
+            raise FileNotFoundError(f"Fixture file not found: {self.path}")
+        logger.info(f"📼 Fixtures {mode}: {len(self._entries)} entries from {self.path}")
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, kind: str, key: str) -> Any:
+        """Recorded value, ``None`` when recording a new call."""
+        with self._lock:
+            if (kind, key) in self._entries:
+                self.hits += 1
+                return self._entries[(kind, key)]
+        if self.replaying:
+            raise FixtureMissingError(f"No recorded {kind} fixture for key {key[:12]}")
+        return None
+
+    def record(self, kind: str, key: str, value: Any):
+        with self._lock:
+            if (kind, key) in self._entries:
+                return
+            self._entries[(kind, key)] = value
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"kind": kind, "key": key, "value": value}, default=str) + "\n")
+            self.recorded += 1
+
+
+def _structured_to_data(result: Any) -> Any:
+    if hasattr(result, "model_dump"):
+        return result.model_dump()
+    if hasattr(result, "dict"):
+        return result.dict()
+    return result
+
+
+def _structured_from_data(schema: Any, data: Any) -> Any:
+    if hasattr(schema, "model_validate"):
+        return schema.model_validate(data)
+    if isinstance(schema, type) and isinstance(data, dict):
+        return schema(**data)
+    return data
+
+
+class FixtureChatModel:
+    """
+    Chat model client that records to or replays from a ``FixtureStore``.
+
+    Used as the client behind the LLM gateway; ``inner`` is the real client
+    when recording and ``None`` when replaying.
+    """
+
+    def __init__(self, store: FixtureStore, model: str, temperature: float,
+                 inner: Any = None, namespace: str = ""):
+        self.store = store
+        self.model = model
+        self.temperature = temperature
+        self.inner = inner
+        self.namespace = namespace
+
+    def _key(self, messages: Any, invoke_kwargs: Dict[str, Any]) -> str:
+        return prompt_cache_key(self.model, self.temperature, messages,
+                                {"namespace": self.namespace}, invoke_kwargs)
+
+    def _decode(self, value: Any) -> Any:
+        return deserialize_response(value)
+
+    def _encode(self, response: Any) -> Any:
+        return serialize_response(response)
+
+    def invoke(self, messages: Any, **kwargs) -> Any:
+        key = self._key(messages, kwargs)
+        recorded = self.store.lookup("llm", key)
+        if recorded is not None:
+            return self._decode(recorded)
+        response = self.inner.invoke(messages, **kwargs)
+        self.store.record("llm", key, self._encode(response))
+        return response
+
+    async def ainvoke(self, messages: Any, **kwargs) -> Any:
+        key = self._key(messages, kwargs)
+        recorded = self.store.lookup("llm", key)
+        if recorded is not None:
+            return self._decode(recorded)
+        response = await self.inner.ainvoke(messages, **kwargs)
+        self.store.record("llm", key, self._encode(response))
+        return response
+
+    def _derive(self, namespace: str, inner: Any, cls: type = None) -> "FixtureChatModel":
+        cls = cls or FixtureChatModel
+        return cls(self.store, self.model, self.temperature, inner,
+                   f"{self.namespace}/{namespace}")
+
+    def bind_tools(self, tools, **kwargs) -> "FixtureChatModel":
+        names = ",".join(sorted(getattr(t, "name", str(t)) for t in tools))
+        inner = self.inner.bind_tools(tools, **kwargs) if self.inner is not None else None
+        return self._derive(f"tools:{names}", inner)
+
+    def with_structured_output(self, schema, **kwargs) -> "FixtureChatModel":
+        name = getattr(schema, "__name__", None) or json.dumps(schema, sort_keys=True, default=str)
+        inner = self.inner.with_structured_output(schema, **kwargs) if self.inner is not None else None
+        structured = self._derive(f"structured:{name}", inner, _StructuredFixtureModel)
+        structured.schema = schema
+        return structured
+
+
+class _StructuredFixtureModel(FixtureChatModel):
+    """``with_structured_output`` runnable; stores parsed objects as JSON data."""
+
+    schema: Any = None
+
+    def _decode(self, value: Any) -> Any:
+        return _structured_from_data(self.schema, value)
+
+    def _encode(self, response: Any) -> Any:
+        return _structured_to_data(response)
+
+
+def fixture_client_factory(store: FixtureStore,
+                           base_factory: Optional[Callable[..., Any]] = None) -> Callable[..., Any]:
+    """Gateway ``client_factory`` wrapping real clients (record) or none (replay)."""
+    def factory(model: str, temperature: float, **client_kwargs):
+        inner = None
+        if not store.replaying:
+            inner = (base_factory or LLMGateway()._default_client_factory)(
+                model, temperature, **client_kwargs
+            )
+        return FixtureChatModel(store, model, temperature, inner)
+    return factory
+
+
+class FixtureContextEngine:
+    """Context engine proxy recording or replaying ``semantic_search`` results."""
+
+    def __init__(self, store: FixtureStore, inner: Any = None):
+        self._store = store
+        self._inner = inner
+        self.vector_store = getattr(inner, "vector_store", None)
+
+    def __getattr__(self, name: str) -> Any:
+        if self._inner is None:
+            raise AttributeError(f"{name} is not available when replaying fixtures")
+        return getattr(self._inner, name)
+
+    async def semantic_search(self, query: str, limit: int = 10, context_filter: str = None,
+                              document_filters: Dict = None) -> Dict[str, Any]:
+        key = prompt_cache_key("semantic_search", 0.0, query, {
+            "limit": limit, "context_filter": context_filter, "document_filters": document_filters
+        })
+        recorded = self._store.lookup("retrieval", key)
+        if recorded is not None:
+            return recorded
+        results = await self._inner.semantic_search(
+            query, limit=limit, context_filter=context_filter, document_filters=document_filters
+        )
+        self._store.record("retrieval", key, results)
+        return results
+
+
+# ----------------------------------------------------------------------
+# Golden queries and results
+# ----------------------------------------------------------------------
+
+@dataclass
+class GoldenQuery:
+    """One golden dataset entry (same shape as the app's ``test_queries``)."""
+    id: Any
+    query: str
+    expected: str = ""
+    category: str = ""
+    document_filters: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], index: int = 0) -> "GoldenQuery":
+        return cls(
+            id=data.get("id", index + 1),
+            query=data["query"],
+            expected=data.get("expected") or "",
+            category=data.get("category") or "",
+            document_filters=data.get("document_filters"),
+        )
+
+
+@dataclass
+class GoldenResult:
+    """Outcome, timings and quality metrics of one golden query."""
+    query_id: Any
+    query: str
+    category: str
+    success: bool
+    status: str
+    response: str = ""
+    error: Optional[str] = None
+    total_seconds: float = 0.0
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    stage_calls: Dict[str, int] = field(default_factory=dict)
+    quality: Dict[str, float] = field(default_factory=dict)
+    results_count: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def load_golden_queries(path: str) -> List[GoldenQuery]:
+    """Load golden queries from a JSONL file or a JSON list."""
+    text = Path(path).read_text(encoding="utf-8")
+    if text.lstrip().startswith("["):
+        items = json.loads(text)
+    else:
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return [GoldenQuery.from_dict(item, i) for i, item in enumerate(items)]
+
+
+_TOKEN = re.compile(r"\w+")
+# Tool call ids of documents emitted by the retrieval nodes
+_RETRIEVAL_CALL = re.compile(r"(?:simple_)?retrieval_\d+")
+
+
+def _tokens(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) > 2]
+
+
+def count_retrieved_documents(messages: Iterable[Any]) -> int:
+    """Distinct retrieval tool messages (``retrieval_<n>``) in a swarm response."""
+    return len({
+        call_id for call_id in (getattr(m, "tool_call_id", None) for m in messages)
+        if isinstance(call_id, str) and _RETRIEVAL_CALL.fullmatch(call_id)
+    })
+
+
+def score_answer(response: str, expected: str) -> Dict[str, float]:
+    """Answer quality: answered flag, plus token recall/F1 against the expected answer."""
+    answered = bool(response.strip()) and not response.startswith("Error:")
+    scores = {"answered": 1.0 if answered else 0.0, "response_chars": float(len(response))}
+    if expected.strip():
+        expected_tokens = set(_tokens(expected))
+        response_tokens = set(_tokens(response))
+        overlap = len(expected_tokens & response_tokens)
+        recall = overlap / len(expected_tokens) if expected_tokens else 0.0
+        precision = overlap / len(response_tokens) if response_tokens else 0.0
+        scores["expected_recall"] = recall
+        scores["expected_f1"] = (2 * precision * recall / (precision + recall)
+                                 if precision + recall else 0.0)
+    return scores
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linearly interpolated percentile (``pct`` in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_results(results: List[GoldenResult]) -> Dict[str, Any]:
+    """Aggregate success rate, p50/p95 latencies (total and per stage) and mean quality."""
+    def latency(values: List[float]) -> Dict[str, float]:
+        return {"p50_ms": percentile(values, 50) * 1000, "p95_ms": percentile(values, 95) * 1000,
+                "mean_ms": sum(values) / len(values) * 1000 if values else 0.0}
+
+    stages: Dict[str, List[float]] = {}
+    quality: Dict[str, List[float]] = {}
+    for result in results:
+        for stage, seconds in result.stage_seconds.items():
+            stages.setdefault(stage, []).append(seconds)
+        for metric, value in result.quality.items():
+            quality.setdefault(metric, []).append(value)
+
+    succeeded = sum(1 for r in results if r.success)
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "success_rate": succeeded / len(results) if results else 0.0,
+        "latency": latency([r.total_seconds for r in results]),
+        "stages": {stage: latency(values) for stage, values in stages.items()},
+        "quality": {metric: sum(values) / len(values) for metric, values in quality.items()},
+    }
+
+
+# ----------------------------------------------------------------------
+# Evaluator
+# ----------------------------------------------------------------------
+
+def _default_coordinator_factory(context_engine: Any):
+    from agents.rag.rag_swarm_coordinator import RAGSwarmCoordinator
+    return RAGSwarmCoordinator(context_engine)
+
+
+def _default_context_engine():
+    from context.context_engine import ContextEngine
+    from models.config import ContextConfig
+    return ContextEngine(ContextConfig())
+
+
+class GoldenEvaluator:
+    """Runs golden queries through the RAG swarm with bounded concurrency."""
+
+    def __init__(self,
+                 context_engine: Any = None,
+                 coordinator_factory: Optional[Callable[[Any], Any]] = None,
+                 concurrency: int = 4,
+                 fixtures: Optional[FixtureStore] = None,
+                 output_path: Optional[str] = None,
+                 client_factory: Optional[Callable[..., Any]] = None):
+        """
+        Initialize evaluator.
+
+        Args:
+            context_engine: ContextEngine to retrieve from; created from the
+                default ``ContextConfig`` when needed (never when replaying)
+            coordinator_factory: ``factory(context_engine)`` returning an object
+                with ``async execute(query, document_filters=...)``
+            concurrency: Maximum queries in flight
+            fixtures: Record/replay store for LLM and retrieval calls
+            output_path: JSONL file receiving one line per result and a summary
+            client_factory: Real chat model factory used while recording
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.context_engine = context_engine
+        self.coordinator_factory = coordinator_factory or _default_coordinator_factory
+        self.concurrency = concurrency
+        self.fixtures = fixtures
+        self.output_path = Path(output_path) if output_path else None
+        self.client_factory = client_factory
+        self.summary: Dict[str, Any] = {}
+
+    def _build_coordinator(self):
+        engine = self.context_engine
+        if self.fixtures is not None:
+            if engine is None and not self.fixtures.replaying:
+                engine = _default_context_engine()
+            engine = FixtureContextEngine(self.fixtures, None if self.fixtures.replaying else engine)
+        elif engine is None:
+            engine = _default_context_engine()
+        return self.coordinator_factory(engine)
+
+    def _run_one(self, coordinator: Any, item: GoldenQuery) -> GoldenResult:
+        """Execute one query on the calling (worker) thread with its own event loop."""
+        started = time.perf_counter()
+        with trace_stages() as trace:
+            try:
+                response = asyncio.run(coordinator.execute(
+                    item.query, document_filters=item.document_filters
+                ))
+                status = response.get("status", "error")
+                text = str(response.get("response") or "")
+                results_count = count_retrieved_documents(response.get("messages") or [])
+                error = text if status == "error" else None
+            except Exception as e:
+                status, text, error, results_count = "error", "", str(e), 0
+        return GoldenResult(
+            query_id=item.id,
+            query=item.query,
+            category=item.category,
+            success=status == "success",
+            status=status,
+            response=text,
+            error=error,
+            total_seconds=time.perf_counter() - started,
+            stage_seconds=dict(trace.seconds),
+            stage_calls=dict(trace.calls),
+            quality=score_answer(text, item.expected),
+            results_count=results_count,
+        )
+
+    async def arun(self, queries: Iterable[Any],
+                   on_result: Optional[Callable[[GoldenResult], None]] = None) -> List[GoldenResult]:
+        """Evaluate queries (``GoldenQuery`` or dicts); results keep input order."""
+        items = [q if isinstance(q, GoldenQuery) else GoldenQuery.from_dict(q, i)
+                 for i, q in enumerate(queries)]
+
+        previous_gateway = None
+        if self.fixtures is not None:
+            gateway = LLMGateway(
+                client_factory=fixture_client_factory(self.fixtures, self.client_factory),
+                rate_limits={} if self.fixtures.replaying else None,
+            )
+            previous_gateway = set_llm_gateway(gateway)
+
+        output = None
+        try:
+            coordinator = self._build_coordinator()
+            if self.output_path is not None:
+                self.output_path.parent.mkdir(parents=True, exist_ok=True)
+                output = open(self.output_path, "w", encoding="utf-8")
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def evaluate(item: GoldenQuery) -> GoldenResult:
+                async with semaphore:
+                    result = await asyncio.to_thread(self._run_one, coordinator, item)
+                if output is not None:
+                    output.write(json.dumps({"type": "result", **result.to_dict()}, default=str) + "\n")
+                    output.flush()
+                if on_result is not None:
+                    on_result(result)
+                logger.info(f"{'✅' if result.success else '❌'} Golden query {result.query_id}: "
+                            f"{result.total_seconds * 1000:.0f}ms")
+                return result
+
+            results = list(await asyncio.gather(*(evaluate(item) for item in items)))
+            self.summary = summarize_results(results)
+            if self.fixtures is not None:
+                self.summary["fixtures"] = {"mode": self.fixtures.mode, "hits": self.fixtures.hits,
+                                            "recorded": self.fixtures.recorded}
+            if output is not None:
+                output.write(json.dumps({"type": "summary", **self.summary}) + "\n")
+            return results
+        finally:
+            if output is not None:
+                output.close()
+            if self.fixtures is not None:
+                set_llm_gateway(previous_gateway)
+
+    def run(self, queries: Iterable[Any],
+            on_result: Optional[Callable[[GoldenResult], None]] = None) -> List[GoldenResult]:
+        """Synchronous wrapper around ``arun`` (must not be called from a running loop)."""
+        return asyncio.run(self.arun(queries, on_result))
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; exits non-zero when any query failed."""
+    parser = argparse.ArgumentParser(description="Headless golden dataset evaluation of the RAG swarm")
+    parser.add_argument("dataset", help="Golden queries (JSONL or JSON list with query/expected/category)")
+    parser.add_argument("--output", "-o", default="reports/golden_evaluation.jsonl",
+                        help="JSONL results file")
+    parser.add_argument("--concurrency", "-c", type=int, default=4, help="Queries in flight")
+    parser.add_argument("--fixtures", help="Fixture file for recorded LLM/retrieval calls")
+    parser.add_argument("--fixture-mode", choices=FIXTURE_MODES, default="off",
+                        help="record: capture live calls; replay: run offline from fixtures")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    fixtures = None
+    if args.fixture_mode != "off":
+        if not args.fixtures:
+            parser.error("--fixtures is required with --fixture-mode record/replay")
+        fixtures = FixtureStore(args.fixtures, args.fixture_mode)
+
+    evaluator = GoldenEvaluator(concurrency=args.concurrency, fixtures=fixtures,
+                                output_path=args.output)
+    results = evaluator.run(load_golden_queries(args.dataset))
+
+    summary = evaluator.summary
+    print(f"Golden evaluation: {summary['succeeded']}/{summary['total']} succeeded")
+    print(f"  latency p50={summary['latency']['p50_ms']:.0f}ms p95={summary['latency']['p95_ms']:.0f}ms")
+    for stage, stats in summary["stages"].items():
+        print(f"  {stage:<12} p50={stats['p50_ms']:.0f}ms p95={stats['p95_ms']:.0f}ms")
+    for metric, value in summary["quality"].items():
+        print(f"  {metric:<16} {value:.3f}")
+    print(f"Results written to {args.output}")
+    return 0 if all(r.success for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Stage Timing - Per-Stage Latency of RAG Swarm Graph Nodes
+=========================================================
+
+Features:
+- ``timed_stage`` wraps a graph node and reports its runtime to the active trace
+- ``trace_stages`` collects the stage timings of one run via a context variable
+- ``NODE_STAGES`` maps graph node names to the reported stage names
+"""
+
+import asyncio
+import contextvars
+import functools
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional
+
+# Graph node -> reported stage
+NODE_STAGES: Dict[str, str] = {
+    "query_analyst": "analysis",
+    "retrieval_specialist": "retrieval",
+    "document_grader": "grading",
+    "re_ranker": "rerank",
+    "context_enrichment": "enrichment",
+    "writer": "writing",
+    "citation_verification": "citation",
+    "quality_assurance": "quality",
+    "rewrite_question": "rewrite",
+}
+
+
+@dataclass
+class StageTrace:
+    """Wall-clock seconds and call counts per pipeline stage of one run."""
+    seconds: Dict[str, float] = field(default_factory=dict)
+    calls: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, stage: str, elapsed: float):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + elapsed
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+
+_current_trace: contextvars.ContextVar[Optional[StageTrace]] = contextvars.ContextVar(
+    "rag_stage_trace", default=None
+)
+
+
+@contextmanager
+def trace_stages() -> Iterator[StageTrace]:
+    """Collect stage timings of graph nodes executed inside this context."""
+    trace = StageTrace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def timed_stage(stage: str, node: Callable) -> Callable:
+    """Wrap a graph node so its runtime is added to the active ``StageTrace``."""
+    if asyncio.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_wrapper(state):
+            trace = _current_trace.get()
+            started = time.perf_counter()
+            try:
+                return await node(state)
+            finally:
+                if trace is not None:
+                    trace.add(stage, time.perf_counter() - started)
+        return async_wrapper
+
+    @functools.wraps(node)
+    def wrapper(state):
+        trace = _current_trace.get()
+        started = time.perf_counter()
+        try:
+            return node(state)
+        finally:
+            if trace is not None:
+                trace.add(stage, time.perf_counter() - started)
+    return wrapper
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Swarm Checkpoint Store - Durable Node Checkpoints for the RAG Swarm
+===================================================================
+
+SQLite store that lets ``RAGSwarmCoordinator`` threads survive a process
+restart without re-running expensive retrieval, grading and drafting stages.
+
+Features:
+- Per-node state deltas (what each node returned), not full state snapshots
+- Thread inputs (initial query, human feedback) recorded in order, so an
+  interrupted thread can be rebuilt by replaying them
+- Large strings (retrieved documents, drafts) stored once per content hash
+  and referenced from every delta that repeats them
+- Compressed blobs, WAL journal, one persistent connection
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Key marking a value that was moved to the blob table
+BLOB_REF = "__blob__"
+
+
+class SwarmCheckpointStore:
+    """Durable per-thread log of swarm inputs and node deltas."""
+
+    def __init__(self, db_path: str, blob_threshold: int = 512):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite file holding the checkpoints
+            blob_threshold: Strings at least this long are deduplicated by content hash
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.blob_threshold = blob_threshold
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS swarm_inputs (
+                thread_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (thread_id, seq)
+            );
+            CREATE TABLE IF NOT EXISTS swarm_node_deltas (
+                thread_id TEXT NOT NULL,
+                step INTEGER NOT NULL,
+                node TEXT NOT NULL,
+                delta TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (thread_id, step)
+            );
+            CREATE TABLE IF NOT EXISTS swarm_blobs (
+                hash TEXT PRIMARY KEY,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS swarm_blob_refs (
+                thread_id TEXT NOT NULL,
+                step INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                PRIMARY KEY (thread_id, step, hash)
+            );
+        """)
+        self._conn.commit()
+        self._known_blobs: Set[str] = {row[0] for row in self._conn.execute("SELECT hash FROM swarm_blobs")}
+
+    # ------------------------------------------------------------------
+    # Thread inputs
+    # ------------------------------------------------------------------
+
+    def record_input(self, thread_id: str, kind: str, payload: Any) -> None:
+        """Append an input (e.g. ``start`` query or ``resume`` feedback) to the thread."""
+        with self._lock, self._conn:
+            (seq,) = self._conn.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM swarm_inputs WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT INTO swarm_inputs (thread_id, seq, kind, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                (thread_id, seq, kind, json.dumps(payload, default=str), time.time())
+            )
+
+    def inputs(self, thread_id: str) -> List[Tuple[str, Any]]:
+        """Inputs of a thread as ``(kind, payload)`` in recording order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, payload FROM swarm_inputs WHERE thread_id = ? ORDER BY seq", (thread_id,)
+            ).fetchall()
+        return [(kind, json.loads(payload)) for kind, payload in rows]
+
+    # ------------------------------------------------------------------
+    # Node deltas
+    # ------------------------------------------------------------------
+
+    def record_node(self, thread_id: str, step: int, node: str, delta: Dict[str, Any]) -> None:
+        """Store the delta a node returned at ``step``, replacing any later history."""
+        hashes: Set[str] = set()
+        new_blobs: Dict[str, bytes] = {}
+        encoded = json.dumps(self._extract_blobs(delta, hashes, new_blobs), default=str)
+
+        with self._lock, self._conn:
+            self._truncate(thread_id, step)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO swarm_blobs (hash, content, size) VALUES (?, ?, ?)",
+                [(digest, zlib.compress(data), len(data)) for digest, data in new_blobs.items()]
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO swarm_blob_refs (thread_id, step, hash) VALUES (?, ?, ?)",
+                [(thread_id, step, digest) for digest in hashes]
+            )
+            self._conn.execute(
+                "INSERT INTO swarm_node_deltas (thread_id, step, node, delta, created_at) VALUES (?, ?, ?, ?, ?)",
+                (thread_id, step, node, encoded, time.time())
+            )
+            self._known_blobs.update(new_blobs)
+
+    def node_deltas(self, thread_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Completed nodes of a thread as ``(node, delta)`` in execution order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT node, delta FROM swarm_node_deltas WHERE thread_id = ? ORDER BY step", (thread_id,)
+            ).fetchall()
+            blobs: Dict[str, str] = {}
+            return [(node, self._restore_blobs(json.loads(delta), blobs)) for node, delta in rows]
+
+    def truncate(self, thread_id: str, step: int) -> None:
+        """Drop node deltas from ``step`` onwards (the thread diverged from its history)."""
+        with self._lock, self._conn:
+            self._truncate(thread_id, step)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Forget a thread and every blob no other thread references."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM swarm_inputs WHERE thread_id = ?", (thread_id,))
+            self._truncate(thread_id, 0)
+
+    def threads(self) -> List[str]:
+        """Thread IDs with recorded inputs."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT thread_id FROM swarm_inputs ORDER BY thread_id"
+            )]
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Row counts and the bytes saved by blob deduplication."""
+        with self._lock:
+            (threads,) = self._conn.execute("SELECT COUNT(DISTINCT thread_id) FROM swarm_inputs").fetchone()
+            (deltas,) = self._conn.execute("SELECT COUNT(*) FROM swarm_node_deltas").fetchone()
+            blobs, blob_bytes, stored_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(content)), 0) FROM swarm_blobs"
+            ).fetchone()
+            (referenced_bytes,) = self._conn.execute(
+                "SELECT COALESCE(SUM(b.size), 0) FROM swarm_blob_refs r JOIN swarm_blobs b ON b.hash = r.hash"
+            ).fetchone()
+        return {
+            'threads': threads,
+            'node_deltas': deltas,
+            'blobs': blobs,
+            'blob_bytes': blob_bytes,
+            'stored_bytes': stored_bytes,
+            'deduplicated_bytes': referenced_bytes - blob_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _truncate(self, thread_id: str, step: int) -> None:
+        self._conn.execute("DELETE FROM swarm_node_deltas WHERE thread_id = ? AND step >= ?", (thread_id, step))
+        orphans = [row[0] for row in self._conn.execute(
+            "SELECT DISTINCT hash FROM swarm_blob_refs WHERE thread_id = ? AND step >= ?", (thread_id, step)
+        )]
+        if not orphans:
+            return
+        self._conn.execute("DELETE FROM swarm_blob_refs WHERE thread_id = ? AND step >= ?", (thread_id, step))
+        unused = [digest for digest in orphans if self._conn.execute(
+            "SELECT 1 FROM swarm_blob_refs WHERE hash = ? LIMIT 1", (digest,)
+        ).fetchone() is None]
+        self._conn.executemany("DELETE FROM swarm_blobs WHERE hash = ?", [(digest,) for digest in unused])
+        self._known_blobs.difference_update(unused)
+
+    def _extract_blobs(self, value: Any, hashes: Set[str], new_blobs: Dict[str, bytes]) -> Any:
+        """Replace long strings with ``{BLOB_REF: hash}``, collecting blobs not yet stored."""
+        if isinstance(value, str):
+            if len(value) < self.blob_threshold:
+                return value
+            data = value.encode('utf-8')
+            digest = hashlib.sha256(data).hexdigest()
+            hashes.add(digest)
+            if digest not in self._known_blobs:
+                new_blobs[digest] = data
+            return {BLOB_REF: digest}
+        if isinstance(value, dict):
+            return {key: self._extract_blobs(item, hashes, new_blobs) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._extract_blobs(item, hashes, new_blobs) for item in value]
+        return value
+
+    def _restore_blobs(self, value: Any, cache: Dict[str, str]) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and BLOB_REF in value:
+                digest = value[BLOB_REF]
+                if digest not in cache:
+                    (content,) = self._conn.execute(
+                        "SELECT content FROM swarm_blobs WHERE hash = ?", (digest,)
+                    ).fetchone()
+                    cache[digest] = zlib.decompress(content).decode('utf-8')
+                return cache[digest]
+            return {key: self._restore_blobs(item, cache) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._restore_blobs(item, cache) for item in value]
+        return value
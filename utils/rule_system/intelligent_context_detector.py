@@ -3,7 +3,9 @@ Intelligent Context-Aware Rule System
 Implementation of US-E0-010: Context detection and rule selection
 
 This module provides the foundation for both current AI assistant efficiency
-and future agent swarm coordination.
+and future agent swarm coordination. Keywords and message/directory patterns
+are matched with ``KeywordAutomaton`` (one pass per text), rebuilt only when
+the configuration file changes.
 """
 
 import yaml
@@ -12,6 +14,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+from utils.keyword_automaton import ConfigSignature, KeywordAutomaton
+
 
 @dataclass
 class ContextResult:
@@ -50,12 +54,8 @@ class IntelligentContextDetector:
             config_path = ".cursor/rules/config/context_rule_mappings.yaml"
         
         self.config_path = config_path
-        self.config = self._load_configuration()
-        self.contexts = self.config["contexts"]
-        self.detection_config = self.config["detection"]
-        
-        # Build keyword mapping for fast lookup
-        self.keyword_map = self._build_keyword_map()
+        self.config_signature = ConfigSignature(config_path)
+        self._apply_configuration(self._load_configuration())
         
         # Performance tracking
         self.session_stats = {
@@ -73,6 +73,33 @@ class IntelligentContextDetector:
             # Fallback to minimal configuration
             return self._get_fallback_config()
     
+    def _apply_configuration(self, config: Dict):
+        """Install a configuration and compile its keyword/pattern automata."""
+        self.config = config
+        self.contexts = self.config["contexts"]
+        self.detection_config = self.config["detection"]
+        
+        # Build keyword mapping for fast lookup
+        self.keyword_map = self._build_keyword_map()
+        self.keyword_automaton = KeywordAutomaton(
+            (keyword, (order, context)) for order, (keyword, context) in enumerate(self.keyword_map.items())
+        )
+        self.message_automaton = self._build_pattern_automaton("message")
+        self.directory_automaton = self._build_pattern_automaton("directories")
+    
+    def _build_pattern_automaton(self, kind: str) -> KeywordAutomaton:
+        """Automaton over ``auto_detect_patterns[kind]``; payload is the context name."""
+        return KeywordAutomaton(
+            (pattern, context_name)
+            for context_name, context_config in self.contexts.items()
+            for pattern in context_config.get("auto_detect_patterns", {}).get(kind, [])
+        )
+    
+    def _reload_if_config_changed(self):
+        """Recompile when the configuration file changed on disk."""
+        if self.config_signature.changed():
+            self._apply_configuration(self._load_configuration())
+    
     def _get_fallback_config(self) -> Dict:
         """Provide fallback configuration if config file not found."""
         return {
@@ -118,6 +145,8 @@ class IntelligentContextDetector:
         if current_directory is None:
             current_directory = ""
         
+        self._reload_if_config_changed()
+        
         # Step 1: Check for explicit keywords (highest priority)
         explicit_context = self._check_explicit_keywords(user_message)
         if explicit_context:
@@ -162,14 +191,9 @@ class IntelligentContextDetector:
     
     def _check_explicit_keywords(self, message: str) -> Optional[str]:
         """Check for explicit @keywords in user message."""
-        message_lower = message.lower()
-        
-        # Check each keyword in our mapping
-        for keyword, context in self.keyword_map.items():
-            if keyword in message_lower:
-                return context
-        
-        return None
+        # First keyword in mapping order wins
+        hits = self.keyword_automaton.payloads(message)
+        return min(hits)[1] if hits else None
     
     def _auto_detect_context(self, message: str, files: List[str], 
                            directory: str) -> Tuple[str, float]:
@@ -190,15 +214,9 @@ class IntelligentContextDetector:
         for context_name in self.contexts.keys():
             context_scores[context_name] = 0
         
-        # Analyze message patterns
-        message_lower = message.lower()
-        for context_name, context_config in self.contexts.items():
-            auto_detect = context_config.get("auto_detect_patterns", {})
-            message_patterns = auto_detect.get("message", [])
-            
-            for pattern in message_patterns:
-                if pattern.lower() in message_lower:
-                    context_scores[context_name] += weights["message_patterns"]
+        # Analyze message patterns (one payload per configured pattern entry)
+        for context_name in self.message_automaton.payloads(message):
+            context_scores[context_name] += weights["message_patterns"]
         
         # Analyze file patterns
         for file_path in files:
@@ -212,14 +230,8 @@ class IntelligentContextDetector:
                         context_scores[context_name] += weights["file_patterns"]
         
         # Analyze directory patterns
-        directory_lower = directory.lower()
-        for context_name, context_config in self.contexts.items():
-            auto_detect = context_config.get("auto_detect_patterns", {})
-            dir_patterns = auto_detect.get("directories", [])
-            
-            for pattern in dir_patterns:
-                if pattern.lower() in directory_lower:
-                    context_scores[context_name] += weights["directory_patterns"]
+        for context_name in self.directory_automaton.payloads(directory):
+            context_scores[context_name] += weights["directory_patterns"]
         
         # Find best context
         if not context_scores or max(context_scores.values()) == 0:
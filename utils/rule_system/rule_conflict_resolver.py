@@ -5,13 +5,24 @@ Rule Conflict Resolver
 Intelligent system for detecting and resolving conflicts between rules,
 ensuring systematic and harmonious rule application without contradictions
 or inefficiencies.
+
+Conflict checks do not grow with the rule catalog:
+- ``ConflictIndex`` holds the rule-pair conflict matrix and each rule's
+  tag-based conflict classes, built once from the rule definitions and
+  persisted next to the resolution history
+- Detection is a lookup over the active rule set; results are memoized
+  per active rule set
+- Resolutions are memoized per conflicting rule pair and context, and the
+  history file is written once per ``resolve_conflicts`` call
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
+import hashlib
 import json
 
 class ConflictSeverity(Enum):
@@ -51,6 +62,180 @@ class ConflictResolution:
     modifications: Dict[str, Any]
     rationale: str
 
+# Known pairwise conflicts (order-independent)
+KNOWN_CONFLICTS: Dict[Tuple[str, str], Dict[str, Any]] = {
+    ('KISS Rule', 'Object-Oriented Programming Rule'): {
+        'type': 'complexity_tension',
+        'severity': ConflictSeverity.MEDIUM,
+        'description': 'KISS promotes simplicity while OOP can introduce complexity'
+    },
+    ('Keep It Small and Simple (KISS) Rule', 'Don\'t Repeat Yourself (DRY) Rule'): {
+        'type': 'abstraction_tension',
+        'severity': ConflictSeverity.LOW,
+        'description': 'KISS favors simplicity while DRY promotes abstraction'
+    },
+    ('No Premature Victory Declaration Rule', 'Clean Repository Focus Rule'): {
+        'type': 'timing_conflict',
+        'severity': ConflictSeverity.LOW,
+        'description': 'Cleanup timing conflicts with thorough validation'
+    }
+}
+
+# Conflict classes: a rule belongs to a class when its normalized name
+# contains one of the class tags
+CONFLICT_CLASSES: Dict[str, Tuple[str, ...]] = {
+    'immediate': ('immediate', 'live'),
+    'thorough': ('thorough',),
+    'simple': ('simple', 'kiss'),
+    'comprehensive': ('comprehensive',),
+}
+
+# (class of the earlier rule, class of the later rule, conflict) in precedence order
+CLASS_CONFLICTS: List[Tuple[str, str, Dict[str, Any]]] = [
+    ('immediate', 'thorough', {
+        'type': 'timing_conflict',
+        'severity': ConflictSeverity.LOW,
+        'description': '{rule_a} requires immediate action while {rule_b} requires thorough analysis'
+    }),
+    ('simple', 'comprehensive', {
+        'type': 'scope_conflict',
+        'severity': ConflictSeverity.MEDIUM,
+        'description': '{rule_a} favors simplicity while {rule_b} requires comprehensive approach'
+    }),
+]
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoder for enums in recorded conflicts and resolutions."""
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class ConflictIndex:
+    """
+    Precomputed conflict index: rule-pair conflict matrix plus per-rule
+    conflict classes, persisted as JSON and rebuilt when the definitions change.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, rules: List[str], index_file: Optional[Path] = None):
+        self.index_file = index_file
+        self.signature = self._definitions_signature(rules)
+        self.pair_conflicts: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        self.rule_classes: Dict[str, FrozenSet[str]] = {}
+        self._dirty = False
+        
+        if not self._load():
+            self._build(rules)
+            self.save()
+    
+    @staticmethod
+    def _definitions_signature(rules: List[str]) -> str:
+        definitions = {
+            'version': ConflictIndex.VERSION,
+            'rules': sorted(rules),
+            'known': sorted([list(pair), data] for pair, data in KNOWN_CONFLICTS.items()),
+            'classes': CONFLICT_CLASSES,
+            'class_conflicts': CLASS_CONFLICTS,
+        }
+        encoded = json.dumps(definitions, sort_keys=True, default=_json_default)
+        return hashlib.md5(encoded.encode()).hexdigest()
+    
+    def _build(self, rules: List[str]):
+        for (rule_a, rule_b), data in KNOWN_CONFLICTS.items():
+            self.pair_conflicts[rule_a][rule_b] = data
+            self.pair_conflicts[rule_b][rule_a] = data
+        for rule in list(rules) + [rule for pair in KNOWN_CONFLICTS for rule in pair]:
+            self.classes_for(rule)
+    
+    def _load(self) -> bool:
+        if self.index_file is None or not self.index_file.exists():
+            return False
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+        if data.get('signature') != self.signature:
+            return False
+        
+        for rule_a, rule_b, conflict_type, severity, description in data.get('pairs', []):
+            conflict = {'type': conflict_type, 'severity': ConflictSeverity(severity), 'description': description}
+            self.pair_conflicts[rule_a][rule_b] = conflict
+            self.pair_conflicts[rule_b][rule_a] = conflict
+        self.rule_classes = {rule: frozenset(classes) for rule, classes in data.get('rule_classes', {}).items()}
+        return True
+    
+    def save(self):
+        """Persist the index (no-op without an index file)."""
+        if self.index_file is None:
+            return
+        pairs = [
+            [rule_a, rule_b, data['type'], data['severity'].value, data['description']]
+            for rule_a, partners in self.pair_conflicts.items()
+            for rule_b, data in partners.items()
+            if rule_a < rule_b
+        ]
+        payload = {
+            'signature': self.signature,
+            'pairs': sorted(pairs),
+            'rule_classes': {rule: sorted(classes) for rule, classes in sorted(self.rule_classes.items())},
+        }
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_file, 'w') as f:
+            json.dump(payload, f, indent=2)
+        self._dirty = False
+    
+    def save_if_changed(self):
+        """Persist classes memoized for rules first seen since the last save."""
+        if self._dirty:
+            self.save()
+    
+    def classes_for(self, rule: str) -> FrozenSet[str]:
+        """Conflict classes of a rule (memoized; new rules are added to the index)."""
+        classes = self.rule_classes.get(rule)
+        if classes is None:
+            rule_key = rule.lower().replace(' ', '_').replace('-', '_')
+            classes = frozenset(
+                name for name, tags in CONFLICT_CLASSES.items()
+                if any(tag in rule_key for tag in tags)
+            )
+            self.rule_classes[rule] = classes
+            self._dirty = True
+        return classes
+    
+    def conflicts_for(self, active_rules: List[str]) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Conflicting ``(rule_a, rule_b, conflict)`` pairs of the active rules,
+        ``rule_a`` preceding ``rule_b`` in ``active_rules``.
+        """
+        positions: Dict[str, List[int]] = defaultdict(list)
+        by_class: Dict[str, List[int]] = defaultdict(list)
+        for i, rule in enumerate(active_rules):
+            positions[rule].append(i)
+            for name in self.classes_for(rule):
+                by_class[name].append(i)
+        
+        found: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        for i, rule in enumerate(active_rules):
+            for partner, data in self.pair_conflicts.get(rule, {}).items():
+                for j in positions.get(partner, ()):
+                    if j > i:
+                        found[(i, j)] = data
+        
+        # Class conflicts only apply where no known conflict (or earlier class conflict) exists
+        for first, second, template in CLASS_CONFLICTS:
+            for i in by_class.get(first, ()):
+                for j in by_class.get(second, ()):
+                    if j > i and (i, j) not in found:
+                        found[(i, j)] = dict(template, description=template['description'].format(
+                            rule_a=active_rules[i], rule_b=active_rules[j]))
+        
+        return [(active_rules[i], active_rules[j], data) for (i, j), data in sorted(found.items())]
+
+
 class RuleConflictResolver:
     """
     Intelligent system for detecting and resolving rule conflicts.
@@ -60,13 +245,23 @@ class RuleConflictResolver:
     harmonious and effective rule application.
     """
     
-    def __init__(self, resolution_file: Path = None):
+    def __init__(self, resolution_file: Path = None, index_file: Path = None,
+                 cache_size: int = 512):
         self.resolution_file = resolution_file or Path('monitoring/rule_conflict_resolutions.json')
         self.resolution_file.parent.mkdir(parents=True, exist_ok=True)
         self.resolution_history = self._load_resolution_history()
         self.rule_hierarchy = self._define_rule_hierarchy()
         self.conflict_patterns = self._load_conflict_patterns()
         
+        # Precomputed conflict index and memoized lookups
+        self.conflict_index = ConflictIndex(
+            list(self.rule_hierarchy),
+            index_file or self.resolution_file.with_name('rule_conflict_index.json')
+        )
+        self.cache_size = cache_size
+        self._detection_cache: "OrderedDict[Tuple[str, ...], List[Tuple[str, str, Dict[str, Any]]]]" = OrderedDict()
+        self._resolution_cache: Dict[Tuple, Tuple] = {}
+        
     def detect_conflicts(self, 
                         active_rules: List[str],
                         task_context: Dict[str, Any]) -> List[RuleConflict]:
@@ -80,14 +275,20 @@ class RuleConflictResolver:
         Returns:
             List of detected conflicts
         """
-        conflicts = []
+        key = tuple(active_rules)
+        pairs = self._detection_cache.get(key)
+        if pairs is None:
+            pairs = self.conflict_index.conflicts_for(active_rules)
+            self.conflict_index.save_if_changed()
+            self._detection_cache[key] = pairs
+            if len(self._detection_cache) > self.cache_size:
+                self._detection_cache.popitem(last=False)
+        else:
+            self._detection_cache.move_to_end(key)
         
-        # Check pairwise conflicts
-        for i, rule_a in enumerate(active_rules):
-            for rule_b in active_rules[i+1:]:
-                conflict = self._analyze_rule_pair(rule_a, rule_b, task_context)
-                if conflict:
-                    conflicts.append(conflict)
+        # Pairwise conflicts from the index
+        conflicts = [self._make_conflict(rule_a, rule_b, data, task_context)
+                     for rule_a, rule_b, data in pairs]
         
         # Check multi-rule conflicts
         multi_conflicts = self._analyze_multi_rule_conflicts(active_rules, task_context)
@@ -114,6 +315,9 @@ class RuleConflictResolver:
             # Record resolution for learning
             self._record_resolution(conflict, resolution)
         
+        if resolutions:
+            self._save_resolution_history()
+        
         return resolutions
     
     def _analyze_rule_pair(self, 
@@ -121,82 +325,52 @@ class RuleConflictResolver:
                          rule_b: str,
                          context: Dict[str, Any]) -> Optional[RuleConflict]:
         """Analyze two rules for potential conflicts."""
-        
-        # Known conflict patterns
-        known_conflicts = {
-            ('KISS Rule', 'Object-Oriented Programming Rule'): {
-                'type': 'complexity_tension',
-                'severity': ConflictSeverity.MEDIUM,
-                'description': 'KISS promotes simplicity while OOP can introduce complexity'
-            },
-            ('Keep It Small and Simple (KISS) Rule', 'Don\'t Repeat Yourself (DRY) Rule'): {
-                'type': 'abstraction_tension',
-                'severity': ConflictSeverity.LOW,
-                'description': 'KISS favors simplicity while DRY promotes abstraction'
-            },
-            ('No Premature Victory Declaration Rule', 'Clean Repository Focus Rule'): {
-                'type': 'timing_conflict',
-                'severity': ConflictSeverity.LOW,
-                'description': 'Cleanup timing conflicts with thorough validation'
-            }
-        }
-        
-        # Check direct conflicts
-        conflict_key = (rule_a, rule_b)
-        reverse_key = (rule_b, rule_a)
-        
-        if conflict_key in known_conflicts:
-            conflict_data = known_conflicts[conflict_key]
-        elif reverse_key in known_conflicts:
-            conflict_data = known_conflicts[reverse_key]
-        else:
-            # Analyze for potential implicit conflicts
-            conflict_data = self._detect_implicit_conflict(rule_a, rule_b, context)
-        
-        if conflict_data:
-            return RuleConflict(
-                rule_a=rule_a,
-                rule_b=rule_b,
-                conflict_type=conflict_data['type'],
-                severity=conflict_data['severity'],
-                description=conflict_data['description'],
-                context=context,
-                resolution_options=self._generate_resolution_options(conflict_data)
-            )
-        
+        pairs = self.conflict_index.conflicts_for([rule_a, rule_b])
+        if pairs:
+            return self._make_conflict(rule_a, rule_b, pairs[0][2], context)
         return None
     
-    def _detect_implicit_conflict(self, 
-                                rule_a: str,
-                                rule_b: str,
-                                context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Detect implicit conflicts between rules."""
-        
-        # Analyze rule characteristics
-        rule_a_key = rule_a.lower().replace(' ', '_').replace('-', '_')
-        rule_b_key = rule_b.lower().replace(' ', '_').replace('-', '_')
-        
-        # Time-based conflicts
-        if ('immediate' in rule_a_key or 'live' in rule_a_key) and ('thorough' in rule_b_key):
-            return {
-                'type': 'timing_conflict',
-                'severity': ConflictSeverity.LOW,
-                'description': f'{rule_a} requires immediate action while {rule_b} requires thorough analysis'
-            }
-        
-        # Scope conflicts
-        if ('simple' in rule_a_key or 'kiss' in rule_a_key) and ('comprehensive' in rule_b_key):
-            return {
-                'type': 'scope_conflict',
-                'severity': ConflictSeverity.MEDIUM,
-                'description': f'{rule_a} favors simplicity while {rule_b} requires comprehensive approach'
-            }
-        
-        return None
+    def _make_conflict(self,
+                       rule_a: str,
+                       rule_b: str,
+                       conflict_data: Dict[str, Any],
+                       context: Dict[str, Any]) -> RuleConflict:
+        return RuleConflict(
+            rule_a=rule_a,
+            rule_b=rule_b,
+            conflict_type=conflict_data['type'],
+            severity=conflict_data['severity'],
+            description=conflict_data['description'],
+            context=context,
+            resolution_options=self._generate_resolution_options(conflict_data)
+        )
     
     def _generate_resolution(self, conflict: RuleConflict) -> ConflictResolution:
-        """Generate resolution strategy for a conflict."""
+        """Generate resolution strategy for a conflict (memoized per rule pair and context)."""
+        key = (conflict.rule_a, conflict.rule_b, conflict.conflict_type,
+               conflict.severity, conflict.context.get('task_type', 'unknown'))
+        cached = self._resolution_cache.get(key)
+        if cached is None:
+            resolution = self._compute_resolution(conflict)
+            self._resolution_cache[key] = (
+                resolution.strategy, resolution.primary_rule, resolution.secondary_rule,
+                list(resolution.application_sequence), dict(resolution.modifications), resolution.rationale
+            )
+            return resolution
         
+        strategy, primary, secondary, sequence, modifications, rationale = cached
+        return ConflictResolution(
+            conflict=conflict,
+            strategy=strategy,
+            primary_rule=primary,
+            secondary_rule=secondary,
+            application_sequence=list(sequence),
+            modifications=dict(modifications),
+            rationale=rationale
+        )
+    
+    def _compute_resolution(self, conflict: RuleConflict) -> ConflictResolution:
+        """Choose and apply a resolution strategy for a conflict."""
         # Determine strategy based on conflict type and context
         if conflict.severity == ConflictSeverity.CRITICAL:
             strategy = ResolutionStrategy.HIERARCHY_PRIORITY
@@ -360,8 +534,8 @@ class RuleConflictResolver:
             'resolution': asdict(resolution)
         }
         
+        # Written once per resolve_conflicts call
         self.resolution_history.append(record)
-        self._save_resolution_history()
     
     def _load_resolution_history(self) -> List[Dict[str, Any]]:
         """Load resolution history."""
@@ -376,7 +550,7 @@ class RuleConflictResolver:
     def _save_resolution_history(self) -> None:
         """Save resolution history."""
         with open(self.resolution_file, 'w') as f:
-            json.dump(self.resolution_history, f, indent=2)
+            json.dump(self.resolution_history, f, indent=2, default=_json_default)
     
     def _load_conflict_patterns(self) -> Dict[str, Any]:
         """Load known conflict patterns."""
@@ -9,20 +9,30 @@ token costs while maintaining excellence standards.
 This system replaces the inefficient "all rules always active" approach with
 a sophisticated, context-aware selection mechanism that can reduce token usage
 by 60-80% while improving rule effectiveness.
+
+Selection stays sub-millisecond and never blocks on disk:
+- All task features (keywords, intent, urgency/complexity/risk/quality/scope
+  indicators) come from one tokenizing pass over the description
+- Rules are scored with a precomputed rules x features matrix
+- Selections are memoized in a bounded LRU cache with TTL and profile checks
+- Selection history is written by the batched telemetry pipeline
 """
 
 import re
 import json
 import hashlib
+import time
 from typing import Dict, List, Any, Optional, Tuple, Set
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
 import sqlite3
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
 import numpy as np
 
+from utils.system.telemetry_pipeline import get_telemetry_pipeline
+
 class TaskType(Enum):
     """Task type classification for rule selection."""
     FILE_OPERATION = "file_operation"
@@ -55,6 +65,83 @@ class RuleCategory(Enum):
     CONTEXT_SPECIFIC = "context_specific"            # Task-specific
     OPTIONAL_ENHANCEMENT = "optional_enhancement"    # Nice to have
 
+# Whole-word feature vocabulary, scanned in a single pass by
+# StrategicRuleSelector._scan_features.
+KEYWORD_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    'file_ops': ('move', 'copy', 'delete', 'organize', 'structure', 'file', 'directory', 'folder'),
+    'code_ops': ('implement', 'create', 'write', 'develop', 'build', 'code', 'function', 'class'),
+    'testing': ('test', 'testing', 'verify', 'validate', 'check', 'ensure', 'confirm', 'assert'),
+    'documentation': ('document', 'documentation', 'readme', 'changelog', 'update', 'doc', 'write', 'comment'),
+    'quality': ('quality', 'improve', 'refactor', 'clean', 'optimize', 'excellent', 'best'),
+    'security': ('secure', 'encrypt', 'auth', 'authentication', 'permission', 'access', 'key', 'vulnerability'),
+    'performance': ('fast', 'slow', 'performance', 'optimize', 'efficiency', 'speed', 'bottleneck'),
+    'debugging': ('debug', 'fix', 'error', 'problem', 'issue', 'bug', 'troubleshoot'),
+    'deployment': ('deploy', 'release', 'launch', 'publish', 'install', 'configure'),
+    'integration': ('integrate', 'connect', 'api', 'service', 'endpoint', 'interface'),
+}
+
+INTENT_WORDS: Dict[str, Tuple[str, ...]] = {
+    'create': ('create', 'add', 'new', 'build', 'implement', 'develop', 'generate'),
+    'modify': ('change', 'update', 'modify', 'edit', 'alter', 'fix', 'improve'),
+    'organize': ('organize', 'structure', 'arrange', 'move', 'place', 'sort', 'order'),
+    'validate': ('test', 'check', 'verify', 'validate', 'ensure', 'confirm', 'review'),
+    'optimize': ('optimize', 'improve', 'enhance', 'refactor', 'speed', 'efficiency'),
+    'debug': ('debug', 'fix', 'error', 'problem', 'issue', 'bug', 'troubleshoot'),
+    'deploy': ('deploy', 'release', 'launch', 'publish', 'install', 'configure'),
+    'secure': ('secure', 'protect', 'encrypt', 'auth', 'permission', 'access'),
+}
+
+# Each indicator is reported once per word group that matches
+INDICATOR_WORDS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    'urgency': (
+        ('urgent', 'asap', 'immediately', 'now', 'quick', 'fast', 'hurry'),
+        ('deadline', 'due', 'time', 'pressure', 'rush'),
+        ('critical', 'important', 'priority', 'high'),
+    ),
+    'complexity': (
+        ('complex', 'complicated', 'difficult', 'challenging', 'advanced'),
+        ('multiple', 'many', 'several', 'various', 'different'),
+        ('system', 'architecture', 'design', 'pattern', 'framework'),
+    ),
+    'risk': (
+        ('risk', 'danger', 'warning', 'caution', 'careful'),
+        ('security', 'vulnerability', 'attack', 'hack', 'breach'),
+        ('critical', 'important', 'production', 'live', 'deploy'),
+    ),
+    'quality': (
+        ('quality', 'excellent', 'best', 'perfect', 'optimal'),
+        ('improve', 'enhance', 'better', 'upgrade', 'polish'),
+        ('professional', 'production', 'enterprise', 'commercial'),
+    ),
+    'scope': (
+        ('system', 'global', 'entire', 'whole', 'complete'),
+        ('module', 'component', 'part', 'section', 'piece'),
+        ('file', 'function', 'class', 'method', 'local'),
+    ),
+}
+
+
+def _build_feature_index() -> Dict[str, List[Tuple[str, str, int]]]:
+    """word -> [(kind, name, group)] for every vocabulary entry."""
+    index: Dict[str, List[Tuple[str, str, int]]] = defaultdict(list)
+    for category, words in KEYWORD_CATEGORIES.items():
+        for word in words:
+            index[word].append(('keyword', category, 0))
+    for intent, words in INTENT_WORDS.items():
+        for word in words:
+            index[word].append(('intent', intent, 0))
+    for indicator, groups in INDICATOR_WORDS.items():
+        for group_index, words in enumerate(groups):
+            for word in words:
+                index[word].append(('indicator', indicator, group_index))
+    return dict(index)
+
+
+_FEATURE_INDEX = _build_feature_index()
+# \w+ tokens are exactly the spans \b(word)\b can match
+_WORD_PATTERN = re.compile(r'\w+')
+
+
 @dataclass
 class TaskContext:
     """Comprehensive task context for intelligent rule selection."""
@@ -96,22 +183,35 @@ class RuleProfile:
     parallel_compatible: List[str]
     context_relevance: Dict[str, float]
 
+_DEFAULT_PROFILE = RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})
+
+
 class StrategicRuleSelector:
     """
     High-performance strategic rule selector that dramatically reduces token costs
     while maintaining excellence through intelligent, context-aware selection.
     """
     
-    def __init__(self, db_path: str = "utils/rule_system/strategic_selection.db"):
+    def __init__(self, db_path: str = "utils/rule_system/strategic_selection.db",
+                 cache_size: int = 256, cache_ttl: float = 3600.0):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
         
         # Core components
         self.rule_profiles = self._load_rule_profiles()
-        self.selection_cache = {}
         self.performance_metrics = self._load_performance_metrics()
         self.context_patterns = self._load_context_patterns()
+        self._profiles_version = 0
+        self._compile_scoring_matrix()
+        
+        # Bounded LRU: task hash -> (selection, created_at, selection signature)
+        self.selection_cache: "OrderedDict[str, Tuple[RuleSelection, float, Tuple]]" = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        
+        # Selection history goes through the background batched writer
+        self.history_writer = get_telemetry_pipeline()
         
         # Optimization settings
         self.max_rules_per_task = 8  # Maximum rules to select
@@ -182,10 +282,12 @@ class StrategicRuleSelector:
         task_hash = self._generate_task_hash(task_description, context)
         
         # Check cache for existing selection
-        if task_hash in self.selection_cache:
-            cached_selection = self.selection_cache[task_hash]
-            if self._is_cache_valid(cached_selection):
-                return cached_selection
+        cached = self.selection_cache.get(task_hash)
+        if cached is not None:
+            if self._is_cache_valid(cached):
+                self.selection_cache.move_to_end(task_hash)
+                return cached[0]
+            del self.selection_cache[task_hash]
         
         # Analyze task for optimal rule selection
         task_analysis = self._analyze_task(task_description, context)
@@ -224,74 +326,55 @@ class StrategicRuleSelector:
         )
         
         # Cache selection
-        self.selection_cache[task_hash] = selection
+        self.selection_cache[task_hash] = (selection, time.monotonic(), self._selection_signature())
+        while len(self.selection_cache) > self.cache_size:
+            self.selection_cache.popitem(last=False)
         
         # Record selection for learning
-        self._record_selection(task_description, context, selection)
+        self._record_selection(task_hash, context, selection)
         
         return selection
     
     def _analyze_task(self, task_description: str, context: TaskContext) -> Dict[str, Any]:
-        """Analyze task for rule selection patterns."""
-        analysis = {
-            'keywords': self._extract_keywords(task_description),
-            'intent': self._classify_intent(task_description),
-            'urgency_indicators': self._detect_urgency(task_description),
-            'complexity_indicators': self._detect_complexity(task_description),
-            'risk_indicators': self._detect_risk_indicators(task_description),
-            'quality_indicators': self._detect_quality_indicators(task_description),
-            'scope_indicators': self._detect_scope_indicators(task_description)
+        """Analyze task for rule selection patterns (one pass over the description)."""
+        return self._scan_features(task_description)
+    
+    def _scan_features(self, text: str) -> Dict[str, Any]:
+        """Extract keywords, intent and all indicators from a single tokenization."""
+        categories: Dict[str, Set[str]] = {}
+        intent_scores = dict.fromkeys(INTENT_WORDS, 0)
+        indicator_groups: Dict[str, Set[int]] = {name: set() for name in INDICATOR_WORDS}
+        
+        for word in _WORD_PATTERN.findall(text.lower()):
+            for kind, name, group in _FEATURE_INDEX.get(word, ()):
+                if kind == 'keyword':
+                    categories.setdefault(name, set()).add(word)
+                elif kind == 'intent':
+                    intent_scores[name] += 1
+                else:
+                    indicator_groups[name].add(group)
+        
+        keywords = set(categories)
+        for words in categories.values():
+            keywords.update(words)
+        
+        return {
+            'keywords': list(keywords),
+            'intent': max(intent_scores, key=intent_scores.get),
+            'urgency_indicators': ['urgency'] * len(indicator_groups['urgency']),
+            'complexity_indicators': ['complexity'] * len(indicator_groups['complexity']),
+            'risk_indicators': ['risk'] * len(indicator_groups['risk']),
+            'quality_indicators': ['quality'] * len(indicator_groups['quality']),
+            'scope_indicators': ['scope'] * len(indicator_groups['scope'])
         }
-        return analysis
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract relevant keywords for rule selection."""
-        keyword_patterns = {
-            'file_ops': r'\b(move|copy|delete|organize|structure|file|directory|folder)\b',
-            'code_ops': r'\b(implement|create|write|develop|build|code|function|class)\b',
-            'testing': r'\b(test|testing|verify|validate|check|ensure|confirm|assert)\b',
-            'documentation': r'\b(document|documentation|readme|changelog|update|doc|write|comment)\b',
-            'quality': r'\b(quality|improve|refactor|clean|optimize|excellent|best)\b',
-            'security': r'\b(secure|encrypt|auth|authentication|permission|access|key|vulnerability)\b',
-            'performance': r'\b(fast|slow|performance|optimize|efficiency|speed|bottleneck)\b',
-            'debugging': r'\b(debug|fix|error|problem|issue|bug|troubleshoot)\b',
-            'deployment': r'\b(deploy|release|launch|publish|install|configure)\b',
-            'integration': r'\b(integrate|connect|api|service|endpoint|interface)\b'
-        }
-        
-        extracted = []
-        text_lower = text.lower()
-        
-        for category, pattern in keyword_patterns.items():
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                extracted.extend([category] + matches)
-        
-        return list(set(extracted))
+        return self._scan_features(text)['keywords']
     
     def _classify_intent(self, text: str) -> str:
         """Classify task intent for rule selection."""
-        intent_patterns = {
-            'create': r'\b(create|add|new|build|implement|develop|generate)\b',
-            'modify': r'\b(change|update|modify|edit|alter|fix|improve)\b',
-            'organize': r'\b(organize|structure|arrange|move|place|sort|order)\b',
-            'validate': r'\b(test|check|verify|validate|ensure|confirm|review)\b',
-            'optimize': r'\b(optimize|improve|enhance|refactor|speed|efficiency)\b',
-            'debug': r'\b(debug|fix|error|problem|issue|bug|troubleshoot)\b',
-            'deploy': r'\b(deploy|release|launch|publish|install|configure)\b',
-            'secure': r'\b(secure|protect|encrypt|auth|permission|access)\b'
-        }
-        
-        text_lower = text.lower()
-        intent_scores = {}
-        
-        for intent, pattern in intent_patterns.items():
-            matches = len(re.findall(pattern, text_lower))
-            intent_scores[intent] = matches
-        
-        if intent_scores:
-            return max(intent_scores, key=intent_scores.get)
-        return 'general'
+        return self._scan_features(text)['intent']
     
     def _get_applicable_rules(self, task_analysis: Dict[str, Any], context: TaskContext) -> List[str]:
         """Get rules applicable to the task based on analysis."""
@@ -375,42 +458,75 @@ class StrategicRuleSelector:
         
         return list(set(applicable_rules))  # Remove duplicates
     
+    def _compile_scoring_matrix(self):
+        """Precompute per-rule score components as arrays (rules x features)."""
+        profiles = list(self.rule_profiles.values())
+        self._rule_names = list(self.rule_profiles)
+        self._rule_index = {name: i for i, name in enumerate(self._rule_names)}
+        self._task_type_index = {task_type.value: i for i, task_type in enumerate(TaskType)}
+        
+        self._base_scores = np.array([p.effectiveness_score for p in profiles], dtype=float)
+        self._relevance_matrix = np.array(
+            [[p.context_relevance.get(task_type.value, 0.5) for task_type in TaskType] for p in profiles],
+            dtype=float
+        ).reshape(len(profiles), len(TaskType))
+        # Column 0: complex tasks, column 1: simpler tasks
+        self._alignment_matrix = np.array(
+            [[self._complexity_alignment(p.category, True), self._complexity_alignment(p.category, False)]
+             for p in profiles],
+            dtype=float
+        ).reshape(len(profiles), 2)
+        self._token_efficiency = np.array([1.0 - (p.token_cost / 1000) for p in profiles], dtype=float)
+        self._performance_bonus = np.array(
+            [self.performance_metrics.get(name, {}).get('bonus', 0.5) for name in self._rule_names],
+            dtype=float
+        )
+        
+        self._applicability_patterns = sorted({pattern for p in profiles for pattern in p.applicability_patterns})
+        pattern_index = {pattern: i for i, pattern in enumerate(self._applicability_patterns)}
+        self._pattern_incidence = np.zeros((len(profiles), len(self._applicability_patterns)), dtype=float)
+        for row, profile in enumerate(profiles):
+            for pattern in profile.applicability_patterns:
+                self._pattern_incidence[row, pattern_index[pattern]] = 1.0
+        self._pattern_counts = np.array([len(p.applicability_patterns) for p in profiles], dtype=float)
+        
+        self._profiles_version += 1
+    
+    def _keyword_relevance_vector(self, keywords: List[str]) -> np.ndarray:
+        """Share of each rule's applicability patterns found in the task keywords."""
+        if not keywords:
+            return np.full(len(self._rule_names), 0.5)
+        
+        hits = np.array([any(pattern in keyword for keyword in keywords)
+                         for pattern in self._applicability_patterns], dtype=float)
+        matches = self._pattern_incidence @ hits
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relevance = matches / self._pattern_counts
+        return np.where(self._pattern_counts > 0, relevance, 0.5)
+    
+    def _score_vector(self, task_analysis: Dict[str, Any], context: TaskContext) -> np.ndarray:
+        """Scores of every profiled rule for this task."""
+        task_column = self._task_type_index[context.task_type.value]
+        complexity_column = 0 if context.complexity.value >= TaskComplexity.COMPLEX.value else 1
+        
+        # Same term order as the per-rule formula, so results are identical
+        scores = (self._base_scores
+                  + self._relevance_matrix[:, task_column] * 0.3
+                  + self._alignment_matrix[:, complexity_column] * 0.2
+                  + self._keyword_relevance_vector(task_analysis['keywords']) * 0.2
+                  + self._performance_bonus * 0.1
+                  + self._token_efficiency * 0.1)
+        return np.clip(scores, 0.0, 1.0)
+    
     def _score_rules(self, applicable_rules: List[str], task_analysis: Dict[str, Any], context: TaskContext) -> Dict[str, float]:
         """Score rules for optimal selection."""
-        rule_scores = {}
+        scores = self._score_vector(task_analysis, context)
         
+        rule_scores = {}
         for rule_name in applicable_rules:
-            if rule_name in self.rule_profiles:
-                profile = self.rule_profiles[rule_name]
-                
-                # Base score from rule profile
-                base_score = profile.effectiveness_score
-                
-                # Context relevance bonus
-                context_relevance = profile.context_relevance.get(context.task_type.value, 0.5)
-                context_bonus = context_relevance * 0.3
-                
-                # Complexity alignment bonus
-                complexity_alignment = self._calculate_complexity_alignment(profile, context)
-                complexity_bonus = complexity_alignment * 0.2
-                
-                # Keyword relevance bonus
-                keyword_relevance = self._calculate_keyword_relevance(profile, task_analysis['keywords'])
-                keyword_bonus = keyword_relevance * 0.2
-                
-                # Performance bonus (based on historical data)
-                performance_bonus = self._get_performance_bonus(rule_name, context) * 0.1
-                
-                # Token efficiency bonus (prefer rules with lower token cost)
-                token_efficiency = 1.0 - (profile.token_cost / 1000)  # Normalize to 0-1
-                token_bonus = token_efficiency * 0.1
-                
-                # Calculate final score
-                final_score = base_score + context_bonus + complexity_bonus + keyword_bonus + performance_bonus + token_bonus
-                rule_scores[rule_name] = min(1.0, max(0.0, final_score))
-            else:
-                # Default score for unknown rules
-                rule_scores[rule_name] = 0.5
+            index = self._rule_index.get(rule_name)
+            # Default score for unknown rules
+            rule_scores[rule_name] = float(scores[index]) if index is not None else 0.5
         
         return rule_scores
     
@@ -432,7 +548,7 @@ class StrategicRuleSelector:
                 continue
             
             # Check token budget
-            rule_tokens = self.rule_profiles.get(rule_name, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).token_cost
+            rule_tokens = self.rule_profiles.get(rule_name, _DEFAULT_PROFILE).token_cost
             if total_tokens + rule_tokens > self.token_budget_per_task:
                 continue
             
@@ -475,27 +591,27 @@ class StrategicRuleSelector:
         
         # Add critical rules first
         critical_rules = [rule for rule in selected_rules if 
-                         self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).category == RuleCategory.CRITICAL_FOUNDATION]
+                         self.rule_profiles.get(rule, _DEFAULT_PROFILE).category == RuleCategory.CRITICAL_FOUNDATION]
         sequence.extend(critical_rules)
         
         # Add safety and security rules
         safety_rules = [rule for rule in selected_rules if 
-                       self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).category == RuleCategory.SAFETY_SECURITY]
+                       self.rule_profiles.get(rule, _DEFAULT_PROFILE).category == RuleCategory.SAFETY_SECURITY]
         sequence.extend(safety_rules)
         
         # Add quality and excellence rules
         quality_rules = [rule for rule in selected_rules if 
-                        self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).category == RuleCategory.QUALITY_EXCELLENCE]
+                        self.rule_profiles.get(rule, _DEFAULT_PROFILE).category == RuleCategory.QUALITY_EXCELLENCE]
         sequence.extend(quality_rules)
         
         # Add context-specific rules
         context_rules = [rule for rule in selected_rules if 
-                        self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).category == RuleCategory.CONTEXT_SPECIFIC]
+                        self.rule_profiles.get(rule, _DEFAULT_PROFILE).category == RuleCategory.CONTEXT_SPECIFIC]
         sequence.extend(context_rules)
         
         # Add optional enhancement rules
         optional_rules = [rule for rule in selected_rules if 
-                         self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).category == RuleCategory.OPTIONAL_ENHANCEMENT]
+                         self.rule_profiles.get(rule, _DEFAULT_PROFILE).category == RuleCategory.OPTIONAL_ENHANCEMENT]
         sequence.extend(optional_rules)
         
         return sequence
@@ -733,13 +849,15 @@ class StrategicRuleSelector:
     
     def _generate_task_hash(self, task_description: str, context: TaskContext) -> str:
         """Generate unique hash for task caching."""
-        task_data = f"{task_description}_{context.task_type.value}_{context.complexity.value}_{context.domain}"
+        # Risk and quality thresholds change the applicable rule set, so they are part of the key
+        task_data = (f"{task_description}_{context.task_type.value}_{context.complexity.value}_{context.domain}"
+                     f"_{context.risk_level > 0.7}_{context.quality_requirements > 0.9}")
         return hashlib.md5(task_data.encode()).hexdigest()
     
     def _calculate_token_savings(self, selected_rules: List[str], all_applicable_rules: List[str]) -> int:
         """Calculate token savings from strategic selection."""
-        selected_tokens = sum(self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).token_cost for rule in selected_rules)
-        all_tokens = sum(self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).token_cost for rule in all_applicable_rules)
+        selected_tokens = sum(self.rule_profiles.get(rule, _DEFAULT_PROFILE).token_cost for rule in selected_rules)
+        all_tokens = sum(self.rule_profiles.get(rule, _DEFAULT_PROFILE).token_cost for rule in all_applicable_rules)
         return max(0, all_tokens - selected_tokens)
     
     def _calculate_selection_confidence(self, selected_rules: List[str], task_analysis: Dict[str, Any]) -> float:
@@ -748,14 +866,14 @@ class StrategicRuleSelector:
             return 0.0
         
         # Average effectiveness of selected rules
-        effectiveness_scores = [self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).effectiveness_score for rule in selected_rules]
+        effectiveness_scores = [self.rule_profiles.get(rule, _DEFAULT_PROFILE).effectiveness_score for rule in selected_rules]
         avg_effectiveness = sum(effectiveness_scores) / len(effectiveness_scores)
         
         # Coverage of task keywords
         keyword_coverage = self._calculate_keyword_coverage(selected_rules, task_analysis['keywords'])
         
         # Rule diversity (prefer diverse rule set)
-        rule_categories = [self.rule_profiles.get(rule, RuleProfile("", RuleCategory.CONTEXT_SPECIFIC, 5, 100, 0.5, [], [], [], [], {})).category for rule in selected_rules]
+        rule_categories = [self.rule_profiles.get(rule, _DEFAULT_PROFILE).category for rule in selected_rules]
         diversity_score = len(set(rule_categories)) / len(rule_categories) if rule_categories else 0
         
         # Calculate final confidence
@@ -795,24 +913,18 @@ class StrategicRuleSelector:
         
         return reasoning
     
-    def _record_selection(self, task_description: str, context: TaskContext, selection: RuleSelection):
-        """Record selection for learning and optimization."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO rule_selections 
-                (session_id, task_hash, task_type, complexity, selected_rules, excluded_rules, 
-                 token_savings, effectiveness_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                datetime.now().strftime("%Y%m%d_%H%M%S"),
-                self._generate_task_hash(task_description, context),
-                context.task_type.value,
-                context.complexity.value,
-                json.dumps(selection.selected_rules),
-                json.dumps(selection.excluded_rules),
-                selection.estimated_token_savings,
-                selection.expected_effectiveness
-            ))
+    def _record_selection(self, task_hash: str, context: TaskContext, selection: RuleSelection):
+        """Queue selection for learning and optimization (written in batches off-thread)."""
+        self.history_writer.submit(str(self.db_path), "rule_selections", {
+            "session_id": datetime.now().strftime("%Y%m%d_%H%M%S"),
+            "task_hash": task_hash,
+            "task_type": context.task_type.value,
+            "complexity": context.complexity.value,
+            "selected_rules": json.dumps(selection.selected_rules),
+            "excluded_rules": json.dumps(selection.excluded_rules),
+            "token_savings": selection.estimated_token_savings,
+            "effectiveness_score": selection.expected_effectiveness
+        })
     
     def _load_performance_metrics(self) -> Dict[str, Any]:
         """Load historical performance metrics."""
@@ -824,35 +936,39 @@ class StrategicRuleSelector:
         # Placeholder - would load from database
         return {}
     
-    def _is_cache_valid(self, cached_selection: RuleSelection) -> bool:
+    def _selection_signature(self) -> Tuple:
+        """Everything besides the task itself that a cached selection depends on."""
+        return (self._profiles_version, self.max_rules_per_task,
+                self.min_confidence_threshold, self.token_budget_per_task)
+    
+    def _is_cache_valid(self, cached: Tuple[RuleSelection, float, Tuple]) -> bool:
         """Check if cached selection is still valid."""
-        # Cache valid for 1 hour
-        return True  # Simplified for now
+        _, created_at, signature = cached
+        # Cache valid for ``cache_ttl`` seconds and while profiles/settings are unchanged
+        return (time.monotonic() - created_at < self.cache_ttl
+                and signature == self._selection_signature())
     
-    def _calculate_complexity_alignment(self, profile: RuleProfile, context: TaskContext) -> float:
-        """Calculate how well rule aligns with task complexity."""
+    def update_rule_profiles(self, profiles: Dict[str, RuleProfile]):
+        """Add or replace rule profiles; recompiles scoring and invalidates cached selections."""
+        self.rule_profiles.update(profiles)
+        self._compile_scoring_matrix()
+    
+    @staticmethod
+    def _complexity_alignment(category: RuleCategory, complex_task: bool) -> float:
         # Higher complexity tasks benefit more from sophisticated rules
-        if context.complexity.value >= TaskComplexity.COMPLEX.value:
-            return 1.0 if profile.category in [RuleCategory.QUALITY_EXCELLENCE, RuleCategory.CONTEXT_SPECIFIC] else 0.5
-        else:
-            return 0.8 if profile.category in [RuleCategory.CRITICAL_FOUNDATION, RuleCategory.SAFETY_SECURITY] else 0.6
+        if complex_task:
+            return 1.0 if category in [RuleCategory.QUALITY_EXCELLENCE, RuleCategory.CONTEXT_SPECIFIC] else 0.5
+        return 0.8 if category in [RuleCategory.CRITICAL_FOUNDATION, RuleCategory.SAFETY_SECURITY] else 0.6
     
-    def _calculate_keyword_relevance(self, profile: RuleProfile, keywords: List[str]) -> float:
-        """Calculate keyword relevance for rule."""
-        if not keywords:
-            return 0.5
-        
-        matches = 0
-        for pattern in profile.applicability_patterns:
-            if any(pattern in keyword for keyword in keywords):
-                matches += 1
-        
-        return matches / len(profile.applicability_patterns) if profile.applicability_patterns else 0.5
+    def _calculate_complexity_alignment(self, profile: RuleProfile, context: TaskContext) -> float:
+        """Calculate how well rule aligns with task complexity."""
+        return self._complexity_alignment(profile.category,
+                                          context.complexity.value >= TaskComplexity.COMPLEX.value)
     
     def _get_performance_bonus(self, rule_name: str, context: TaskContext) -> float:
         """Get performance bonus based on historical data."""
-        # Placeholder - would query performance database
-        return 0.5
+        index = self._rule_index.get(rule_name)
+        return float(self._performance_bonus[index]) if index is not None else 0.5
     
     def _has_conflicts(self, rule_name: str, selected_rules: List[str]) -> bool:
         """Check if rule conflicts with already selected rules."""
@@ -884,86 +1000,28 @@ class StrategicRuleSelector:
     
     def _detect_urgency(self, text: str) -> List[str]:
         """Detect urgency indicators in text."""
-        urgency_patterns = [
-            r'\b(urgent|asap|immediately|now|quick|fast|hurry)\b',
-            r'\b(deadline|due|time|pressure|rush)\b',
-            r'\b(critical|important|priority|high)\b'
-        ]
-        
-        indicators = []
-        text_lower = text.lower()
-        for pattern in urgency_patterns:
-            if re.search(pattern, text_lower):
-                indicators.append("urgency")
-        
-        return indicators
+        return self._scan_features(text)['urgency_indicators']
     
     def _detect_complexity(self, text: str) -> List[str]:
         """Detect complexity indicators in text."""
-        complexity_patterns = [
-            r'\b(complex|complicated|difficult|challenging|advanced)\b',
-            r'\b(multiple|many|several|various|different)\b',
-            r'\b(system|architecture|design|pattern|framework)\b'
-        ]
-        
-        indicators = []
-        text_lower = text.lower()
-        for pattern in complexity_patterns:
-            if re.search(pattern, text_lower):
-                indicators.append("complexity")
-        
-        return indicators
+        return self._scan_features(text)['complexity_indicators']
     
     def _detect_risk_indicators(self, text: str) -> List[str]:
         """Detect risk indicators in text."""
-        risk_patterns = [
-            r'\b(risk|danger|warning|caution|careful)\b',
-            r'\b(security|vulnerability|attack|hack|breach)\b',
-            r'\b(critical|important|production|live|deploy)\b'
-        ]
-        
-        indicators = []
-        text_lower = text.lower()
-        for pattern in risk_patterns:
-            if re.search(pattern, text_lower):
-                indicators.append("risk")
-        
-        return indicators
+        return self._scan_features(text)['risk_indicators']
     
     def _detect_quality_indicators(self, text: str) -> List[str]:
         """Detect quality indicators in text."""
-        quality_patterns = [
-            r'\b(quality|excellent|best|perfect|optimal)\b',
-            r'\b(improve|enhance|better|upgrade|polish)\b',
-            r'\b(professional|production|enterprise|commercial)\b'
-        ]
-        
-        indicators = []
-        text_lower = text.lower()
-        for pattern in quality_patterns:
-            if re.search(pattern, text_lower):
-                indicators.append("quality")
-        
-        return indicators
+        return self._scan_features(text)['quality_indicators']
     
     def _detect_scope_indicators(self, text: str) -> List[str]:
         """Detect scope indicators in text."""
-        scope_patterns = [
-            r'\b(system|global|entire|whole|complete)\b',
-            r'\b(module|component|part|section|piece)\b',
-            r'\b(file|function|class|method|local)\b'
-        ]
-        
-        indicators = []
-        text_lower = text.lower()
-        for pattern in scope_patterns:
-            if re.search(pattern, text_lower):
-                indicators.append("scope")
-        
-        return indicators
+        return self._scan_features(text)['scope_indicators']
     
     def get_selection_statistics(self) -> Dict[str, Any]:
         """Get statistics about rule selection performance."""
+        # Include selections still queued in the history writer
+        self.history_writer.flush()
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             
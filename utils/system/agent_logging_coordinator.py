@@ -24,6 +24,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from utils.system.telemetry_pipeline import get_telemetry_pipeline
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,6 +44,7 @@ class AgentLoggingCoordinator:
         self.registered_agents = {}
         self.keyword_sessions = {}
         self.framework_agents = {}
+        self.telemetry = get_telemetry_pipeline()
         
         # Initialize connection
         self._initialize_universal_tracking()
@@ -358,42 +361,21 @@ class AgentLoggingCoordinator:
             logger.warning("⚠️ Cannot log to all tables - tracker or schema not available")
             return
             
-        import sqlite3
-        
         timestamp = datetime.now().isoformat()
         
-        try:
-            with sqlite3.connect("utils/universal_agent_tracking.db") as conn:
-                cursor = conn.cursor()
-                
-                # Log to each available table based on its schema
-                for table_name, table_info in self.available_tables.items():
-                    columns = table_info["columns"]
-                    
-                    # Prepare data for this table
-                    table_data = self._prepare_data_for_table(
-                        table_name, columns, event_type, agent_id, context_data, timestamp
-                    )
-                    
-                    if table_data:
-                        # Insert into this table
-                        column_names = list(table_data.keys())
-                        placeholders = ', '.join(['?' for _ in column_names])
-                        column_list = ', '.join(column_names)
-                        
-                        insert_sql = f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})"
-                        values = list(table_data.values())
-                        
-                        try:
-                            cursor.execute(insert_sql, values)
-                            logger.info(f"✅ Logged {event_type} to table '{table_name}' for agent {agent_id}")
-                        except Exception as table_error:
-                            logger.warning(f"⚠️ Could not log to table '{table_name}': {table_error}")
-                
-                conn.commit()
-                
-        except Exception as e:
-            logger.error(f"❌ Failed to log to all tables: {e}")
+        # Queue one row per applicable table - the telemetry writer inserts them
+        # in a single batched transaction off the agent's hot path
+        for table_name, table_info in self.available_tables.items():
+            columns = table_info["columns"]
+            
+            # Prepare data for this table
+            table_data = self._prepare_data_for_table(
+                table_name, columns, event_type, agent_id, context_data, timestamp
+            )
+            
+            if table_data:
+                if not self.telemetry.submit("utils/universal_agent_tracking.db", table_name, table_data):
+                    logger.debug(f"Telemetry queue rejected {event_type} for table '{table_name}'")
     
     def _prepare_data_for_table(self, table_name: str, columns: List[str], 
                                event_type: str, agent_id: str, context_data: Dict[str, Any], 
@@ -481,8 +463,10 @@ class AgentLoggingCoordinator:
         }
         
         # Add current record counts for all tables
+        status["telemetry"] = self.telemetry.get_metrics()
         if hasattr(self, 'available_tables'):
             import sqlite3
+            self.telemetry.flush()
             try:
                 with sqlite3.connect("utils/universal_agent_tracking.db") as conn:
                     cursor = conn.cursor()
@@ -5,6 +5,10 @@ Multi-Database Logger - Simple and Direct
 
 Logs agent activities to ALL 8 database files for complete transparency.
 No complex discovery - just direct, reliable logging.
+
+Writes go through the shared telemetry pipeline: ``log_activity`` only queues
+one row per database, and the background writer commits each database in a
+single batched transaction so agents never block on tracking I/O.
 """
 
 import sqlite3
@@ -15,10 +19,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+from utils.system.telemetry_pipeline import TelemetryPipeline, get_telemetry_pipeline
+
 class MultiDatabaseLogger:
     """Simple, reliable logger that writes to all databases."""
     
-    def __init__(self):
+    def __init__(self, pipeline: Optional[TelemetryPipeline] = None):
         self.databases = {
             "universal_agent_tracking": "utils/universal_agent_tracking.db",
             "strategic_selection": "utils/strategic_selection.db", 
@@ -29,6 +35,7 @@ class MultiDatabaseLogger:
             "backup_tracking": "utils/backup_tracking.db",
             "analytics": "utils/analytics.db"
         }
+        self.pipeline = pipeline or get_telemetry_pipeline()
         
         # Ensure all databases exist
         self._ensure_databases_exist()
@@ -93,31 +100,17 @@ class MultiDatabaseLogger:
             "session_id": session_id
         }
         
-        # Log to ALL databases
-        for db_name, db_path in self.databases.items():
-            try:
-                with sqlite3.connect(db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute("""
-                        INSERT INTO agent_activities 
-                        (id, timestamp, agent_id, activity_type, context, details, session_id)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        data["id"],
-                        data["timestamp"], 
-                        data["agent_id"],
-                        data["activity_type"],
-                        data["context"],
-                        data["details"],
-                        data["session_id"]
-                    ))
-                    
-                    conn.commit()
-                    print(f"✅ Logged to {db_name}: {agent_id} - {activity_type}")
-                    
-            except Exception as e:
-                print(f"⚠️ Failed to log to {db_name}: {e}")
+        # Queue for ALL databases - the telemetry writer batches the inserts
+        for db_path in self.databases.values():
+            self.pipeline.submit(db_path, "agent_activities", data)
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until all queued activities are written."""
+        return self.pipeline.flush(timeout)
+    
+    def get_telemetry_metrics(self) -> Dict[str, Any]:
+        """Get queue metrics of the underlying telemetry pipeline."""
+        return self.pipeline.get_metrics()
     
     def log_cursor_keyword(self, keyword: str):
         """Log Cursor keyword usage."""
@@ -149,6 +142,7 @@ class MultiDatabaseLogger:
     def get_all_activities(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent activities from the main database."""
         activities = []
+        self.flush()
         
         try:
             with sqlite3.connect(self.databases["universal_agent_tracking"]) as conn:
@@ -179,8 +173,10 @@ class MultiDatabaseLogger:
         status = {
             "total_databases": len(self.databases),
             "databases": {},
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(),
+            "telemetry": self.get_telemetry_metrics()
         }
+        self.flush()
         
         for db_name, db_path in self.databases.items():
             try:
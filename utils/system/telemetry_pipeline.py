@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Telemetry Pipeline - Asynchronous Batched Tracking Writes
+=========================================================
+
+Single in-process queue with a background writer thread for agent tracking
+events. Producers (agents, loggers, coordinators) only append to an in-memory
+queue; the writer groups pending rows per database and commits each database
+in ONE transaction every ``flush_interval_ms`` or ``batch_size`` events.
+
+Agent execution never blocks on tracking I/O:
+- ``submit`` is O(1) and never touches SQLite
+- under backpressure events are sampled, and dropped once the queue is full
+- pending events are flushed on ``flush()``, ``shutdown()`` and interpreter exit
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BackpressurePolicy(Enum):
+    """What to do with new events when the queue is under pressure."""
+    DROP = "drop"        # Accept until full, then drop new events
+    SAMPLE = "sample"    # Above the high watermark keep 1 in N, drop when full
+
+
+@dataclass
+class TelemetryEvent:
+    """A single row destined for one table of one database."""
+    db_path: str
+    table: str
+    row: Dict[str, Any]
+
+
+@dataclass
+class TelemetryMetrics:
+    """Counters describing pipeline health."""
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    sampled_out: int = 0
+    failed: int = 0
+    batches: int = 0
+    transactions: int = 0
+    max_queue_depth: int = 0
+    last_flush_ms: float = 0.0
+
+
+class _FlushMarker:
+    """Queue marker that is acknowledged once everything before it is written."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class TelemetryPipeline:
+    """
+    Background batching writer for tracking databases.
+
+    Rows are grouped per database and per (table, columns) so each flush costs
+    one connection reuse, one transaction and one ``executemany`` per group.
+    """
+
+    def __init__(self,
+                 max_queue_size: int = 10000,
+                 batch_size: int = 500,
+                 flush_interval_ms: int = 250,
+                 backpressure: BackpressurePolicy = BackpressurePolicy.SAMPLE,
+                 high_watermark: float = 0.8,
+                 sample_every: int = 10):
+        """
+        Initialize the pipeline and start the writer thread.
+
+        Args:
+            max_queue_size: Hard cap on pending events; new events are dropped beyond it
+            batch_size: Flush as soon as this many events are pending
+            flush_interval_ms: Flush at least this often while events are pending
+            backpressure: Policy applied when the queue fills up
+            high_watermark: Fraction of ``max_queue_size`` where sampling starts
+            sample_every: Under sampling, keep one event out of this many
+        """
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.backpressure = backpressure
+        self.high_watermark = int(max_queue_size * high_watermark)
+        self.sample_every = max(1, sample_every)
+
+        self._queue = deque()
+        self._pending_events = 0
+        self._pending_markers = 0
+        self._condition = threading.Condition()
+        self._metrics = TelemetryMetrics()
+        self._sample_counter = 0
+        self._connections: Dict[str, sqlite3.Connection] = {}
+        self._closed = False
+
+        self._writer = threading.Thread(
+            target=self._run, name="telemetry-writer", daemon=True
+        )
+        self._writer.start()
+
+    # ------------------------------------------------------------------
+    # Producer API
+    # ------------------------------------------------------------------
+
+    def submit(self, db_path: str, table: str, row: Dict[str, Any]) -> bool:
+        """
+        Queue one row for insertion without blocking on I/O.
+
+        Returns:
+            True if the event was accepted, False if it was dropped or sampled out
+        """
+        with self._condition:
+            if self._closed:
+                self._metrics.dropped += 1
+                return False
+
+            depth = self._pending_events
+            if depth >= self.max_queue_size:
+                self._metrics.dropped += 1
+                return False
+
+            if (self.backpressure == BackpressurePolicy.SAMPLE
+                    and depth >= self.high_watermark):
+                self._sample_counter += 1
+                if self._sample_counter % self.sample_every:
+                    self._metrics.sampled_out += 1
+                    return False
+
+            self._queue.append(TelemetryEvent(db_path, table, dict(row)))
+            self._pending_events += 1
+            self._metrics.enqueued += 1
+            if self._pending_events > self._metrics.max_queue_depth:
+                self._metrics.max_queue_depth = self._pending_events
+            if self._pending_events >= self.batch_size:
+                self._condition.notify()
+            return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Block until every event submitted before this call is written.
+
+        Returns:
+            True if the flush completed within ``timeout``
+        """
+        marker = _FlushMarker()
+        with self._condition:
+            if self._closed and not self._writer.is_alive():
+                return self._pending_events == 0
+            self._queue.append(marker)
+            self._pending_markers += 1
+            self._condition.notify()
+        return marker.done.wait(timeout)
+
+    def shutdown(self, timeout: Optional[float] = 5.0):
+        """Flush pending events and stop the writer thread."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._writer.join(timeout)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue and writer metrics."""
+        with self._condition:
+            metrics = asdict(self._metrics)
+            metrics["queue_depth"] = self._pending_events
+        metrics["max_queue_size"] = self.max_queue_size
+        metrics["avg_batch_size"] = (
+            metrics["written"] / metrics["batches"] if metrics["batches"] else 0.0
+        )
+        metrics["writer_alive"] = self._writer.is_alive()
+        return metrics
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        """Writer loop: wait for a full batch or the flush interval, then write."""
+        try:
+            while True:
+                with self._condition:
+                    deadline = time.monotonic() + self.flush_interval
+                    while (not self._closed
+                           and self._pending_events < self.batch_size
+                           and not self._pending_markers):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+
+                    items = list(self._queue)
+                    self._queue.clear()
+                    self._pending_events = 0
+                    self._pending_markers = 0
+                    closing = self._closed
+
+                self._process(items)
+
+                if closing:
+                    with self._condition:
+                        items = list(self._queue)
+                        self._queue.clear()
+                        self._pending_events = 0
+                        self._pending_markers = 0
+                    self._process(items)
+                    break
+        finally:
+            self._close_connections()
+
+    def _process(self, items: List[Any]):
+        """Write events in order, acknowledging flush markers as they are reached."""
+        batch: List[TelemetryEvent] = []
+        for item in items:
+            if isinstance(item, _FlushMarker):
+                self._write_batch(batch)
+                batch = []
+                item.done.set()
+            else:
+                batch.append(item)
+        self._write_batch(batch)
+
+    def _write_batch(self, events: List[TelemetryEvent]):
+        """Write a batch with one transaction per database."""
+        if not events:
+            return
+
+        start = time.perf_counter()
+        by_database: Dict[str, Dict[Tuple[str, Tuple[str, ...]], List[Tuple]]] = {}
+        for event in events:
+            columns = tuple(event.row.keys())
+            groups = by_database.setdefault(event.db_path, {})
+            groups.setdefault((event.table, columns), []).append(tuple(event.row.values()))
+
+        written = 0
+        failed = 0
+        transactions = 0
+        for db_path, groups in by_database.items():
+            try:
+                conn = self._get_connection(db_path)
+                with conn:
+                    # Explicit BEGIN: a SAVEPOINT outside a transaction would
+                    # commit each table group on its own RELEASE
+                    conn.execute("BEGIN")
+                    for (table, columns), rows in groups.items():
+                        ok, bad = self._insert_rows(conn, table, columns, rows)
+                        written += ok
+                        failed += bad
+                transactions += 1
+            except sqlite3.Error as e:
+                failed += sum(len(rows) for rows in groups.values())
+                logger.warning(f"⚠️ Telemetry write to {db_path} failed: {e}")
+                self._drop_connection(db_path)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._condition:
+            self._metrics.written += written
+            self._metrics.failed += failed
+            self._metrics.transactions += transactions
+            self._metrics.batches += 1
+            self._metrics.last_flush_ms = elapsed_ms
+
+    def _insert_rows(self, conn: sqlite3.Connection, table: str,
+                     columns: Tuple[str, ...], rows: List[Tuple]) -> Tuple[int, int]:
+        """Insert rows with executemany, isolating bad rows on failure."""
+        column_list = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        sql = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})"
+
+        conn.execute("SAVEPOINT telemetry_group")
+        try:
+            conn.executemany(sql, rows)
+            conn.execute("RELEASE telemetry_group")
+            return len(rows), 0
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO telemetry_group")
+            conn.execute("RELEASE telemetry_group")
+
+        # executemany stops at the first bad row - retry individually
+        ok = 0
+        for row in rows:
+            try:
+                conn.execute(sql, row)
+                ok += 1
+            except sqlite3.Error as e:
+                logger.debug(f"Telemetry row rejected by '{table}': {e}")
+        return ok, len(rows) - ok
+
+    def _get_connection(self, db_path: str) -> sqlite3.Connection:
+        """Get the writer's persistent connection for a database."""
+        conn = self._connections.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path)
+            self._connections[db_path] = conn
+        return conn
+
+    def _drop_connection(self, db_path: str):
+        """Discard a connection after an error so it is reopened next time."""
+        conn = self._connections.pop(db_path, None)
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def _close_connections(self):
+        """Close every writer connection."""
+        for db_path in list(self._connections):
+            self._drop_connection(db_path)
+
+
+# Global instance
+_global_pipeline = None
+_global_pipeline_lock = threading.Lock()
+
+
+def get_telemetry_pipeline() -> TelemetryPipeline:
+    """Get the process-wide telemetry pipeline (flushed at interpreter exit)."""
+    global _global_pipeline
+    with _global_pipeline_lock:
+        if _global_pipeline is None:
+            _global_pipeline = TelemetryPipeline()
+            atexit.register(_global_pipeline.shutdown)
+    return _global_pipeline
@@ -0,0 +1,252 @@
+"""
+Tracker Storage - Persistent WAL Storage Layer for UniversalAgentTracker
+=======================================================================
+
+Keeps one long-lived write connection and one read connection per database
+instead of opening a new ``sqlite3.connect`` per call:
+- WAL journal so dashboards polling the timeline never block writers
+- statement reuse through the connection's prepared-statement cache
+- indexes on ``session_id`` and ``timestamp`` for every tracking table
+- keyset-paginated timeline queries (no OFFSET rescans)
+"""
+
+import heapq
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Tables queried by the timeline, with the column used as keyset tie-breaker
+TIMELINE_SOURCES = {
+    "agent_events": "event_id",
+    "context_switches": "switch_id",
+    "rule_activations": "activation_id",
+}
+
+# Columns later tracker versions write that early databases may be missing
+_CONTEXT_SWITCH_MIGRATIONS = {
+    "trigger_type": "TEXT",
+    "trigger_details": "TEXT",
+}
+
+TimelineCursor = Tuple[str, str, str]
+
+
+def decode_json_column(raw: Optional[str], default: Any) -> Any:
+    """Decode a JSON text column, falling back to ``default``."""
+    if not raw:
+        return default
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return default
+
+
+class TrackerStorage:
+    """Connection-reusing SQLite storage for agent tracking data."""
+
+    def __init__(self, db_path: Union[str, Path], busy_timeout_ms: int = 5000):
+        """
+        Open persistent connections and prepare the schema.
+
+        Args:
+            db_path: Path to the tracking database
+            busy_timeout_ms: How long a writer waits on a locked database
+        """
+        self.db_path = Path(db_path)
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+
+        self._writer = self._connect(busy_timeout_ms)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._reader = self._connect(busy_timeout_ms)
+
+        self._table_columns: Dict[str, List[str]] = {}
+
+    def _connect(self, busy_timeout_ms: int) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=busy_timeout_ms / 1000.0,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Schema
+    # ------------------------------------------------------------------
+
+    def ensure_schema(self, statements: Iterable[str] = ()):
+        """
+        Run ``CREATE`` statements, migrate known columns and build indexes.
+
+        Args:
+            statements: DDL statements executed before migrations
+        """
+        with self._write_lock, self._writer:
+            for statement in statements:
+                self._writer.execute(statement)
+
+            existing = self._columns_locked("context_switches")
+            if existing:
+                for column, column_type in _CONTEXT_SWITCH_MIGRATIONS.items():
+                    if column not in existing:
+                        self._writer.execute(
+                            f"ALTER TABLE context_switches ADD COLUMN {column} {column_type}"
+                        )
+
+            for table in ("agent_sessions", *TIMELINE_SOURCES):
+                columns = self._columns_locked(table)
+                if "session_id" in columns:
+                    self._writer.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{table}_session "
+                        f"ON {table}(session_id)"
+                    )
+                if "timestamp" in columns:
+                    self._writer.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{table}_timestamp "
+                        f"ON {table}(timestamp)"
+                    )
+                if "session_id" in columns and "timestamp" in columns:
+                    self._writer.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{table}_session_timestamp "
+                        f"ON {table}(session_id, timestamp)"
+                    )
+            self._table_columns.clear()
+
+    def _columns_locked(self, table: str) -> List[str]:
+        return [row[1] for row in self._writer.execute(f"PRAGMA table_info({table})")]
+
+    def table_columns(self, table: str) -> List[str]:
+        """
+        Get (cached) column names of a table; empty if it does not exist.
+
+        Missing tables are not cached, so a table created later by another
+        connection is picked up on the next call.
+        """
+        columns = self._table_columns.get(table)
+        if columns is None:
+            with self._read_lock:
+                columns = [row[1] for row in self._reader.execute(f"PRAGMA table_info({table})")]
+            if columns:
+                self._table_columns[table] = columns
+        return columns
+
+    # ------------------------------------------------------------------
+    # Reads and writes
+    # ------------------------------------------------------------------
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Execute one write statement in its own transaction; returns rowcount."""
+        with self._write_lock, self._writer:
+            return self._writer.execute(sql, params).rowcount
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Execute a write statement for many rows in one transaction."""
+        with self._write_lock, self._writer:
+            return self._writer.executemany(sql, rows).rowcount
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Run a read query and return rows as dictionaries."""
+        with self._read_lock:
+            cursor = self._reader.execute(sql, params)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def query_rows(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple]:
+        """Run a read query and return raw tuples."""
+        with self._read_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    # ------------------------------------------------------------------
+    # Timeline
+    # ------------------------------------------------------------------
+
+    def fetch_timeline_rows(self, limit: int = 50,
+                            cursor: Optional[TimelineCursor] = None,
+                            session_id: Optional[str] = None,
+                            since: Optional[str] = None,
+                            source_limits: Optional[Dict[str, int]] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Fetch the newest timeline rows across all sources, keyset-paginated.
+
+        Each source is read through its timestamp index with at most ``limit``
+        rows, then the sorted streams are merged.
+
+        Args:
+            limit: Maximum rows to return
+            cursor: ``(timestamp, source, key)`` of the last row of the previous page
+            session_id: Only rows of this session
+            since: Only rows with ``timestamp >= since``
+            source_limits: Lower per-source row caps, by table name
+
+        Returns:
+            List of ``(source_table, row_dict)`` sorted newest first
+        """
+        streams = []
+        for table, key_column in TIMELINE_SOURCES.items():
+            columns = self.table_columns(table)
+            if not columns or "timestamp" not in columns:
+                continue
+            key_expr = key_column if key_column in columns else "rowid"
+
+            clauses = []
+            params: List[Any] = []
+            if cursor is not None:
+                ts, source, key = cursor
+                # Sources are merged by (timestamp, table, key) descending
+                if table < source:
+                    clauses.append("timestamp <= ?")
+                    params.append(ts)
+                elif table == source:
+                    clauses.append(
+                        f"timestamp <= ? AND (timestamp, CAST({key_expr} AS TEXT)) < (?, ?)"
+                    )
+                    params.extend([ts, ts, key])
+                else:
+                    clauses.append("timestamp < ?")
+                    params.append(ts)
+            if session_id is not None and "session_id" in columns:
+                clauses.append("session_id = ?")
+                params.append(session_id)
+            if since is not None:
+                clauses.append("timestamp >= ?")
+                params.append(since)
+
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            sql = (
+                f"SELECT *, CAST({key_expr} AS TEXT) AS _page_key FROM {table} {where} "
+                f"ORDER BY timestamp DESC, _page_key DESC LIMIT ?"
+            )
+            try:
+                source_limit = min(limit, (source_limits or {}).get(table, limit))
+                rows = self.query(sql, [*params, source_limit])
+            except sqlite3.OperationalError as e:
+                logger.debug(f"Timeline source '{table}' unavailable: {e}")
+                continue
+            streams.append([
+                ((row.get("timestamp") or ""), table, row.pop("_page_key") or "", row)
+                for row in rows
+            ])
+
+        merged = heapq.merge(*streams, key=lambda item: item[:3], reverse=True)
+        page = []
+        for timestamp, table, key, row in merged:
+            row["_cursor"] = (timestamp, table, key)
+            page.append((table, row))
+            if len(page) >= limit:
+                break
+        return page
+
+    def close(self):
+        """Close both connections."""
+        with self._write_lock:
+            self._writer.close()
+        with self._read_lock:
+            self._reader.close()
@@ -1,14 +1,17 @@
 """
 Universal Agent Tracker - Minimal Working Version
 """
-import sqlite3
-import json
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
+from utils.system.tracker_storage import TrackerStorage, TimelineCursor, decode_json_column
+
+# Per-source caps of the dashboard timeline
+SECONDARY_SOURCE_LIMITS = {"context_switches": 20, "rule_activations": 20}
+
 
 class AgentType(Enum):
     """Agent types."""
@@ -43,49 +46,50 @@ class EventType(Enum):
     SESSION_START = "session_start"
 
 
+_INSERT_CONTEXT_SWITCH = """
+    INSERT INTO context_switches 
+    (switch_id, session_id, from_context, to_context, timestamp, trigger_type, trigger_details)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class UniversalAgentTracker:
     """Minimal working tracker."""
     
     def __init__(self, db_path: str = "utils/universal_agent_tracking.db"):
         self.db_path = Path(db_path)
+        self.storage = TrackerStorage(self.db_path)
         self._init_database()
     
     def _init_database(self):
         """Initialize database - backward compatible."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Check existing schema first
-            cursor.execute("PRAGMA table_info(agent_sessions)")
-            existing_cols = [row[1] for row in cursor.fetchall()]
-            
-            if not existing_cols:
-                # Create new table only if it doesn't exist
-                cursor.execute("""
-                    CREATE TABLE agent_sessions (
-                        session_id TEXT PRIMARY KEY,
-                        agent_id TEXT,
-                        agent_type TEXT,
-                        timestamp TEXT,
-                        context TEXT
-                    )
-                """)
-            
-            # Store column info for use in other methods
-            cursor.execute("PRAGMA table_info(agent_sessions)")
-            self.session_columns = [row[1] for row in cursor.fetchall()]
-            
+        self.storage.ensure_schema([
+            # Create new table only if it doesn't exist
+            """
+                CREATE TABLE IF NOT EXISTS agent_sessions (
+                    session_id TEXT PRIMARY KEY,
+                    agent_id TEXT,
+                    agent_type TEXT,
+                    timestamp TEXT,
+                    context TEXT
+                )
+            """,
             # Context switches table
-            cursor.execute("""
+            """
                 CREATE TABLE IF NOT EXISTS context_switches (
                     switch_id TEXT PRIMARY KEY,
                     session_id TEXT,
                     from_context TEXT,
                     to_context TEXT,
-                    timestamp TEXT
+                    timestamp TEXT,
+                    trigger_type TEXT,
+                    trigger_details TEXT
                 )
-            """)
-            conn.commit()
+            """
+        ])
+        
+        # Store column info for use in other methods
+        self.session_columns = self.storage.table_columns("agent_sessions")
     
     def register_agent(self, agent_id: str, agent_type, initial_context=None, **kwargs) -> str:
         """Register an agent - adapts to existing schema."""
@@ -95,41 +99,37 @@ class UniversalAgentTracker:
         agent_type_str = agent_type.value if hasattr(agent_type, 'value') else str(agent_type)
         context_str = initial_context.value if hasattr(initial_context, 'value') else str(initial_context or "system_startup")
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Build insert query based on existing columns
-            available_cols = ['session_id']
-            values = [session_id]
-            
-            if 'agent_id' in self.session_columns:
-                available_cols.append('agent_id')
-                values.append(agent_id)
-            
-            if 'agent_type' in self.session_columns:
-                available_cols.append('agent_type')
-                values.append(agent_type_str)
-                
-            if 'timestamp' in self.session_columns:
-                available_cols.append('timestamp')
-                values.append(datetime.now().isoformat())
-            elif 'start_time' in self.session_columns:
-                available_cols.append('start_time')
-                values.append(datetime.now().isoformat())
-                
-            if 'context' in self.session_columns:
-                available_cols.append('context')
-                values.append(context_str)
+        # Build insert query based on existing columns
+        available_cols = ['session_id']
+        values = [session_id]
+        
+        if 'agent_id' in self.session_columns:
+            available_cols.append('agent_id')
+            values.append(agent_id)
+        
+        if 'agent_type' in self.session_columns:
+            available_cols.append('agent_type')
+            values.append(agent_type_str)
             
-            # Build dynamic query
-            placeholders = ', '.join(['?' for _ in values])
-            cols_str = ', '.join(available_cols)
+        if 'timestamp' in self.session_columns:
+            available_cols.append('timestamp')
+            values.append(datetime.now().isoformat())
+        elif 'start_time' in self.session_columns:
+            available_cols.append('start_time')
+            values.append(datetime.now().isoformat())
             
-            cursor.execute(f"""
-                INSERT OR REPLACE INTO agent_sessions ({cols_str})
-                VALUES ({placeholders})
-            """, values)
-            conn.commit()
+        if 'context' in self.session_columns:
+            available_cols.append('context')
+            values.append(context_str)
+        
+        # Build dynamic query (same column set -> same cached statement)
+        placeholders = ', '.join(['?' for _ in values])
+        cols_str = ', '.join(available_cols)
+        
+        self.storage.execute(f"""
+            INSERT OR REPLACE INTO agent_sessions ({cols_str})
+            VALUES ({placeholders})
+        """, values)
         
         return session_id
     
@@ -152,24 +152,16 @@ class UniversalAgentTracker:
             import json
             trigger_details = json.dumps(trigger_details)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO context_switches 
-                (switch_id, session_id, from_context, to_context, timestamp, trigger_type, trigger_details)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (switch_id, session_id, str(from_context), to_context, datetime.now().isoformat(), trigger_type, trigger_details))
-            conn.commit()
+        self.storage.execute(_INSERT_CONTEXT_SWITCH, (
+            switch_id, session_id, str(from_context), to_context,
+            datetime.now().isoformat(), trigger_type, trigger_details
+        ))
         
         return switch_id
     
     def get_recent_context_switches(self, **kwargs) -> List[Dict]:
         """Get recent context switches."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM context_switches ORDER BY timestamp DESC LIMIT 50")
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return self.storage.query("SELECT * FROM context_switches ORDER BY timestamp DESC LIMIT 50")
     
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get system metrics."""
@@ -182,122 +174,99 @@ class UniversalAgentTracker:
     
     def get_agent_timeline(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get agent timeline for the specified time period."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            timeline = []
-            
-            # PRIMARY: Get agent_events (main event table with rich data)
-            try:
-                cursor.execute("SELECT * FROM agent_events ORDER BY timestamp DESC LIMIT 50")
-                events = cursor.fetchall()
-                event_columns = [desc[0] for desc in cursor.description]
-                
-                for event in events:
-                    event_dict = dict(zip(event_columns, event))
-                    # Parse JSON fields safely
-                    try:
-                        details = json.loads(event_dict.get("details", "{}")) if event_dict.get("details") else {}
-                        rules_affected = json.loads(event_dict.get("rules_affected", "[]")) if event_dict.get("rules_affected") else []
-                        performance_metrics = json.loads(event_dict.get("performance_metrics", "{}")) if event_dict.get("performance_metrics") else {}
-                        related_agents = json.loads(event_dict.get("related_agents", "[]")) if event_dict.get("related_agents") else []
-                    except (json.JSONDecodeError, TypeError):
-                        details = {}
-                        rules_affected = []
-                        performance_metrics = {}
-                        related_agents = []
-                    
-                    timeline.append({
-                        "timestamp": event_dict.get("timestamp", ""),
-                        "event_type": event_dict.get("event_type", "unknown"),
-                        "agent_id": event_dict.get("agent_id", "unknown"),
-                        "agent_type": event_dict.get("agent_type", "unknown"),
-                        "context": event_dict.get("context", "unknown"),
-                        "session_id": event_dict.get("session_id", ""),
-                        "details": details,
-                        "rules_affected": rules_affected,
-                        "performance_metrics": performance_metrics,
-                        "related_agents": related_agents,
-                        "event_id": event_dict.get("event_id", "")
-                    })
-            except sqlite3.OperationalError:
-                # agent_events table might not exist yet
-                pass
-            
-            # SECONDARY: Add context switch events  
-            try:
-                cursor.execute("SELECT * FROM context_switches ORDER BY timestamp DESC LIMIT 20")
-                switches = cursor.fetchall()
-                switch_columns = [desc[0] for desc in cursor.description]
-                
-                for switch in switches:
-                    switch_dict = dict(zip(switch_columns, switch))
-                    try:
-                        trigger_details = json.loads(switch_dict.get("trigger_details", "{}")) if switch_dict.get("trigger_details") else {}
-                    except (json.JSONDecodeError, TypeError):
-                        trigger_details = {}
-                    
-                    timeline.append({
-                        "timestamp": switch_dict.get("timestamp", ""),
-                        "event_type": "context_switch",
-                        "agent_id": "context_system",
-                        "agent_type": "system",
-                        "context": switch_dict.get("to_context", "unknown"),
-                        "session_id": switch_dict.get("session_id", ""),
-                        "details": {
-                            "from_context": switch_dict.get("from_context", ""),
-                            "to_context": switch_dict.get("to_context", ""),
-                            "trigger_type": switch_dict.get("trigger_type", ""),
-                            **trigger_details
-                        },
-                        "rules_affected": [],
-                        "performance_metrics": {},
-                        "related_agents": [],
-                        "switch_id": switch_dict.get("switch_id", "")
-                    })
-            except sqlite3.OperationalError:
-                pass
-            
-            # TERTIARY: Add rule activations
-            try:
-                cursor.execute("SELECT * FROM rule_activations ORDER BY timestamp DESC LIMIT 20")
-                activations = cursor.fetchall()
-                activation_columns = [desc[0] for desc in cursor.description]
-                
-                for activation in activations:
-                    activation_dict = dict(zip(activation_columns, activation))
-                    try:
-                        rules_activated = json.loads(activation_dict.get("rules_activated", "[]")) if activation_dict.get("rules_activated") else []
-                        trigger_details = json.loads(activation_dict.get("trigger_details", "{}")) if activation_dict.get("trigger_details") else {}
-                        performance_impact = json.loads(activation_dict.get("performance_impact", "{}")) if activation_dict.get("performance_impact") else {}
-                    except (json.JSONDecodeError, TypeError):
-                        rules_activated = []
-                        trigger_details = {}
-                        performance_impact = {}
-                    
-                    timeline.append({
-                        "timestamp": activation_dict.get("timestamp", ""),
-                        "event_type": "rule_activation",
-                        "agent_id": "rule_system",
-                        "agent_type": "system",
-                        "context": trigger_details.get("context", "unknown"),
-                        "session_id": activation_dict.get("session_id", ""),
-                        "details": {
-                            "trigger_event": activation_dict.get("trigger_event", ""),
-                            **trigger_details
-                        },
-                        "rules_affected": rules_activated,
-                        "performance_metrics": performance_impact,
-                        "related_agents": [],
-                        "activation_id": activation_dict.get("activation_id", "")
-                    })
-            except sqlite3.OperationalError:
-                pass
-            
-            # Sort by timestamp (newest first)
-            timeline.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        # Context switches and rule activations contribute at most 20 events each
+        return self.get_timeline_page(limit=50, source_limits=SECONDARY_SOURCE_LIMITS)["events"]
+    
+    def get_timeline_page(self, limit: int = 50, cursor: Optional[TimelineCursor] = None,
+                          session_id: Optional[str] = None,
+                          since: Optional[str] = None,
+                          source_limits: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """
+        Get one page of the merged agent timeline, newest first.
+        
+        Uses keyset pagination over the timestamp indexes, so polling the next
+        page never rescans earlier rows.
+        
+        Args:
+            limit: Maximum events per page
+            cursor: ``next_cursor`` from the previous page
+            session_id: Only events of this session
+            since: Only events with an ISO timestamp at or after this value
+            source_limits: Lower per-source caps per page, by table name
             
-            return timeline[:50]  # Return last 50 events
+        Returns:
+            Dict with ``events`` and ``next_cursor`` (None on the last page)
+        """
+        rows = self.storage.fetch_timeline_rows(
+            limit=limit, cursor=cursor, session_id=session_id, since=since,
+            source_limits=source_limits
+        )
+        events = [self._timeline_entry(source, row) for source, row in rows]
+        next_cursor = rows[-1][1]["_cursor"] if len(rows) == limit else None
+        return {"events": events, "next_cursor": next_cursor}
+    
+    def _timeline_entry(self, source: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a stored row into a timeline event."""
+        if source == "agent_events":
+            # PRIMARY: agent_events (main event table with rich data)
+            return {
+                "timestamp": row.get("timestamp", ""),
+                "event_type": row.get("event_type", "unknown"),
+                "agent_id": row.get("agent_id", "unknown"),
+                "agent_type": row.get("agent_type", "unknown"),
+                "context": row.get("context", "unknown"),
+                "session_id": row.get("session_id", ""),
+                "details": decode_json_column(row.get("details"), {}),
+                "rules_affected": decode_json_column(row.get("rules_affected"), []),
+                "performance_metrics": decode_json_column(row.get("performance_metrics"), {}),
+                "related_agents": decode_json_column(row.get("related_agents"), []),
+                "event_id": row.get("event_id", "")
+            }
+        
+        if source == "context_switches":
+            # SECONDARY: context switch events
+            trigger_details = decode_json_column(row.get("trigger_details"), {})
+            if not isinstance(trigger_details, dict):
+                trigger_details = {}
+            return {
+                "timestamp": row.get("timestamp", ""),
+                "event_type": "context_switch",
+                "agent_id": "context_system",
+                "agent_type": "system",
+                "context": row.get("to_context", "unknown"),
+                "session_id": row.get("session_id", ""),
+                "details": {
+                    "from_context": row.get("from_context", ""),
+                    "to_context": row.get("to_context", ""),
+                    "trigger_type": row.get("trigger_type", ""),
+                    **trigger_details
+                },
+                "rules_affected": [],
+                "performance_metrics": {},
+                "related_agents": [],
+                "switch_id": row.get("switch_id", "")
+            }
+        
+        # TERTIARY: rule activations
+        trigger_details = decode_json_column(row.get("trigger_details"), {})
+        if not isinstance(trigger_details, dict):
+            trigger_details = {}
+        return {
+            "timestamp": row.get("timestamp", ""),
+            "event_type": "rule_activation",
+            "agent_id": "rule_system",
+            "agent_type": "system",
+            "context": trigger_details.get("context", "unknown"),
+            "session_id": row.get("session_id", ""),
+            "details": {
+                "trigger_event": row.get("trigger_event", ""),
+                **trigger_details
+            },
+            "rules_affected": decode_json_column(row.get("rules_activated"), []),
+            "performance_metrics": decode_json_column(row.get("performance_impact"), {}),
+            "related_agents": [],
+            "activation_id": row.get("activation_id", "")
+        }
     
     def record_rule_activation(self, session_id: str, rule_name: str, **kwargs) -> str:
         """Record a rule activation event."""
@@ -319,37 +288,34 @@ class UniversalAgentTracker:
         import json
         trigger_details_json = json.dumps(trigger_details)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO context_switches 
-                (switch_id, session_id, from_context, to_context, timestamp, trigger_type, trigger_details)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (activation_id, session_id, "rule_activation", rule_name, datetime.now().isoformat(), "rule_activation", trigger_details_json))
-            conn.commit()
+        self.storage.execute(_INSERT_CONTEXT_SWITCH, (
+            activation_id, session_id, "rule_activation", rule_name,
+            datetime.now().isoformat(), "rule_activation", trigger_details_json
+        ))
         
         return activation_id
     
     def get_swarm_status(self) -> Dict[str, Any]:
         """Get swarm status information."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Count different agent types
-            cursor.execute("SELECT agent_type, COUNT(*) FROM agent_sessions GROUP BY agent_type")
-            agent_counts = dict(cursor.fetchall())
-            
-            # Count recent activity
-            cursor.execute("SELECT COUNT(*) FROM context_switches")
-            total_switches = cursor.fetchone()[0]
-            
-            return {
-                "total_agents": sum(agent_counts.values()),
-                "agent_types": agent_counts,
-                "total_context_switches": total_switches,
-                "swarm_health": "active" if total_switches > 0 else "idle",
-                "timestamp": datetime.now().isoformat()
-            }
+        # Count different agent types
+        agent_counts = dict(self.storage.query_rows(
+            "SELECT agent_type, COUNT(*) FROM agent_sessions GROUP BY agent_type"
+        ))
+        
+        # Count recent activity
+        total_switches = self.storage.query_rows("SELECT COUNT(*) FROM context_switches")[0][0]
+        
+        return {
+            "total_agents": sum(agent_counts.values()),
+            "agent_types": agent_counts,
+            "total_context_switches": total_switches,
+            "swarm_health": "active" if total_switches > 0 else "idle",
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def close(self):
+        """Close the storage connections."""
+        self.storage.close()
 
 
 # Global tracker instance
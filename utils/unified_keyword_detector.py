@@ -8,6 +8,8 @@ Single, stable, production-ready keyword detection system that:
 - Replaces all scattered hardcoded keyword implementations
 - Provides consistent, reliable keyword detection and context switching
 - Integrates with universal agent tracker for complete transparency
+- Matches all keywords and message patterns in a single pass with a
+  ``KeywordAutomaton``, rebuilt only when the YAML changes
 
 This is the ONLY keyword detection system - all others are deprecated.
 """
@@ -21,6 +23,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 
+from utils.keyword_automaton import ConfigSignature, KeywordAutomaton
+
 logger = logging.getLogger(__name__)
 
 class UnifiedKeywordDetector:
@@ -35,14 +39,16 @@ class UnifiedKeywordDetector:
     - Real-time logging
     """
     
-    def __init__(self):
+    def __init__(self, config_path: Optional[str] = None):
         """Initialize the unified keyword detection system."""
-        self.config_path = ".cursor/rules/config/optimized_context_rule_mappings.yaml"
+        self.config_path = config_path or ".cursor/rules/config/optimized_context_rule_mappings.yaml"
         self.db_path = "utils/universal_agent_tracking.db"
         
         # Load configuration
+        self.config_signature = ConfigSignature(self.config_path)
         self.config = self._load_yaml_config()
         self.keywords_map = self._build_complete_keyword_map()
+        self.automaton = self._build_automaton()
         
         # Session tracking
         self.session_id = str(uuid.uuid4())
@@ -150,6 +156,35 @@ class UnifiedKeywordDetector:
                 keywords_map[keyword] = config
                 logger.info(f"✅ Added critical missing keyword: {keyword}")
     
+    def _build_automaton(self) -> KeywordAutomaton:
+        """Compile keywords and message patterns into one automaton.
+
+        Payloads are ``(keyword_index, pattern_index)``; ``pattern_index`` is
+        ``None`` for the keyword itself.
+        """
+        self._keyword_entries = list(self.keywords_map.items())
+        automaton = KeywordAutomaton()
+        for keyword_index, (keyword, config) in enumerate(self._keyword_entries):
+            automaton.add(keyword, (keyword_index, None))
+            for pattern_index, pattern in enumerate(config.get('message_patterns', [])):
+                automaton.add(pattern, (keyword_index, pattern_index))
+        automaton.build()
+        return automaton
+    
+    def _reload_if_config_changed(self):
+        """Rebuild keyword map and automaton when the YAML file changed."""
+        if not self.config_signature.changed():
+            return
+        try:
+            config = self._load_yaml_config()
+        except RuntimeError:
+            logger.warning("⚠️ Keeping previous keyword configuration")
+            return
+        self.config = config
+        self.keywords_map = self._build_complete_keyword_map()
+        self.automaton = self._build_automaton()
+        logger.info(f"🔄 Keyword configuration reloaded: {len(self.keywords_map)} keywords")
+    
     def _ensure_database_ready(self):
         """Ensure database connection is ready for logging."""
         try:
@@ -217,61 +252,54 @@ class UnifiedKeywordDetector:
             }
     
     def _detect_keywords(self, message: str) -> List[Dict[str, Any]]:
-        """Detect all keywords in the message."""
+        """Detect all keywords in the message with one automaton pass."""
+        self._reload_if_config_changed()
+        
+        # keyword index -> None (direct hit) or lowest matching pattern index
+        hits: Dict[int, Optional[int]] = {}
+        for keyword_index, pattern_index in self.automaton.payloads(message):
+            if pattern_index is None or keyword_index not in hits:
+                hits[keyword_index] = pattern_index
+            elif hits[keyword_index] is not None:
+                hits[keyword_index] = min(hits[keyword_index], pattern_index)
+        
+        if not hits:
+            return []
+        
+        keywords = self._keyword_entries
+        batch_id = uuid.uuid4().hex
+        timestamp = datetime.now().isoformat()
         detected = []
-        message_lower = message.lower()
         
-        for keyword, config in self.keywords_map.items():
-            if self._keyword_matches(keyword, config, message, message_lower):
-                keyword_data = {
-                    'keyword': keyword,
-                    'context': config['context'],
-                    'agent_type': config['agent_type'],
-                    'rules': config['rules'],
-                    'rules_count': len(config['rules']),
-                    'confidence_threshold': config['confidence_threshold'],
-                    'priority': config['priority'],
-                    'detection_method': self._get_detection_method(keyword, config, message, message_lower),
-                    'event_id': str(uuid.uuid4()),
-                    'timestamp': datetime.now().isoformat()
-                }
-                detected.append(keyword_data)
+        for keyword_index in sorted(hits):
+            keyword, config = keywords[keyword_index]
+            pattern_index = hits[keyword_index]
+            if pattern_index is None:
+                detection_method = 'direct_keyword'
+            elif config.get('confidence_threshold', 0.7) <= 0.8:
+                # Pattern matches are less direct; only for reasonable thresholds
+                detection_method = f"pattern_match:{config['message_patterns'][pattern_index]}"
+            else:
+                continue
+            
+            detected.append({
+                'keyword': keyword,
+                'context': config['context'],
+                'agent_type': config['agent_type'],
+                'rules': config['rules'],
+                'rules_count': len(config['rules']),
+                'confidence_threshold': config['confidence_threshold'],
+                'priority': config['priority'],
+                'detection_method': detection_method,
+                'event_id': f"{batch_id}-{len(detected)}",
+                'timestamp': timestamp
+            })
         
         # Sort by priority (higher priority first)
         detected.sort(key=lambda x: x['priority'], reverse=True)
         
         return detected
     
-    def _keyword_matches(self, keyword: str, config: Dict[str, Any], message: str, message_lower: str) -> bool:
-        """Check if keyword matches using multiple detection methods."""
-        
-        # Direct keyword match (highest confidence)
-        if keyword.lower() in message_lower:
-            return True
-        
-        # Message pattern matching
-        message_patterns = config.get('message_patterns', [])
-        for pattern in message_patterns:
-            if pattern.lower() in message_lower:
-                # Check confidence threshold for pattern matches
-                threshold = config.get('confidence_threshold', 0.7)
-                if threshold <= 0.8:  # Allow pattern matches for reasonable thresholds
-                    return True
-        
-        return False
-    
-    def _get_detection_method(self, keyword: str, config: Dict[str, Any], message: str, message_lower: str) -> str:
-        """Determine how the keyword was detected."""
-        if keyword.lower() in message_lower:
-            return 'direct_keyword'
-        
-        message_patterns = config.get('message_patterns', [])
-        for pattern in message_patterns:
-            if pattern.lower() in message_lower:
-                return f'pattern_match:{pattern}'
-        
-        return 'unknown'
-    
     def _process_context_switch(self, keyword_data: Dict[str, Any], message: str) -> Optional[Dict[str, Any]]:
         """Process context switch for detected keyword."""
         try:
@@ -7,6 +7,8 @@ Uses optimized_context_rule_mappings.yaml to create comprehensive keyword detect
 with proper context switches, rule activations, and agent logging.
 
 This integrates our official YAML configuration with real-time keyword detection.
+Keywords and message patterns are matched in a single pass by a shared
+``KeywordAutomaton`` that is rebuilt only when the YAML file changes.
 """
 
 import yaml
@@ -18,6 +20,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
+from utils.keyword_automaton import ConfigSignature, KeywordAutomaton
+
 logger = logging.getLogger(__name__)
 
 class YamlBasedKeywordDetector:
@@ -31,8 +35,10 @@ class YamlBasedKeywordDetector:
     def __init__(self, config_path: Optional[str] = None):
         """Initialize with YAML configuration."""
         self.config_path = config_path or ".cursor/rules/config/optimized_context_rule_mappings.yaml"
+        self.config_signature = ConfigSignature(self.config_path)
         self.config = self._load_yaml_config()
         self.keywords_map = self._build_keywords_from_config()
+        self.automaton = self._build_automaton()
         self.current_context = "DEFAULT"
         self.context_history = []
         self.session_id = str(uuid.uuid4())
@@ -144,6 +150,25 @@ class YamlBasedKeywordDetector:
                 keywords_map[keyword] = config
                 logger.info(f"✅ Added missing essential keyword: {keyword}")
     
+    def _build_automaton(self) -> KeywordAutomaton:
+        """Compile keywords and message patterns; payload is the keyword index."""
+        self._keyword_entries = list(self.keywords_map.items())
+        automaton = KeywordAutomaton()
+        for keyword_index, (keyword, config) in enumerate(self._keyword_entries):
+            automaton.add(keyword, (keyword_index, True))
+            for pattern in config.get('message_patterns', []):
+                automaton.add(pattern, (keyword_index, False))
+        automaton.build()
+        return automaton
+    
+    def _reload_if_config_changed(self):
+        """Rebuild keyword map and automaton when the YAML file changed."""
+        if self.config_signature.changed():
+            self.config = self._load_yaml_config()
+            self.keywords_map = self._build_keywords_from_config()
+            self.automaton = self._build_automaton()
+            logger.info(f"🔄 Reloaded {len(self.keywords_map)} keywords from {self.config_path}")
+    
     def _ensure_database_connection(self):
         """Ensure database connection and tables exist."""
         try:
@@ -164,40 +189,34 @@ class YamlBasedKeywordDetector:
         """
         detected_events = []
         
-        # Check for each keyword
-        for keyword, config in self.keywords_map.items():
-            if self._matches_keyword(keyword, config, message):
-                event = self._process_keyword_detection(keyword, config, message)
-                detected_events.append(event)
-                
-                # Log to database
-                self._log_to_database(event)
-                
-                # Trigger context switch
-                self._trigger_context_switch(keyword, config, message)
-                
-                print(f"🎯 DETECTED: {keyword} → {config['context']} context with {len(config['rules'])} rules")
+        for keyword, config in self._matching_keywords(message):
+            event = self._process_keyword_detection(keyword, config, message)
+            detected_events.append(event)
+            
+            # Log to database
+            self._log_to_database(event)
+            
+            # Trigger context switch
+            self._trigger_context_switch(keyword, config, message)
+            
+            print(f"🎯 DETECTED: {keyword} → {config['context']} context with {len(config['rules'])} rules")
         
         return detected_events
     
-    def _matches_keyword(self, keyword: str, config: Dict[str, Any], message: str) -> bool:
-        """Check if keyword matches the message using multiple detection methods."""
-        message_lower = message.lower()
-        
-        # Direct keyword match (highest priority)
-        if keyword.lower() in message_lower:
-            return True
+    def _matching_keywords(self, message: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Keywords matching the message, in configuration order (one automaton pass)."""
+        self._reload_if_config_changed()
         
-        # Message pattern matching
-        message_patterns = config.get('message_patterns', [])
-        for pattern in message_patterns:
-            if pattern.lower() in message_lower:
-                confidence_threshold = config.get('confidence_threshold', 0.7)
-                # For pattern matches, use a lower threshold since it's less direct
-                if confidence_threshold <= 0.8:  # Adjust threshold for pattern matching
-                    return True
+        keywords = self._keyword_entries
+        matched = set()
+        for keyword_index, direct in self.automaton.payloads(message):
+            if direct:
+                matched.add(keyword_index)
+            elif keywords[keyword_index][1].get('confidence_threshold', 0.7) <= 0.8:
+                # Pattern matches are less direct; only for reasonable thresholds
+                matched.add(keyword_index)
         
-        return False
+        return [keywords[i] for i in sorted(matched)]
     
     def _process_keyword_detection(self, keyword: str, config: Dict[str, Any], message: str) -> Dict[str, Any]:
         """Process a detected keyword and create event data."""
@@ -2,19 +2,128 @@
 """
 Task Analyzer for the Workflow Composition Engine.
 Analyzes natural language task descriptions to determine workflow requirements.
+
+Performance:
+- Every entity, context, dependency and complexity pattern is compiled once;
+  the literal keywords each pattern requires are derived from the pattern
+- One multi-keyword scan of the description finds which keywords occur, and
+  only patterns whose keywords are present are run (results are identical
+  to running every pattern)
+- Analyses are memoized by lowercased description plus the context fields
+  that affect them; ``analyze_tasks`` analyzes a batch
 """
 
 import re
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 
+try:
+    import re._parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from utils.keyword_automaton import KeywordAutomaton
 from workflow.models.workflow_models import (
     TaskAnalysis, Entity, ComplexityLevel, ValidationResult
 )
 
 logger = logging.getLogger(__name__)
 
+# Common dependency patterns
+DEPENDENCY_PATTERNS = [
+    r"depends on ([^,\.]+)",
+    r"requires ([^,\.]+)",
+    r"needs ([^,\.]+)",
+    r"after ([^,\.]+)",
+    r"once ([^,\.]+) is complete"
+]
+
+# Context fields that influence an analysis (part of the memo key)
+ANALYSIS_CONTEXT_FIELDS = ("project_size", "team_experience")
+
+_MAX_EXPANSIONS = 64
+
+
+def _expand_literals(items) -> Optional[List[str]]:
+    """All strings a purely literal (sub)pattern can match, or None if not purely literal."""
+    strings = [""]
+    for op, av in items:
+        if op is sre_parse.AT:
+            continue
+        if op is sre_parse.LITERAL:
+            options = [chr(av)]
+        elif op is sre_parse.SUBPATTERN:
+            options = _expand_literals(av[-1])
+        elif op is sre_parse.BRANCH:
+            options = []
+            for branch in av[1]:
+                expanded = _expand_literals(branch)
+                if expanded is None:
+                    return None
+                options.extend(expanded)
+        else:
+            return None
+        if options is None or len(strings) * len(options) > _MAX_EXPANSIONS:
+            return None
+        strings = [prefix + option for prefix in strings for option in options]
+    return strings
+
+
+def _required_literals(items) -> Optional[Set[str]]:
+    """
+    Literal strings of which at least one occurs in any text the pattern matches.
+    
+    Picks the most selective candidate (longest shortest string); None when
+    the pattern has no required literal.
+    """
+    best: Optional[List[str]] = None
+
+    def consider(candidates):
+        nonlocal best
+        if candidates and min(map(len, candidates)) > 0:
+            if best is None or min(map(len, candidates)) > min(map(len, best)):
+                best = list(candidates)
+
+    run = []
+    for item in items:
+        op, av = item
+        if op is sre_parse.AT:
+            continue
+        if _expand_literals([item]) is not None:
+            run.append(item)
+            continue
+        if run:
+            consider(_expand_literals(run))
+            run = []
+        if op is sre_parse.SUBPATTERN:
+            consider(_required_literals(av[-1]))
+        elif op is sre_parse.BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branches):
+                consider(set().union(*branches))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            consider(_required_literals(av[2]))
+    if run:
+        consider(_expand_literals(run))
+
+    return {literal.lower() for literal in best} if best else None
+
+
+class _ScannedPattern:
+    """Compiled case-insensitive pattern plus the keywords it requires."""
+
+    __slots__ = ('regex', 'keywords')
+
+    def __init__(self, pattern: str):
+        self.regex = re.compile(pattern, re.IGNORECASE)
+        self.keywords = _required_literals(sre_parse.parse(pattern, re.IGNORECASE))
+
+    def possible(self, found: Optional[Set[str]]) -> bool:
+        """False only if a required keyword set exists and none of it was found."""
+        return found is None or self.keywords is None or not found.isdisjoint(self.keywords)
+
 
 class TaskAnalyzer:
     """
@@ -27,12 +136,83 @@ class TaskAnalyzer:
     4. Estimate execution time and dependencies
     """
     
-    def __init__(self):
-        """Initialize the task analyzer with pattern libraries."""
+    def __init__(self, cache_size: int = 1024):
+        """
+        Initialize the task analyzer with pattern libraries.
+        
+        Args:
+            cache_size: Maximum number of memoized analyses
+        """
         self.context_patterns = self._build_context_patterns()
         self.entity_patterns = self._build_entity_patterns()
         self.complexity_indicators = self._build_complexity_indicators()
         self.duration_estimates = self._build_duration_estimates()
+        self._compile_patterns()
+        
+        self.cache_size = cache_size
+        self.analysis_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._last_scan: Tuple[Optional[str], Optional[Set[str]]] = (None, None)
+    
+    def _compile_patterns(self):
+        """Compile every pattern once and build the keyword automaton for the shared scan."""
+        self._entity_regexes = {
+            entity_type: [_ScannedPattern(pattern) for pattern in patterns]
+            for entity_type, patterns in self.entity_patterns.items()
+        }
+        self._context_regexes = {
+            context: [_ScannedPattern(pattern) for pattern in patterns]
+            for context, patterns in self.context_patterns.items()
+        }
+        self._dependency_regexes = [_ScannedPattern(pattern) for pattern in DEPENDENCY_PATTERNS]
+        
+        keywords = set(self.complexity_indicators)
+        for scanned in [*self._dependency_regexes,
+                        *(p for group in self._entity_regexes.values() for p in group),
+                        *(p for group in self._context_regexes.values() for p in group)]:
+            keywords.update(scanned.keywords or ())
+        self._automaton = KeywordAutomaton((keyword, keyword) for keyword in sorted(keywords))
+    
+    def _scan(self, text_lower: str) -> Optional[Set[str]]:
+        """
+        Keywords present in the (lowercased) text, from one automaton pass.
+        
+        Returns None for non-ASCII text, where case-insensitive regexes can
+        match characters the keyword scan would miss; callers then run every pattern.
+        """
+        if self._last_scan[0] == text_lower:
+            return self._last_scan[1]
+        found = set(self._automaton.search(text_lower)) if text_lower.isascii() else None
+        self._last_scan = (text_lower, found)
+        return found
+    
+    @staticmethod
+    def _context_key(context: Dict[str, Any]) -> tuple:
+        return tuple(context.get(field) for field in ANALYSIS_CONTEXT_FIELDS)
+    
+    @staticmethod
+    def _copy_entities(entities: List[Entity]) -> List[Entity]:
+        # Attributes is the only mutable field of Entity
+        return [entity.model_copy(update={"attributes": dict(entity.attributes)}) for entity in entities]
+    
+    def _memoize(self, cache_key: tuple, result: Dict[str, Any]) -> None:
+        self.analysis_cache[cache_key] = result
+        if len(self.analysis_cache) > self.cache_size:
+            self.analysis_cache.popitem(last=False)
+    
+    def analyze_tasks(self, task_descriptions: List[str], context: Optional[Dict[str, Any]] = None) -> List[TaskAnalysis]:
+        """
+        Analyze a batch of task descriptions with a shared context.
+        
+        Repeated descriptions in the batch (or seen before) are served from the memo.
+        
+        Args:
+            task_descriptions: Natural language task descriptions
+            context: Current project and environment context
+            
+        Returns:
+            One TaskAnalysis per description, in order
+        """
+        return [self.analyze_task(description, context) for description in task_descriptions]
         
     def analyze_task(self, task_description: str, context: Optional[Dict[str, Any]] = None) -> TaskAnalysis:
         """
@@ -53,11 +233,25 @@ class TaskAnalyzer:
         # Generate unique task ID
         task_id = self._generate_task_id(task_description)
         
+        # Memoized by everything the analysis depends on
+        context = context or {}
+        cache_key = (task_description.lower(), len(task_description.strip()) < 5, self._context_key(context))
+        cached = self.analysis_cache.get(cache_key)
+        if cached is not None:
+            self.analysis_cache.move_to_end(cache_key)
+            return TaskAnalysis(
+                task_id=task_id,
+                description=task_description,
+                entities=self._copy_entities(cached["entities"]),
+                **{field: list(value) if isinstance(value, list) else value
+                   for field, value in cached.items() if field != "entities"}
+            )
+        
         # Extract entities from task description
         entities = self.extract_entities(task_description)
         
         # Assess task complexity
-        complexity = self.assess_complexity(entities, task_description, context or {})
+        complexity = self.assess_complexity(entities, task_description, context)
         
         # Identify required contexts
         required_contexts = self.identify_contexts(entities, task_description, complexity)
@@ -86,6 +280,17 @@ class TaskAnalyzer:
             confidence=confidence
         )
         
+        if self.cache_size > 0:
+            self._memoize(cache_key, {
+                "entities": self._copy_entities(entities),
+                "complexity": complexity,
+                "required_contexts": list(required_contexts),
+                "estimated_duration": estimated_duration,
+                "dependencies": list(dependencies),
+                "success_criteria": list(success_criteria),
+                "confidence": confidence
+            })
+        
         logger.info(f"Task analysis complete: {len(required_contexts)} contexts, "
                    f"{complexity} complexity, {estimated_duration}min estimated")
         
@@ -103,12 +308,14 @@ class TaskAnalyzer:
         """
         entities = []
         text_lower = task_description.lower()
+        found = self._scan(text_lower)
         
-        # Extract different types of entities
-        for entity_type, patterns in self.entity_patterns.items():
+        # Extract different types of entities (patterns whose keywords are absent cannot match)
+        for entity_type, patterns in self._entity_regexes.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-                for match in matches:
+                if not pattern.possible(found):
+                    continue
+                for match in pattern.regex.finditer(text_lower):
                     entity_name = match.group(1) if match.groups() else match.group(0)
                     confidence = self._calculate_entity_confidence(entity_name, entity_type, text_lower)
                     
@@ -156,8 +363,9 @@ class TaskAnalyzer:
         
         # Check for complexity indicators in text
         text_lower = task_description.lower()
+        found = self._scan(text_lower)
         for indicator, weight in self.complexity_indicators.items():
-            if indicator in text_lower:
+            if indicator in (text_lower if found is None else found):
                 # Count occurrences for repeated patterns
                 occurrences = text_lower.count(indicator)
                 complexity_score += weight * occurrences
@@ -203,11 +411,12 @@ class TaskAnalyzer:
         """
         contexts = set()
         text_lower = task_description.lower()
+        found = self._scan(text_lower)
         
         # Check for explicit context patterns
-        for context, patterns in self.context_patterns.items():
+        for context, patterns in self._context_regexes.items():
             for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
+                if pattern.possible(found) and pattern.regex.search(text_lower):
                     contexts.add(context)
         
         # Add contexts based on entity types
@@ -289,19 +498,12 @@ class TaskAnalyzer:
         """
         dependencies = []
         text_lower = task_description.lower()
+        found = self._scan(text_lower)
         
-        # Common dependency patterns
-        dependency_patterns = [
-            r"depends on ([^,\.]+)",
-            r"requires ([^,\.]+)",
-            r"needs ([^,\.]+)",
-            r"after ([^,\.]+)",
-            r"once ([^,\.]+) is complete"
-        ]
-        
-        for pattern in dependency_patterns:
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
+        for pattern in self._dependency_regexes:
+            if not pattern.possible(found):
+                continue
+            for match in pattern.regex.finditer(text_lower):
                 dependency = match.group(1).strip()
                 if dependency and len(dependency) < 100:  # Reasonable length
                     dependencies.append(dependency)
@@ -2,9 +2,17 @@
 """
 Workflow Composer for the Workflow Composition Engine.
 Composes optimal workflows using available contexts and templates.
+
+Parsed templates are cached on disk (validated by file mtime and size) and
+indexed by context and complexity, so template selection only scores
+plausible candidates, best first, and stops once none can win.
 """
 
+import heapq
+import json
 import logging
+from collections import Counter
+from itertools import chain
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import yaml
@@ -17,6 +25,55 @@ from workflow.models.workflow_models import (
 
 logger = logging.getLogger(__name__)
 
+# Parsed templates of a template directory; not YAML, so never loaded as a template
+TEMPLATE_CACHE_FILE = ".template_cache.json"
+
+# Minimum score for a template to be used
+TEMPLATE_MATCH_THRESHOLD = 0.6
+
+# Entity types each template category is suited for
+TEMPLATE_CATEGORY_ENTITIES = {
+    'feature_development': {'feature', 'component', 'api', 'ui'},
+    'development': {'feature', 'component', 'api', 'ui'},  # Added for backward compatibility
+    'test': {'feature', 'component', 'api', 'ui'},  # Added for test templates
+    'bug_fix': {'bug', 'issue', 'error'},
+    'maintenance': {'bug', 'issue', 'error'},  # Added for backward compatibility
+    'security_audit': {'security', 'vulnerability'},
+    'performance_optimization': {'performance', 'optimization'},
+    'code_review': {'review', 'quality'},
+    'documentation': {'documentation', 'guide', 'manual'}
+}
+
+
+def _complexity_fits(complexity: ComplexityLevel, phase_count: int) -> bool:
+    """Whether a template with ``phase_count`` phases suits the complexity (lenient ranges)."""
+    if complexity == ComplexityLevel.SIMPLE:
+        return phase_count <= 4
+    if complexity == ComplexityLevel.MEDIUM:
+        return 2 <= phase_count <= 6
+    if complexity == ComplexityLevel.COMPLEX:
+        return phase_count >= 4
+    return False
+
+
+class _TemplateIndex:
+    """Inverted index over a snapshot of the loaded templates (positions keep load order)."""
+
+    def __init__(self, templates: List[WorkflowTemplate]):
+        self.templates = templates
+        self.by_context: Dict[str, List[int]] = {}
+        self.by_entity_type: Dict[str, set] = {}
+        self.by_complexity: Dict[ComplexityLevel, set] = {level: set() for level in ComplexityLevel}
+
+        for position, template in enumerate(templates):
+            for context in {phase.context for phase in template.phases}:
+                self.by_context.setdefault(context, []).append(position)
+            for entity_type in TEMPLATE_CATEGORY_ENTITIES.get(template.category, ()):
+                self.by_entity_type.setdefault(entity_type, set()).add(position)
+            for level, positions in self.by_complexity.items():
+                if _complexity_fits(level, len(template.phases)):
+                    positions.add(position)
+
 
 class WorkflowComposer:
     """
@@ -38,6 +95,7 @@ class WorkflowComposer:
         """
         self.template_directory = template_directory or "workflow/templates"
         self.templates: Dict[str, WorkflowTemplate] = {}
+        self._template_index: Optional[_TemplateIndex] = None
         self.context_capabilities = self._build_context_capabilities()
         self.optimization_rules = self._build_optimization_rules()
         
@@ -90,23 +148,80 @@ class WorkflowComposer:
         Returns:
             Best matching template or None if no good match
         """
-        if not self.templates:
-            return None
-        
-        best_template = None
-        best_score = 0.0
-        
-        for template in self.templates.values():
-            score = self._calculate_template_score(template, analysis)
-            if score > best_score and score >= 0.6:  # Minimum match threshold
-                best_score = score
-                best_template = template
+        ranked = self.rank_templates(analysis, top_k=1)
+        best_template, best_score = ranked[0] if ranked else (None, 0.0)
         
         if best_template:
             logger.info(f"Selected template '{best_template.name}' with score {best_score:.2f}")
         
         return best_template
     
+    def rank_templates(self, analysis: TaskAnalysis, top_k: int = 5) -> List[Tuple[WorkflowTemplate, float]]:
+        """
+        Rank the templates that reach the match threshold.
+        
+        Candidates come from the context/complexity index and are scored in
+        order of their score upper bound; scoring stops once no remaining
+        candidate can enter the top ``top_k``. Equal scores rank in load order.
+        
+        Args:
+            analysis: Task analysis results
+            top_k: Number of templates to return
+            
+        Returns:
+            Up to ``top_k`` (template, score) pairs, best first
+        """
+        if not self.templates or top_k <= 0:
+            return []
+        index = self._get_template_index()
+        
+        # Bounds add up the same terms as _calculate_template_score; only the
+        # success-rate bonus is not indexed and is assumed to apply
+        required_contexts = set(analysis.required_contexts)
+        overlaps = Counter(chain.from_iterable(index.by_context.get(context, ()) for context in required_contexts))
+        category_hits = set()
+        for entity_type in {entity.type for entity in analysis.entities}:
+            category_hits |= index.by_entity_type.get(entity_type, set())
+        complexity_fits = index.by_complexity.get(analysis.complexity, set())
+        
+        def bound(position: int, context_score: float) -> float:
+            score = context_score
+            if position in category_hits:
+                score += 0.3
+            if position in complexity_fits:
+                score += 0.2
+            return min(1.0, score + 0.1)
+        
+        # (-bound, position) sorts best bound first, then load order
+        candidates = [
+            (-bound(position, 0.0 + count / len(required_contexts) * 0.4), position)
+            for position, count in overlaps.items()
+        ]
+        # Without a shared context only category + complexity + success rate can reach the threshold
+        candidates.extend(
+            (-bound(position, 0.0), position)
+            for position in category_hits & complexity_fits
+            if position not in overlaps
+        )
+        candidates.sort()
+        
+        # Min-heap of (score, -position): the root is the current k-th best
+        top: List[Tuple[float, int]] = []
+        for negative_bound, position in candidates:
+            if -negative_bound < TEMPLATE_MATCH_THRESHOLD:
+                break
+            if len(top) == top_k and (-negative_bound, -position) < top[0]:
+                break
+            score = self._calculate_template_score(index.templates[position], analysis)
+            if score < TEMPLATE_MATCH_THRESHOLD:
+                continue
+            if len(top) < top_k:
+                heapq.heappush(top, (score, -position))
+            elif (score, -position) > top[0]:
+                heapq.heapreplace(top, (score, -position))
+        
+        return [(index.templates[-neg_position], score) for score, neg_position in sorted(top, reverse=True)]
+    
     def customize_workflow(self, template: WorkflowTemplate, analysis: TaskAnalysis) -> WorkflowDefinition:
         """
         Customize template based on specific requirements.
@@ -321,25 +436,77 @@ class WorkflowComposer:
         )
     
     def _load_templates(self) -> None:
-        """Load workflow templates from files."""
+        """Load workflow templates from files, reusing parsed templates of unchanged files."""
         if not os.path.exists(self.template_directory):
             logger.warning(f"Template directory not found: {self.template_directory}")
             return
         
+        cache_path = os.path.join(self.template_directory, TEMPLATE_CACHE_FILE)
+        cached = self._read_template_cache(cache_path)
+        fresh: Dict[str, Dict[str, Any]] = {}
+        
         template_count = 0
+        parsed_count = 0
         for root, dirs, files in os.walk(self.template_directory):
             for file in files:
                 if file.endswith(('.yaml', '.yml')):
                     template_path = os.path.join(root, file)
                     try:
-                        template = self._load_template_file(template_path)
+                        stat = os.stat(template_path)
+                        signature = [stat.st_mtime_ns, stat.st_size]
+                        relative_path = os.path.relpath(template_path, self.template_directory)
+                        entry = cached.get(relative_path)
+                        template = None
+                        if entry and entry.get('signature') == signature:
+                            try:
+                                template = WorkflowTemplate.model_validate(entry['template'])
+                            except Exception as e:
+                                logger.debug(f"Discarding cached template {template_path}: {e}")
+                        if template is None:
+                            template = self._load_template_file(template_path)
+                            parsed_count += 1
                         if template:
+                            fresh[relative_path] = {
+                                'signature': signature,
+                                'template': template.model_dump(mode='json')
+                            }
                             self.templates[template.template_id] = template
                             template_count += 1
                     except Exception as e:
                         logger.error(f"Failed to load template {template_path}: {e}")
         
-        logger.info(f"Loaded {template_count} workflow templates")
+        if fresh != cached:
+            self._write_template_cache(cache_path, fresh)
+        self._template_index = None
+        
+        logger.info(f"Loaded {template_count} workflow templates ({parsed_count} parsed from YAML)")
+    
+    @staticmethod
+    def _read_template_cache(cache_path: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _write_template_cache(cache_path: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(entries))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            # Read-only template directories still work, just without the cache
+            logger.debug(f"Failed to save template cache: {e}")
+    
+    def _get_template_index(self) -> _TemplateIndex:
+        """Index of the current templates, rebuilt when templates are added, replaced or removed."""
+        templates = list(self.templates.values())
+        if self._template_index is None or self._template_index.templates != templates:
+            self._template_index = _TemplateIndex(templates)
+        return self._template_index
     
     def _load_template_file(self, template_path: str) -> Optional[WorkflowTemplate]:
         """Load a single template file."""
@@ -396,30 +563,13 @@ class WorkflowComposer:
         entity_types = {entity.type for entity in analysis.entities}
         
         # Template category matching
-        category_matches = {
-            'feature_development': {'feature', 'component', 'api', 'ui'},
-            'development': {'feature', 'component', 'api', 'ui'},  # Added for backward compatibility
-            'test': {'feature', 'component', 'api', 'ui'},  # Added for test templates
-            'bug_fix': {'bug', 'issue', 'error'},
-            'maintenance': {'bug', 'issue', 'error'},  # Added for backward compatibility
-            'security_audit': {'security', 'vulnerability'},
-            'performance_optimization': {'performance', 'optimization'},
-            'code_review': {'review', 'quality'},
-            'documentation': {'documentation', 'guide', 'manual'}
-        }
-        
-        if template.category in category_matches:
-            category_entities = category_matches[template.category]
+        if template.category in TEMPLATE_CATEGORY_ENTITIES:
+            category_entities = TEMPLATE_CATEGORY_ENTITIES[template.category]
             if entity_types & category_entities:
                 score += 0.3
         
-        # Complexity matching (more lenient ranges)
-        phase_count = len(template.phases)
-        if analysis.complexity == ComplexityLevel.SIMPLE and phase_count <= 4:
-            score += 0.2
-        elif analysis.complexity == ComplexityLevel.MEDIUM and 2 <= phase_count <= 6:
-            score += 0.2
-        elif analysis.complexity == ComplexityLevel.COMPLEX and phase_count >= 4:
+        # Complexity matching
+        if _complexity_fits(analysis.complexity, len(template.phases)):
             score += 0.2
         
         # Success rate bonus
@@ -23,7 +23,7 @@ from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
+from utils.core.llm_gateway import get_llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -162,11 +162,11 @@ class AgentSwarm:
         self.logger.info("✅ Agent Swarm initialized")
     
     def _create_llm(self):
-        """Create LLM - simple helper."""
-        return ChatGoogleGenerativeAI(
-            model=self.llm_config.get('model_name', 'gemini-2.5-flash'),
-            google_api_key=os.environ.get("GEMINI_API_KEY"),
-            temperature=self.llm_config.get('temperature', 0.0)  # Deterministic for software development
+        """Create LLM - pooled client from the shared gateway."""
+        return get_llm_gateway().get_chat_model(
+            self.llm_config.get('model_name', 'gemini-2.5-flash'),
+            temperature=self.llm_config.get('temperature', 0.0),  # Deterministic for software development
+            agent_name="agent_swarm"
         )
     
     def _build_workflow(self):
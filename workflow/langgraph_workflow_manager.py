@@ -6,7 +6,8 @@ Test-driven implementation using established libraries.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Callable
+import operator
+from typing import Dict, Any, List, Optional, Callable, Annotated
 try:
     from typing_extensions import TypedDict  # Python < 3.12 compatibility
 except ImportError:
@@ -42,8 +43,32 @@ from utils.core.structured_outputs import (
 logger = logging.getLogger(__name__)
 
 
+def merge_dicts(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """Reducer merging per-agent dict updates from parallel branches."""
+    return {**(left or {}), **(right or {})}
+
+
+def last_value(left: Any, right: Any) -> Any:
+    """Reducer keeping the most recent value when parallel branches both write."""
+    return right
+
+
+# Agent nodes that only depend on generated code and run concurrently after it
+POST_CODEGEN_NODES = [
+    "test_generation",
+    "code_review",
+    "security_analysis",
+    "documentation_generation",
+]
+
+
 class AgentState(TypedDict):
-    """LangGraph state definition for agent workflow."""
+    """
+    LangGraph state definition for agent workflow.
+    
+    Nodes return only the fields they change; Annotated reducers merge the
+    updates so parallel branches never copy or overwrite the full state.
+    """
     project_context: str
     project_name: str
     session_id: str
@@ -53,12 +78,12 @@ class AgentState(TypedDict):
     tests: Dict[str, Any]
     documentation: Dict[str, Any]
     diagrams: Dict[str, Any]
-    agent_outputs: Dict[str, Any]
-    errors: List[str]
-    warnings: List[str]
-    approval_requests: List[Dict[str, Any]]
-    current_step: str
-    execution_history: List[Dict[str, Any]]
+    agent_outputs: Annotated[Dict[str, Any], merge_dicts]
+    errors: Annotated[List[str], operator.add]
+    warnings: Annotated[List[str], operator.add]
+    approval_requests: Annotated[List[Dict[str, Any]], operator.add]
+    current_step: Annotated[str, last_value]
+    execution_history: Annotated[List[Dict[str, Any]], operator.add]
 
 
 class AgentNodeFactory:
@@ -69,9 +94,9 @@ class AgentNodeFactory:
         self.llm = llm
         self.logger = logging.getLogger(__name__)
     
-    def create_requirements_node(self) -> Callable[[AgentState], AgentState]:
+    def create_requirements_node(self) -> Callable[[AgentState], Dict[str, Any]]:
         """Create a requirements analysis node."""
-        async def requirements_node(state: AgentState) -> AgentState:
+        async def requirements_node(state: AgentState) -> Dict[str, Any]:
             try:
                 # Use JSON Output Parser instead of PydanticOutputParser
                 json_parser = JsonOutputParser()
@@ -131,15 +156,12 @@ Do not include any text before or after the JSON object.""",
                 
                 # Update state
                 return {
-                    **state,
                     "requirements": result.get("functional_requirements", []),
                     "agent_outputs": {
-                        **state["agent_outputs"],
                         "requirements_analyst": result
                     },
                     "current_step": "requirements_analysis",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "requirements_analysis",
                             "timestamp": datetime.now().isoformat(),
@@ -152,11 +174,9 @@ Do not include any text before or after the JSON object.""",
             except Exception as e:
                 self.logger.error(f"Requirements analysis failed: {e}")
                 return {
-                    **state,
-                    "errors": [*state["errors"], f"Requirements analysis failed: {str(e)}"],
+                    "errors": [f"Requirements analysis failed: {str(e)}"],
                     "current_step": "requirements_analysis",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "requirements_analysis",
                             "timestamp": datetime.now().isoformat(),
@@ -168,9 +188,9 @@ Do not include any text before or after the JSON object.""",
         
         return requirements_node
     
-    def create_architecture_node(self) -> Callable[[AgentState], AgentState]:
+    def create_architecture_node(self) -> Callable[[AgentState], Dict[str, Any]]:
         """Create an architecture design node."""
-        async def architecture_node(state: AgentState) -> AgentState:
+        async def architecture_node(state: AgentState) -> Dict[str, Any]:
             try:
                 # Use JSON Output Parser instead of PydanticOutputParser
                 json_parser = JsonOutputParser()
@@ -233,15 +253,12 @@ Do not include any text before or after the JSON object.""",
                 })
                 
                 return {
-                    **state,
                     "architecture": result,
                     "agent_outputs": {
-                        **state["agent_outputs"],
                         "architecture_designer": result
                     },
                     "current_step": "architecture_design",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "architecture_design",
                             "timestamp": datetime.now().isoformat(),
@@ -254,11 +271,9 @@ Do not include any text before or after the JSON object.""",
             except Exception as e:
                 self.logger.error(f"Architecture design failed: {e}")
                 return {
-                    **state,
-                    "errors": [*state["errors"], f"Architecture design failed: {str(e)}"],
+                    "errors": [f"Architecture design failed: {str(e)}"],
                     "current_step": "architecture_design",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "architecture_design",
                             "timestamp": datetime.now().isoformat(),
@@ -270,9 +285,9 @@ Do not include any text before or after the JSON object.""",
         
         return architecture_node
     
-    def create_code_generator_node(self) -> Callable[[AgentState], AgentState]:
+    def create_code_generator_node(self) -> Callable[[AgentState], Dict[str, Any]]:
         """Create a code generation node."""
-        async def code_generator_node(state: AgentState) -> AgentState:
+        async def code_generator_node(state: AgentState) -> Dict[str, Any]:
             try:
                 # Use StrOutputParser for markdown with code blocks
                 output_parser = StrOutputParser()
@@ -319,10 +334,8 @@ Return ONLY the markdown with code blocks, no additional text.""",
                 source_files = self.parse_markdown_code_blocks(result)
                 
                 return {
-                    **state,
                     "code_files": source_files,  # FIXED: Store files directly in code_files
                     "agent_outputs": {
-                        **state["agent_outputs"],
                         "code_generator": {
                             "source_files": source_files,
                             "raw_markdown": result
@@ -330,7 +343,6 @@ Return ONLY the markdown with code blocks, no additional text.""",
                     },
                     "current_step": "code_generation",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "code_generation",
                             "timestamp": datetime.now().isoformat(),
@@ -344,11 +356,9 @@ Return ONLY the markdown with code blocks, no additional text.""",
             except Exception as e:
                 self.logger.error(f"Code generation failed: {e}")
                 return {
-                    **state,
-                    "errors": [*state["errors"], f"Code generation failed: {str(e)}"],
+                    "errors": [f"Code generation failed: {str(e)}"],
                     "current_step": "code_generation",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "code_generation",
                             "timestamp": datetime.now().isoformat(),
@@ -407,9 +417,9 @@ Return ONLY the markdown with code blocks, no additional text.""",
             
             return source_files
     
-    def create_test_generator_node(self) -> Callable[[AgentState], AgentState]:
+    def create_test_generator_node(self) -> Callable[[AgentState], Dict[str, Any]]:
         """Create a test generation node."""
-        async def test_generator_node(state: AgentState) -> AgentState:
+        async def test_generator_node(state: AgentState) -> Dict[str, Any]:
             try:
                 # Use JSON Output Parser instead of PydanticOutputParser
                 json_parser = JsonOutputParser()
@@ -468,15 +478,12 @@ Return ONLY the JSON object.""",
                 })
                 
                 return {
-                    **state,
                     "tests": result.get("test_files", {}),
                     "agent_outputs": {
-                        **state["agent_outputs"],
                         "test_generator": result
                     },
                     "current_step": "test_generation",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "test_generation",
                             "timestamp": datetime.now().isoformat(),
@@ -489,11 +496,9 @@ Return ONLY the JSON object.""",
             except Exception as e:
                 self.logger.error(f"Test generation failed: {e}")
                 return {
-                    **state,
-                    "errors": [*state["errors"], f"Test generation failed: {str(e)}"],
+                    "errors": [f"Test generation failed: {str(e)}"],
                     "current_step": "test_generation",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "test_generation",
                             "timestamp": datetime.now().isoformat(),
@@ -505,9 +510,9 @@ Return ONLY the JSON object.""",
         
         return test_generator_node
     
-    def create_code_reviewer_node(self) -> Callable[[AgentState], AgentState]:
+    def create_code_reviewer_node(self) -> Callable[[AgentState], Dict[str, Any]]:
         """Create a code review node."""
-        async def code_reviewer_node(state: AgentState) -> AgentState:
+        async def code_reviewer_node(state: AgentState) -> Dict[str, Any]:
             try:
                 parser = PydanticOutputParser(pydantic_object=CodeReviewOutput)
                 
@@ -536,14 +541,11 @@ Perform a comprehensive code review, identifying issues, suggesting improvements
                 })
                 
                 return {
-                    **state,
                     "agent_outputs": {
-                        **state["agent_outputs"],
                         "code_reviewer": result.dict()
                     },
                     "current_step": "code_review",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "code_review",
                             "timestamp": datetime.now().isoformat(),
@@ -556,11 +558,9 @@ Perform a comprehensive code review, identifying issues, suggesting improvements
             except Exception as e:
                 self.logger.error(f"Code review failed: {e}")
                 return {
-                    **state,
-                    "errors": [*state["errors"], f"Code review failed: {str(e)}"],
+                    "errors": [f"Code review failed: {str(e)}"],
                     "current_step": "code_review",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "code_review",
                             "timestamp": datetime.now().isoformat(),
@@ -572,9 +572,9 @@ Perform a comprehensive code review, identifying issues, suggesting improvements
         
         return code_reviewer_node
     
-    def create_security_analyst_node(self) -> Callable[[AgentState], AgentState]:
+    def create_security_analyst_node(self) -> Callable[[AgentState], Dict[str, Any]]:
         """Create a security analysis node."""
-        async def security_analyst_node(state: AgentState) -> AgentState:
+        async def security_analyst_node(state: AgentState) -> Dict[str, Any]:
             try:
                 parser = PydanticOutputParser(pydantic_object=SecurityAnalysisOutput)
                 
@@ -607,14 +607,11 @@ Perform a comprehensive security analysis, identifying vulnerabilities and provi
                 })
                 
                 return {
-                    **state,
                     "agent_outputs": {
-                        **state["agent_outputs"],
                         "security_analyst": result.dict()
                     },
                     "current_step": "security_analysis",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "security_analysis",
                             "timestamp": datetime.now().isoformat(),
@@ -627,11 +624,9 @@ Perform a comprehensive security analysis, identifying vulnerabilities and provi
             except Exception as e:
                 self.logger.error(f"Security analysis failed: {e}")
                 return {
-                    **state,
-                    "errors": [*state["errors"], f"Security analysis failed: {str(e)}"],
+                    "errors": [f"Security analysis failed: {str(e)}"],
                     "current_step": "security_analysis",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "security_analysis",
                             "timestamp": datetime.now().isoformat(),
@@ -643,9 +638,9 @@ Perform a comprehensive security analysis, identifying vulnerabilities and provi
         
         return security_analyst_node
     
-    def create_documentation_generator_node(self) -> Callable[[AgentState], AgentState]:
+    def create_documentation_generator_node(self) -> Callable[[AgentState], Dict[str, Any]]:
         """Create a documentation generation node."""
-        async def documentation_generator_node(state: AgentState) -> AgentState:
+        async def documentation_generator_node(state: AgentState) -> Dict[str, Any]:
             try:
                 parser = PydanticOutputParser(pydantic_object=DocumentationGenerationOutput)
                 
@@ -682,15 +677,12 @@ Generate comprehensive documentation including README, API docs, and user guides
                 })
                 
                 return {
-                    **state,
                     "documentation": result.documentation_files,
                     "agent_outputs": {
-                        **state["agent_outputs"],
                         "documentation_generator": result.dict()
                     },
                     "current_step": "documentation_generation",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "documentation_generation",
                             "timestamp": datetime.now().isoformat(),
@@ -703,11 +695,9 @@ Generate comprehensive documentation including README, API docs, and user guides
             except Exception as e:
                 self.logger.error(f"Documentation generation failed: {e}")
                 return {
-                    **state,
-                    "errors": [*state["errors"], f"Documentation generation failed: {str(e)}"],
+                    "errors": [f"Documentation generation failed: {str(e)}"],
                     "current_step": "documentation_generation",
                     "execution_history": [
-                        *state["execution_history"],
                         {
                             "step": "documentation_generation",
                             "timestamp": datetime.now().isoformat(),
@@ -726,17 +716,21 @@ class LangGraphWorkflowManager:
     Test-driven implementation with comprehensive error handling.
     """
     
-    def __init__(self, llm_config: Dict[str, Any]):
+    def __init__(self, llm_config: Dict[str, Any], parallel_post_codegen: bool = True):
         """
         Initialize the LangGraph workflow manager.
         
         Args:
             llm_config: Configuration for the LLM
+            parallel_post_codegen: Run test generation, code review, security
+                analysis and documentation concurrently after code generation
+                (False keeps the strict sequential chain)
         """
         if not LANGGRAPH_AVAILABLE:
             raise ImportError("LangGraph is required for this workflow")
         
         self.llm_config = llm_config
+        self.parallel_post_codegen = parallel_post_codegen
         self.logger = logging.getLogger(__name__)
         self.llm = self._setup_llm()
         self.node_factory = AgentNodeFactory(self.llm)
@@ -759,8 +753,14 @@ class LangGraphWorkflowManager:
             self.logger.error(f"Failed to setup LLM: {e}")
             raise
     
-    def _initialize_state_node(self, state: dict) -> AgentState:
-        """Initialize state with default values for all required fields."""
+    def _initialize_state_node(self, state: dict) -> Dict[str, Any]:
+        """
+        Initialize state with default values for all required fields.
+        
+        Reducer-managed fields (agent_outputs, errors, warnings,
+        approval_requests, execution_history) already hold their input values
+        and are not returned, otherwise the reducers would duplicate them.
+        """
         import uuid
         
         self.logger.info(f"📝 Initializing state with project_context: {state.get('project_context', 'NOT_PROVIDED')}")
@@ -775,12 +775,7 @@ class LangGraphWorkflowManager:
             "tests": state.get("tests", {}),
             "documentation": state.get("documentation", {}),
             "diagrams": state.get("diagrams", {}),
-            "agent_outputs": state.get("agent_outputs", {}),
-            "errors": state.get("errors", []),
-            "warnings": state.get("warnings", []),
-            "approval_requests": state.get("approval_requests", []),
-            "current_step": state.get("current_step", "initialization"),
-            "execution_history": state.get("execution_history", [])
+            "current_step": state.get("current_step", "initialization")
         }
     
     def _create_workflow(self) -> StateGraph:
@@ -809,11 +804,19 @@ class LangGraphWorkflowManager:
         workflow.add_edge("initialize", "requirements_analysis")
         workflow.add_edge("requirements_analysis", "architecture_design")
         workflow.add_edge("architecture_design", "code_generation")
-        workflow.add_edge("code_generation", "test_generation")
-        workflow.add_edge("test_generation", "code_review")
-        workflow.add_edge("code_review", "security_analysis")
-        workflow.add_edge("security_analysis", "documentation_generation")
-        workflow.add_edge("documentation_generation", "workflow_complete")
+        
+        if self.parallel_post_codegen:
+            # Fan out: post-codegen agents only depend on generated code
+            for node_name in POST_CODEGEN_NODES:
+                workflow.add_edge("code_generation", node_name)
+            # Fan in: complete once every branch has finished
+            workflow.add_edge(POST_CODEGEN_NODES, "workflow_complete")
+        else:
+            workflow.add_edge("code_generation", "test_generation")
+            workflow.add_edge("test_generation", "code_review")
+            workflow.add_edge("code_review", "security_analysis")
+            workflow.add_edge("security_analysis", "documentation_generation")
+            workflow.add_edge("documentation_generation", "workflow_complete")
         
         # Add error handling edges
         workflow.add_edge("error_handler", END)
@@ -822,14 +825,12 @@ class LangGraphWorkflowManager:
         # Compile the workflow (Studio handles persistence)
         return workflow.compile()
     
-    def _error_handler_node(self, state: AgentState) -> AgentState:
+    def _error_handler_node(self, state: AgentState) -> Dict[str, Any]:
         """Error handling node."""
         self.logger.error(f"Workflow error at step {state.get('current_step', 'unknown')}")
         return {
-            **state,
             "current_step": "error",
             "execution_history": [
-                *state["execution_history"],
                 {
                     "step": "error_handler",
                     "timestamp": datetime.now().isoformat(),
@@ -839,14 +840,12 @@ class LangGraphWorkflowManager:
             ]
         }
     
-    def _workflow_complete_node(self, state: AgentState) -> AgentState:
+    def _workflow_complete_node(self, state: AgentState) -> Dict[str, Any]:
         """Workflow completion node."""
         self.logger.info("Workflow completed successfully")
         return {
-            **state,
             "current_step": "completed",
             "execution_history": [
-                *state["execution_history"],
                 {
                     "step": "workflow_complete",
                     "timestamp": datetime.now().isoformat(),
@@ -6,6 +6,7 @@ Implements automated task analysis, workflow composition, and agent coordination
 
 Main Components:
 - WorkflowOrchestrationEngine: Core orchestration engine
+- DagScheduler: Ready-queue step scheduler (critical-path-first, timeouts, cancellation)
 - WorkflowOrchestrationTeam: Specialized team for workflow design
 - Integration interfaces for existing agent systems
 
@@ -24,13 +25,21 @@ from .workflow_orchestration_engine import (
     WorkflowStatus,
     WorkflowExecution
 )
+from .dag_scheduler import (
+    DagScheduler,
+    ScheduledStepResult,
+    StepOutcome
+)
 
 __all__ = [
     'WorkflowOrchestrationEngine',
     'WorkflowOrchestrator', 
     'create_workflow_orchestration_engine',
     'WorkflowStatus',
-    'WorkflowExecution'
+    'WorkflowExecution',
+    'DagScheduler',
+    'ScheduledStepResult',
+    'StepOutcome'
 ]
 
 # Version info
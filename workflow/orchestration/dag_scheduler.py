@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Dynamic DAG Scheduler - Ready-Queue Step Execution
+
+Starts every workflow step the moment its dependencies have finished instead
+of waiting for level-synchronous batches. Wall-clock time for wide workflows
+approaches the critical path length.
+
+Core Features:
+- Ready queue ordered critical-path-first (longest remaining path runs first)
+- Optional max parallelism
+- Per-step timeouts
+- Cancellation of downstream steps when a step fails
+- O(n + e) planning and cycle detection
+"""
+
+import asyncio
+import heapq
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+class StepOutcome(Enum):
+    """Final state of a scheduled step"""
+    COMPLETED = "completed"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class ScheduledStepResult:
+    """Result of one step run by the scheduler"""
+    step_id: str
+    outcome: StepOutcome
+    result: Any = None
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+def _default_weight(step: Any) -> float:
+    return float(getattr(step, "estimated_effort", 1) or 1)
+
+
+class DagScheduler:
+    """Ready-queue scheduler for steps with ``id`` and ``dependencies``"""
+
+    def __init__(self,
+                 max_parallelism: Optional[int] = None,
+                 step_timeout: Optional[float] = None,
+                 cancel_downstream_on_failure: bool = True,
+                 weight: Callable[[Any], float] = _default_weight):
+        """
+        Args:
+            max_parallelism: Maximum steps running at once (None = unbounded)
+            step_timeout: Default timeout in seconds per step (None = no timeout)
+            cancel_downstream_on_failure: Cancel every transitive dependent of a
+                failed step; if False, dependents still run once all their
+                dependencies have finished
+            weight: Estimated cost of a step, used for critical-path priority
+        """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError("max_parallelism must be at least 1")
+        self.max_parallelism = max_parallelism
+        self.step_timeout = step_timeout
+        self.cancel_downstream_on_failure = cancel_downstream_on_failure
+        self.weight = weight
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _graph(steps: Sequence[Any]):
+        """Build successor lists and in-degrees, validating dependencies"""
+        step_ids = {step.id for step in steps}
+        successors: Dict[str, List[str]] = {step.id: [] for step in steps}
+        in_degree: Dict[str, int] = {}
+        for step in steps:
+            deps = set(step.dependencies)
+            unknown = deps - step_ids
+            if unknown:
+                raise ValueError(f"Step '{step.id}' depends on unknown steps: {sorted(unknown)}")
+            in_degree[step.id] = len(deps)
+            for dep in deps:
+                successors[dep].append(step.id)
+        return successors, in_degree
+
+    def topological_levels(self, steps: Sequence[Any]) -> List[List[Any]]:
+        """
+        Group steps into dependency levels in O(n + e).
+
+        Raises:
+            ValueError: On circular or unknown dependencies
+        """
+        by_id = {step.id: step for step in steps}
+        successors, in_degree = self._graph(steps)
+
+        levels = []
+        current = [step.id for step in steps if in_degree[step.id] == 0]
+        visited = 0
+        while current:
+            levels.append([by_id[step_id] for step_id in current])
+            visited += len(current)
+            following = []
+            for step_id in current:
+                for successor in successors[step_id]:
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        following.append(successor)
+            current = following
+
+        if visited != len(steps):
+            raise ValueError("Circular dependency detected or invalid workflow")
+        return levels
+
+    def critical_path_lengths(self, steps: Sequence[Any]) -> Dict[str, float]:
+        """Longest weighted path from each step to any sink, including itself"""
+        successors, _ = self._graph(steps)
+        by_id = {step.id: step for step in steps}
+        lengths: Dict[str, float] = {}
+        for level in reversed(self.topological_levels(steps)):
+            for step in level:
+                tail = max((lengths[s] for s in successors[step.id]), default=0.0)
+                lengths[step.id] = self.weight(by_id[step.id]) + tail
+        return lengths
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def run(self,
+                  steps: Sequence[Any],
+                  execute: Callable[[Any], Awaitable[Any]],
+                  is_success: Callable[[Any], bool] = lambda result: True,
+                  timeout_for: Optional[Callable[[Any], Optional[float]]] = None,
+                  on_finished: Optional[Callable[[ScheduledStepResult], None]] = None
+                  ) -> Dict[str, ScheduledStepResult]:
+        """
+        Execute steps as soon as their dependencies finish.
+
+        Args:
+            steps: Steps with ``id`` and ``dependencies`` attributes
+            execute: Coroutine function running one step
+            is_success: Decides whether a returned result counts as success
+            timeout_for: Per-step timeout override (falls back to ``step_timeout``)
+            on_finished: Callback invoked for every finished or cancelled step
+
+        Returns:
+            Results keyed by step id
+        """
+        by_id = {step.id: step for step in steps}
+        order = {step.id: index for index, step in enumerate(steps)}
+        successors, in_degree = self._graph(steps)
+        priority = self.critical_path_lengths(steps)
+
+        results: Dict[str, ScheduledStepResult] = {}
+        ready: List = []
+        for step in steps:
+            if in_degree[step.id] == 0:
+                heapq.heappush(ready, (-priority[step.id], order[step.id], step.id))
+
+        running: Dict[asyncio.Task, str] = {}
+
+        def record(result: ScheduledStepResult):
+            results[result.step_id] = result
+            if on_finished:
+                on_finished(result)
+
+        def cancel_descendants(step_id: str, reason: str):
+            stack = list(successors[step_id])
+            while stack:
+                descendant = stack.pop()
+                if descendant in results:
+                    continue
+                record(ScheduledStepResult(descendant, StepOutcome.CANCELLED, error=reason))
+                stack.extend(successors[descendant])
+
+        def release(step_id: str):
+            for successor in successors[step_id]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0 and successor not in results:
+                    heapq.heappush(ready, (-priority[successor], order[successor], successor))
+
+        try:
+            while ready or running:
+                while ready and (self.max_parallelism is None
+                                 or len(running) < self.max_parallelism):
+                    _, _, step_id = heapq.heappop(ready)
+                    if step_id in results:
+                        continue
+                    step = by_id[step_id]
+                    timeout = timeout_for(step) if timeout_for else None
+                    if timeout is None:
+                        timeout = self.step_timeout
+                    task = asyncio.ensure_future(self._run_step(step, execute, timeout))
+                    running[task] = step_id
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step_id = running.pop(task)
+                    result = task.result()
+                    if result.outcome == StepOutcome.COMPLETED and not is_success(result.result):
+                        result.outcome = StepOutcome.FAILED
+                    record(result)
+
+                    if result.outcome == StepOutcome.COMPLETED:
+                        release(step_id)
+                    elif self.cancel_downstream_on_failure:
+                        cancel_descendants(step_id, f"Upstream step '{step_id}' {result.outcome.value}")
+                    else:
+                        release(step_id)
+        finally:
+            for task in running:
+                task.cancel()
+
+        return results
+
+    @staticmethod
+    async def _run_step(step: Any, execute: Callable[[Any], Awaitable[Any]],
+                        timeout: Optional[float]) -> ScheduledStepResult:
+        """Run one step, converting exceptions and timeouts into outcomes"""
+        started = time.perf_counter()
+        try:
+            if timeout is not None:
+                value = await asyncio.wait_for(execute(step), timeout)
+            else:
+                value = await execute(step)
+            return ScheduledStepResult(step.id, StepOutcome.COMPLETED, result=value,
+                                       started_at=started, finished_at=time.perf_counter())
+        except asyncio.TimeoutError:
+            return ScheduledStepResult(step.id, StepOutcome.TIMED_OUT,
+                                       error=f"Step timed out after {timeout} seconds",
+                                       started_at=started, finished_at=time.perf_counter())
+        except Exception as e:
+            return ScheduledStepResult(step.id, StepOutcome.FAILED, error=str(e),
+                                       started_at=started, finished_at=time.perf_counter())
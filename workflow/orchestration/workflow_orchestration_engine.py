@@ -31,6 +31,7 @@ from agents.teams.workflow_orchestration_team import (
     WorkflowType,
     AgentRole
 )
+from workflow.orchestration.dag_scheduler import DagScheduler, ScheduledStepResult, StepOutcome
 
 class WorkflowStatus(Enum):
     """Workflow execution status"""
@@ -57,9 +58,17 @@ class WorkflowExecution:
 class WorkflowOrchestrationEngine:
     """Core workflow orchestration engine"""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", max_parallelism: Optional[int] = None,
+                 step_timeout: Optional[float] = None, cancel_downstream_on_failure: bool = True):
         self.project_root = Path(project_root)
         self.team = WorkflowOrchestrationTeam(str(project_root))
+        
+        # Ready-queue scheduler: steps start as soon as their dependencies finish
+        self.scheduler = DagScheduler(
+            max_parallelism=max_parallelism,
+            step_timeout=step_timeout,
+            cancel_downstream_on_failure=cancel_downstream_on_failure
+        )
         self.active_workflows: Dict[str, WorkflowExecution] = {}
         self.workflow_history: List[WorkflowExecution] = []
         
@@ -175,12 +184,9 @@ class WorkflowOrchestrationEngine:
         }
         
         try:
-            # Execute workflow steps in dependency order
-            execution_order = self._calculate_execution_order(execution.composition.steps)
-            
-            for step_batch in execution_order:
-                batch_results = await self._execute_step_batch(execution, step_batch)
-                execution_results["step_executions"].extend(batch_results)
+            # Execute workflow steps as soon as their dependencies finish
+            step_executions = await self._execute_step_graph(execution)
+            execution_results["step_executions"].extend(step_executions)
             
             # Validate workflow completion
             validation_results = await self._validate_workflow_completion(execution)
@@ -213,59 +219,40 @@ class WorkflowOrchestrationEngine:
         return execution_results
     
     def _calculate_execution_order(self, steps: List[WorkflowStep]) -> List[List[WorkflowStep]]:
-        """Calculate optimal execution order considering dependencies"""
-        execution_order = []
-        remaining_steps = steps.copy()
-        completed_step_ids = set()
-        
-        while remaining_steps:
-            # Find steps that can be executed (all dependencies completed)
-            ready_steps = []
-            for step in remaining_steps:
-                if all(dep_id in completed_step_ids for dep_id in step.dependencies):
-                    ready_steps.append(step)
-            
-            if not ready_steps:
-                # Handle circular dependencies or errors
-                raise ValueError("Circular dependency detected or invalid workflow")
-            
-            # Add ready steps as a batch (can be executed in parallel)
-            execution_order.append(ready_steps)
-            
-            # Remove ready steps and mark as completed
-            for step in ready_steps:
-                remaining_steps.remove(step)
-                completed_step_ids.add(step.id)
-        
-        return execution_order
+        """Calculate dependency levels (steps in a level can run in parallel)"""
+        return self.scheduler.topological_levels(steps)
     
-    async def _execute_step_batch(self, execution: WorkflowExecution, step_batch: List[WorkflowStep]) -> List[Dict[str, Any]]:
-        """Execute a batch of workflow steps (potentially in parallel)"""
-        batch_results = []
+    async def _execute_step_graph(self, execution: WorkflowExecution) -> List[Dict[str, Any]]:
+        """Execute workflow steps with the ready-queue DAG scheduler"""
+        step_executions = []
+        steps_by_id = {step.id: step for step in execution.composition.steps}
         
-        if len(step_batch) == 1:
-            # Single step execution
-            step = step_batch[0]
-            result = await self._execute_single_step(execution, step)
-            batch_results.append(result)
-        else:
-            # Parallel step execution
-            print(f"🔄 EXECUTING {len(step_batch)} STEPS IN PARALLEL")
-            tasks = [self._execute_single_step(execution, step) for step in step_batch]
-            parallel_results = await asyncio.gather(*tasks, return_exceptions=True)
+        def on_finished(scheduled: ScheduledStepResult):
+            if scheduled.outcome in (StepOutcome.COMPLETED, StepOutcome.FAILED) and scheduled.result:
+                # _execute_single_step already tracked the step
+                step_executions.append(scheduled.result)
+                return
             
-            for i, result in enumerate(parallel_results):
-                if isinstance(result, Exception):
-                    batch_results.append({
-                        "step_id": step_batch[i].id,
-                        "status": "failed",
-                        "error": str(result),
-                        "timestamp": datetime.now().isoformat()
-                    })
-                else:
-                    batch_results.append(result)
+            step = steps_by_id[scheduled.step_id]
+            if scheduled.outcome != StepOutcome.CANCELLED:
+                execution.failed_steps.append(step.id)
+            step_executions.append({
+                "step_id": step.id,
+                "step_name": step.name,
+                "status": scheduled.outcome.value,
+                "error": scheduled.error,
+                "duration_seconds": scheduled.duration_seconds,
+                "timestamp": datetime.now().isoformat()
+            })
+            print(f"⏹️ STEP {scheduled.outcome.value.upper()}: {step.name} - {scheduled.error}")
         
-        return batch_results
+        await self.scheduler.run(
+            execution.composition.steps,
+            execute=lambda step: self._execute_single_step(execution, step),
+            is_success=lambda result: result.get("status") == "completed",
+            on_finished=on_finished
+        )
+        return step_executions
     
     async def _execute_single_step(self, execution: WorkflowExecution, step: WorkflowStep) -> Dict[str, Any]:
         """Execute a single workflow step"""